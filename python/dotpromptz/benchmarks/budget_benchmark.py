@@ -0,0 +1,85 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks for rendering a long conversation within a token budget.
+
+Simulates a chat session in which one message is added to the history before
+each render, with a budget that only fits part of the history. Compares the
+per-render cost without a budget, with a budget and a list of messages, whose
+estimates are recomputed on every render, and with a budget and a `History`,
+which only estimates new messages.
+
+Usage:
+    python benchmarks/budget_benchmark.py
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from dotpromptz.parse import to_messages
+from dotpromptz.typing import DataArgument, History, HistoryBudget, Message, Role, TextPart
+
+_TEMPLATE = '<<<dotprompt:role:system>>>Be brief.<<<dotprompt:history>>><<<dotprompt:role:user>>>Next question'
+
+
+def _messages(count: int) -> list[Message]:
+    """Build a conversation of alternating user and model messages."""
+    return [
+        Message(role=Role.USER if i % 2 == 0 else Role.MODEL, content=[TextPart(text=f'Message {i} ' * 20)])
+        for i in range(count)
+    ]
+
+
+def _per_render_ms(
+    history: list[Message] | History,
+    message: Message,
+    budget: HistoryBudget | None,
+    renders: int = 20,
+) -> float:
+    """Add a message and render, repeatedly; return the mean time per render."""
+
+    def turn() -> None:
+        history.append(message)
+        to_messages(_TEMPLATE, DataArgument(messages=history), history_budget=budget)
+
+    return timeit.timeit(turn, number=renders) / renders * 1000
+
+
+def main() -> None:
+    """Run the benchmarks and print a table of timings."""
+    print(f'{"history":>8} {"kept":>6} {"no budget ms":>13} {"list ms":>9} {"History ms":>11}')
+    for count in (100, 1_000, 10_000):
+        messages = _messages(count)
+        message = messages[-1]
+        # Leave room for about half of the history.
+        budget = HistoryBudget(max_tokens=count * 30, placeholder='[{count} earlier messages left out]')
+        unbudgeted = History(messages)
+        history = History(messages)
+        # The first render tags and estimates the existing messages once. The
+        # system, placeholder and user messages are not counted as kept.
+        to_messages(_TEMPLATE, DataArgument(messages=unbudgeted))
+        kept = len(to_messages(_TEMPLATE, DataArgument(messages=history), history_budget=budget)) - 3
+        print(
+            f'{count:>8} {kept:>6}'
+            f' {_per_render_ms(unbudgeted, message, None):>13.2f}'
+            f' {_per_render_ms(list(messages), message, budget):>9.2f}'
+            f' {_per_render_ms(history, message, budget):>11.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks for loading prompts through a caching store.
+
+Loads prompts from `DirStoreSync` and `DirStore` directly, which reads and
+hashes the file every time, and through `CachingStoreSync` and `CachingStore`
+once the cache is warm. Concurrent loads of one prompt from a cold cache show
+how many reach the backing store with and without the cache coalescing them.
+
+Usage:
+    python benchmarks/caching_store_benchmark.py
+"""
+
+from __future__ import annotations
+
+import logging
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import anyio
+import structlog
+
+from dotpromptz.stores import CachingStore, CachingStoreSync, DirStore, DirStoreOptions, DirStoreSync
+from dotpromptz.typing import PromptStore
+
+_BODY = 'Hello {{name}}, here is what we know about {{#each topics}}{{this}}, {{/each}} and more.\n' * 40
+_COUNT = 100
+
+
+def _create_prompts(directory: Path) -> None:
+    """Create prompts to load."""
+    for i in range(_COUNT):
+        (directory / f'prompt{i}.prompt').write_text(f'---\nmodel: test\n---\n{i} {_BODY}', encoding='utf-8')
+
+
+def _sync_us(load: Callable[[str], Any], rounds: int) -> float:
+    """Return the time of loading every prompt a number of times, in microseconds per load."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for i in range(_COUNT):
+            load(f'prompt{i}')
+    return (time.perf_counter() - start) / (rounds * _COUNT) * 1_000_000
+
+
+async def _async_us(load: Callable[[str], Awaitable[Any]], rounds: int) -> float:
+    """Return the time of loading every prompt a number of times, in microseconds per load."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for i in range(_COUNT):
+            await load(f'prompt{i}')
+    return (time.perf_counter() - start) / (rounds * _COUNT) * 1_000_000
+
+
+class _CountingStore(DirStore):
+    """Directory store counting its loads."""
+
+    loads = 0
+
+    async def load(self, name: str, options: Any = None) -> Any:
+        """Count and load a prompt."""
+        self.loads += 1
+        return await super().load(name, options)
+
+
+async def _backing_loads(store: PromptStore, tasks: int) -> None:
+    """Load one prompt from many tasks at once."""
+    async with anyio.create_task_group() as tg:
+        for _ in range(tasks):
+            tg.start_soon(store.load, 'prompt0')
+
+
+async def _main(directory: Path) -> None:
+    """Run the async benchmarks and print their timings."""
+    options = DirStoreOptions(directory=directory)
+    direct = DirStore(options)
+    cached = CachingStore(DirStore(options))
+    await _async_us(cached.load, 1)
+    print(f'{"async DirStore":<24} {await _async_us(direct.load, 5):>12.1f}')
+    print(f'{"async CachingStore":<24} {await _async_us(cached.load, 50):>12.1f}')
+
+    print(f'\n{"concurrent loads":<24} {"backing loads":>14}')
+    for name, wrap in (('uncached', False), ('cached', True)):
+        backing = _CountingStore(options)
+        store: PromptStore = CachingStore(backing) if wrap else backing
+        await _backing_loads(store, 100)
+        print(f'{name:<24} {backing.loads:>14}')
+
+
+def main() -> None:
+    """Run the benchmarks and print a table of timings."""
+    # Keep per-load debug logs out of the timings.
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        _create_prompts(directory)
+        direct = DirStoreSync(DirStoreOptions(directory=directory))
+        cached = CachingStoreSync(DirStoreSync(DirStoreOptions(directory=directory)))
+        _sync_us(cached.load, 1)
+        print(f'{"store":<24} {"load us":>12}')
+        print(f'{"DirStoreSync":<24} {_sync_us(direct.load, 20):>12.1f}')
+        print(f'{"CachingStoreSync":<24} {_sync_us(cached.load, 200):>12.1f}')
+        anyio.run(_main, directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks for listing directory-based prompt stores.
+
+Lists a tree of prompts with `DirStoreSync` and `DirStore`: the first listing
+of a new store, which hashes every file, a repeated listing, which only stats
+files, and the first listing of a new store started from a persisted version
+index. Reading and hashing every file, as each listing used to, is shown for
+comparison.
+
+Usage:
+    python benchmarks/dir_store_benchmark.py
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import anyio
+import structlog
+
+from dotpromptz.stores import DirStore, DirStoreOptions, DirStoreSync
+from dotpromptz.stores._index import INDEX_FILE_NAME
+from dotpromptz.stores._io import calculate_version, read_prompt_file_sync, scan_directory_sync
+
+_BODY = 'Hello {{name}}, here is what we know about {{#each topics}}{{this}}, {{/each}} and more.\n' * 40
+
+
+def _create_tree(directory: Path, count: int) -> None:
+    """Create prompts spread over subdirectories, modified a minute ago."""
+    mtime = time.time() - 60
+    for i in range(count):
+        path = directory / f'group{i % 50}' / f'prompt{i}.prompt'
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(f'---\nmodel: test\n---\n{i} {_BODY}', encoding='utf-8')
+        os.utime(path, (mtime, mtime))
+
+
+def _hash_all(directory: Path) -> int:
+    """Read and hash every prompt file."""
+    files = scan_directory_sync(directory)
+    return len({calculate_version(read_prompt_file_sync(directory / path)) for path in files})
+
+
+def _ms(fn: Callable[[], Any]) -> float:
+    """Return the time of one call, in milliseconds."""
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def _print_row(store: str, count: int, hash_all: float, cold: float, warm: float, persisted: float) -> None:
+    """Print a row of timings."""
+    print(f'{store:<8} {count:>8} {hash_all:>12.0f} {cold:>10.0f} {warm:>10.0f} {persisted:>11.0f}')
+
+
+async def _ams(fn: Callable[[], Awaitable[Any]]) -> float:
+    """Return the time of one awaited call, in milliseconds."""
+    start = time.perf_counter()
+    await fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def _sync_row(directory: Path, count: int) -> None:
+    """Print the timings of listing the tree with the sync store."""
+    options = DirStoreOptions(directory=directory, persist_index=True)
+    (directory / INDEX_FILE_NAME).unlink(missing_ok=True)
+    store = DirStoreSync(options)
+    cold = _ms(store.list)
+    warm = min(_ms(store.list) for _ in range(3))
+    persisted = _ms(DirStoreSync(options).list)
+    _print_row('sync', count, _ms(lambda: _hash_all(directory)), cold, warm, persisted)
+
+
+async def _async_row(directory: Path, count: int) -> None:
+    """Print the timings of listing the tree with the async store."""
+    options = DirStoreOptions(directory=directory, persist_index=True)
+    (directory / INDEX_FILE_NAME).unlink(missing_ok=True)
+    store = DirStore(options)
+    cold = await _ams(store.list)
+    warm = min([await _ams(store.list) for _ in range(3)])
+    persisted = await _ams(DirStore(options).list)
+    _print_row('async', count, _ms(lambda: _hash_all(directory)), cold, warm, persisted)
+
+
+def main() -> None:
+    """Run the benchmarks and print a table of timings."""
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    print('Timings are per listing, in milliseconds.')
+    print(f'{"store":<8} {"prompts":>8} {"hash all":>12} {"cold":>10} {"warm":>10} {"persisted":>11}')
+    for count in (1_000, 10_000):
+        directory = Path(tempfile.mkdtemp())
+        try:
+            _create_tree(directory, count)
+            _sync_row(directory, count)
+            anyio.run(_async_row, directory, count)
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks for parsing prompt frontmatter.
+
+Compares the pure-Python and libyaml loaders on a typical frontmatter block,
+and full document parsing against frontmatter-only parsing of prompt files
+with large template bodies.
+
+Usage:
+    python benchmarks/frontmatter_benchmark.py
+"""
+
+from __future__ import annotations
+
+import tempfile
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from dotpromptz.parse import extract_frontmatter, parse_document, parse_frontmatter
+
+_FRONTMATTER = """---
+model: googleai/gemini-1.5-pro
+config:
+  temperature: 0.7
+  maxOutputTokens: 2048
+input:
+  schema:
+    name: string, the user's name
+    topics(array, topics of interest): string
+    style?(enum): [FORMAL, CASUAL]
+output:
+  format: json
+  schema:
+    reply: string
+    followUps(array): string
+myext.owner: prompts-team
+---
+"""
+
+_BODY_LINE = 'Hello {{name}}, here is what we know about {{#each topics}}{{this}}, {{/each}} and more.\n'
+
+
+def _read(path: Path) -> str:
+    """Read a whole prompt file."""
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+def _read_frontmatter(path: Path) -> dict[str, Any]:
+    """Parse the frontmatter of a prompt file, reading no further than it."""
+    with open(path, encoding='utf-8') as f:
+        return parse_frontmatter(f)
+
+
+def _best_of(fn: Callable[[], Any], number: int, repeat: int = 5) -> float:
+    """Return the best time per call of a few runs, in microseconds."""
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e6
+
+
+def _document_row(source: str, path: Path) -> None:
+    """Print the timings for one prompt, parsed from a string and from a file."""
+    path.write_text(source, encoding='utf-8')
+    number = 20 if len(source) > 1_000_000 else 200
+    print(
+        f'{len(source):<12}'
+        f' {_best_of(lambda: parse_document(source), number):>15.1f}'
+        f' {_best_of(lambda: parse_frontmatter(source), number):>18.1f}'
+        f' {_best_of(lambda: parse_document(_read(path)), number):>11.1f}'
+        f' {_best_of(lambda: _read_frontmatter(path), number):>18.1f}'
+    )
+
+
+def main() -> None:
+    """Run the benchmarks and print a table of timings."""
+    frontmatter = extract_frontmatter(_FRONTMATTER + 'Body')
+    print('Timings are per call, in microseconds.')
+    print(f'{"yaml loader":<40} {"us":>10}')
+    print(f'{"SafeLoader":<40} {_best_of(lambda: yaml.load(frontmatter, Loader=yaml.SafeLoader), 200):>10.1f}')
+    if yaml.__with_libyaml__:
+        print(f'{"CSafeLoader":<40} {_best_of(lambda: yaml.load(frontmatter, Loader=yaml.CSafeLoader), 200):>10.1f}')
+
+    print()
+    print(
+        f'{"body bytes":<12} {"parse_document":>15} {"parse_frontmatter":>18}'
+        f' {"file, full":>11} {"file, frontmatter":>18}'
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for lines in (10, 1_000, 50_000):
+            _document_row(_FRONTMATTER + _BODY_LINE * lines, Path(tmp) / f'bench{lines}.prompt')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks for rendering messages with a long conversation history.
+
+Simulates a chat session in which one message is added to the history before
+each render, and compares the per-render cost of passing the history as a
+list of messages against passing a `History`.
+
+Usage:
+    python benchmarks/history_benchmark.py
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from dotpromptz.parse import to_messages
+from dotpromptz.typing import DataArgument, History, Message, Role, TextPart
+
+_TEMPLATE = '<<<dotprompt:role:system>>>Be brief.<<<dotprompt:history>>><<<dotprompt:role:user>>>{{question}}'
+
+
+def _messages(count: int) -> list[Message]:
+    """Build a conversation of alternating user and model messages."""
+    return [
+        Message(role=Role.USER if i % 2 == 0 else Role.MODEL, content=[TextPart(text=f'Message {i}')])
+        for i in range(count)
+    ]
+
+
+def _per_render_ms(history: list[Message] | History, message: Message, renders: int = 20) -> float:
+    """Add a message and render, repeatedly; return the mean time per render."""
+
+    def turn() -> None:
+        history.append(message)
+        to_messages(_TEMPLATE, DataArgument(messages=history))
+
+    return timeit.timeit(turn, number=renders) / renders * 1000
+
+
+def main() -> None:
+    """Run the benchmarks and print a table of timings."""
+    print(f'{"history":>8} {"list ms":>9} {"History ms":>11}')
+    for count in (100, 1_000, 10_000):
+        messages = _messages(count)
+        message = Message(role=Role.USER, content=[TextPart(text='Next')])
+        history = History(messages)
+        # The first render tags the existing messages once.
+        to_messages(_TEMPLATE, DataArgument(messages=history))
+        print(f'{count:>8} {_per_render_ms(list(messages), message):>9.2f} {_per_render_ms(history, message):>11.2f}')
+
+
+if __name__ == '__main__':
+    main()
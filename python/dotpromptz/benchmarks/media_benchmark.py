@@ -0,0 +1,89 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks for rendering prompts with large inline media.
+
+Renders a template with a 10 MB base64 data URL and compares passing the URL
+through the template engine and the rendered string against setting it aside
+with `MediaHandles`. Reports the wall-clock time and the peak Python memory
+allocated by each render; copies made inside the template engine itself are
+not traced.
+
+Usage:
+    python benchmarks/media_benchmark.py
+"""
+
+from __future__ import annotations
+
+import base64
+import logging
+import os
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import structlog
+
+from dotpromptz.media import MediaHandles
+from dotpromptz.parse import to_messages
+from handlebarrz import Handlebars
+
+_TEMPLATE = 'Describe these images.{{#each photos}}<<<dotprompt:media:url {{this}} image/png>>>{{/each}}'
+
+
+def _render_inline(handlebars: Handlebars, context: dict[str, Any]) -> None:
+    """Render with the media inline in the context."""
+    to_messages(handlebars.render('prompt', context))
+
+
+def _render_handles(handlebars: Handlebars, context: dict[str, Any]) -> None:
+    """Render with the media set aside behind handles."""
+    media = MediaHandles()
+    to_messages(handlebars.render('prompt', media.extract(context)), media=media)
+
+
+def _measure(render: Callable[[Handlebars, dict[str, Any]], None], context: dict[str, Any]) -> tuple[float, float]:
+    """Return the best time in milliseconds and the peak traced memory in MB."""
+    handlebars = Handlebars()
+    handlebars.register_template('prompt', _TEMPLATE)
+    best = min(timeit.repeat(lambda: render(handlebars, context), number=1, repeat=3)) * 1000
+
+    tracemalloc.start()
+    render(handlebars, context)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak / 1e6
+
+
+def main() -> None:
+    """Run the benchmarks and print a table of timings and memory."""
+    # Keep the template engine's debug logging out of the timings.
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.INFO))
+    print(f'{"images":>6} {"inline ms":>10} {"inline MB":>10} {"handles ms":>11} {"handles MB":>11}')
+    for images in (1, 4):
+        # Each image is a 10 MB data URL.
+        photos = [
+            'data:image/png;base64,' + base64.b64encode(os.urandom(7_500_000)).decode('ascii') for _ in range(images)
+        ]
+        context = {'photos': photos}
+        inline_ms, inline_mb = _measure(_render_inline, context)
+        handles_ms, handles_mb = _measure(_render_handles, context)
+        print(f'{images:>6} {inline_ms:>10.1f} {inline_mb:>10.1f} {handles_ms:>11.2f} {handles_mb:>11.2f}')
+
+
+if __name__ == '__main__':
+    main()
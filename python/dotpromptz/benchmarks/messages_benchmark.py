@@ -0,0 +1,76 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks for the lightweight output mode of `to_messages`.
+
+Compares building validated messages, building and then serializing them as a
+provider SDK would, and building serialized messages directly in lightweight
+mode. Reports throughput and the memory allocated while converting.
+
+Usage:
+    python benchmarks/messages_benchmark.py
+"""
+
+from __future__ import annotations
+
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from dotpromptz.parse import message_to_dict, to_messages
+
+_TURN = (
+    '<<<dotprompt:role:user>>>Describe <<<dotprompt:media:url https://example.com/a.png image/png>>> '
+    'and <<<dotprompt:section code>>> the code below.\n'
+    '<<<dotprompt:role:model>>>It shows a cat.\n'
+)
+
+
+def _best_of(fn: Callable[[], Any], repeat: int = 5) -> float:
+    """Return the best wall-clock time of a few runs, in milliseconds."""
+    return min(timeit.repeat(fn, number=1, repeat=repeat)) * 1000
+
+
+def _allocated(fn: Callable[[], Any]) -> tuple[float, float]:
+    """Return the peak and retained memory of one call, in KiB."""
+    tracemalloc.start()
+    result = fn()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak / 1024, retained / 1024
+
+
+def _row(case: str, turns: int, convert: Callable[[str], Any]) -> None:
+    """Print the throughput and allocations of converting a rendered prompt."""
+    rendered = _TURN * turns
+    ms = _best_of(lambda: convert(rendered))
+    peak, retained = _allocated(lambda: convert(rendered))
+    print(f'{case:<24} {turns:>6} {ms:>8.1f} {turns * 2 / ms * 1000:>12.0f} {peak:>10.0f} {retained:>12.0f}')
+
+
+def main() -> None:
+    """Run the benchmarks and print a table of timings and allocations."""
+    print(f'{"case":<24} {"turns":>6} {"ms":>8} {"messages/s":>12} {"peak KiB":>10} {"retained KiB":>12}')
+    for turns in (100, 2_000):
+        _row('models', turns, to_messages)
+        _row('models, then dumped', turns, lambda rendered: [message_to_dict(m) for m in to_messages(rendered)])
+        _row('lightweight', turns, lambda rendered: to_messages(rendered, lightweight=True))
+
+
+if __name__ == '__main__':
+    main()
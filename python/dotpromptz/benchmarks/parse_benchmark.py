@@ -0,0 +1,87 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks for converting rendered templates into messages and parts.
+
+Compares the single-pass marker tokenizer used by `to_messages` and `to_parts`
+against splitting with the marker regular expressions, on rendered prompts with
+thousands of markers and on text with many unterminated markers.
+
+Usage:
+    python benchmarks/parse_benchmark.py
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from dotpromptz.parse import (
+    parse_part,
+    split_by_media_and_section_markers,
+    to_messages,
+    to_parts,
+)
+from dotpromptz.typing import Part
+
+_TURN = (
+    '<<<dotprompt:role:user>>>Describe <<<dotprompt:media:url https://example.com/a.png image/png>>> '
+    'and <<<dotprompt:section code>>> the code below.\n'
+    '<<<dotprompt:role:model>>>It shows a cat.\n'
+)
+
+
+def _regex_to_parts(source: str) -> list[Part]:
+    """Split at media and section markers with the regular expression."""
+    return [parse_part(piece) for piece in split_by_media_and_section_markers(source)]
+
+
+def _best_of(fn: Callable[[], Any], repeat: int = 5) -> float:
+    """Return the best wall-clock time of a few runs, in milliseconds."""
+    return min(timeit.repeat(fn, number=1, repeat=repeat)) * 1000
+
+
+def _messages_row(rendered: str) -> None:
+    """Print the timing of converting a rendered prompt into messages."""
+    markers = rendered.count('<<<dotprompt:')
+    print(f'{"to_messages":<40} {markers:>8} {_best_of(lambda: to_messages(rendered)):>13.1f} {"":>10}')
+
+
+def _parts_row(case: str, body: str, count: int, regex_repeat: int = 5) -> None:
+    """Print the timings of splitting a body into parts with both approaches."""
+    print(
+        f'{case:<40} {count:>8}'
+        f' {_best_of(lambda: to_parts(body)):>13.1f}'
+        f' {_best_of(lambda: _regex_to_parts(body), repeat=regex_repeat):>10.1f}'
+    )
+
+
+def main() -> None:
+    """Run the benchmarks and print a table of timings."""
+    print(f'{"case":<40} {"markers":>8} {"tokenizer ms":>13} {"regex ms":>10}')
+    for turns in (1_000, 5_000):
+        rendered = _TURN * turns
+        _messages_row(rendered)
+        body = rendered.replace('<<<dotprompt:role:', '')
+        _parts_row('to_parts', body, body.count('<<<dotprompt:'))
+
+    for count in (1_000, 5_000):
+        _parts_row('to_parts, unterminated markers', 'x <<<dotprompt:section ' * count, count, regex_repeat=1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks for converting Picoschema to JSON Schema.
+
+Compares `PicoschemaParser.parse`, which converts in a single synchronous pass
+and then resolves the named schemas it refers to all at once, against awaiting
+the conversion recursively for every property and resolving names as they are
+met, on wide and deep schemas with and without named schemas.
+
+Usage:
+    python benchmarks/picoschema_benchmark.py
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import anyio
+
+from dotpromptz.picoschema import (
+    JSON_SCHEMA_SCALAR_TYPES,
+    WILDCARD_PROPERTY_NAME,
+    PicoschemaParser,
+    extract_description,
+)
+from dotpromptz.typing import JsonSchema, SchemaResolver
+
+
+class _RecursiveParser(PicoschemaParser):
+    """Converts by awaiting itself for every property, resolving names as they are met."""
+
+    async def parse_pico(self, obj: Any, path: list[str] | None = None) -> JsonSchema:
+        """Convert a fragment recursively."""
+        path = path or []
+        if isinstance(obj, str):
+            type_name, description = extract_description(obj)
+            if type_name not in JSON_SCHEMA_SCALAR_TYPES:
+                resolved = await self.must_resolve_schema(type_name)
+                return {**resolved, 'description': description} if description else resolved
+            if type_name == 'any':
+                return {'description': description} if description else {}
+            return {'type': type_name, 'description': description} if description else {'type': type_name}
+
+        schema: JsonSchema = {'type': 'object', 'properties': {}, 'required': [], 'additionalProperties': False}
+        for key, value in obj.items():
+            if key == WILDCARD_PROPERTY_NAME:
+                schema['additionalProperties'] = await self.parse_pico(value, [*path, key])
+                continue
+            parts = key.split('(')
+            name = parts[0]
+            type_info = parts[1][:-1] if len(parts) > 1 else None
+            is_optional = name.endswith('?')
+            property_name = name[:-1] if is_optional else name
+            if not is_optional:
+                schema['required'].append(property_name)
+            if not type_info:
+                prop = await self.parse_pico(value, [*path, key])
+                if is_optional and isinstance(prop.get('type'), str):
+                    prop['type'] = [prop['type'], 'null']
+                schema['properties'][property_name] = prop
+                continue
+            type_name, description = extract_description(type_info)
+            if type_name == 'array':
+                prop = {'type': 'array', 'items': await self.parse_pico(value, [*path, key])}
+            else:
+                prop = await self.parse_pico(value, [*path, key])
+            if description:
+                prop['description'] = description
+            schema['properties'][property_name] = prop
+        if not schema['required']:
+            del schema['required']
+        return schema
+
+
+async def _resolver(name: str) -> JsonSchema | None:
+    """Resolve every name to a small object schema."""
+    return {'type': 'object', 'properties': {'id': {'type': 'string'}}}
+
+
+async def _slow_resolver(name: str) -> JsonSchema | None:
+    """Resolve every name after a millisecond, like a store lookup."""
+    await anyio.sleep(0.001)
+    return await _resolver(name)
+
+
+def _wide(fields: int, named_every: int = 0) -> dict[str, Any]:
+    """Build a flat schema, referring to a named schema every few fields."""
+    schema: dict[str, Any] = {}
+    for i in range(fields):
+        if named_every and i % named_every == 0:
+            schema[f'ref{i}'] = f'Ref{i % 20}, a reference'
+        elif i % 3 == 0:
+            schema[f'tags{i}(array)'] = 'string'
+        else:
+            schema[f'field{i}'] = 'string, a field'
+    return schema
+
+
+def _deep(depth: int) -> dict[str, Any]:
+    """Build a schema of nested objects."""
+    schema: dict[str, Any] = {'leaf': 'string', 'count': 'integer'}
+    for _ in range(depth):
+        schema = {'name': 'string', 'child(object)': schema}
+    return schema
+
+
+async def _best_of(parse: Callable[[Any], Awaitable[Any]], schema: Any, number: int, repeat: int = 5) -> str:
+    """Return the best time of a few runs, in milliseconds per conversion."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            for _ in range(number):
+                await parse(schema)
+        except RecursionError:
+            return 'RecursionError'
+        best = min(best, time.perf_counter() - start)
+    return f'{best / number * 1000:.3f}'
+
+
+async def _row(case: str, schema: dict[str, Any], number: int, resolver: SchemaResolver = _resolver) -> None:
+    """Print the timings of converting a schema with both parsers."""
+    iterative = PicoschemaParser(schema_resolver=resolver)
+    recursive = _RecursiveParser(schema_resolver=resolver)
+    print(
+        f'{case:<40}'
+        f' {await _best_of(iterative.parse, schema, number):>14}'
+        f' {await _best_of(recursive.parse, schema, number):>14}'
+    )
+
+
+async def _main() -> None:
+    """Run the benchmarks and print a table of timings."""
+    print(f'{"case":<40} {"iterative ms":>14} {"recursive ms":>14}')
+    await _row('wide, 500 fields', _wide(500), 200)
+    await _row('wide, 500 fields, 20 names', _wide(500, named_every=10), 200)
+    await _row('wide, 500 fields, 20 names, 1 ms lookup', _wide(500, named_every=10), 5, _slow_resolver)
+    await _row('deep, 200 levels', _deep(200), 200)
+    await _row('deep, 2000 levels', _deep(2_000), 20)
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    anyio.run(_main)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks for rendering one prompt against many inputs.
+
+Times `Dotprompt.render_many` at several concurrency levels for a template
+that only loops over its input, which the template engine renders while
+holding the GIL, and for a template calling a helper that blocks for a
+millisecond, as a lookup in a remote service would.
+
+Usage:
+    python benchmarks/render_many_benchmark.py
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import anyio
+
+from dotpromptz.dotprompt import Dotprompt
+from dotpromptz.typing import DataArgument
+
+_LOOP_TEMPLATE = '{{#each items}}<{{this.id}}: {{this.text}}>{{/each}}'
+_HELPER_TEMPLATE = 'Hello {{lookup_user id}}!'
+
+
+def _lookup_user(params: list[Any], options: Any) -> str:
+    """Pretend to fetch a user name from a remote service."""
+    time.sleep(0.001)
+    return f'user {params[0]}'
+
+
+async def _ms(dotprompt: Dotprompt, template: str, inputs: list[DataArgument[Any]], concurrency: int) -> float:
+    """Render all inputs and return the elapsed time in milliseconds."""
+    start = time.perf_counter()
+    async for _ in dotprompt.render_many(template, inputs, concurrency=concurrency):
+        pass
+    return (time.perf_counter() - start) * 1000
+
+
+async def _main() -> None:
+    """Run the benchmarks and print a table of timings."""
+    dotprompt = Dotprompt(helpers={'lookup_user': _lookup_user})
+    items = [{'id': i, 'text': 'x' * 40} for i in range(500)]
+    loop_inputs = [DataArgument[Any](input={'items': items}) for _ in range(200)]
+    helper_inputs = [DataArgument[Any](input={'id': i}) for i in range(200)]
+
+    print(f'{"concurrency":>11} {"loop ms":>9} {"helper ms":>10}')
+    for concurrency in (1, 2, 4, 8):
+        loop_ms = await _ms(dotprompt, _LOOP_TEMPLATE, loop_inputs, concurrency)
+        helper_ms = await _ms(dotprompt, _HELPER_TEMPLATE, helper_inputs, concurrency)
+        print(f'{concurrency:>11} {loop_ms:>9.1f} {helper_ms:>10.1f}')
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    anyio.run(_main)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks for the latency of resolving names.
+
+Measures `resolve` and `resolve_many` with an async resolver, a sync resolver
+run in a worker thread, and a sync resolver marked `nonblocking` and called
+inline. The same lookups are then timed while other work keeps anyio's default
+thread limiter busy, with and without a dedicated limiter for the resolver.
+
+Usage:
+    python benchmarks/resolver_benchmark.py
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import anyio
+
+from dotpromptz.resolvers import nonblocking, resolve, resolve_many
+
+_DATA = {f'name{i}': {'type': 'string'} for i in range(20)}
+_NAMES = list(_DATA)
+
+
+def _sync_resolver(name: str) -> Any:
+    """Look a name up in a dictionary."""
+    return _DATA.get(name)
+
+
+@nonblocking
+def _inline_resolver(name: str) -> Any:
+    """Look a name up in a dictionary, on the event loop."""
+    return _DATA.get(name)
+
+
+async def _async_resolver(name: str) -> Any:
+    """Look a name up in a dictionary."""
+    return _DATA.get(name)
+
+
+async def _best_us(fn: Callable[[], Awaitable[Any]], number: int, repeat: int = 5) -> float:
+    """Return the best time of a few runs, in microseconds per call."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            await fn()
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1_000_000
+
+
+async def _row(case: str, resolver: Any, number: int, limiter: anyio.CapacityLimiter | None = None) -> None:
+    """Print the timings of resolving one name and a batch of names."""
+    one = await _best_us(lambda: resolve('name0', 'schema', resolver, limiter=limiter), number)
+    many = await _best_us(lambda: resolve_many(_NAMES, 'schema', resolver, limiter=limiter), number // 10)
+    print(f'{case:<36} {one:>12.1f} {many:>14.1f}')
+
+
+async def _busy_worker(stop: anyio.Event) -> None:
+    """Keep a worker thread of the default limiter busy until stopped."""
+    while not stop.is_set():
+        await anyio.to_thread.run_sync(time.sleep, 0.005)
+
+
+async def _main() -> None:
+    """Run the benchmarks and print a table of timings."""
+    print(f'{"case":<36} {"resolve us":>12} {"20 names us":>14}')
+    await _row('async', _async_resolver, 2_000)
+    await _row('sync, worker thread', _sync_resolver, 500)
+    await _row('sync, nonblocking', _inline_resolver, 2_000)
+
+    # Saturate the default limiter with blocking work, as a busy server would.
+    stop = anyio.Event()
+    async with anyio.create_task_group() as tg:
+        for _ in range(int(anyio.to_thread.current_default_thread_limiter().total_tokens)):
+            tg.start_soon(_busy_worker, stop)
+        await anyio.sleep(0.05)
+        await _row('sync, busy default limiter', _sync_resolver, 20)
+        await _row('sync, busy, dedicated limiter', _sync_resolver, 200, anyio.CapacityLimiter(4))
+        await _row('sync, busy, nonblocking', _inline_resolver, 2_000)
+        stop.set()
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    anyio.run(_main)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks for the SQLite-backed prompt store at 100k prompts.
+
+Saves 100,000 prompts to `SqliteStoreSync` in one `save_many` transaction, then
+times listing the first page, a page deep into the listing by cursor, the full
+listing, single loads and a `load_many` batch. A `DirStoreSync` holding the
+same prompts is timed for the operations it supports, and `import_store` is
+timed copying it into a new database.
+
+Usage:
+    python benchmarks/sqlite_store_benchmark.py [COUNT]
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from dotpromptz.stores import DirStoreOptions, DirStoreSync, SqliteStoreSync, import_store
+from dotpromptz.typing import ListPromptsOptions, PromptData
+
+_BODY = 'Hello {{name}}, here is what we know about {{#each topics}}{{this}}, {{/each}} and more.\n' * 10
+_PAGE = 100
+
+
+def _prompts(count: int) -> list[PromptData]:
+    """Build prompts spread over groups. One in ten shares its source with another."""
+    return [
+        PromptData(name=f'group{i % 100}/prompt{i}', source=f'{i - i % 10 if i % 10 == 9 else i} {_BODY}')
+        for i in range(count)
+    ]
+
+
+def _write_tree(directory: Path, prompts: list[PromptData]) -> None:
+    """Write prompts as files, modified a minute ago."""
+    mtime = time.time() - 60
+    for prompt in prompts:
+        path = directory / f'{prompt.name}.prompt'
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(prompt.source or '', encoding='utf-8')
+        os.utime(path, (mtime, mtime))
+
+
+def _ms(fn: Callable[[], Any], number: int = 1) -> float:
+    """Return the best time of a few runs of a call, in milliseconds."""
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1000
+
+
+def _row(operation: str, sqlite_ms: float, dir_ms: float | None = None) -> None:
+    """Print a row of timings."""
+    dir_cell = f'{dir_ms:>12.2f}' if dir_ms is not None else f'{"-":>12}'
+    print(f'{operation:<30} {sqlite_ms:>12.2f} {dir_cell}')
+
+
+def main() -> None:
+    """Run the benchmarks and print a table of timings."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    # Keep per-prompt debug logs out of the timings.
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    prompts = _prompts(count)
+    names = [prompt.name for prompt in prompts[:: max(count // _PAGE, 1)]][:_PAGE]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp) / 'prompts'
+        directory.mkdir()
+        _write_tree(directory, prompts)
+        dir_store = DirStoreSync(DirStoreOptions(directory=directory))
+        dir_store.list()
+
+        store = SqliteStoreSync(Path(tmp) / 'prompts.db')
+        start = time.perf_counter()
+        store.save_many(prompts)
+        save_ms = (time.perf_counter() - start) * 1000
+
+        middle = store.list(ListPromptsOptions(limit=count // 2)).cursor
+        dir_middle = dir_store.list(ListPromptsOptions(limit=count // 2)).cursor
+
+        print(f'{count} prompts')
+        print(f'{"operation (ms)":<30} {"SqliteStore":>12} {"DirStore":>12}')
+        _row('save_many', save_ms)
+        _row(
+            f'list first {_PAGE}',
+            _ms(lambda: store.list(ListPromptsOptions(limit=_PAGE)), 20),
+            _ms(lambda: dir_store.list(ListPromptsOptions(limit=_PAGE))),
+        )
+        _row(
+            f'list {_PAGE} after cursor',
+            _ms(lambda: store.list(ListPromptsOptions(cursor=middle, limit=_PAGE)), 20),
+            _ms(lambda: dir_store.list(ListPromptsOptions(cursor=dir_middle, limit=_PAGE)), 20),
+        )
+        _row('list all', _ms(store.list), _ms(dir_store.list))
+        _row(
+            f'load x{_PAGE}',
+            _ms(lambda: [store.load(name) for name in names], 5),
+            _ms(lambda: [dir_store.load(name) for name in names], 5),
+        )
+        _row(f'load_many {_PAGE}', _ms(lambda: store.load_many(names), 5))
+
+        start = time.perf_counter()
+        import_store(dir_store, SqliteStoreSync(Path(tmp) / 'imported.db'))
+        _row('import_store', (time.perf_counter() - start) * 1000)
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
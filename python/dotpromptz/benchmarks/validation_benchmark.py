@@ -0,0 +1,89 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks for validating prompt input against its input schema.
+
+Compares a validator compiled once and reused, as compiled prompts keep it,
+against compiling the schema for every input, which is what validating with a
+schema-interpreting `validate(instance, schema)` call amounts to.
+
+Usage:
+    python benchmarks/validation_benchmark.py
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from dotpromptz.picoschema import picoschema_to_json_schema_sync
+from dotpromptz.typing import JsonSchema
+from dotpromptz.validation import compile_validator
+
+
+def _schema(fields: int) -> JsonSchema:
+    """Build the input schema of a prompt with string, integer, array and object fields."""
+    picoschema: dict[str, Any] = {}
+    for i in range(fields):
+        if i % 4 == 0:
+            picoschema[f'name{i}'] = 'string, a name'
+        elif i % 4 == 1:
+            picoschema[f'count{i}?'] = 'integer'
+        elif i % 4 == 2:
+            picoschema[f'tags{i}(array)'] = 'string'
+        else:
+            picoschema[f'address{i}(object)'] = {'city': 'string', 'zip?': 'string'}
+    schema = picoschema_to_json_schema_sync(picoschema)
+    assert schema is not None
+    return schema
+
+
+def _input(fields: int) -> dict[str, Any]:
+    """Build a valid input for `_schema`."""
+    values: list[Any] = ['Ada', 3, ['a', 'b'], {'city': 'Paris'}]
+    names = ['name', 'count', 'tags', 'address']
+    return {f'{names[i % 4]}{i}': values[i % 4] for i in range(fields)}
+
+
+def _per_input_us(fn: Callable[[], Any], number: int) -> float:
+    """Return the best time of a few runs, in microseconds per input."""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1_000_000
+
+
+def _row(fields: int) -> None:
+    """Print the timings of validating one input with both approaches."""
+    schema = _schema(fields)
+    value = _input(fields)
+    validate = compile_validator(schema)
+    assert validate(value) == []
+    invalid = {**value, 'name0': 1}
+
+    compiled = _per_input_us(lambda: validate(value), 2_000)
+    compiled_invalid = _per_input_us(lambda: validate(invalid), 2_000)
+    per_call = _per_input_us(lambda: compile_validator(schema)(value), 200)
+    print(f'{fields:>8} {compiled:>13.1f} {compiled_invalid:>15.1f} {per_call:>15.1f} {per_call / compiled:>8.1f}x')
+
+
+def main() -> None:
+    """Run the benchmarks and print a table of timings."""
+    print(f'{"fields":>8} {"compiled us":>13} {"invalid us":>15} {"per-call us":>15} {"speedup":>9}')
+    for fields in (10, 50, 200):
+        _row(fields)
+
+
+if __name__ == '__main__':
+    main()
@@ -14,9 +14,39 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-"""Dotpromptz implements the .prompt templates for Python."""
+"""Dotpromptz implements the .prompt templates for Python.
 
-from .dotprompt import Dotprompt
+Public names are imported lazily on first access, so that importing the package
+(for example, to reach `dotpromptz.typing` or `dotpromptz.stores`) does not pay
+for loading the template engine and its dependencies.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .dotprompt import Dotprompt
+
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    'Dotprompt': '.dotprompt',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including the lazily imported ones."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 
 def package_name() -> str:
@@ -25,5 +55,5 @@ def package_name() -> str:
 
 
 __all__ = [
-    Dotprompt.__name__,
+    'Dotprompt',
 ]
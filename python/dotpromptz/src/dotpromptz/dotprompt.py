@@ -34,32 +34,68 @@ Key features include:
 | Partial Templates    | Registration and management of partial templates.                                       |
 | Model Configuration  | Support for default models and model-specific configurations.                           |
 | Prompt Store         | Integration with a prompt store for loading prompts and partials.                       |
+| Preloading           | Warming compiled prompts, partials, tools and schemas from a store at startup.          |
+| Invalidation         | Dropping cached prompts and partials affected by store changes, for hot reload.         |
+| Input Validation     | Checking render input against the resolved input schema with compiled validators.       |
 | Extensibility        | Designed to be extensible with custom helpers, resolvers, and stores.                   |
 """
 
 from __future__ import annotations
 
+import hashlib
+import inspect
+import json
 import re
-from typing import Any
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, cast
 
 import anyio
 
+from dotpromptz.errors import InputValidationError
 from dotpromptz.helpers import register_all_helpers
-from dotpromptz.parse import parse_document
-from dotpromptz.picoschema import picoschema_to_json_schema
-from dotpromptz.resolvers import resolve_json_schema, resolve_partial, resolve_tool
+from dotpromptz.media import MediaHandles
+from dotpromptz.parse import parse_document, to_messages
+from dotpromptz.picoschema import PicoschemaCache, picoschema_to_json_schema, picoschema_to_json_schema_sync
+from dotpromptz.resolvers import (
+    resolve_json_schema,
+    resolve_json_schema_sync,
+    resolve_json_schemas,
+    resolve_json_schemas_sync,
+    resolve_partials,
+    resolve_partials_sync,
+    resolve_tools,
+    resolve_tools_sync,
+)
 from dotpromptz.typing import (
+    DataArgument,
+    HistoryBudget,
     JsonSchema,
+    ListPartialsOptions,
+    ListPromptsOptions,
+    LoadPartialOptions,
+    LoadPromptOptions,
     ModelConfigT,
     ParsedPrompt,
+    PartialData,
+    PartialRef,
     PartialResolver,
+    PromptData,
     PromptMetadata,
+    PromptRef,
     PromptStore,
+    PromptStoreSync,
+    RenderedPrompt,
     SchemaResolver,
+    StoreChange,
     ToolDefinition,
     ToolResolver,
 )
 from dotpromptz.util import remove_undefined_fields
+from dotpromptz.validation import Validator, compile_validator
 from handlebarrz import EscapeFunction, Handlebars, HelperFn
 
 # Pre-compiled regex for finding partial references in handlebars templates
@@ -113,6 +149,496 @@ def _identify_partials(template: str) -> set[str]:
     return set(_PARTIAL_PATTERN.findall(template))
 
 
+async def _call_store(method: Callable[..., Any], *args: Any) -> Any:
+    """Call a sync or async store method without blocking the event loop.
+
+    Args:
+        method: The bound store method.
+        *args: Arguments to pass to the method.
+
+    Returns:
+        The method's result.
+    """
+    if inspect.iscoroutinefunction(method):
+        return await method(*args)
+    return await anyio.to_thread.run_sync(method, *args)
+
+
+async def _future_result(future: Future[Any], limiter: anyio.CapacityLimiter) -> Any:
+    """Wait for a future from a thread pool without blocking the event loop.
+
+    Args:
+        future: The future to wait for.
+        limiter: Capacity limiter for the thread that waits on the future.
+
+    Returns:
+        The result of the future.
+    """
+    if future.done():
+        await anyio.lowlevel.checkpoint()
+    else:
+        await anyio.to_thread.run_sync(wait, [future], limiter=limiter, abandon_on_cancel=True)
+    return future.result()
+
+
+@dataclass
+class PreloadReport:
+    """Summary of a `Dotprompt.preload` run.
+
+    Attributes:
+        prompts: Number of prompts compiled.
+        partials: Number of partials registered.
+        timings: Wall-clock seconds spent in each phase, in phase order.
+    """
+
+    prompts: int = 0
+    partials: int = 0
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+def _rendered_prompt_fields(metadata: PromptMetadata[ModelConfigT]) -> dict[str, Any]:
+    """Collect the metadata fields carried over into a rendered prompt.
+
+    The input schema is discarded since it no longer makes sense once the
+    template has been rendered.
+
+    Args:
+        metadata: The resolved prompt metadata.
+
+    Returns:
+        The metadata fields keyed by field name.
+    """
+    return {key: value for key, value in metadata if key != 'input' and value is not None}
+
+
+def _input_schema(metadata: PromptMetadata[ModelConfigT] | None) -> Any:
+    """Return the resolved input schema of a prompt, if any."""
+    return metadata.input.schema_ if metadata is not None and metadata.input is not None else None
+
+
+def _merge_options(
+    *options: PromptMetadata[ModelConfigT] | None,
+) -> PromptMetadata[ModelConfigT] | None:
+    """Merge the render options of a prompt, later ones overriding earlier ones.
+
+    Args:
+        options: The options to merge; None entries are skipped.
+
+    Returns:
+        The merged options, or None if none were given.
+    """
+    merged: PromptMetadata[ModelConfigT] | None = None
+    for option in options:
+        if option is not None:
+            merged = option if merged is None else _merge_metadata(merged, option)
+    return merged
+
+
+def _render_input(data: DataArgument[Any], options: PromptMetadata[ModelConfigT] | None = None) -> dict[str, Any]:
+    """Merge the input of a render with the input defaults of its options.
+
+    Args:
+        data: The runtime data to render the template with.
+        options: Optional metadata supplying input defaults.
+
+    Returns:
+        The input the template is rendered with.
+    """
+    defaults = options.input.default if options and options.input and options.input.default else {}
+    return {**defaults, **(data.input or {})}
+
+
+class _ValidatorCache:
+    """Compiled input validators shared by the prompts of a `Dotprompt`.
+
+    Validators are keyed by a hash of the canonical JSON form of their
+    schema, so a schema is compiled once however many times it is resolved.
+    The least recently used validators are dropped once `maxsize` is reached.
+    """
+
+    __slots__ = ('_maxsize', '_validators')
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of validators to keep.
+        """
+        self._maxsize = maxsize
+        self._validators: OrderedDict[str, Validator] = OrderedDict()
+
+    def get(self, schema: Any) -> Validator | None:
+        """Return the validator for a resolved input schema.
+
+        Args:
+            schema: The resolved input schema, or None.
+
+        Returns:
+            The compiled validator, or None if there is no schema.
+        """
+        if schema is None:
+            return None
+        try:
+            canonical = json.dumps(schema, separators=(',', ':'), ensure_ascii=False)
+        except (TypeError, ValueError):
+            return compile_validator(schema)
+        key = hashlib.sha1(canonical.encode('utf-8'), usedforsecurity=False).hexdigest()
+        validator = self._validators.get(key)
+        if validator is not None:
+            self._validators.move_to_end(key)
+            return validator
+        validator = self._validators[key] = compile_validator(schema)
+        if len(self._validators) > self._maxsize:
+            self._validators.popitem(last=False)
+        return validator
+
+
+def _render_prompt(
+    render_string: Callable[[dict[str, Any]], str],
+    fields: dict[str, Any],
+    data: DataArgument[Any],
+    options: PromptMetadata[ModelConfigT] | None = None,
+    history_budget: HistoryBudget | None = None,
+    validator: Validator | None = None,
+) -> RenderedPrompt[ModelConfigT]:
+    """Render a compiled template against already resolved metadata.
+
+    Args:
+        render_string: The compiled template function.
+        fields: The metadata fields as returned by `_rendered_prompt_fields`.
+        data: The runtime data to render the template with.
+        options: Optional metadata supplying input defaults.
+        history_budget: Optional token budget to fit the history into.
+        validator: Optional validator to check the input with before rendering.
+
+    Returns:
+        The rendered prompt.
+
+    Raises:
+        InputValidationError: If the input does not pass the validator.
+    """
+    render_input = _render_input(data, options)
+    if validator is not None:
+        errors = validator(render_input)
+        if errors:
+            raise InputValidationError(errors)
+    # Media is set aside so that only short handles go through the template.
+    media = MediaHandles()
+    context = media.extract(render_input)
+    rendered_string = render_string(context)
+    messages = to_messages(rendered_string, data, history_budget=history_budget, media=media)
+    return RenderedPrompt[ModelConfigT](**fields, messages=messages)
+
+
+class _CompiledPrompt:
+    """State shared by the async and sync compiled prompts.
+
+    Metadata resolved without call options is kept until the tools or schemas
+    of the `Dotprompt` change; calls with options resolve it afresh.
+    """
+
+    def __init__(
+        self,
+        dotprompt: Dotprompt,
+        prompt: ParsedPrompt[Any],
+        render_string: Callable[[dict[str, Any]], str],
+        metadata: PromptMetadata[Any] | None = None,
+        options: PromptMetadata[Any] | None = None,
+    ) -> None:
+        """Initialize the compiled prompt.
+
+        Args:
+            dotprompt: The Dotprompt instance that compiled the prompt.
+            prompt: The parsed prompt.
+            render_string: The compiled template function.
+            metadata: Already resolved metadata for the prompt. When omitted,
+                metadata is resolved on the first call.
+            options: Metadata merged over the prompt's own on every call.
+        """
+        self.prompt = prompt
+        self._dotprompt = dotprompt
+        self._render_string = render_string
+        self._options = options
+        self._fields: dict[str, Any] | None = None
+        self._input_schema: Any = None
+        self._input_validator: Validator | None = None
+        self._generation = -1
+        if metadata is not None:
+            self._keep(metadata)
+
+    def _keep(self, metadata: PromptMetadata[Any]) -> tuple[dict[str, Any], Any]:
+        """Keep the metadata resolved without call options.
+
+        Args:
+            metadata: The resolved metadata.
+
+        Returns:
+            The rendered prompt fields and input schema of the metadata.
+        """
+        self._fields = _rendered_prompt_fields(metadata)
+        self._input_schema = _input_schema(metadata)
+        self._input_validator = None
+        self._generation = self._dotprompt._metadata_generation
+        return self._fields, self._input_schema
+
+    def _kept(self) -> tuple[dict[str, Any], Any] | None:
+        """Return the kept fields and input schema, unless they are outdated."""
+        if self._fields is None or self._generation != self._dotprompt._metadata_generation:
+            return None
+        return self._fields, self._input_schema
+
+    def _validator(self, schema: Any) -> Validator | None:
+        """Return the validator for a resolved input schema.
+
+        Args:
+            schema: The resolved input schema, or None.
+
+        Returns:
+            The compiled validator, or None if there is no schema.
+        """
+        if schema is not self._input_schema:
+            return self._dotprompt._validators.get(schema)
+        if self._input_validator is None:
+            self._input_validator = self._dotprompt._validators.get(schema)
+        return self._input_validator
+
+
+class _PromptFunction(_CompiledPrompt):
+    """A compiled prompt implementing the `PromptFunction` protocol."""
+
+    async def _resolve(self, options: PromptMetadata[Any] | None) -> tuple[dict[str, Any], Any]:
+        """Resolve the rendered prompt fields and input schema for a call.
+
+        Args:
+            options: The options of the call.
+
+        Returns:
+            The metadata fields and the resolved input schema.
+        """
+        if options is not None:
+            metadata = await self._dotprompt.render_metadata(self.prompt, _merge_options(self._options, options))
+            return _rendered_prompt_fields(metadata), _input_schema(metadata)
+        kept = self._kept()
+        if kept is None:
+            kept = self._keep(await self._dotprompt.render_metadata(self.prompt, self._options))
+        return kept
+
+    async def __call__(
+        self,
+        data: DataArgument[Any],
+        options: PromptMetadata[Any] | None = None,
+    ) -> RenderedPrompt[Any]:
+        """Render the prompt.
+
+        Args:
+            data: The runtime data to render the template with.
+            options: Optional metadata merged over the prompt's own, also
+                supplying input defaults.
+
+        Returns:
+            The rendered prompt.
+
+        Raises:
+            InputValidationError: If input validation is enabled and the input
+                does not match the input schema.
+        """
+        fields, schema = await self._resolve(options)
+        validator = self._validator(schema) if self._dotprompt._validate_input else None
+        return _render_prompt(
+            self._render_string,
+            fields,
+            data,
+            _merge_options(self._options, options),
+            self._dotprompt._history_budget,
+            validator,
+        )
+
+    async def validate_input(
+        self,
+        data: DataArgument[Any],
+        options: PromptMetadata[Any] | None = None,
+    ) -> list[str]:
+        """Check the input of a render against the prompt's input schema.
+
+        Args:
+            data: The runtime data to render the template with.
+            options: Optional metadata supplying input defaults.
+
+        Returns:
+            The validation errors; empty if the input is valid.
+        """
+        return (await self.validate_inputs([data], options))[0]
+
+    async def validate_inputs(
+        self,
+        batch: Iterable[DataArgument[Any]],
+        options: PromptMetadata[Any] | None = None,
+    ) -> list[list[str]]:
+        """Check the inputs of many renders against the prompt's input schema.
+
+        The schema is resolved and its validator looked up once for the
+        whole batch.
+
+        Args:
+            batch: The runtime data of the renders.
+            options: Optional metadata supplying input defaults.
+
+        Returns:
+            The validation errors of each input, in order; empty for valid
+            inputs.
+        """
+        _, schema = await self._resolve(options)
+        validator = self._validator(schema)
+        if validator is None:
+            return [[] for _ in batch]
+        options = _merge_options(self._options, options)
+        return [validator(_render_input(data, options)) for data in batch]
+
+
+class _PromptFunctionSync(_CompiledPrompt):
+    """A compiled prompt that renders synchronously."""
+
+    def _resolve(self, options: PromptMetadata[Any] | None) -> tuple[dict[str, Any], Any]:
+        """Resolve the rendered prompt fields and input schema for a call.
+
+        Args:
+            options: The options of the call.
+
+        Returns:
+            The metadata fields and the resolved input schema.
+        """
+        if options is not None:
+            metadata = self._dotprompt.render_metadata_sync(self.prompt, _merge_options(self._options, options))
+            return _rendered_prompt_fields(metadata), _input_schema(metadata)
+        kept = self._kept()
+        if kept is None:
+            kept = self._keep(self._dotprompt.render_metadata_sync(self.prompt, self._options))
+        return kept
+
+    def __call__(
+        self,
+        data: DataArgument[Any],
+        options: PromptMetadata[Any] | None = None,
+    ) -> RenderedPrompt[Any]:
+        """Render the prompt.
+
+        Args:
+            data: The runtime data to render the template with.
+            options: Optional metadata merged over the prompt's own, also
+                supplying input defaults.
+
+        Returns:
+            The rendered prompt.
+
+        Raises:
+            InputValidationError: If input validation is enabled and the input
+                does not match the input schema.
+        """
+        fields, schema = self._resolve(options)
+        validator = self._validator(schema) if self._dotprompt._validate_input else None
+        return _render_prompt(
+            self._render_string,
+            fields,
+            data,
+            _merge_options(self._options, options),
+            self._dotprompt._history_budget,
+            validator,
+        )
+
+    def validate_input(
+        self,
+        data: DataArgument[Any],
+        options: PromptMetadata[Any] | None = None,
+    ) -> list[str]:
+        """Check the input of a render against the prompt's input schema.
+
+        Args:
+            data: The runtime data to render the template with.
+            options: Optional metadata supplying input defaults.
+
+        Returns:
+            The validation errors; empty if the input is valid.
+        """
+        return self.validate_inputs([data], options)[0]
+
+    def validate_inputs(
+        self,
+        batch: Iterable[DataArgument[Any]],
+        options: PromptMetadata[Any] | None = None,
+    ) -> list[list[str]]:
+        """Check the inputs of many renders against the prompt's input schema.
+
+        Args:
+            batch: The runtime data of the renders.
+            options: Optional metadata supplying input defaults.
+
+        Returns:
+            The validation errors of each input, in order; empty for valid
+            inputs.
+        """
+        _, schema = self._resolve(options)
+        validator = self._validator(schema)
+        if validator is None:
+            return [[] for _ in batch]
+        options = _merge_options(self._options, options)
+        return [validator(_render_input(data, options)) for data in batch]
+
+
+class _SchemaLookup:
+    """Resolves named schemas for a `Dotprompt`, many at a time if asked.
+
+    Local schemas are used first; the rest go to the schema resolver in one
+    batch when it implements `resolve_many`.
+    """
+
+    __slots__ = ('_dotprompt',)
+    # Calling the lookup only creates a coroutine, so it is marked the way
+    # `nonblocking` marks resolvers, to be called inline on the event loop.
+    __dotprompt_nonblocking__ = True
+
+    def __init__(self, dotprompt: Dotprompt) -> None:
+        self._dotprompt = dotprompt
+
+    async def __call__(self, name: str) -> JsonSchema | None:
+        """Resolve a single schema."""
+        return await self._dotprompt._wrapped_schema_resolver(name)
+
+    async def resolve_many(self, names: list[str]) -> dict[str, JsonSchema]:
+        """Resolve many schemas, calling the schema resolver at most once."""
+        local = self._dotprompt._schemas
+        found = {name: local[name] for name in names if name in local}
+        rest = [name for name in names if name not in local]
+        if rest and self._dotprompt._schema_resolver is not None:
+            found.update(
+                await resolve_json_schemas(
+                    rest, self._dotprompt._schema_resolver, limiter=self._dotprompt._resolver_limiter
+                )
+            )
+        return found
+
+
+class _SchemaLookupSync:
+    """Synchronous counterpart of `_SchemaLookup`."""
+
+    __slots__ = ('_dotprompt',)
+
+    def __init__(self, dotprompt: Dotprompt) -> None:
+        self._dotprompt = dotprompt
+
+    def __call__(self, name: str) -> JsonSchema | None:
+        """Resolve a single schema."""
+        return self._dotprompt._wrapped_schema_resolver_sync(name)
+
+    def resolve_many(self, names: list[str]) -> dict[str, JsonSchema]:
+        """Resolve many schemas, calling the schema resolver at most once."""
+        local = self._dotprompt._schemas
+        found = {name: local[name] for name in names if name in local}
+        rest = [name for name in names if name not in local]
+        if rest and self._dotprompt._schema_resolver is not None:
+            found.update(resolve_json_schemas_sync(rest, self._dotprompt._schema_resolver))
+        return found
+
+
 class Dotprompt:
     """Dotprompt extends a Handlebars template for use with Gen AI prompts."""
 
@@ -128,6 +654,10 @@ class Dotprompt:
         schema_resolver: SchemaResolver | None = None,
         partial_resolver: PartialResolver | None = None,
         escape_fn: EscapeFunction = EscapeFunction.NO_ESCAPE,
+        history_budget: HistoryBudget | None = None,
+        validate_input: bool = False,
+        use_schema_defs: bool = False,
+        resolver_limiter: anyio.CapacityLimiter | None = None,
     ) -> None:
         """Initialize Dotprompt with a Handlebars template.
 
@@ -142,6 +672,18 @@ class Dotprompt:
             schema_resolver: resolver for schema names to JSON schema definitions.
             partial_resolver: resolver for partial names to their content.
             escape_fn: escape function to use for the template.
+            history_budget: Token budget for rendered prompts. Older history
+                messages are left out of renders that would exceed it.
+            validate_input: Check the input of every render against the
+                prompt's input schema, raising `InputValidationError` before
+                rendering invalid input.
+            use_schema_defs: Emit named schemas that a Picoschema refers to more
+                than once under `$defs`, and refer to them with `$ref`, instead
+                of inlining a copy each time.
+            resolver_limiter: Capacity limiter for running synchronous
+                resolvers in worker threads, keeping blocking resolvers from
+                competing with other work for anyio's default limiter.
+                Resolvers marked with `nonblocking` run inline regardless.
         """
         self._handlebars: Handlebars = Handlebars(escape_fn=escape_fn)
 
@@ -154,8 +696,23 @@ class Dotprompt:
         self._tool_resolver: ToolResolver | None = tool_resolver
         self._schemas: dict[str, JsonSchema] = schemas or {}
         self._schema_resolver: SchemaResolver | None = schema_resolver
+        self._schema_lookup = _SchemaLookup(self)
+        self._schema_lookup_sync = _SchemaLookupSync(self)
+        self._picoschema_cache = PicoschemaCache()
+        self._validators = _ValidatorCache()
+        # Bumped whenever tools or schemas change, so that compiled prompts
+        # know to resolve the metadata they keep again.
+        self._metadata_generation = 0
         self._partial_resolver: PartialResolver | None = partial_resolver
-        self._store: PromptStore | None = None
+        self._history_budget: HistoryBudget | None = history_budget
+        self._validate_input = validate_input
+        self._use_schema_defs = use_schema_defs
+        self._resolver_limiter = resolver_limiter
+        self._store: PromptStore | PromptStoreSync | None = None
+        self._compiled_prompts: dict[tuple[str, str | None], _PromptFunction] = {}
+        self._prompt_partials: dict[tuple[str, str | None], set[str]] = {}
+        self._partial_sources: dict[str, str] = dict(self._partials)
+        self._stale_partials: set[str] = set()
 
         self._register_initial_helpers()
         self._register_initial_partials()
@@ -197,6 +754,8 @@ class Dotprompt:
             The Dotprompt instance.
         """
         self._handlebars.register_partial(name, source)
+        self._partial_sources[name] = source
+        self._stale_partials.discard(name)
         return self
 
     def define_tool(self, definition: ToolDefinition) -> Dotprompt:
@@ -209,8 +768,43 @@ class Dotprompt:
             The Dotprompt instance.
         """
         self._tools[definition.name] = definition
+        self._metadata_generation += 1
+        return self
+
+    def define_schema(self, name: str, schema: JsonSchema) -> Dotprompt:
+        """Define a named schema for the template.
+
+        Cached conversions and compiled prompts that may depend on an earlier
+        definition of the schema are invalidated.
+
+        Args:
+            name: The name of the schema.
+            schema: The JSON schema definition.
+
+        Returns:
+            The Dotprompt instance.
+        """
+        self._schemas[name] = schema
+        self.invalidate_schemas([name])
         return self
 
+    def invalidate_schemas(self, names: Iterable[str] | None = None) -> None:
+        """Forget what was derived from named schemas that have changed.
+
+        Picoschema conversions are cached, so call this when the schema
+        resolver starts returning a different schema for a name. Conversions
+        that resolved one of the names are dropped, as are all compiled
+        prompts, whose resolved metadata may include them.
+
+        Args:
+            names: The names of the changed schemas, or None if any schema
+                may have changed.
+        """
+        self._picoschema_cache.invalidate(names)
+        self._metadata_generation += 1
+        self._compiled_prompts.clear()
+        self._prompt_partials.clear()
+
     def parse(self, source: str) -> ParsedPrompt[Any]:
         """Parse a prompt from a string.
 
@@ -222,6 +816,405 @@ class Dotprompt:
         """
         return parse_document(source)
 
+    async def preload(self, store: PromptStore | PromptStoreSync, concurrency: int = 32) -> PreloadReport:
+        """Warm all prompts and partials from a store ahead of rendering.
+
+        Lists and loads every prompt and partial concurrently, registers the
+        partials, parses the prompts, resolves their tools and schemas, and
+        compiles their templates. The compiled prompts are served by
+        `get_prompt` without touching the store again, and the store is kept
+        as the fallback for resolving partials.
+
+        Sync stores are called on worker threads.
+
+        Args:
+            store: The store to load prompts and partials from.
+            concurrency: Maximum number of concurrent store loads and metadata
+                resolutions.
+
+        Returns:
+            The number of prompts and partials loaded and the time spent in
+            each phase (`list`, `load`, `partials`, `parse`, `metadata` and
+            `compile`).
+        """
+        self._store = store
+        report = PreloadReport()
+        limiter = anyio.CapacityLimiter(concurrency)
+
+        started = time.perf_counter()
+
+        def end_phase(name: str) -> None:
+            nonlocal started
+            now = time.perf_counter()
+            report.timings[name] = now - started
+            started = now
+
+        prompt_refs: list[PromptRef] = []
+        partial_refs: list[PartialRef] = []
+
+        async def list_prompts() -> None:
+            cursor: str | None = None
+            while True:
+                page = await _call_store(store.list, ListPromptsOptions(cursor=cursor))
+                prompt_refs.extend(page.prompts)
+                cursor = page.cursor
+                if not cursor:
+                    break
+
+        async def list_partials() -> None:
+            cursor: str | None = None
+            while True:
+                page = await _call_store(store.list_partials, ListPartialsOptions(cursor=cursor))
+                partial_refs.extend(page.partials)
+                cursor = page.cursor
+                if not cursor:
+                    break
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(list_prompts)
+            tg.start_soon(list_partials)
+        end_phase('list')
+
+        prompts: list[PromptData | None] = [None] * len(prompt_refs)
+        partials: list[PartialData | None] = [None] * len(partial_refs)
+
+        async def load_prompt(index: int, ref: PromptRef) -> None:
+            async with limiter:
+                prompts[index] = await _call_store(store.load, ref.name, LoadPromptOptions(variant=ref.variant))
+
+        async def load_partial(index: int, ref: PartialRef) -> None:
+            async with limiter:
+                partials[index] = await _call_store(
+                    store.load_partial, ref.name, LoadPartialOptions(variant=ref.variant)
+                )
+
+        async with anyio.create_task_group() as tg:
+            for index, prompt_ref in enumerate(prompt_refs):
+                tg.start_soon(load_prompt, index, prompt_ref)
+            for index, partial_ref in enumerate(partial_refs):
+                tg.start_soon(load_partial, index, partial_ref)
+        end_phase('load')
+
+        # Handlebars partials have no notion of variants, so only the default
+        # variant of each partial is registered.
+        for partial in partials:
+            if partial is not None and partial.variant is None:
+                self.define_partial(partial.name, partial.source)
+                report.partials += 1
+        end_phase('partials')
+
+        parsed: dict[tuple[str, str | None], ParsedPrompt[Any]] = {
+            (data.name, data.variant): self.parse(data.source) for data in prompts if data is not None
+        }
+        end_phase('parse')
+
+        metadata: dict[tuple[str, str | None], PromptMetadata[Any]] = {}
+
+        async def resolve_metadata(key: tuple[str, str | None], prompt: ParsedPrompt[Any]) -> None:
+            async with limiter:
+                metadata[key] = await self.render_metadata(prompt)
+
+        async with anyio.create_task_group() as tg:
+            for key, prompt in parsed.items():
+                tg.start_soon(resolve_metadata, key, prompt)
+        end_phase('metadata')
+
+        for key, prompt in parsed.items():
+            await self._resolve_partials(prompt.template)
+            self._compiled_prompts[key] = _PromptFunction(
+                self, prompt, self._compile_template(prompt.template), metadata[key]
+            )
+            self._prompt_partials[key] = self._partial_closure(prompt.template)
+            report.prompts += 1
+        end_phase('compile')
+
+        return report
+
+    async def get_prompt(self, name: str, variant: str | None = None) -> _PromptFunction:
+        """Get a compiled prompt by reference.
+
+        Prompts warmed by `preload` are returned directly. Otherwise the prompt
+        is loaded from the store, compiled with its metadata resolved, and
+        kept for later calls.
+
+        Args:
+            name: The name of the prompt.
+            variant: The variant of the prompt.
+
+        Returns:
+            The compiled prompt.
+
+        Raises:
+            ValueError: If the prompt has not been preloaded and no store is
+                configured.
+        """
+        key = (name, variant)
+        renderer = self._compiled_prompts.get(key)
+        if renderer is not None:
+            return renderer
+
+        if self._store is None:
+            raise ValueError(f"Prompt '{name}' is not loaded and no prompt store is configured")
+
+        data = await _call_store(self._store.load, name, LoadPromptOptions(variant=variant))
+        prompt = self.parse(data.source)
+        await self._resolve_partials(prompt.template)
+        metadata = await self.render_metadata(prompt)
+        renderer = _PromptFunction(self, prompt, self._compile_template(prompt.template), metadata)
+        self._compiled_prompts[key] = renderer
+        self._prompt_partials[key] = self._partial_closure(prompt.template)
+        return renderer
+
+    def invalidate(self, changes: Iterable[StoreChange]) -> None:
+        """Drop cached state affected by changes to prompts and partials.
+
+        A changed prompt is evicted from the compiled prompt cache. A changed
+        partial, and any partial including it, is marked for reloading from
+        the partial resolver or store, and every cached prompt that includes
+        it, directly or through other partials, is evicted. Evicted prompts
+        are recompiled by the next `get_prompt` call. Partial variants are
+        ignored, since only the default variant of a partial is ever
+        registered.
+
+        Args:
+            changes: The changes reported by a store, e.g. `DirStore.watch`.
+
+        Examples:
+            ```python
+            async for changes in store.watch():
+                dotprompt.invalidate(changes)
+            ```
+        """
+        for change in changes:
+            if change.kind == 'prompt':
+                self._forget_prompt((change.name, change.variant))
+                continue
+            if change.variant is not None:
+                continue
+            if change.name in self._partial_sources:
+                # Partials that include the changed one are reloaded too, so
+                # that resolving a prompt's partials reaches the changed one.
+                self._stale_partials.add(change.name)
+                self._stale_partials.update(
+                    name
+                    for name, source in self._partial_sources.items()
+                    if change.name in self._partial_closure(source)
+                )
+            for key, partials in list(self._prompt_partials.items()):
+                if change.name in partials:
+                    self._forget_prompt(key)
+
+    def _forget_prompt(self, key: tuple[str, str | None]) -> None:
+        """Evict a prompt from the compiled prompt cache.
+
+        Args:
+            key: The name and variant of the prompt.
+        """
+        self._compiled_prompts.pop(key, None)
+        self._prompt_partials.pop(key, None)
+
+    def _partial_closure(self, template: str) -> set[str]:
+        """Find every partial a template includes, directly or transitively.
+
+        Args:
+            template: The template to inspect.
+
+        Returns:
+            The names of the included partials.
+        """
+        found: set[str] = set()
+        pending = [template]
+        while pending:
+            for name in _identify_partials(pending.pop()):
+                if name not in found:
+                    found.add(name)
+                    source = self._partial_sources.get(name)
+                    if source is not None:
+                        pending.append(source)
+        return found
+
+    async def render(
+        self,
+        source: str,
+        data: DataArgument[Any] | None = None,
+        options: PromptMetadata[ModelConfigT] | None = None,
+    ) -> RenderedPrompt[ModelConfigT]:
+        """Render a prompt template with the provided data.
+
+        Args:
+            source: The template source string to render.
+            data: The data to use when rendering the template.
+            options: Additional metadata and options for rendering.
+
+        Returns:
+            The rendered prompt.
+        """
+        renderer = await self.compile(source)
+        return await renderer(data or DataArgument[Any](), options)
+
+    def render_sync(
+        self,
+        source: str,
+        data: DataArgument[Any] | None = None,
+        options: PromptMetadata[ModelConfigT] | None = None,
+    ) -> RenderedPrompt[ModelConfigT]:
+        """Render a prompt template with the provided data synchronously.
+
+        Resolvers and the store are called directly on the calling thread
+        without an event loop, so they must all be synchronous.
+
+        Args:
+            source: The template source string to render.
+            data: The data to use when rendering the template.
+            options: Additional metadata and options for rendering.
+
+        Returns:
+            The rendered prompt.
+
+        Raises:
+            TypeError: If a resolver or the store is asynchronous.
+        """
+        renderer = self.compile_sync(source)
+        return renderer(data or DataArgument[Any](), options)
+
+    async def render_many(
+        self,
+        source: str | ParsedPrompt[ModelConfigT],
+        inputs: Iterable[DataArgument[Any]],
+        options: PromptMetadata[ModelConfigT] | None = None,
+        concurrency: int = 1,
+    ) -> AsyncIterator[RenderedPrompt[ModelConfigT]]:
+        """Render a single prompt template against many inputs.
+
+        Partials, metadata, tools and schemas are resolved once up front and
+        only the template itself is rendered per input. Inputs are consumed
+        lazily and at most `concurrency` of them are held in memory at a time,
+        so `inputs` may be an arbitrarily long iterator.
+
+        With a `concurrency` of 1, templates are rendered on the calling thread
+        and the event loop is given a chance to run other tasks between inputs.
+        With a higher `concurrency`, up to that many inputs are rendered at once
+        on a pool of worker threads, and each result is yielded as soon as the
+        inputs before it are done. The template engine holds the GIL while
+        rendering, so this only pays off for templates whose helpers block,
+        for example on I/O; see `benchmarks/render_many_benchmark.py`.
+
+        Args:
+            source: The template source or a parsed prompt.
+            inputs: The data arguments to render the template with.
+            options: Additional metadata and options for rendering.
+            concurrency: Maximum number of inputs rendered at the same time.
+
+        Yields:
+            The rendered prompts, in the same order as `inputs`.
+
+        Raises:
+            ValueError: If `concurrency` is less than 1.
+            InputValidationError: If input validation is enabled and an input
+                does not match the input schema.
+        """
+        if concurrency < 1:
+            raise ValueError(f'concurrency must be at least 1, got {concurrency}')
+
+        renderer = await self.compile(source)
+        metadata = await self.render_metadata(renderer.prompt, options)
+        fields = _rendered_prompt_fields(metadata)
+        validator = self._validators.get(_input_schema(metadata)) if self._validate_input else None
+
+        def render_one(data: DataArgument[Any]) -> RenderedPrompt[ModelConfigT]:
+            return _render_prompt(renderer._render_string, fields, data, options, self._history_budget, validator)
+
+        if concurrency == 1:
+            for data in inputs:
+                yield render_one(data)
+                await anyio.lowlevel.checkpoint()
+            return
+
+        # Renders are awaited in input order, but a slow input only holds
+        # back the results after it, not the renders already under way.
+        waiter = anyio.CapacityLimiter(1)
+        pending: deque[Future[RenderedPrompt[ModelConfigT]]] = deque()
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='dotprompt-render') as executor:
+            try:
+                for data in inputs:
+                    pending.append(executor.submit(render_one, data))
+                    if len(pending) == concurrency:
+                        yield await _future_result(pending.popleft(), waiter)
+                while pending:
+                    yield await _future_result(pending.popleft(), waiter)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    async def compile(
+        self,
+        source: str | ParsedPrompt[ModelConfigT],
+        additional_metadata: PromptMetadata[ModelConfigT] | None = None,
+    ) -> _PromptFunction:
+        """Compile a template into a reusable function for rendering prompts.
+
+        Args:
+            source: The template source or parsed prompt to compile.
+            additional_metadata: Additional metadata merged over the
+                prompt's own on every render.
+
+        Returns:
+            A function for rendering the template.
+        """
+        prompt = self.parse(source) if isinstance(source, str) else source
+
+        # Resolve all partials before compilation.
+        await self._resolve_partials(prompt.template)
+
+        return _PromptFunction(self, prompt, self._compile_template(prompt.template), options=additional_metadata)
+
+    def compile_sync(
+        self,
+        source: str | ParsedPrompt[ModelConfigT],
+        additional_metadata: PromptMetadata[ModelConfigT] | None = None,
+    ) -> _PromptFunctionSync:
+        """Compile a template into a reusable synchronous render function.
+
+        Args:
+            source: The template source or parsed prompt to compile.
+            additional_metadata: Additional metadata merged over the
+                prompt's own on every render.
+
+        Returns:
+            A function for rendering the template synchronously.
+
+        Raises:
+            TypeError: If the partial resolver or the store is asynchronous.
+        """
+        prompt = self.parse(source) if isinstance(source, str) else source
+
+        # Resolve all partials before compilation.
+        self._resolve_partials_sync(prompt.template)
+
+        return _PromptFunctionSync(self, prompt, self._compile_template(prompt.template), options=additional_metadata)
+
+    def _compile_template(self, template: str) -> Callable[[dict[str, Any]], str]:
+        """Register a template once and return a function rendering it.
+
+        The template is registered under a name derived from its content, so
+        repeated renders skip re-parsing it.
+
+        Args:
+            template: The template body.
+
+        Returns:
+            A function rendering the template with a context.
+        """
+        digest = hashlib.sha1(template.encode('utf-8'), usedforsecurity=False).hexdigest()
+        template_name = f'__dotprompt_{digest}'
+        if not self._handlebars.has_template(template_name):
+            self._handlebars.register_template(template_name, template)
+
+        def render_string(context: dict[str, Any]) -> str:
+            return self._handlebars.render(template_name, context)
+
+        return render_string
+
     async def render_metadata(
         self,
         source: str | ParsedPrompt[ModelConfigT],
@@ -237,22 +1230,66 @@ class Dotprompt:
             The rendered metadata.
         """
         prompt = self.parse(source) if isinstance(source, str) else source
+        return await self._resolve_metadata(
+            self._base_metadata(prompt, additional_metadata),
+            prompt,
+            additional_metadata,
+        )
+
+    def render_metadata_sync(
+        self,
+        source: str | ParsedPrompt[ModelConfigT],
+        additional_metadata: PromptMetadata[ModelConfigT] | None = None,
+    ) -> PromptMetadata[ModelConfigT]:
+        """Render metadata for a prompt synchronously.
+
+        Tool and schema resolvers are called directly on the calling thread
+        without an event loop, so they must be synchronous.
+
+        Args:
+            source: The source code for the prompt or a parsed prompt.
+            additional_metadata: Additional metadata to be used to render the prompt.
+
+        Returns:
+            The rendered metadata.
+
+        Raises:
+            TypeError: If a tool or schema resolver is asynchronous.
+        """
+        prompt = self.parse(source) if isinstance(source, str) else source
+        return self._resolve_metadata_sync(
+            self._base_metadata(prompt, additional_metadata),
+            prompt,
+            additional_metadata,
+        )
+
+    def _base_metadata(
+        self,
+        prompt: ParsedPrompt[ModelConfigT],
+        additional_metadata: PromptMetadata[ModelConfigT] | None = None,
+    ) -> PromptMetadata[ModelConfigT]:
+        """Build the base metadata holding the model config for a prompt.
 
+        Args:
+            prompt: The parsed prompt.
+            additional_metadata: Additional metadata to be used to render the prompt.
+
+        Returns:
+            The base metadata to merge the prompt metadata into.
+        """
         default_model = prompt.model or self._default_model
-        model = additional_metadata.model if additional_metadata else default_model
+        model = (additional_metadata.model if additional_metadata else None) or default_model
 
         config: ModelConfigT | None = None
         if model is not None and self._model_configs.get(model) is not None:
             config = self._model_configs.get(model)
 
-        return await self._resolve_metadata(
+        return (
             PromptMetadata[ModelConfigT](
                 config=config,
             )
             if config is not None
-            else PromptMetadata[ModelConfigT](),
-            prompt,
-            additional_metadata,
+            else PromptMetadata[ModelConfigT]()
         )
 
     async def _resolve_metadata(
@@ -262,6 +1299,43 @@ class Dotprompt:
 
         Later metadata objects override earlier ones.
 
+        Args:
+            base: The base metadata object.
+            merges: Additional metadata objects to merge into base.
+
+        Returns:
+            Merged metadata.
+        """
+        out = self._merge_all_metadata(base, *merges)
+        # TODO: can this be done concurrently?
+        out = await self._resolve_tools(out)
+        out = await self._render_picoschema(out)
+        return out
+
+    def _resolve_metadata_sync(
+        self, base: PromptMetadata[ModelConfigT], *merges: PromptMetadata[ModelConfigT] | None
+    ) -> PromptMetadata[ModelConfigT]:
+        """Merges multiple metadata objects, resolving tools and schemas synchronously.
+
+        Later metadata objects override earlier ones.
+
+        Args:
+            base: The base metadata object.
+            merges: Additional metadata objects to merge into base.
+
+        Returns:
+            Merged metadata.
+        """
+        out = self._merge_all_metadata(base, *merges)
+        out = self._resolve_tools_sync(out)
+        out = self._render_picoschema_sync(out)
+        return out
+
+    def _merge_all_metadata(
+        self, base: PromptMetadata[ModelConfigT], *merges: PromptMetadata[ModelConfigT] | None
+    ) -> PromptMetadata[ModelConfigT]:
+        """Merges multiple metadata objects without resolving anything.
+
         Args:
             base: The base metadata object.
             merges: Additional metadata objects to merge into base.
@@ -279,11 +1353,7 @@ class Dotprompt:
         if hasattr(out, 'template'):
             delattr(out, 'template')
 
-        out = remove_undefined_fields(out)
-        # TODO: can this be done concurrently?
-        out = await self._resolve_tools(out)
-        out = await self._render_picoschema(out)
-        return out
+        return cast(PromptMetadata[ModelConfigT], remove_undefined_fields(out))
 
     async def _render_picoschema(self, meta: PromptMetadata[ModelConfigT]) -> PromptMetadata[ModelConfigT]:
         """Render a Picoschema prompt.
@@ -306,14 +1376,18 @@ class Dotprompt:
             if new_meta.input is not None:
                 new_meta.input.schema_ = await picoschema_to_json_schema(
                     schema_to_process,
-                    self._wrapped_schema_resolver,
+                    self._schema_lookup,
+                    self._picoschema_cache,
+                    self._use_schema_defs,
                 )
 
         async def _process_output_schema(schema_to_process: Any) -> None:
             if new_meta.output is not None:
                 new_meta.output.schema_ = await picoschema_to_json_schema(
                     schema_to_process,
-                    self._wrapped_schema_resolver,
+                    self._schema_lookup,
+                    self._picoschema_cache,
+                    self._use_schema_defs,
                 )
 
         async with anyio.create_task_group() as tg:
@@ -326,6 +1400,38 @@ class Dotprompt:
 
         return new_meta
 
+    def _render_picoschema_sync(self, meta: PromptMetadata[ModelConfigT]) -> PromptMetadata[ModelConfigT]:
+        """Render a Picoschema prompt synchronously.
+
+        Args:
+            meta: The prompt metadata.
+
+        Returns:
+            The rendered prompt metadata.
+        """
+        needs_input_processing = meta.input is not None and meta.input.schema_ is not None
+        needs_output_processing = meta.output is not None and meta.output.schema_ is not None
+
+        if not needs_input_processing and not needs_output_processing:
+            return meta
+
+        new_meta = meta.model_copy(deep=True)
+        if needs_input_processing and new_meta.input is not None:
+            new_meta.input.schema_ = picoschema_to_json_schema_sync(
+                new_meta.input.schema_,
+                self._schema_lookup_sync,
+                self._picoschema_cache,
+                self._use_schema_defs,
+            )
+        if needs_output_processing and new_meta.output is not None:
+            new_meta.output.schema_ = picoschema_to_json_schema_sync(
+                new_meta.output.schema_,
+                self._schema_lookup_sync,
+                self._picoschema_cache,
+                self._use_schema_defs,
+            )
+        return new_meta
+
     async def _resolve_tools(self, metadata: PromptMetadata[ModelConfigT]) -> PromptMetadata[ModelConfigT]:
         """Resolve all tools in a prompt.
 
@@ -341,9 +1447,48 @@ class Dotprompt:
             TypeError: If a tool resolver returns an invalid type.
             ValueError: If a tool resolver is not defined.
         """
+        out, to_resolve = self._collect_tools(metadata)
+        if to_resolve and out.tool_defs is not None:
+            # A batch resolver gets every name in one call; others are called
+            # once per name, concurrently.
+            out.tool_defs.extend(
+                (await resolve_tools(to_resolve, self._tool_resolver, limiter=self._resolver_limiter)).values()
+            )
+        return out
+
+    def _resolve_tools_sync(self, metadata: PromptMetadata[ModelConfigT]) -> PromptMetadata[ModelConfigT]:
+        """Resolve all tools in a prompt synchronously.
+
+        Args:
+            metadata: The prompt metadata.
+
+        Returns:
+            A copy of the prompt metadata with the tools resolved.
+
+        Raises:
+            ToolNotFoundError: If a tool is not found in the resolver or store.
+            ToolResolverFailedError: If a tool resolver fails.
+            TypeError: If a tool resolver is asynchronous or returns an invalid type.
+            ValueError: If a tool resolver is not defined.
+        """
+        out, to_resolve = self._collect_tools(metadata)
+        if to_resolve and out.tool_defs is not None:
+            out.tool_defs.extend(resolve_tools_sync(to_resolve, self._tool_resolver).values())
+        return out
+
+    def _collect_tools(self, metadata: PromptMetadata[ModelConfigT]) -> tuple[PromptMetadata[ModelConfigT], list[str]]:
+        """Collect the locally registered tools and the names left to resolve.
+
+        Args:
+            metadata: The prompt metadata.
+
+        Returns:
+            A copy of the prompt metadata with registered tools moved into
+            `tool_defs` and the names of tools to resolve with the resolver.
+        """
         out: PromptMetadata[ModelConfigT] = metadata.model_copy(deep=True)
         if out.tools is None:
-            return out
+            return out, []
 
         # Resolve tools that are already registered into toolDefs, leave
         # unregistered tools alone.
@@ -367,34 +1512,17 @@ class Dotprompt:
                 # Unregistered tool.
                 unregistered_names.append(name)
 
-        if to_resolve:
-
-            async def resolve_and_append(tool_name: str) -> None:
-                """Resolve a tool and append it to the list of tools.
-
-                Args:
-                    tool_name: The name of the tool to resolve.
-
-                Raises:
-                    ToolNotFoundError: If a tool is not found in the resolver or store.
-                    ToolResolverFailedError: If a tool resolver fails.
-                    TypeError: If a tool resolver returns an invalid type.
-                    ValueError: If a tool resolver is not defined.
-                """
-                tool = await resolve_tool(tool_name, self._tool_resolver)
-                if out.tool_defs is not None:
-                    out.tool_defs.append(tool)
-
-            async with anyio.create_task_group() as tg:
-                for name in to_resolve:
-                    tg.start_soon(resolve_and_append, name)
-
         out.tools = unregistered_names
-        return out
+        return out, to_resolve
 
     async def _resolve_partials(self, template: str) -> None:
         """Resolve all partials in a template.
 
+        The partial graph is walked one level at a time: the partials missing
+        at each level are resolved together, in a single call if the partial
+        resolver implements `resolve_many`. The store is used when there is
+        no partial resolver. Partials that cannot be found are not registered.
+
         Args:
             template: The template to resolve partials in.
 
@@ -404,40 +1532,105 @@ class Dotprompt:
         if self._partial_resolver is None and self._store is None:
             return
 
-        names = _identify_partials(template)
-        unregistered_names: list[str] = [name for name in names if not self._handlebars.has_partial(name)]
+        names = self._missing_partials([template])
+        while names:
+            if self._partial_resolver is not None:
+                contents = await resolve_partials(names, self._partial_resolver, limiter=self._resolver_limiter)
+            else:
+                contents = await self._load_store_partials(names)
+            for name, content in contents.items():
+                self.define_partial(name, content)
+            names = self._missing_partials(contents.values())
 
-        async def resolve_and_register(name: str) -> None:
-            """Resolve a partial from the resolver or store and register it.
+    async def _load_store_partials(self, names: list[str]) -> dict[str, str]:
+        """Load partials from the store concurrently.
 
-            The partial resolver is preferred, and the store is used as a
-            fallback. If neither is available, the partial is not registered.
+        Sync stores are called on worker threads.
 
-            Args:
-                name: The name of the partial to resolve.
+        Args:
+            names: The names of the partials to load.
 
-            Returns:
-                None.
-            """
-            content: str | None = None
+        Returns:
+            The sources of the partials found, by name.
+        """
+        contents: dict[str, str] = {}
 
-            if self._partial_resolver is not None:
-                content = await resolve_partial(name, self._partial_resolver)
+        async def load(name: str) -> None:
+            assert self._store is not None
+            partial = await _call_store(self._store.load_partial, name)
+            if partial is not None:
+                contents[name] = partial.source
 
-            if content is None and self._store is not None:
-                partial = await self._store.load_partial(name)
-                if partial is not None:
-                    content = partial.source
+        async with anyio.create_task_group() as tg:
+            for name in names:
+                tg.start_soon(load, name)
+        return {name: contents[name] for name in names if name in contents}
+
+    def _resolve_partials_sync(self, template: str) -> None:
+        """Resolve all partials in a template synchronously.
+
+        The partial graph is walked one level at a time, as by
+        `_resolve_partials`.
+
+        Args:
+            template: The template to resolve partials in.
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: If the partial resolver or the store is asynchronous.
+        """
+        if self._partial_resolver is None and self._store is None:
+            return
 
-            if content is not None:
+        names = self._missing_partials([template])
+        while names:
+            if self._partial_resolver is not None:
+                contents = resolve_partials_sync(names, self._partial_resolver)
+            else:
+                contents = self._load_store_partials_sync(names)
+            for name, content in contents.items():
                 self.define_partial(name, content)
+            names = self._missing_partials(contents.values())
 
-                # Recursively resolve partials in the content.
-                await self._resolve_partials(content)
+    def _load_store_partials_sync(self, names: list[str]) -> dict[str, str]:
+        """Load partials from a synchronous store.
 
-        async with anyio.create_task_group() as tg:
-            for name in unregistered_names:
-                tg.start_soon(resolve_and_register, name)
+        Args:
+            names: The names of the partials to load.
+
+        Returns:
+            The sources of the partials found, by name.
+
+        Raises:
+            TypeError: If the store is asynchronous.
+        """
+        assert self._store is not None
+        contents: dict[str, str] = {}
+        for name in names:
+            partial = self._store.load_partial(name)
+            if inspect.isawaitable(partial):
+                if inspect.iscoroutine(partial):
+                    partial.close()
+                raise TypeError(f"store for partial '{name}' is asynchronous; use the async API")
+            if partial is not None:
+                contents[name] = partial.source
+        return contents
+
+    def _missing_partials(self, templates: Iterable[str]) -> list[str]:
+        """Find the partials used by templates that are unregistered or stale.
+
+        Args:
+            templates: The templates to scan.
+
+        Returns:
+            The names of the partials to resolve, sorted.
+        """
+        names: set[str] = set()
+        for template in templates:
+            names.update(_identify_partials(template))
+        return sorted(name for name in names if name in self._stale_partials or not self._handlebars.has_partial(name))
 
     async def _wrapped_schema_resolver(self, name: str) -> JsonSchema | None:
         """Resolve a schema from either instance local mapping or the resolver.
@@ -455,4 +1648,21 @@ class Dotprompt:
             return None
 
         # TODO: Should we cache the resolved schema in self._schemas?
-        return await resolve_json_schema(name, self._schema_resolver)
+        return await resolve_json_schema(name, self._schema_resolver, limiter=self._resolver_limiter)
+
+    def _wrapped_schema_resolver_sync(self, name: str) -> JsonSchema | None:
+        """Resolve a schema from either instance local mapping or the sync resolver.
+
+        Args:
+            name: The name of the schema to resolve.
+
+        Returns:
+            The resolved schema or None if it is not found.
+        """
+        if name in self._schemas:
+            return self._schemas[name]
+
+        if self._schema_resolver is None:
+            return None
+
+        return resolve_json_schema_sync(name, self._schema_resolver)
@@ -40,3 +40,16 @@ class ResolverFailedError(RuntimeError):
     def __repr__(self) -> str:
         """Return a string representation of the error."""
         return f'{self.kind} resolver failed for {self.name}; {self.reason}'
+
+
+class InputValidationError(ValueError):
+    """Raised when prompt input does not match the prompt's input schema."""
+
+    def __init__(self, errors: list[str]) -> None:
+        """Initialize the error.
+
+        Args:
+            errors: The validation errors, e.g. `input.name: expected string, got integer`.
+        """
+        self.errors = errors
+        super().__init__('; '.join(errors))
@@ -0,0 +1,176 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Out-of-band handling of media passed to templates.
+
+Media in a render context would otherwise be copied several times on its way
+through a render: serialized to JSON for the template engine, written into the
+rendered string as a media marker, and split back out of it. A multi-megabyte
+data URL makes each of those copies expensive.
+
+Before rendering, `MediaHandles.extract` sets aside `MediaContent` objects and
+large `data:` URLs found in the context and puts short handles in their place.
+Only the handles travel through the template engine and the rendered string;
+`to_parts` and `to_messages` resolve them back to the original objects. Each
+`MediaHandles` puts a random nonce in its handles, so handle-like text in the
+input of a render is never mistaken for media set aside by it.
+
+Examples:
+    ```python
+    media = MediaHandles()
+    photo = MediaContent(url=data_url, contentType='image/png')
+    context = media.extract({'photo': photo})
+    messages = to_messages(render_string(context), media=media)
+    ```
+"""
+
+import re
+import secrets
+from typing import Any
+
+from dotpromptz.typing import MediaContent
+
+MEDIA_HANDLE_PREFIX = 'dotprompt-media:'
+"""Prefix of the handles standing in for media in rendered templates."""
+
+MEDIA_HANDLE_REGEX = re.compile(r'dotprompt-media:([0-9a-f]{16}):(\d+);')
+"""Regular expression matching a media handle, capturing its nonce and index."""
+
+MEDIA_HANDLE_MIN_LENGTH = 4096
+"""Length from which `data:` URL strings are set aside as media."""
+
+
+class MediaHandles:
+    """Media set aside from a render context, by handle.
+
+    A handle is only meaningful to the `MediaHandles` that created it, so a
+    new one is used for every render. Handles carry a nonce drawn for each
+    `MediaHandles`, and only handles with that nonce are resolved.
+    """
+
+    __slots__ = ('_media', '_nonce', '_prefix')
+
+    def __init__(self) -> None:
+        """Initialize an empty set of media."""
+        self._media: list[MediaContent | str] = []
+        self._nonce = secrets.token_hex(8)
+        self._prefix = f'{MEDIA_HANDLE_PREFIX}{self._nonce}:'
+
+    def add(self, media: MediaContent | str) -> str:
+        """Sets media aside.
+
+        Args:
+            media: The media, or a media URL.
+
+        Returns:
+            The handle standing in for the media.
+        """
+        self._media.append(media)
+        return f'{self._prefix}{len(self._media) - 1};'
+
+    def extract(self, value: Any) -> Any:
+        """Replaces the media in a render context with handles.
+
+        `MediaContent` objects and `data:` URL strings of at least
+        `MEDIA_HANDLE_MIN_LENGTH` characters are replaced, at any depth of
+        nested dictionaries, lists and tuples. Containers are only copied
+        when they hold media.
+
+        Args:
+            value: The render context, or a value within it.
+
+        Returns:
+            The value with media replaced by handles.
+        """
+        if isinstance(value, str):
+            if len(value) >= MEDIA_HANDLE_MIN_LENGTH and value.startswith('data:'):
+                return self.add(value)
+            return value
+        if isinstance(value, MediaContent):
+            return self.add(value)
+        if isinstance(value, dict):
+            extracted: dict[Any, Any] | None = None
+            for key, item in value.items():
+                replaced = self.extract(item)
+                if replaced is not item:
+                    if extracted is None:
+                        extracted = dict(value)
+                    extracted[key] = replaced
+            return value if extracted is None else extracted
+        if isinstance(value, list | tuple):
+            items = [self.extract(item) for item in value]
+            if any(replaced is not item for replaced, item in zip(items, value, strict=True)):
+                return items
+        return value
+
+    def media_content(self, url: str, content_type: str | None = None) -> MediaContent | None:
+        """Returns the media a handle stands for.
+
+        Args:
+            url: The URL of a media marker, which may be a handle.
+            content_type: The content type given in the media marker, which
+                takes precedence over that of the media.
+
+        Returns:
+            The original media, or None if `url` is not one of the handles.
+        """
+        media = self._lookup(url)
+        if media is None:
+            return None
+        if isinstance(media, str):
+            return MediaContent.model_construct(url=media, content_type=content_type)
+        if content_type is None or content_type == media.content_type:
+            return media
+        return media.model_copy(update={'content_type': content_type})
+
+    def resolve_text(self, text: str) -> str:
+        """Replaces the handles in text with the URLs they stand for.
+
+        Media rendered outside of a media marker, e.g. with `{{photo}}`, is
+        turned back into the URL it would have rendered as.
+
+        Args:
+            text: The text to resolve.
+
+        Returns:
+            The text with handles replaced.
+        """
+        if self._prefix not in text:
+            return text
+
+        def replace(match: re.Match[str]) -> str:
+            media = self._media_at(match)
+            if media is None:
+                return match.group(0)
+            return media if isinstance(media, str) else media.url
+
+        return MEDIA_HANDLE_REGEX.sub(replace, text)
+
+    def _lookup(self, handle: str) -> MediaContent | str | None:
+        """Returns the media set aside under a handle, if any."""
+        match = MEDIA_HANDLE_REGEX.fullmatch(handle)
+        return None if match is None else self._media_at(match)
+
+    def _media_at(self, match: re.Match[str]) -> MediaContent | str | None:
+        """Returns the media a matched handle stands for, if it is one of ours."""
+        nonce, index = match.groups()
+        if nonce != self._nonce or int(index) >= len(self._media):
+            return None
+        return self._media[int(index)]
+
+    def __len__(self) -> int:
+        """Return the number of media set aside."""
+        return len(self._media)
@@ -23,33 +23,50 @@ media, or metadata).
 
 Key functionalities include:
 
-- Extracting YAML frontmatter and the main template body.
+- Extracting YAML frontmatter and the main template body, or only the
+  frontmatter, reading no further than its closing marker.
 - Parsing the YAML frontmatter into a structured metadata object, handling
   reserved keywords and namespaced entries.
 - Splitting the template body into message sources based on role and history
   markers.
 - Converting message sources into structured messages, processing media and
   section markers within the content.
+- Tokenizing rendered templates into messages and parts in a single linear
+  scan over the markers.
 - Handling the insertion of historical messages into the conversation flow.
+- Streaming conversion of rendered text chunks into messages.
+- Producing messages as plain dictionaries, without building or validating
+  models, and converting between the two forms.
 """
 
+import bisect
+import itertools
 import re
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
-from typing import Any, TypeVar
+from typing import Any, Literal, TypeVar, overload
 
 import yaml
+from pydantic import BaseModel
 
+from dotpromptz.media import MediaHandles
+from dotpromptz.tokens import estimate_tokens
 from dotpromptz.typing import (
     DataArgument,
+    History,
+    HistoryBudget,
     MediaContent,
     MediaPart,
     Message,
+    MessageDict,
     ParsedPrompt,
     Part,
+    PartDict,
     PendingMetadata,
     PendingPart,
     Role,
     TextPart,
+    TokenEstimator,
 )
 
 T = TypeVar('T')
@@ -57,11 +74,14 @@ T = TypeVar('T')
 
 @dataclass
 class MessageSource:
-    """A message with a source string and optional content and metadata."""
+    """A message with a source string and optional content and metadata.
+
+    In lightweight mode, the content holds `PartDict`s instead of parts.
+    """
 
     role: Role
     source: str | None = None
-    content: list[Part] | None = None
+    content: list[Any] | None = None
     metadata: dict[str, Any] | None = field(default_factory=dict)
 
 
@@ -74,13 +94,35 @@ HISTORY_MARKER_PREFIX = '<<<dotprompt:history'
 # Prefixes for the media markers in the template.
 MEDIA_MARKER_PREFIX = '<<<dotprompt:media:'
 
+# The full prefix of a media marker as matched by
+# MEDIA_AND_SECTION_MARKER_REGEX.
+MEDIA_URL_MARKER_PREFIX = '<<<dotprompt:media:url'
+
+# The common start of every marker in the template.
+MARKER_START = '<<<dotprompt:'
+
+# The end of every marker in the template.
+MARKER_END = '>>>'
+
 # Prefixes for the section markers in the template.
 SECTION_MARKER_PREFIX = '<<<dotprompt:section'
 
+# The complete history marker emitted by the `history` helper.
+HISTORY_MARKER = '<<<dotprompt:history>>>'
+
 # Regular expression to match YAML frontmatter delineated by `---` markers at
 # the start of a .prompt content block.
 FRONTMATTER_AND_BODY_REGEX = re.compile(r'^---\s*\n([\s\S]*?)\n---\s*\n([\s\S]*)$')
 
+# Regular expression to match only the YAML frontmatter. The body group of
+# FRONTMATTER_AND_BODY_REGEX matches any remainder, so both expressions capture
+# the same frontmatter and this one ends where the body starts.
+FRONTMATTER_REGEX = re.compile(r'^---\s*\n([\s\S]*?)\n---\s*\n')
+
+# The libyaml-backed loader is several times faster than the pure-Python one
+# and constructs the same objects; PyYAML builds without libyaml lack it.
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 # Regular expression to match <<<dotprompt:role:xxx>>> and
 # <<<dotprompt:history>>> markers in the template.
 #
@@ -206,13 +248,91 @@ def extract_frontmatter_and_body(source: str) -> tuple[str, str]:
         A tuple containing the frontmatter and body If the pattern does not
         match, both the values returned will be empty.
     """
-    match = FRONTMATTER_AND_BODY_REGEX.match(source)
+    match = FRONTMATTER_REGEX.match(source)
     if match:
-        frontmatter, body = match.groups()
-        return frontmatter, body
+        return match.group(1), source[match.end() :]
     return '', ''
 
 
+def extract_frontmatter(source: str | Iterable[str]) -> str:
+    """Extracts the YAML frontmatter from a document without its body.
+
+    Given an iterable of lines, such as an open text file, lines are consumed
+    only up to the closing `---`, so the body is never read.
+
+    Args:
+        source: The source document, or an iterable over its lines with line
+            endings kept.
+
+    Returns:
+        The frontmatter, or an empty string if the document has none.
+    """
+    if isinstance(source, str):
+        match = FRONTMATTER_REGEX.match(source)
+        return match.group(1) if match else ''
+
+    head: list[str] = []
+    seen_content = False
+    for line in source:
+        head.append(line)
+        if len(head) == 1:
+            if line.rstrip() != '---':
+                return ''
+            continue
+        # Blank lines right after the opening `---` may be taken as part of
+        # it, so a `---` line only closes the frontmatter once some content
+        # has been seen. This matches how FRONTMATTER_REGEX backtracks.
+        if seen_content and line.endswith('\n') and line.rstrip() == '---':
+            match = FRONTMATTER_REGEX.match(''.join(head))
+            if match:
+                return match.group(1)
+        seen_content = seen_content or not line.isspace()
+    match = FRONTMATTER_REGEX.match(''.join(head))
+    return match.group(1) if match else ''
+
+
+def load_frontmatter(frontmatter: str) -> dict[str, Any]:
+    """Loads YAML frontmatter into a dictionary.
+
+    Args:
+        frontmatter: The YAML frontmatter, without the `---` markers.
+
+    Returns:
+        The frontmatter as a dictionary; empty if there is none.
+
+    Raises:
+        yaml.YAMLError: If the frontmatter is not valid YAML.
+        ValueError: If the frontmatter is not a mapping.
+    """
+    parsed = yaml.load(frontmatter, Loader=YAML_LOADER)
+    if parsed is None:
+        return {}
+    if not isinstance(parsed, dict):
+        raise ValueError(f'Frontmatter must be a mapping, got {type(parsed).__name__}')
+    return parsed
+
+
+def parse_frontmatter(source: str | Iterable[str]) -> dict[str, Any]:
+    """Parses only the YAML frontmatter of a document.
+
+    Unlike `parse_document`, the template body is neither scanned nor kept,
+    which makes this suitable for listing, indexing and filtering prompts by
+    metadata.
+
+    Args:
+        source: The source document, or an iterable over its lines with line
+            endings kept.
+
+    Returns:
+        The raw frontmatter as a dictionary; empty if there is none.
+
+    Raises:
+        yaml.YAMLError: If the frontmatter is not valid YAML.
+        ValueError: If the frontmatter is not a mapping.
+    """
+    return load_frontmatter(extract_frontmatter(source))
+
+
 def parse_document(source: str) -> ParsedPrompt[T]:
     """Parses document containing YAML frontmatter and template content.
 
@@ -230,11 +350,7 @@ def parse_document(source: str) -> ParsedPrompt[T]:
         return ParsedPrompt(ext={}, config=None, metadata={}, toolDefs=None, template=source)
 
     try:
-        parsed_metadata = yaml.safe_load(frontmatter)
-        if parsed_metadata is None:
-            parsed_metadata = {}
-
-        raw = dict(parsed_metadata)
+        raw = load_frontmatter(frontmatter)
         pruned: dict[str, Any] = {'ext': {}, 'config': {}, 'metadata': {}}
         ext: dict[str, dict[str, Any]] = {}
 
@@ -283,76 +399,497 @@ def parse_document(source: str) -> ParsedPrompt[T]:
         )
 
 
+@overload
 def to_messages(
     rendered_string: str,
     data: DataArgument[Any] | None = None,
-) -> list[Message]:
+    *,
+    lightweight: Literal[False] = False,
+    history_budget: HistoryBudget | None = None,
+    media: MediaHandles | None = None,
+) -> list[Message]: ...
+
+
+@overload
+def to_messages(
+    rendered_string: str,
+    data: DataArgument[Any] | None = None,
+    *,
+    lightweight: Literal[True],
+    history_budget: HistoryBudget | None = None,
+    media: MediaHandles | None = None,
+) -> list[MessageDict]: ...
+
+
+@overload
+def to_messages(
+    rendered_string: str,
+    data: DataArgument[Any] | None = None,
+    *,
+    lightweight: bool,
+    history_budget: HistoryBudget | None = None,
+    media: MediaHandles | None = None,
+) -> list[Message] | list[MessageDict]: ...
+
+
+def to_messages(
+    rendered_string: str,
+    data: DataArgument[Any] | None = None,
+    *,
+    lightweight: bool = False,
+    history_budget: HistoryBudget | None = None,
+    media: MediaHandles | None = None,
+) -> list[Message] | list[MessageDict]:
     """Converts a rendered template string into an array of messages.
 
     Processes role markers and history placeholders to structure the
     conversation.
 
+    In lightweight mode, messages and parts are built as plain dictionaries
+    in their serialized form, without constructing or validating models.
+    `messages_from_dicts` converts them to the same messages this function
+    returns otherwise.
+
+    With a history budget, only the newest history messages that fit in the
+    budget, after the messages rendered from the template, are inserted. The
+    token estimates of a `History` are kept by it, so only messages added
+    since the previous render are estimated.
+
     Args:
         rendered_string: The rendered template string to convert
         data: Optional data containing message history
+        lightweight: Whether to return `MessageDict`s instead of messages
+        history_budget: Optional token budget to fit the history into
+        media: The media set aside before rendering, to resolve handles to
 
     Returns:
         List of structured messages
     """
-    current_message = MessageSource(role=Role.USER, source='')
+    history = data.messages if data else None
+    current_message = MessageSource(role=Role.USER, content=[])
     message_sources = [current_message]
+    # The number of message sources that precede each history marker.
+    history_markers: list[int] = []
 
-    for piece in split_by_role_and_history_markers(rendered_string):
+    def apply_marker(piece: str) -> None:
+        nonlocal current_message
         if piece.startswith(ROLE_MARKER_PREFIX):
-            role = piece[len(ROLE_MARKER_PREFIX) :]
+            role = Role(piece[len(ROLE_MARKER_PREFIX) :])
 
-            if current_message.source and current_message.source.strip():
+            if current_message.content:
                 # If the current message has content, create a new message
-                current_message = MessageSource(role=Role(role), source='')
+                current_message = MessageSource(role=role, content=[])
                 message_sources.append(current_message)
             else:
                 # Otherwise, update the role of the current message
-                current_message.role = Role(role)
-
-        elif piece.startswith(HISTORY_MARKER_PREFIX):
-            # Add the history messages to the message sources
-            msgs: list[Message] = []
-            if data and data.messages:
-                msgs = data.messages
-            history_messages = transform_messages_to_history(msgs)
-            if history_messages:
-                message_sources.extend([
-                    MessageSource(
-                        role=msg.role,
-                        content=msg.content,
-                        metadata=msg.metadata,
-                    )
-                    for msg in history_messages
-                ])
+                current_message.role = role
+
+        else:
+            # Add the history messages after the message sources so far
+            history_markers.append(len(message_sources))
 
             # Add a new message source for the model
-            current_message = MessageSource(role=Role.MODEL, source='')
+            current_message = MessageSource(role=Role.MODEL, content=[])
             message_sources.append(current_message)
 
+    # The text between two role or history markers forms the source of a
+    # message. It is scanned for media and section markers in place, without
+    # first being split out of the rendered string.
+    position = 0
+    for match in ROLE_AND_HISTORY_MARKER_REGEX.finditer(rendered_string):
+        _scan_region(rendered_string, position, match.start(), current_message, apply_marker, lightweight, media)
+        apply_marker(match.group(1))
+        position = match.end()
+    _scan_region(rendered_string, position, len(rendered_string), current_message, apply_marker, lightweight, media)
+
+    # The messages built from the message sources between history markers.
+    segments: list[list[Any]] = []
+    start = 0
+    for index in history_markers:
+        segments.append(message_sources_to_messages(message_sources[start:index], lightweight=lightweight))
+        start = index
+    segments.append(message_sources_to_messages(message_sources[start:], lightweight=lightweight))
+
+    start, placeholder = 0, None
+    if history and history_budget is not None:
+        estimator = history_budget.estimator or estimate_tokens
+        rendered = [msg for segment in segments for msg in segment]
+        used = sum(map(estimator, messages_from_dicts(rendered) if lightweight else rendered))
+        # Each history marker inserts the history again.
+        tokens = (history_budget.max_tokens - used) // max(len(history_markers), 1)
+        start, placeholder = _fit_history(history, tokens, estimator, history_budget.placeholder)
+
+    # History messages are already built, so they are spliced in between the
+    # messages built from the message sources instead of being rebuilt.
+    messages = segments[0]
+    inserted = False
+    for segment in segments[1:]:
+        block = _history_block(history, lightweight, start, placeholder)
+        messages.extend(block)
+        messages.extend(segment)
+        inserted = inserted or bool(block)
+
+    if inserted:
+        # The history is already in place.
+        return messages
+    history_list = list(history) if isinstance(history, History) else history
+    if history_list and start:
+        history_list = [placeholder, *history_list[start:]] if placeholder else history_list[start:]
+    if lightweight:
+        return _insert_history_dicts(messages, history_list)
+    return insert_history(messages, history_list)
+
+
+def _fit_history(
+    history: list[Message] | History,
+    tokens: int,
+    estimator: TokenEstimator,
+    placeholder: str | None = None,
+) -> tuple[int, Message | None]:
+    """Finds the newest history messages that fit in a number of tokens.
+
+    Args:
+        history: The history messages.
+        tokens: The estimated number of tokens left for the history.
+        estimator: Estimates the tokens of a message.
+        placeholder: Optional text of a message standing in for the messages
+            left out, formatted with their count.
+
+    Returns:
+        The index of the first message kept, and the placeholder message, if
+        any messages are left out and it fits.
+    """
+    if isinstance(history, History):
+        offsets = history.token_offsets(estimator)
+    else:
+        offsets = list(itertools.accumulate(map(estimator, history), initial=0))
+    total = offsets[-1]
+    tokens = max(tokens, 0)
+    if total <= tokens:
+        return 0, None
+    # Keeping the messages from the i-th on leaves out the tokens counted by
+    # the i-th offset.
+    start = bisect.bisect_left(offsets, total - tokens)
+    if placeholder is None:
+        return start, None
+
+    cost = estimator(_placeholder_message(placeholder, start))
+    if cost > tokens:
+        return len(history), None
+    start = bisect.bisect_left(offsets, total - tokens + cost)
+    return start, _placeholder_message(placeholder, start)
+
+
+def _placeholder_message(placeholder: str, count: int) -> Message:
+    """Builds the message standing in for history messages left out.
+
+    Args:
+        placeholder: The placeholder text, formatted with `count`.
+        count: The number of messages left out.
+
+    Returns:
+        The placeholder message.
+    """
+    return Message(role=Role.USER, content=[TextPart(text=placeholder.format(count=count))])
+
+
+def _history_block(
+    history: list[Message] | History | None,
+    lightweight: bool,
+    start: int = 0,
+    placeholder: Message | None = None,
+) -> list[Any]:
+    """Builds the messages inserted at a history marker.
+
+    Messages are tagged as history, and those without content are dropped.
+    The tagged messages of a `History` are cached by it, so only messages
+    added since the previous render are tagged.
+
+    Args:
+        history: The history messages.
+        lightweight: Whether to return `MessageDict`s instead of messages.
+        start: The index of the first history message to insert.
+        placeholder: A message to insert first, standing in for the history
+            messages before `start`.
+
+    Returns:
+        The history messages to insert.
+    """
+    if not history:
+        return []
+    if isinstance(history, History):
+        tagged = history.tagged(start)
+    else:
+        tagged = [msg for msg in transform_messages_to_history(history[start:]) if msg.content]
+    if placeholder is not None:
+        tagged = [*transform_messages_to_history([placeholder]), *tagged]
+    if lightweight:
+        return [message_to_dict(msg) for msg in tagged]
+    return tagged
+
+
+def _scan_region(
+    source: str,
+    start: int,
+    end: int,
+    message: MessageSource,
+    apply_marker: Callable[[str], None],
+    lightweight: bool = False,
+    media: MediaHandles | None = None,
+) -> None:
+    """Adds the parts of the text between two role or history markers.
+
+    Text that begins like a role or history marker without being one is
+    treated as a marker, as when splitting the rendered string at markers.
+
+    Args:
+        source: The rendered template string.
+        start: The start of the text.
+        end: The end of the text.
+        message: The message source receiving the parts.
+        apply_marker: Callback applying a role or history marker.
+        lightweight: Whether to add `PartDict`s instead of parts.
+        media: The media set aside before rendering, to resolve handles to.
+    """
+    if source.startswith(ROLE_MARKER_PREFIX, start, end) or source.startswith(HISTORY_MARKER_PREFIX, start, end):
+        apply_marker(source[start:end])
+    elif message.content is not None:
+        message.content.extend(_scan_parts(source, start, end, lightweight, media))
+
+
+def _scan_parts(
+    source: str,
+    start: int,
+    end: int,
+    lightweight: bool = False,
+    media: MediaHandles | None = None,
+) -> list[Any]:
+    """Splits text into parts at media and section markers in one pass.
+
+    Produces the same parts as splitting `source[start:end]` with
+    `MEDIA_AND_SECTION_MARKER_REGEX` and dropping whitespace-only pieces, but
+    runs in linear time: the positions of the next marker end and line break
+    are reused across candidate markers instead of being searched for again.
+
+    Args:
+        source: The string containing the text.
+        start: The start of the text.
+        end: The end of the text.
+        lightweight: Whether to produce `PartDict`s instead of parts.
+        media: The media set aside before rendering, to resolve handles to.
+
+    Returns:
+        The parts of the text, in order.
+    """
+    parse_text: Callable[[str, MediaHandles | None], Any] = _part_dict if lightweight else parse_part
+    parse_media: Callable[[str, MediaHandles | None], Any] = _media_part_dict if lightweight else parse_media_part
+    parse_section: Callable[[str], Any] = _section_part_dict if lightweight else parse_section_part
+    parts: list[Any] = []
+    position = start
+    search = start
+    close = -1
+    newline = -1
+    while True:
+        candidate = source.find(MARKER_START, search, end)
+        if candidate == -1:
+            break
+        if source.startswith(MEDIA_URL_MARKER_PREFIX, candidate, end):
+            body = candidate + len(MEDIA_URL_MARKER_PREFIX)
+            is_media = True
+        elif source.startswith(SECTION_MARKER_PREFIX, candidate, end):
+            body = candidate + len(SECTION_MARKER_PREFIX)
+            is_media = False
         else:
-            # Otherwise, add the piece to the current message source
-            current_message.source = (current_message.source or '') + piece
+            search = candidate + len(MARKER_START)
+            continue
+
+        if close < body:
+            close = source.find(MARKER_END, body, end)
+            if close == -1:
+                break
+        if newline < body:
+            newline = source.find('\n', body, end)
+            if newline == -1:
+                newline = end
+        if newline < close:
+            # Markers do not span lines.
+            search = candidate + len(MARKER_START)
+            continue
+
+        text = source[position:candidate]
+        if text.strip():
+            parts.append(parse_text(text, media))
+        marker = source[candidate:close]
+        parts.append(parse_media(marker, media) if is_media else parse_section(marker))
+        position = search = close + len(MARKER_END)
+
+    text = source[position:end]
+    if text.strip():
+        parts.append(parse_text(text, media))
+    return parts
+
+
+def _incomplete_marker_start(text: str) -> int:
+    """Finds where a role or history marker may begin at the end of a text.
+
+    Used when scanning streamed chunks to hold back a marker that has been
+    split across chunk boundaries.
 
-    messages = message_sources_to_messages(message_sources)
-    return insert_history(messages, data.messages if data else None)
+    Args:
+        text: The text to inspect.
+
+    Returns:
+        The index at which a possibly incomplete marker starts, or the length
+        of the text if it cannot end in a partial marker.
+    """
+    start = text.rfind('<<<')
+    if start != -1:
+        candidate = text[start:]
+        if (
+            HISTORY_MARKER.startswith(candidate)
+            or ROLE_MARKER_PREFIX.startswith(candidate)
+            or re.fullmatch(r'<<<dotprompt:role:[a-z]*>{0,2}', candidate)
+        ):
+            return start
+    if text.endswith('<<'):
+        return len(text) - 2
+    if text.endswith('<'):
+        return len(text) - 1
+    return len(text)
+
+
+def to_messages_stream(
+    chunks: Iterable[str],
+    data: DataArgument[Any] | None = None,
+) -> Iterator[Message]:
+    """Converts rendered template chunks into messages as they complete.
+
+    This is the streaming counterpart to `to_messages`: it produces the same
+    messages in the same order, but yields each message as soon as the role or
+    history marker that closes it has been read. Markers may be split across
+    chunk boundaries.
 
+    Without a history marker, history is inserted before a trailing user
+    message, so the most recently completed message is held back until the
+    next one completes or the chunks are exhausted.
 
+    Args:
+        chunks: The rendered template string, in pieces.
+        data: Optional data containing message history
+
+    Yields:
+        Structured messages, in conversation order.
+    """
+    history = data.messages if data else None
+    current = MessageSource(role=Role.USER, source='')
+    # Raw text read since the last marker; whitespace-only segments are
+    # dropped once the marker that ends them is found, as in `to_messages`.
+    segment: list[str] = []
+    held: Message | None = None
+    have_history = False
+    carry = ''
+
+    def end_segment() -> None:
+        text = ''.join(segment)
+        segment.clear()
+        if text.strip():
+            current.source = (current.source or '') + text
+
+    for chunk in chunks:
+        window = carry + chunk
+        position = 0
+        for match in ROLE_AND_HISTORY_MARKER_REGEX.finditer(window):
+            segment.append(window[position : match.start()])
+            position = match.end()
+            end_segment()
+
+            marker = match.group(1)
+            if marker.startswith(ROLE_MARKER_PREFIX):
+                role = Role(marker[len(ROLE_MARKER_PREFIX) :])
+                if current.source:
+                    for message in message_sources_to_messages([current]):
+                        if held is not None:
+                            yield held
+                        held = message
+                    current = MessageSource(role=role, source='')
+                else:
+                    current.role = role
+            else:
+                if held is not None:
+                    yield held
+                    held = None
+                yield from message_sources_to_messages([current])
+                have_history = True
+                yield from _history_block(history, lightweight=False)
+                current = MessageSource(role=Role.MODEL, source='')
+
+        rest = window[position:]
+        cut = _incomplete_marker_start(rest)
+        segment.append(rest[:cut])
+        carry = rest[cut:]
+
+    segment.append(carry)
+    end_segment()
+    for message in message_sources_to_messages([current]):
+        if held is not None:
+            yield held
+        held = message
+
+    if not history or have_history:
+        if held is not None:
+            yield held
+    elif held is None:
+        yield from history
+    elif held.role == 'user':
+        yield from history
+        yield held
+    else:
+        yield held
+        yield from history
+
+
+@overload
 def message_sources_to_messages(
     message_sources: list[MessageSource],
-) -> list[Message]:
+    *,
+    lightweight: Literal[False] = False,
+) -> list[Message]: ...
+
+
+@overload
+def message_sources_to_messages(
+    message_sources: list[MessageSource],
+    *,
+    lightweight: Literal[True],
+) -> list[MessageDict]: ...
+
+
+@overload
+def message_sources_to_messages(
+    message_sources: list[MessageSource],
+    *,
+    lightweight: bool,
+) -> list[Message] | list[MessageDict]: ...
+
+
+def message_sources_to_messages(
+    message_sources: list[MessageSource],
+    *,
+    lightweight: bool = False,
+) -> list[Message] | list[MessageDict]:
     """Processes an array of message sources into an array of messages.
 
     Args:
         message_sources: List of message sources
+        lightweight: Whether to return `MessageDict`s built without
+            validation instead of messages
 
     Returns:
         List of structured messages
     """
+    if lightweight:
+        return [_message_source_to_dict(m) for m in message_sources if m.content or m.source]
+
     messages: list[Message] = []
     for m in message_sources:
         if m.content or m.source:
@@ -369,6 +906,60 @@ def message_sources_to_messages(
     return messages
 
 
+def _message_source_to_dict(message_source: MessageSource) -> MessageDict:
+    """Builds a `MessageDict` from a message source without validation.
+
+    Args:
+        message_source: The message source.
+
+    Returns:
+        The message in serialized form.
+    """
+    if message_source.content is None:
+        source = message_source.source or ''
+        content = _scan_parts(source, 0, len(source), lightweight=True)
+    else:
+        content = [
+            part.model_dump(by_alias=True, exclude_none=True) if isinstance(part, BaseModel) else part
+            for part in message_source.content
+        ]
+    message: MessageDict = {'role': message_source.role, 'content': content}
+    if message_source.metadata:
+        message['metadata'] = message_source.metadata
+    return message
+
+
+def message_to_dict(message: Message) -> MessageDict:
+    """Converts a message into its serialized form.
+
+    Args:
+        message: The message to convert.
+
+    Returns:
+        The message as produced by `to_messages` in lightweight mode.
+    """
+    return message.model_dump(by_alias=True, exclude_none=True)
+
+
+def messages_from_dicts(messages: Iterable[MessageDict]) -> list[Message]:
+    """Validates serialized messages into messages.
+
+    This is the inverse of `message_to_dict`: messages produced by
+    `to_messages` in lightweight mode convert to the messages it produces
+    otherwise.
+
+    Args:
+        messages: The messages in serialized form.
+
+    Returns:
+        The validated messages.
+
+    Raises:
+        pydantic.ValidationError: If a message is not valid.
+    """
+    return [Message.model_validate(message) for message in messages]
+
+
 def transform_messages_to_history(
     messages: list[Message],
 ) -> list[Message]:
@@ -443,46 +1034,97 @@ def insert_history(
     return messages
 
 
-def to_parts(source: str) -> list[Part]:
+def _insert_history_dicts(
+    messages: list[MessageDict],
+    history: list[Message] | None = None,
+) -> list[MessageDict]:
+    """Inserts historical messages into serialized messages.
+
+    The lightweight counterpart of `insert_history`, with the same placement
+    rules. History is only serialized when it is inserted.
+
+    Args:
+        messages: Current array of serialized messages
+        history: Historical messages to insert
+
+    Returns:
+        Serialized messages with history inserted
+    """
+    if not history or any((msg.get('metadata') or {}).get('purpose') == 'history' for msg in messages):
+        return messages
+
+    history_dicts = [message_to_dict(msg) for msg in history]
+    if not messages:
+        return history_dicts
+    if messages[-1]['role'] == 'user':
+        return [*messages[:-1], *history_dicts, messages[-1]]
+    return [*messages, *history_dicts]
+
+
+def to_parts(source: str, media: MediaHandles | None = None) -> list[Part]:
     """Converts a source string into an array of parts.
 
     Also processes media and section markers.
 
     Args:
         source: The source string to convert into parts
+        media: The media set aside before rendering, to resolve handles to
 
     Returns:
         Array of structured parts (text, media, or metadata)
     """
-    return [parse_part(piece) for piece in split_by_media_and_section_markers(source)]
+    return _scan_parts(source, 0, len(source), media=media)
 
 
-def parse_part(piece: str) -> Part:
+def parse_part(piece: str, media: MediaHandles | None = None) -> Part:
     """Parses a part from a piece of rendered template.
 
     Args:
         piece: The piece to parse
+        media: The media set aside before rendering, to resolve handles to
 
     Returns:
         Part, PendingPart, TextPart, or MediaPart
     """
     if piece.startswith(MEDIA_MARKER_PREFIX):
-        return parse_media_part(piece)
+        return parse_media_part(piece, media)
     elif piece.startswith(SECTION_MARKER_PREFIX):
         return parse_section_part(piece)
     else:
-        return parse_text_part(piece)
+        return parse_text_part(piece, media)
 
 
-def parse_media_part(piece: str) -> MediaPart:
+def parse_media_part(piece: str, media: MediaHandles | None = None) -> MediaPart:
     """Parses a media part from a piece of rendered template.
 
+    A media handle is resolved to the original media, which is not copied.
+
     Args:
         piece: The piece to parse
+        media: The media set aside before rendering, to resolve handles to
 
     Returns:
         Media part
 
+    Raises:
+        ValueError: If the media piece is invalid
+    """
+    url, content_type = _media_fields(piece)
+    media_content = media.media_content(url, content_type) if media else None
+    if media_content is None:
+        media_content = MediaContent(url=url, contentType=content_type)
+    return MediaPart(media=media_content)
+
+
+def _media_fields(piece: str) -> tuple[str, str | None]:
+    """Splits a media piece into its URL and content type.
+
+    Args:
+        piece: The piece to split
+
+    Returns:
+        The URL and the content type, if any
+
     Raises:
         ValueError: If the media piece is invalid
     """
@@ -499,11 +1141,19 @@ def parse_media_part(piece: str) -> MediaPart:
     else:
         raise ValueError(f'Invalid media piece: {piece}; expected 2 or 3 fields, found {n}')
 
-    media_content = MediaContent(
-        url=url,
-        contentType=(content_type if content_type and content_type.strip() else None),
-    )
-    return MediaPart(media=media_content)
+    return url, (content_type if content_type and content_type.strip() else None)
+
+
+def _media_part_dict(piece: str, media: MediaHandles | None = None) -> PartDict:
+    """Parses a media piece into a `PartDict` without validation."""
+    url, content_type = _media_fields(piece)
+    media_content = media.media_content(url, content_type) if media else None
+    if media_content is not None:
+        url, content_type = media_content.url, media_content.content_type
+    fields = {'url': url}
+    if content_type is not None:
+        fields['contentType'] = content_type
+    return {'media': fields}
 
 
 def parse_section_part(piece: str) -> PendingPart:
@@ -515,6 +1165,25 @@ def parse_section_part(piece: str) -> PendingPart:
     Returns:
         Section part
 
+    Raises:
+        ValueError: If the section piece is invalid
+    """
+    section_type = _section_type(piece)
+
+    # Use the helper method to set purpose
+    pending_metadata = PendingMetadata.with_purpose(section_type)
+    return PendingPart(metadata=pending_metadata)
+
+
+def _section_type(piece: str) -> str:
+    """Extracts the section type from a section piece.
+
+    Args:
+        piece: The piece to parse
+
+    Returns:
+        The section type
+
     Raises:
         ValueError: If the section piece is invalid
     """
@@ -523,22 +1192,35 @@ def parse_section_part(piece: str) -> PendingPart:
 
     fields = piece.split(' ')
     if len(fields) == 2:
-        section_type = fields[1]
-    else:
-        raise ValueError(f'Invalid section piece: {piece}; expected 2 fields, found {len(fields)}')
+        return fields[1]
+    raise ValueError(f'Invalid section piece: {piece}; expected 2 fields, found {len(fields)}')
 
-    # Use the helper method to set purpose
-    pending_metadata = PendingMetadata.with_purpose(section_type)
-    return PendingPart(metadata=pending_metadata)
 
+def _section_part_dict(piece: str) -> PartDict:
+    """Parses a section piece into a `PartDict` without validation."""
+    _section_type(piece)
+    # A PendingPart keeps only the pending flag of its metadata.
+    return {'metadata': {'pending': True}}
 
-def parse_text_part(piece: str) -> TextPart:
+
+def parse_text_part(piece: str, media: MediaHandles | None = None) -> TextPart:
     """Parses a text part from a piece of rendered template.
 
     Args:
         piece: The piece to parse
+        media: The media set aside before rendering, whose handles are
+            replaced by their URLs
 
     Returns:
         Text part
     """
-    return TextPart(text=piece)
+    return TextPart(text=media.resolve_text(piece) if media else piece)
+
+
+def _part_dict(piece: str, media: MediaHandles | None = None) -> PartDict:
+    """Parses a piece of rendered template into a `PartDict` like `parse_part`."""
+    if piece.startswith(MEDIA_MARKER_PREFIX):
+        return _media_part_dict(piece, media)
+    elif piece.startswith(SECTION_MARKER_PREFIX):
+        return _section_part_dict(piece)
+    return {'text': media.resolve_text(piece) if media else piece}
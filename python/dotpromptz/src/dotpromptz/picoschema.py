@@ -162,10 +162,23 @@ These error checks ensure that the Picoschema is well-formed and can be
 correctly translated to JSON Schema.
 """
 
+import copy
+import hashlib
+import json
 import re
-from typing import Any, cast
-
-from dotpromptz.resolvers import resolve_json_schema
+from collections import Counter, OrderedDict
+from collections.abc import Iterable
+from typing import Any, NamedTuple, cast
+
+import anyio
+
+from dotpromptz.resolvers import (
+    is_batch_resolver,
+    resolve_json_schema,
+    resolve_json_schema_sync,
+    resolve_json_schemas,
+    resolve_json_schemas_sync,
+)
 from dotpromptz.typing import JsonSchema, SchemaResolver
 
 JSON_SCHEMA_SCALAR_TYPES = [
@@ -179,6 +192,8 @@ JSON_SCHEMA_SCALAR_TYPES = [
 
 WILDCARD_PROPERTY_NAME = '(*)'
 
+_DESCRIPTION_REGEX = re.compile(r'(.*?), *(.*)$')
+
 
 def _is_json_schema(schema: dict[str, Any]) -> bool:
     """Checks if a schema is already in JSON Schema format.
@@ -197,17 +212,165 @@ def _is_json_schema(schema: dict[str, Any]) -> bool:
     )
 
 
-async def picoschema_to_json_schema(schema: Any, schema_resolver: SchemaResolver | None = None) -> JsonSchema | None:
+class PicoschemaCache:
+    """A cache of Picoschema to JSON Schema conversions.
+
+    Conversions are keyed by a hash of the canonical JSON form of the
+    Picoschema and by the schema resolver, so converting an unchanged schema
+    is a lookup. The named schemas resolved by each conversion are recorded,
+    and `invalidate` drops the conversions that depend on a changed name.
+
+    The least recently used conversions are dropped once `maxsize` is
+    reached. The cache keeps its own copy of each JSON Schema and hands out
+    copies, so callers are free to modify the schemas they get.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Initializes the cache.
+
+        Args:
+            maxsize: Maximum number of conversions to keep.
+        """
+        self._maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, Any, bool], tuple[JsonSchema, frozenset[str]]] = OrderedDict()
+
+    def key(
+        self, schema: Any, schema_resolver: SchemaResolver | None, use_defs: bool = False
+    ) -> tuple[str, Any, bool] | None:
+        """Builds the cache key of a conversion.
+
+        Keys preserve the order of properties, which the conversion keeps.
+
+        Args:
+            schema: The Picoschema definition.
+            schema_resolver: The resolver used for named schemas.
+            use_defs: Whether shared named schemas are emitted under `$defs`.
+
+        Returns:
+            The key, or None if the schema has no JSON form and cannot be
+            cached.
+        """
+        try:
+            canonical = json.dumps(schema, separators=(',', ':'), ensure_ascii=False)
+        except (TypeError, ValueError):
+            return None
+        digest = hashlib.sha1(canonical.encode('utf-8'), usedforsecurity=False).hexdigest()
+        return digest, schema_resolver, use_defs
+
+    def get(self, key: tuple[str, Any, bool]) -> JsonSchema | None:
+        """Looks up a conversion.
+
+        Args:
+            key: The key of the conversion, as built by `key`.
+
+        Returns:
+            A copy of the cached JSON Schema, or None if there is none.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(entry[0])
+
+    def put(
+        self, key: tuple[str, Any, bool], json_schema: JsonSchema | None, names: Iterable[str] = ()
+    ) -> JsonSchema | None:
+        """Adds a conversion.
+
+        Args:
+            key: The key of the conversion, as built by `key`.
+            json_schema: The converted JSON Schema. None is not cached.
+            names: The named schemas the conversion resolved.
+
+        Returns:
+            The converted JSON Schema.
+        """
+        if json_schema is None:
+            return None
+        self._entries[key] = (copy.deepcopy(json_schema), frozenset(names))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+        return json_schema
+
+    def invalidate(self, names: Iterable[str] | None = None) -> None:
+        """Drops the conversions that resolved any of the given named schemas.
+
+        Args:
+            names: The names of the changed schemas, or None to drop every
+                conversion.
+        """
+        if names is None:
+            self._entries.clear()
+            return
+        changed = set(names)
+        for key in [key for key, (_, resolved) in self._entries.items() if not changed.isdisjoint(resolved)]:
+            del self._entries[key]
+
+    def __len__(self) -> int:
+        """Returns the number of cached conversions."""
+        return len(self._entries)
+
+
+async def picoschema_to_json_schema(
+    schema: Any,
+    schema_resolver: SchemaResolver | None = None,
+    cache: PicoschemaCache | None = None,
+    use_defs: bool = False,
+) -> JsonSchema | None:
     """Parses a Picoschema definition into a JSON Schema.
 
     Args:
         schema: The Picoschema definition (can be a dict or string).
         schema_resolver: Optional callable to resolve named schema references.
+        cache: Optional cache of earlier conversions to look the schema up in
+            and to add the conversion to.
+        use_defs: Emit named schemas referred to more than once under `$defs`
+            and refer to them with `$ref`, instead of inlining a copy each time.
 
     Returns:
         The equivalent JSON Schema, or None if the input schema is None.
     """
-    return await PicoschemaParser(schema_resolver).parse(schema)
+    key = cache.key(schema, schema_resolver, use_defs) if cache is not None else None
+    if cache is None or key is None:
+        return await PicoschemaParser(schema_resolver, use_defs).parse(schema)
+
+    entry = cache.get(key)
+    if entry is not None:
+        return entry
+    parser = PicoschemaParser(schema_resolver, use_defs)
+    return cache.put(key, await parser.parse(schema), parser.resolved_names)
+
+
+def picoschema_to_json_schema_sync(
+    schema: Any,
+    schema_resolver: SchemaResolver | None = None,
+    cache: PicoschemaCache | None = None,
+    use_defs: bool = False,
+) -> JsonSchema | None:
+    """Parses a Picoschema definition into a JSON Schema synchronously.
+
+    Args:
+        schema: The Picoschema definition (can be a dict or string).
+        schema_resolver: Optional synchronous callable to resolve named schema
+            references.
+        cache: Optional cache of earlier conversions to look the schema up in
+            and to add the conversion to.
+        use_defs: Emit named schemas referred to more than once under `$defs`
+            and refer to them with `$ref`, instead of inlining a copy each time.
+
+    Returns:
+        The equivalent JSON Schema, or None if the input schema is None.
+    """
+    key = cache.key(schema, schema_resolver, use_defs) if cache is not None else None
+    if cache is None or key is None:
+        return PicoschemaParser(schema_resolver, use_defs).parse_sync(schema)
+
+    entry = cache.get(key)
+    if entry is not None:
+        return entry
+    parser = PicoschemaParser(schema_resolver, use_defs)
+    return cache.put(key, parser.parse_sync(schema), parser.resolved_names)
 
 
 class PicoschemaParser:
@@ -217,13 +380,19 @@ class PicoschemaParser:
     enums, wildcards, and named schema resolution.
     """
 
-    def __init__(self, schema_resolver: SchemaResolver | None = None):
+    def __init__(self, schema_resolver: SchemaResolver | None = None, use_defs: bool = False):
         """Initializes the PicoschemaParser.
 
         Args:
             schema_resolver: Optional callable to resolve named schema references.
+            use_defs: Emit named schemas referred to more than once under
+                `$defs` and refer to them with `$ref`, instead of inlining a
+                copy each time.
         """
         self._schema_resolver = schema_resolver
+        self._use_defs = use_defs
+        self.resolved_names: set[str] = set()
+        """The names of the schemas resolved so far."""
 
     async def must_resolve_schema(self, schema_name: str) -> JsonSchema:
         """Resolves a named schema using the configured resolver.
@@ -241,11 +410,34 @@ class PicoschemaParser:
         if not self._schema_resolver:
             raise ValueError(f"Picoschema: unsupported scalar type '{schema_name}'.")
 
+        self.resolved_names.add(schema_name)
         val = await resolve_json_schema(schema_name, self._schema_resolver)
         if not val:
             raise ValueError(f"Picoschema: could not find schema with name '{schema_name}'")
         return val
 
+    def must_resolve_schema_sync(self, schema_name: str) -> JsonSchema:
+        """Resolves a named schema using the configured synchronous resolver.
+
+        Args:
+            schema_name: The name of the schema to resolve.
+
+        Returns:
+            The resolved JSON Schema.
+
+        Raises:
+            ValueError: If no schema resolver is configured or the schema
+                        name is not found.
+        """
+        if not self._schema_resolver:
+            raise ValueError(f"Picoschema: unsupported scalar type '{schema_name}'.")
+
+        self.resolved_names.add(schema_name)
+        val = resolve_json_schema_sync(schema_name, self._schema_resolver)
+        if not val:
+            raise ValueError(f"Picoschema: could not find schema with name '{schema_name}'")
+        return val
+
     async def parse(self, schema: Any) -> JsonSchema | None:
         """Parses a schema, detecting if it's Picoschema or JSON Schema.
 
@@ -282,7 +474,11 @@ class PicoschemaParser:
         return await self.parse_pico(schema)
 
     async def parse_pico(self, obj: Any, path: list[str] | None = None) -> JsonSchema:
-        """Recursively parses a Picoschema object or string fragment.
+        """Parses a Picoschema object or string fragment.
+
+        The fragment is converted in a single synchronous pass. The named
+        schemas it refers to, if any, are then resolved all at once and
+        filled in.
 
         Args:
             obj: The Picoschema fragment (dict or string).
@@ -294,76 +490,367 @@ class PicoschemaParser:
         Raises:
             ValueError: If the schema structure is invalid.
         """
-        if path is None:
-            path = []
+        conversion = _Conversion(obj)
+        if conversion.references:
+            conversion.fill(await self._resolve_all(conversion.names()), self._use_defs)
+        return conversion.schema
+
+    async def _resolve_all(self, names: list[str]) -> dict[str, JsonSchema]:
+        """Resolves named schemas concurrently.
+
+        A resolver implementing `resolve_many` resolves all the names in a
+        single call.
+
+        Args:
+            names: The names of the schemas, in order of appearance.
+
+        Returns:
+            The resolved schemas by name.
+
+        Raises:
+            ValueError: If a schema cannot be resolved. The first name in
+                `names` that fails is reported.
+        """
+        if is_batch_resolver(self._schema_resolver):
+            self.resolved_names.update(names)
+            return self._check_resolved(await resolve_json_schemas(names, self._schema_resolver))
+        if len(names) == 1:
+            return {names[0]: await self.must_resolve_schema(names[0])}
+
+        resolved: dict[str, JsonSchema] = {}
+        errors: dict[str, Exception] = {}
+
+        async def resolve_one(name: str) -> None:
+            try:
+                resolved[name] = await self.must_resolve_schema(name)
+            except Exception as e:
+                errors[name] = e
+
+        async with anyio.create_task_group() as tg:
+            for name in names:
+                tg.start_soon(resolve_one, name)
+        for name in names:
+            if name in errors:
+                raise errors[name]
+        return resolved
+
+    def parse_sync(self, schema: Any) -> JsonSchema | None:
+        """Synchronously parses a schema, detecting if it's Picoschema or JSON Schema.
+
+        If the input looks like standard JSON Schema (contains top-level 'type'
+        or 'properties'), it's returned directly. Otherwise, it's parsed as
+        Picoschema.
+
+        Args:
+            schema: The schema definition to parse.
 
-        if isinstance(obj, str):
-            type_name, description = extract_description(obj)
+        Returns:
+            The resulting JSON Schema, or None if the input is None.
+        """
+        if not schema:
+            return None
+
+        if isinstance(schema, str):
+            type_name, description = extract_description(schema)
+            if type_name in JSON_SCHEMA_SCALAR_TYPES:
+                out: JsonSchema = {'type': type_name}
+                if description:
+                    out['description'] = description
+                return out
+            resolved_schema = self.must_resolve_schema_sync(type_name)
+            return {**resolved_schema, 'description': description} if description else resolved_schema
+
+        if isinstance(schema, dict) and _is_json_schema(schema):
+            return cast(JsonSchema, schema)
+
+        if isinstance(schema, dict) and isinstance(schema.get('properties'), dict):
+            return {**cast(JsonSchema, schema), 'type': 'object'}
+
+        # If the schema is not a JSON Schema, parse it as Picoschema.
+        return self.parse_pico_sync(schema)
+
+    def parse_pico_sync(self, obj: Any, path: list[str] | None = None) -> JsonSchema:
+        """Synchronously parses a Picoschema object or string fragment.
+
+        The fragment is converted in a single pass, and the named schemas it
+        refers to, if any, are then resolved and filled in.
+
+        Args:
+            obj: The Picoschema fragment (dict or string).
+            path: The current path within the schema structure (for error reporting).
+
+        Returns:
+            The JSON Schema representation of the fragment.
+
+        Raises:
+            ValueError: If the schema structure is invalid.
+        """
+        conversion = _Conversion(obj)
+        if conversion.references:
+            names = conversion.names()
+            if is_batch_resolver(self._schema_resolver):
+                self.resolved_names.update(names)
+                resolved = self._check_resolved(resolve_json_schemas_sync(names, self._schema_resolver))
+            else:
+                resolved = {name: self.must_resolve_schema_sync(name) for name in names}
+            conversion.fill(resolved, self._use_defs)
+        return conversion.schema
+
+    @staticmethod
+    def _check_resolved(resolved: dict[str, JsonSchema]) -> dict[str, JsonSchema]:
+        """Checks that every schema resolved in a batch is non-empty.
+
+        Raises:
+            ValueError: If a schema is empty.
+        """
+        for name, schema in resolved.items():
+            if not schema:
+                raise ValueError(f"Picoschema: could not find schema with name '{name}'")
+        return resolved
+
+
+class _Reference(NamedTuple):
+    """A place in a converted schema where a named schema goes."""
+
+    parent: JsonSchema
+    """The schema holding the named schema."""
+
+    key: str
+    """The key of the named schema in `parent`."""
+
+    name: str
+    """The name of the schema."""
+
+    description: str | None
+    """The description given with the name."""
+
+    nullable: str
+    """How the schema is made nullable: never (''), if it has a type
+    ('typed'), or always ('always')."""
+
+    property_description: str | None
+    """The description given with the property, which takes precedence."""
+
+
+class _Conversion:
+    """The conversion of a Picoschema fragment into JSON Schema.
+
+    The fragment is walked iteratively, so deep schemas neither recurse nor
+    create a coroutine per property. Named schemas are not resolved during
+    the walk: the places they go are collected as `references`, to be filled
+    in once all of them have been resolved.
+    """
+
+    __slots__ = ('_root', '_pending', 'references')
+
+    def __init__(self, obj: Any) -> None:
+        """Converts a Picoschema fragment.
+
+        Args:
+            obj: The Picoschema fragment (dict or string).
+
+        Raises:
+            ValueError: If the schema structure is invalid.
+        """
+        self._root: JsonSchema = {}
+        # Objects whose schema has been created, but not filled in yet.
+        self._pending: list[tuple[dict[str, Any], JsonSchema]] = []
+        self.references: list[_Reference] = []
+        self._place(self._root, 'schema', obj)
+        while self._pending:
+            self._convert_object(*self._pending.pop())
+
+    @property
+    def schema(self) -> JsonSchema:
+        """The JSON Schema, complete once the references are filled in."""
+        return cast(JsonSchema, self._root['schema'])
+
+    def names(self) -> list[str]:
+        """Returns the names of the schemas referred to, in order of first appearance."""
+        return list(dict.fromkeys(reference.name for reference in self.references))
+
+    def fill(self, resolved: dict[str, JsonSchema], use_defs: bool = False) -> None:
+        """Fills in the named schemas.
+
+        The resolved schemas are copied, as they may be shared and are
+        completed in place, e.g. when a property is optional.
+
+        Args:
+            resolved: The resolved schemas, by name.
+            use_defs: Emit the schemas referred to more than once under
+                `$defs` of the root schema, and refer to them with `$ref`.
+        """
+        shared: set[str] = set()
+        if use_defs:
+            counts = Counter(reference.name for reference in self.references)
+            shared = {name for name, count in counts.items() if count > 1}
+        defs: JsonSchema = {}
+        for reference in self.references:
+            if reference.name in shared:
+                if reference.name not in defs:
+                    defs[reference.name] = {**resolved[reference.name]}
+                reference.parent[reference.key] = _ref_schema(reference, defs[reference.name])
+                continue
+            schema = {**resolved[reference.name]}
+            if reference.description:
+                schema['description'] = reference.description
+            _make_nullable(schema, reference.nullable)
+            if reference.property_description:
+                schema['description'] = reference.property_description
+            reference.parent[reference.key] = schema
+        if defs:
+            self.schema['$defs'] = defs
+
+    def _place(
+        self,
+        parent: JsonSchema,
+        key: str,
+        value: Any,
+        nullable: str = '',
+        property_description: str | None = None,
+    ) -> None:
+        """Converts a value and sets it as `parent[key]`.
+
+        Args:
+            parent: The schema to set the converted value in.
+            key: The key to set it under.
+            value: The Picoschema value, an object or a type string.
+            nullable: How to make the schema nullable, see `_Reference`.
+            property_description: The description given with the property.
+
+        Raises:
+            ValueError: If the value is neither an object nor a string.
+        """
+        if isinstance(value, dict):
+            schema = _object_schema()
+            self._pending.append((value, schema))
+        elif not isinstance(value, str):
+            raise ValueError(f'Picoschema: only consists of objects and strings. Got: {value}')
+        else:
+            type_name, description = (value, None) if ',' not in value else extract_description(value)
             if type_name not in JSON_SCHEMA_SCALAR_TYPES:
-                resolved_schema = await self.must_resolve_schema(type_name)
-                return {**resolved_schema, 'description': description} if description else resolved_schema
+                parent[key] = None
+                self.references.append(_Reference(parent, key, type_name, description, nullable, property_description))
+                return
+            schema = {} if type_name == 'any' else {'type': type_name}
+            if description:
+                schema['description'] = description
 
-            if type_name == 'any':
-                return {'description': description} if description else {}
+        if nullable:
+            _make_nullable(schema, nullable)
+        if property_description:
+            schema['description'] = property_description
+        parent[key] = schema
 
-            return {'type': type_name, 'description': description} if description else {'type': type_name}
-        elif not isinstance(obj, dict):
-            raise ValueError(f'Picoschema: only consists of objects and strings. Got: {obj}')
+    def _convert_object(self, obj: dict[str, Any], schema: JsonSchema) -> None:
+        """Fills in the schema of a Picoschema object.
 
-        schema: JsonSchema = {
-            'type': 'object',
-            'properties': {},
-            'required': [],
-            'additionalProperties': False,
-        }
+        Args:
+            obj: The Picoschema object.
+            schema: The schema created for it by `_object_schema`.
 
+        Raises:
+            ValueError: If the schema structure is invalid.
+        """
+        properties = schema['properties']
         for key, value in obj.items():
             if key == WILDCARD_PROPERTY_NAME:
-                schema['additionalProperties'] = await self.parse_pico(value, [*path, key])
+                self._place(schema, 'additionalProperties', value)
                 continue
 
-            parts = key.split('(')
-            name = parts[0]
-            type_info = parts[1][:-1] if len(parts) > 1 else None
-            is_optional = name.endswith('?')
-            property_name = name[:-1] if is_optional else name
+            property_name, type_info, is_optional = _parse_key(key)
 
             if not is_optional:
                 schema['required'].append(property_name)
 
             if not type_info:
-                prop = await self.parse_pico(value, [*path, key])
-                if is_optional and isinstance(prop.get('type'), str):
-                    prop['type'] = [prop['type'], 'null']
-                schema['properties'][property_name] = prop
+                self._place(properties, property_name, value, 'typed' if is_optional else '')
                 continue
 
             type_name, description = extract_description(type_info)
             if type_name == 'array':
-                prop = await self.parse_pico(value, [*path, key])
-                schema['properties'][property_name] = {
-                    'type': ['array', 'null'] if is_optional else 'array',
-                    'items': prop,
-                }
+                prop: JsonSchema = {'type': ['array', 'null'] if is_optional else 'array'}
+                self._place(prop, 'items', value)
+                properties[property_name] = prop
             elif type_name == 'object':
-                prop = await self.parse_pico(value, [*path, key])
-                if is_optional:
-                    prop['type'] = [prop['type'], 'null']
-                schema['properties'][property_name] = prop
+                self._place(properties, property_name, value, 'always' if is_optional else '', description)
+                continue
             elif type_name == 'enum':
                 prop = {'enum': value}
                 if is_optional and None not in prop['enum']:
                     prop['enum'].append(None)
-                schema['properties'][property_name] = prop
+                properties[property_name] = prop
             else:
                 raise ValueError(f"Picoschema: parenthetical types must be 'object' or 'array', got: {type_name}")
 
             if description:
-                schema['properties'][property_name]['description'] = description
+                prop['description'] = description
 
         if not schema['required']:
             del schema['required']
-        return schema
+
+
+def _ref_schema(reference: _Reference, target: JsonSchema) -> JsonSchema:
+    """Builds the `$ref` to a schema under `$defs` for a reference.
+
+    Args:
+        reference: The reference.
+        target: The schema referred to, to tell whether it is nullable.
+
+    Returns:
+        The schema referring to the shared schema, with the description of
+        the reference, and allowing `null` where the inlined schema would.
+    """
+    pointer = reference.name.replace('~', '~0').replace('/', '~1')
+    ref: JsonSchema = {'$ref': f'#/$defs/{pointer}'}
+    nullable = reference.nullable == 'always' or (reference.nullable == 'typed' and isinstance(target.get('type'), str))
+    schema: JsonSchema = {'anyOf': [ref, {'type': 'null'}]} if nullable else ref
+    description = reference.property_description or reference.description
+    if description:
+        schema['description'] = description
+    return schema
+
+
+def _make_nullable(schema: JsonSchema, nullable: str) -> None:
+    """Adds `null` to the type of a schema.
+
+    Args:
+        schema: The schema, changed in place.
+        nullable: How to make the schema nullable, see `_Reference`.
+    """
+    if nullable == 'always' or (nullable == 'typed' and isinstance(schema.get('type'), str)):
+        schema['type'] = [schema['type'], 'null']
+
+
+def _object_schema() -> JsonSchema:
+    """Creates the JSON Schema of a Picoschema object, to be filled in."""
+    return {
+        'type': 'object',
+        'properties': {},
+        'required': [],
+        'additionalProperties': False,
+    }
+
+
+def _parse_key(key: str) -> tuple[str, str | None, bool]:
+    """Splits a Picoschema property key into its parts.
+
+    Args:
+        key: The key, e.g. `tags?(array, the tags)`.
+
+    Returns:
+        The property name, the parenthetical type information if any, and
+        whether the property is optional.
+    """
+    if '(' in key:
+        parts = key.split('(')
+        name = parts[0]
+        type_info: str | None = parts[1][:-1]
+    else:
+        name = key
+        type_info = None
+    is_optional = name.endswith('?')
+    return (name[:-1] if is_optional else name), type_info, is_optional
 
 
 def extract_description(input_str: str) -> tuple[str, str | None]:
@@ -380,7 +867,7 @@ def extract_description(input_str: str) -> tuple[str, str | None]:
     if ',' not in input_str:
         return input_str, None
 
-    match = re.match(r'(.*?), *(.*)$', input_str)
+    match = _DESCRIPTION_REGEX.match(input_str)
     if match:
         return match.group(1), match.group(2)
     else:
@@ -29,18 +29,45 @@ object.
 | `resolve_tool`        | Helper async function specifically for resolving tool names.               |
 | `resolve_partial`     | Helper async function specifically for resolving partial names.            |
 | `resolve_json_schema` | Helper async function specifically for resolving JSON schemas.             |
+| `resolve_many`        | Resolves many names, in one call if the resolver is a `BatchResolver`.     |
+| `is_batch_resolver`   | Whether a resolver implements `resolve_many`.                              |
+| `nonblocking`         | Marks a sync resolver as safe to call inline on the event loop.            |
+| `is_nonblocking`      | Whether a resolver is marked with `nonblocking`.                           |
+| `resolve_tools`,      | Helpers resolving many tools, partials or JSON schemas.                    |
+| `resolve_partials`,   |                                                                            |
+| `resolve_json_schemas`|                                                                            |
+| `resolve_sync`        | Sync counterpart of `resolve` for synchronous resolvers only.              |
+| `resolve_*_sync`      | Sync counterparts of the `resolve_*` helpers.                              |
 
 The `resolve` function handles both sync and async resolvers. If the resolver is
-sync, it is run in a thread pool to avoid blocking the event loop. If the
-resolver is async, it is awaited directly.
+sync, it is run in a thread pool to avoid blocking the event loop, limited by
+the capacity limiter passed as `limiter` (anyio's default limiter otherwise).
+If the resolver is async, it is awaited directly.
+
+Sync resolvers that never block, such as dictionary lookups, can be marked with
+`nonblocking`. They are then called inline on the event loop, saving the thread
+hop and leaving the thread pool to resolvers that do block:
+
+```python
+tools = {'search': search_tool}
+dotprompt = Dotprompt(tool_resolver=nonblocking(tools.get))
+```
+
+The `resolve_sync` function calls the resolver directly on the calling thread
+and rejects asynchronous resolvers, which cannot be resolved without an event
+loop.
 
 The `resolve_*` functions are convenience wrappers around `resolve` that handle
 the specific types of resolvers for tools, partials, and schemas.
+
+A resolver that also implements `resolve_many` (see `BatchResolver`) resolves
+all the names passed to `resolve_many` in a single call. Other resolvers are
+called once per name, concurrently.
 """
 
 import inspect
-from collections.abc import Awaitable, Callable
-from typing import Any, TypeVar
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from typing import Any, TypeVar, cast
 
 import anyio
 
@@ -58,22 +85,80 @@ ResolverCallable = Callable[[str], Awaitable[Any] | Any]
 ResolverT = TypeVar('ResolverT', bound=ResolverCallable)
 DefinitionT = TypeVar('DefinitionT')
 
+_NONBLOCKING_ATTR = '__dotprompt_nonblocking__'
+
+
+def nonblocking(resolver: Any) -> Any:
+    """Marks a synchronous resolver as safe to call on the event loop.
+
+    `resolve` and `resolve_many` call marked resolvers inline instead of in a
+    worker thread. Only mark resolvers that return quickly without I/O or
+    locks, since they hold up the event loop while they run.
+
+    Functions, resolver objects and resolver classes are marked in place and
+    returned as they are. Callables that cannot be marked, such as `dict.get`,
+    are wrapped.
+
+    Args:
+        resolver: The resolver, or resolver class, to mark.
+
+    Returns:
+        The marked resolver, or a marked wrapper around it.
+    """
+    try:
+        setattr(resolver, _NONBLOCKING_ATTR, True)
+    except (AttributeError, TypeError):
+        return _NonBlocking(resolver)
+    return resolver
+
+
+def is_nonblocking(resolver: Any) -> bool:
+    """Returns whether a resolver is marked with `nonblocking`.
+
+    Args:
+        resolver: The resolver to check.
+
+    Returns:
+        True if the resolver may be called on the event loop.
+    """
+    return getattr(resolver, _NONBLOCKING_ATTR, False) is True
+
+
+class _NonBlocking:
+    """Marked wrapper for resolvers that cannot be marked in place."""
+
+    __slots__ = ('_resolver',)
+    __dotprompt_nonblocking__ = True
+
+    def __init__(self, resolver: ResolverCallable) -> None:
+        self._resolver = resolver
+
+    def __call__(self, name: str) -> Any:
+        return self._resolver(name)
+
+    def __repr__(self) -> str:
+        return f'nonblocking({self._resolver!r})'
+
 
 # TODO: Python 3.12+:
 # async def resolve[
 #     ResolverT: ResolverCallable,
 #     DefinitionT: Any,
 # ](name: str, kind: str, resolver: ResolverT) -> DefinitionT:
-async def resolve(name: str, kind: str, resolver: ResolverT | None) -> DefinitionT:
+async def resolve(
+    name: str, kind: str, resolver: ResolverT | None, *, limiter: anyio.CapacityLimiter | None = None
+) -> DefinitionT:
     """Resolves a single object using the provided resolver.
 
     If the resolver is synchronous, it is run in a thread pool to avoid
-    blocking the event loop.
+    blocking the event loop, unless it is marked with `nonblocking`.
 
     Args:
         name: The name of the object to resolve.
         kind: The kind of object to resolve.
         resolver: The object resolver callable.
+        limiter: The capacity limiter for running a synchronous resolver in
+            a worker thread. Defaults to anyio's default thread limiter.
 
     Returns:
         The resolved object.
@@ -129,11 +214,15 @@ async def resolve(name: str, kind: str, resolver: ResolverT | None) -> Definitio
             # If resolver is async, call it directly and await.
             obj = await resolver(name)
         else:
-            # If resolver is sync, run it in a thread pool and check the return
-            # type after calling, as we don't know it yet. It might still return
-            # an awaitable (e.g. sync function returning `asyncio.Future`) but
-            # calling it sync first is necessary to check.
-            result_or_awaitable = await anyio.to_thread.run_sync(resolver, name)
+            # If resolver is sync, run it in a thread pool (or inline, if it
+            # never blocks) and check the return type after calling, as we
+            # don't know it yet. It might still return an awaitable (e.g. sync
+            # function returning `asyncio.Future`) but calling it sync first is
+            # necessary to check.
+            if is_nonblocking(resolver):
+                result_or_awaitable = resolver(name)
+            else:
+                result_or_awaitable = await anyio.to_thread.run_sync(resolver, name, limiter=limiter)
             if inspect.isawaitable(result_or_awaitable):
                 obj = await result_or_awaitable
             else:
@@ -150,12 +239,15 @@ async def resolve(name: str, kind: str, resolver: ResolverT | None) -> Definitio
     return obj
 
 
-async def resolve_tool(name: str, resolver: ToolResolver | None) -> ToolDefinition:
+async def resolve_tool(
+    name: str, resolver: ToolResolver | None, *, limiter: anyio.CapacityLimiter | None = None
+) -> ToolDefinition:
     """Resolve a tool using the provided resolver.
 
     Args:
         name: The name of the tool to resolve.
         resolver: The tool resolver callable (sync or async).
+        limiter: The capacity limiter for synchronous resolvers.
 
     Returns:
         The resolved tool definition.
@@ -166,15 +258,18 @@ async def resolve_tool(name: str, resolver: ToolResolver | None) -> ToolDefiniti
         TypeError: If the resolver is not callable or returns an invalid type.
         ValueError: If the resolver is not defined.
     """
-    return await resolve(name, 'tool', resolver)
+    return await resolve(name, 'tool', resolver, limiter=limiter)
 
 
-async def resolve_partial(name: str, resolver: PartialResolver | None) -> str:
+async def resolve_partial(
+    name: str, resolver: PartialResolver | None, *, limiter: anyio.CapacityLimiter | None = None
+) -> str:
     """Resolve a partial using the provided resolver.
 
     Args:
         name: The name of the partial to resolve.
         resolver: The partial resolver callable.
+        limiter: The capacity limiter for synchronous resolvers.
 
     Returns:
         The resolved partial.
@@ -185,15 +280,18 @@ async def resolve_partial(name: str, resolver: PartialResolver | None) -> str:
         TypeError: If the resolver is not callable or returns an invalid type.
         ValueError: If the resolver is not defined.
     """
-    return await resolve(name, 'partial', resolver)
+    return await resolve(name, 'partial', resolver, limiter=limiter)
 
 
-async def resolve_json_schema(name: str, resolver: SchemaResolver | None) -> JsonSchema:
+async def resolve_json_schema(
+    name: str, resolver: SchemaResolver | None, *, limiter: anyio.CapacityLimiter | None = None
+) -> JsonSchema:
     """Resolve a JSON schema using the provided resolver.
 
     Args:
         name: The name of the JSON schema to resolve.
         resolver: The JSON schema resolver callable.
+        limiter: The capacity limiter for synchronous resolvers.
 
     Returns:
         The resolved JSON schema.
@@ -203,4 +301,400 @@ async def resolve_json_schema(name: str, resolver: SchemaResolver | None) -> Jso
         ResolverFailedError: For exceptions raised by the resolver.
         TypeError: If the resolver is not callable or returns an invalid type.
     """
-    return await resolve(name, 'schema', resolver)
+    return await resolve(name, 'schema', resolver, limiter=limiter)
+
+
+async def resolve_many(
+    names: Iterable[str],
+    kind: str,
+    resolver: ResolverCallable | None,
+    *,
+    limiter: anyio.CapacityLimiter | None = None,
+) -> dict[str, Any]:
+    """Resolves many objects using the provided resolver.
+
+    If the resolver implements `resolve_many`, all names are resolved in a
+    single call to it; a synchronous `resolve_many` is run in a thread pool
+    unless the resolver is marked with `nonblocking`. Otherwise each name is
+    resolved with `resolve`, concurrently.
+
+    Args:
+        names: The names of the objects to resolve. Duplicates are resolved
+            once.
+        kind: The kind of objects to resolve.
+        resolver: The object resolver callable.
+        limiter: The capacity limiter for running a synchronous resolver in
+            worker threads. Defaults to anyio's default thread limiter.
+
+    Returns:
+        The resolved objects by name, in the order of `names`.
+
+    Raises:
+        LookupError: If the resolver does not resolve one of the names.
+        ResolverFailedError: For exceptions raised by the resolver.
+        TypeError: If the resolver is not callable or returns an invalid type.
+        ValueError: If the resolver is not defined.
+    """
+    unique = list(dict.fromkeys(names))
+    if not unique:
+        return {}
+
+    batch = _batch_method(kind, resolver)
+    if batch is None:
+        return await _resolve_each(unique, kind, resolver, limiter)
+
+    try:
+        if inspect.iscoroutinefunction(batch):
+            result = await batch(unique)
+        else:
+            if is_nonblocking(resolver):
+                result = batch(unique)
+            else:
+                result = await anyio.to_thread.run_sync(batch, unique, limiter=limiter)
+            if inspect.isawaitable(result):
+                result = await result
+    except Exception as e:
+        raise ResolverFailedError(', '.join(unique), kind, str(e)) from e
+
+    return _check_batch(unique, kind, result)
+
+
+async def _resolve_each(
+    names: list[str], kind: str, resolver: ResolverCallable | None, limiter: anyio.CapacityLimiter | None
+) -> dict[str, Any]:
+    """Resolves names one by one, concurrently unless they resolve inline.
+
+    Raises:
+        Exception: The error of the first name in `names` that fails.
+    """
+    if is_nonblocking(resolver) and not inspect.iscoroutinefunction(resolver):
+        return {name: await resolve(name, kind, resolver) for name in names}
+
+    resolved: dict[str, Any] = {}
+    errors: dict[str, Exception] = {}
+
+    async def resolve_one(name: str) -> None:
+        try:
+            resolved[name] = await resolve(name, kind, resolver, limiter=limiter)
+        except Exception as e:
+            errors[name] = e
+
+    async with anyio.create_task_group() as tg:
+        for name in names:
+            tg.start_soon(resolve_one, name)
+    for name in names:
+        if name in errors:
+            raise errors[name]
+    return {name: resolved[name] for name in names}
+
+
+async def resolve_tools(
+    names: Iterable[str], resolver: ToolResolver | None, *, limiter: anyio.CapacityLimiter | None = None
+) -> dict[str, ToolDefinition]:
+    """Resolve many tools using the provided resolver.
+
+    Args:
+        names: The names of the tools to resolve.
+        resolver: The tool resolver callable, which may be a `BatchResolver`.
+        limiter: The capacity limiter for synchronous resolvers.
+
+    Returns:
+        The resolved tool definitions by name.
+
+    Raises:
+        LookupError: If the resolver does not resolve one of the tools.
+        ResolverFailedError: For exceptions raised by the resolver.
+        TypeError: If the resolver is not callable or returns an invalid type.
+        ValueError: If the resolver is not defined.
+    """
+    return await resolve_many(names, 'tool', resolver, limiter=limiter)
+
+
+async def resolve_partials(
+    names: Iterable[str], resolver: PartialResolver | None, *, limiter: anyio.CapacityLimiter | None = None
+) -> dict[str, str]:
+    """Resolve many partials using the provided resolver.
+
+    Args:
+        names: The names of the partials to resolve.
+        resolver: The partial resolver callable, which may be a `BatchResolver`.
+        limiter: The capacity limiter for synchronous resolvers.
+
+    Returns:
+        The resolved partials by name.
+
+    Raises:
+        LookupError: If the resolver does not resolve one of the partials.
+        ResolverFailedError: For exceptions raised by the resolver.
+        TypeError: If the resolver is not callable or returns an invalid type.
+        ValueError: If the resolver is not defined.
+    """
+    return await resolve_many(names, 'partial', resolver, limiter=limiter)
+
+
+async def resolve_json_schemas(
+    names: Iterable[str], resolver: SchemaResolver | None, *, limiter: anyio.CapacityLimiter | None = None
+) -> dict[str, JsonSchema]:
+    """Resolve many JSON schemas using the provided resolver.
+
+    Args:
+        names: The names of the JSON schemas to resolve.
+        resolver: The JSON schema resolver callable, which may be a
+            `BatchResolver`.
+        limiter: The capacity limiter for synchronous resolvers.
+
+    Returns:
+        The resolved JSON schemas by name.
+
+    Raises:
+        LookupError: If the resolver does not resolve one of the schemas.
+        ResolverFailedError: For exceptions raised by the resolver.
+        TypeError: If the resolver is not callable or returns an invalid type.
+    """
+    return await resolve_many(names, 'schema', resolver, limiter=limiter)
+
+
+def resolve_sync(name: str, kind: str, resolver: ResolverCallable | None) -> Any:
+    """Resolves a single object using the provided synchronous resolver.
+
+    The resolver is called directly on the calling thread, without an event
+    loop or a worker thread.
+
+    Args:
+        name: The name of the object to resolve.
+        kind: The kind of object to resolve.
+        resolver: The object resolver callable.
+
+    Returns:
+        The resolved object.
+
+    Raises:
+        LookupError: If the resolver returns None for the object.
+        ResolverFailedError: For exceptions raised by the resolver.
+        TypeError: If the resolver is not callable or is asynchronous.
+        ValueError: If the resolver is not defined.
+    """
+    if resolver is None:
+        raise ValueError(f'{kind} resolver is not defined')
+
+    if not callable(resolver):
+        raise TypeError(f"{kind} resolver for '{name}' is not callable")
+
+    if inspect.iscoroutinefunction(resolver):
+        raise TypeError(f"{kind} resolver for '{name}' is asynchronous; use the async API")
+
+    try:
+        obj = resolver(name)
+    except Exception as e:
+        raise ResolverFailedError(name, kind, str(e)) from e
+
+    if inspect.isawaitable(obj):
+        if inspect.iscoroutine(obj):
+            obj.close()
+        raise TypeError(f"{kind} resolver for '{name}' returned an awaitable; use the async API")
+
+    if obj is None:
+        raise LookupError(f"{kind} resolver for '{name}' returned None")
+
+    return obj
+
+
+def resolve_tool_sync(name: str, resolver: ToolResolver | None) -> ToolDefinition:
+    """Resolve a tool using the provided synchronous resolver.
+
+    Args:
+        name: The name of the tool to resolve.
+        resolver: The sync tool resolver callable.
+
+    Returns:
+        The resolved tool definition.
+
+    Raises:
+        LookupError: If the resolver returns None for the tool.
+        ResolverFailedError: For exceptions raised by the resolver.
+        TypeError: If the resolver is not callable or is asynchronous.
+        ValueError: If the resolver is not defined.
+    """
+    return cast(ToolDefinition, resolve_sync(name, 'tool', resolver))
+
+
+def resolve_partial_sync(name: str, resolver: PartialResolver | None) -> str:
+    """Resolve a partial using the provided synchronous resolver.
+
+    Args:
+        name: The name of the partial to resolve.
+        resolver: The sync partial resolver callable.
+
+    Returns:
+        The resolved partial.
+
+    Raises:
+        LookupError: If the resolver returns None for the partial.
+        ResolverFailedError: For exceptions raised by the resolver.
+        TypeError: If the resolver is not callable or is asynchronous.
+        ValueError: If the resolver is not defined.
+    """
+    return cast(str, resolve_sync(name, 'partial', resolver))
+
+
+def resolve_json_schema_sync(name: str, resolver: SchemaResolver | None) -> JsonSchema:
+    """Resolve a JSON schema using the provided synchronous resolver.
+
+    Args:
+        name: The name of the JSON schema to resolve.
+        resolver: The sync JSON schema resolver callable.
+
+    Returns:
+        The resolved JSON schema.
+
+    Raises:
+        LookupError: If the resolver returns None for the schema.
+        ResolverFailedError: For exceptions raised by the resolver.
+        TypeError: If the resolver is not callable or is asynchronous.
+    """
+    return resolve_sync(name, 'schema', resolver)
+
+
+def resolve_many_sync(names: Iterable[str], kind: str, resolver: ResolverCallable | None) -> dict[str, Any]:
+    """Resolves many objects using the provided synchronous resolver.
+
+    If the resolver implements `resolve_many`, all names are resolved in a
+    single call to it. Otherwise each name is resolved with `resolve_sync`,
+    in order.
+
+    Args:
+        names: The names of the objects to resolve. Duplicates are resolved
+            once.
+        kind: The kind of objects to resolve.
+        resolver: The object resolver callable.
+
+    Returns:
+        The resolved objects by name, in the order of `names`.
+
+    Raises:
+        LookupError: If the resolver does not resolve one of the names.
+        ResolverFailedError: For exceptions raised by the resolver.
+        TypeError: If the resolver is not callable or is asynchronous.
+        ValueError: If the resolver is not defined.
+    """
+    unique = list(dict.fromkeys(names))
+    if not unique:
+        return {}
+
+    batch = _batch_method(kind, resolver)
+    if batch is None:
+        return {name: resolve_sync(name, kind, resolver) for name in unique}
+
+    if inspect.iscoroutinefunction(batch):
+        raise TypeError(f'{kind} resolver is asynchronous; use the async API')
+
+    try:
+        result = batch(unique)
+    except Exception as e:
+        raise ResolverFailedError(', '.join(unique), kind, str(e)) from e
+
+    if inspect.isawaitable(result):
+        if inspect.iscoroutine(result):
+            result.close()
+        raise TypeError(f'{kind} resolver returned an awaitable; use the async API')
+
+    return _check_batch(unique, kind, result)
+
+
+def resolve_tools_sync(names: Iterable[str], resolver: ToolResolver | None) -> dict[str, ToolDefinition]:
+    """Resolve many tools using the provided synchronous resolver.
+
+    Args:
+        names: The names of the tools to resolve.
+        resolver: The sync tool resolver callable, which may be a `BatchResolver`.
+
+    Returns:
+        The resolved tool definitions by name.
+
+    Raises:
+        LookupError: If the resolver does not resolve one of the tools.
+        ResolverFailedError: For exceptions raised by the resolver.
+        TypeError: If the resolver is not callable or is asynchronous.
+        ValueError: If the resolver is not defined.
+    """
+    return resolve_many_sync(names, 'tool', resolver)
+
+
+def resolve_partials_sync(names: Iterable[str], resolver: PartialResolver | None) -> dict[str, str]:
+    """Resolve many partials using the provided synchronous resolver.
+
+    Args:
+        names: The names of the partials to resolve.
+        resolver: The sync partial resolver callable, which may be a
+            `BatchResolver`.
+
+    Returns:
+        The resolved partials by name.
+
+    Raises:
+        LookupError: If the resolver does not resolve one of the partials.
+        ResolverFailedError: For exceptions raised by the resolver.
+        TypeError: If the resolver is not callable or is asynchronous.
+        ValueError: If the resolver is not defined.
+    """
+    return resolve_many_sync(names, 'partial', resolver)
+
+
+def resolve_json_schemas_sync(names: Iterable[str], resolver: SchemaResolver | None) -> dict[str, JsonSchema]:
+    """Resolve many JSON schemas using the provided synchronous resolver.
+
+    Args:
+        names: The names of the JSON schemas to resolve.
+        resolver: The sync JSON schema resolver callable, which may be a
+            `BatchResolver`.
+
+    Returns:
+        The resolved JSON schemas by name.
+
+    Raises:
+        LookupError: If the resolver does not resolve one of the schemas.
+        ResolverFailedError: For exceptions raised by the resolver.
+        TypeError: If the resolver is not callable or is asynchronous.
+    """
+    return resolve_many_sync(names, 'schema', resolver)
+
+
+def is_batch_resolver(resolver: Any) -> bool:
+    """Returns whether a resolver implements `resolve_many`.
+
+    The method is looked up on the resolver's class, so that objects answering
+    any attribute, such as mocks, are not taken for batch resolvers.
+
+    Args:
+        resolver: The resolver to check.
+
+    Returns:
+        True if the resolver is a `BatchResolver`.
+    """
+    return callable(getattr(type(resolver), 'resolve_many', None))
+
+
+def _batch_method(kind: str, resolver: ResolverCallable | None) -> Callable[[list[str]], Any] | None:
+    """Returns the `resolve_many` method of a resolver, if it has one.
+
+    Raises:
+        ValueError: If the resolver is not defined.
+    """
+    if resolver is None:
+        raise ValueError(f'{kind} resolver is not defined')
+    return cast(Callable[[list[str]], Any], resolver.resolve_many) if is_batch_resolver(resolver) else None  # type: ignore[attr-defined]
+
+
+def _check_batch(names: list[str], kind: str, result: Any) -> dict[str, Any]:
+    """Checks the result of a `resolve_many` call covers every name.
+
+    Raises:
+        LookupError: If a name is missing from the result or maps to None.
+        TypeError: If the result is not a mapping.
+    """
+    if not isinstance(result, Mapping):
+        raise TypeError(f'{kind} resolver returned {type(result).__name__} from resolve_many; expected a mapping')
+    for name in names:
+        if result.get(name) is None:
+            raise LookupError(f"{kind} resolver for '{name}' returned None")
+    return {name: result[name] for name in names}
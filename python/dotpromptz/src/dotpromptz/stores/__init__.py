@@ -24,6 +24,18 @@ Available Store Implementations:
 - DirStore: Asynchronous filesystem-based store
 - DirStoreSync: Synchronous filesystem-based store
 - DirStoreOptions: Configuration options for directory-based stores
+- BundleStore: Read-only asynchronous store backed by a compiled bundle file
+- BundleStoreSync: Read-only synchronous store backed by a compiled bundle file
+- build_bundle: Compiles the prompts and partials of a store into a bundle
+- CachingStore: Asynchronous read-through cache in front of any store
+- CachingStoreSync: Synchronous read-through cache in front of any store
+- CacheStats: Hit, miss and eviction counters of a caching store
+- SqliteStore: Asynchronous store backed by an SQLite database
+- SqliteStoreSync: Synchronous store backed by an SQLite database
+- import_store: Copies the prompts and partials of a store into an SQLite store
+
+Store implementations are imported lazily on first access, so importing this
+package does not load the dependencies of stores that are never used.
 
 Directory-based stores organize prompts using the following conventions:
 - Prompts are stored as files with extension `.prompt`
@@ -48,12 +60,61 @@ prompts = sync_store.list()
 ```
 """
 
-from ._dir_async import DirStore as DirStore
-from ._dir_sync import DirStoreSync
-from ._typing import DirStoreOptions
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._bundle import BundleStore, BundleStoreSync, build_bundle
+    from ._cache import CacheStats, CachingStore, CachingStoreSync
+    from ._dir_async import DirStore
+    from ._dir_sync import DirStoreSync
+    from ._sqlite import SqliteStore, SqliteStoreSync, import_store
+    from ._typing import DirStoreOptions
+
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    'BundleStore': '._bundle',
+    'BundleStoreSync': '._bundle',
+    'build_bundle': '._bundle',
+    'CacheStats': '._cache',
+    'CachingStore': '._cache',
+    'CachingStoreSync': '._cache',
+    'DirStore': '._dir_async',
+    'DirStoreSync': '._dir_sync',
+    'SqliteStore': '._sqlite',
+    'SqliteStoreSync': '._sqlite',
+    'import_store': '._sqlite',
+    'DirStoreOptions': '._typing',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including the lazily imported ones."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
+    'BundleStore',
+    'BundleStoreSync',
+    'CacheStats',
+    'CachingStore',
+    'CachingStoreSync',
     'DirStore',
     'DirStoreOptions',
     'DirStoreSync',
+    'SqliteStore',
+    'SqliteStoreSync',
+    'build_bundle',
+    'import_store',
 ]
@@ -0,0 +1,664 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compiled prompt bundles and a read-only store backed by them.
+
+A bundle packs every prompt and partial of a store into a single file that can
+be memory-mapped and served without touching the source tree. Alongside each
+source it records the version, the parsed frontmatter and, for prompts, the
+input and output schemas with Picoschema already converted to JSON Schema.
+
+File Layout:
+- Header: the magic bytes `DPBUNDLE`, the format version, and the offset and
+  length of the index (`<8sIQQ`, little-endian).
+- Sources: UTF-8 encoded sources, stored back to back.
+- Index: a UTF-8 JSON document listing every prompt and partial, ordered by
+  name and variant, with the offset and length of its source.
+
+Frontmatter is stored in the index only when JSON represents it exactly.
+YAML values without a JSON equivalent, such as dates or non-string keys, make
+the entry record null instead, and the frontmatter is reparsed from the
+bundled source on access, so it always matches `parse_frontmatter`.
+
+The index is decoded once when the bundle is opened, so each load is a
+dictionary lookup followed by a slice of the mapped file.
+
+Example Usage:
+```python
+from pathlib import Path
+
+from dotpromptz.stores import (
+    BundleStoreSync,
+    DirStoreOptions,
+    DirStoreSync,
+    build_bundle,
+)
+from dotpromptz.typing import LoadPromptOptions
+
+source = DirStoreSync(DirStoreOptions(directory=Path('./prompts')))
+build_bundle(source, 'prompts.bundle')
+
+store = BundleStoreSync('prompts.bundle')
+prompt = store.load('greeting', LoadPromptOptions(variant='formal'))
+```
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any
+
+import structlog
+import yaml
+
+from dotpromptz.errors import ResolverFailedError
+from dotpromptz.parse import parse_frontmatter
+from dotpromptz.picoschema import picoschema_to_json_schema_sync
+from dotpromptz.typing import (
+    JsonSchema,
+    ListPartialsOptions,
+    ListPromptsOptions,
+    LoadPartialOptions,
+    LoadPromptOptions,
+    PaginatedPartials,
+    PaginatedPrompts,
+    PartialData,
+    PartialRef,
+    PromptData,
+    PromptRef,
+    PromptStore,
+    PromptStoreSync,
+    SchemaResolver,
+)
+
+from ._index import SortKey, decode_cursor, encode_cursor, sort_key
+from ._io import calculate_version
+
+logger = structlog.get_logger(__name__)
+
+BUNDLE_MAGIC = b'DPBUNDLE'
+BUNDLE_FORMAT_VERSION = 2
+
+_HEADER = struct.Struct('<8sIQQ')
+
+_Key = tuple[str, str | None]
+
+
+def _list_all(store: PromptStoreSync) -> tuple[list[PromptRef], list[PartialRef]]:
+    """List every prompt and partial in a store, following cursors."""
+    prompts: list[PromptRef] = []
+    cursor: str | None = None
+    while True:
+        page = store.list(ListPromptsOptions(cursor=cursor))
+        prompts.extend(page.prompts)
+        cursor = page.cursor
+        if not cursor:
+            break
+
+    partials: list[PartialRef] = []
+    cursor = None
+    while True:
+        partial_page = store.list_partials(ListPartialsOptions(cursor=cursor))
+        partials.extend(partial_page.partials)
+        cursor = partial_page.cursor
+        if not cursor:
+            break
+
+    return prompts, partials
+
+
+def _read_frontmatter(source: str, name: str) -> dict[str, Any]:
+    """Parse the frontmatter of a prompt, tolerating malformed YAML.
+
+    Args:
+        source: The prompt source.
+        name: The prompt name, for logging.
+
+    Returns:
+        The raw frontmatter, or an empty dictionary if it cannot be parsed.
+    """
+    try:
+        return parse_frontmatter(source)
+    except (yaml.YAMLError, ValueError) as e:
+        logger.warning('Storing empty frontmatter in bundle', name=name, error=str(e))
+        return {}
+
+
+def _json_exact(value: Any) -> bool:
+    """Check whether a value survives a JSON round trip unchanged.
+
+    Args:
+        value: A value parsed from YAML.
+
+    Returns:
+        True if decoding the JSON encoding of the value yields an equal value.
+    """
+    try:
+        return bool(json.loads(json.dumps(value)) == value)
+    except (TypeError, ValueError):
+        return False
+
+
+def _declared_schema(frontmatter: dict[str, Any], key: str, name: str) -> Any:
+    """Return the schema declared under `input` or `output` of a frontmatter.
+
+    Args:
+        frontmatter: The raw frontmatter.
+        key: Either `'input'` or `'output'`.
+        name: The prompt name, for logging.
+
+    Returns:
+        The declared schema, or None if there is none or the section is not a
+        mapping.
+    """
+    section = frontmatter.get(key)
+    if section is None:
+        return None
+    if not isinstance(section, dict):
+        logger.warning('Leaving schema unresolved in bundle', name=name, error=f'{key} is not a mapping')
+        return None
+    return section.get('schema')
+
+
+def _resolve_schema(schema: Any, schema_resolver: SchemaResolver | None, name: str) -> JsonSchema | None:
+    """Convert a frontmatter schema to JSON Schema, tolerating unknown names.
+
+    Args:
+        schema: The Picoschema or JSON Schema from the frontmatter.
+        schema_resolver: Resolver for named schemas.
+        name: The prompt name, for logging.
+
+    Returns:
+        The JSON Schema, or None if the schema is absent, references a named
+        schema that cannot be resolved at build time, or holds values that
+        JSON cannot represent exactly.
+    """
+    if schema is None:
+        return None
+    try:
+        resolved = picoschema_to_json_schema_sync(schema, schema_resolver)
+    except (LookupError, ResolverFailedError, TypeError, ValueError) as e:
+        logger.warning('Leaving schema unresolved in bundle', name=name, error=str(e))
+        return None
+    if not _json_exact(resolved):
+        logger.warning('Leaving schema unresolved in bundle', name=name, error='schema is not representable as JSON')
+        return None
+    return resolved
+
+
+def build_bundle(
+    store: PromptStoreSync,
+    path: str | Path,
+    schema_resolver: SchemaResolver | None = None,
+) -> None:
+    """Compile every prompt and partial of a store into a bundle file.
+
+    The bundle is written to a temporary file and moved into place, so
+    readers never observe a partially written bundle.
+
+    Args:
+        store: The store to read from, typically a `DirStoreSync`.
+        path: Where to write the bundle.
+        schema_resolver: Synchronous resolver for named schemas referenced by
+            Picoschema. Schemas that cannot be resolved are stored as null
+            and left for resolution at runtime.
+    """
+    path = Path(path)
+    prompt_refs, partial_refs = _list_all(store)
+    prompt_refs.sort(key=lambda ref: sort_key(ref.name, ref.variant))
+    partial_refs.sort(key=lambda ref: sort_key(ref.name, ref.variant))
+
+    index: dict[str, list[dict[str, Any]]] = {'prompts': [], 'partials': []}
+    tmp_path = path.with_name(f'.{path.name}.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(BUNDLE_MAGIC, BUNDLE_FORMAT_VERSION, 0, 0))
+        offset = _HEADER.size
+
+        for ref in prompt_refs:
+            prompt = store.load(ref.name, LoadPromptOptions(variant=ref.variant))
+            encoded = prompt.source.encode('utf-8')
+            frontmatter = _read_frontmatter(prompt.source, ref.name)
+            input_schema = _declared_schema(frontmatter, 'input', ref.name)
+            output_schema = _declared_schema(frontmatter, 'output', ref.name)
+            index['prompts'].append(
+                {
+                    'name': ref.name,
+                    'variant': ref.variant,
+                    'version': calculate_version(prompt.source),
+                    'offset': offset,
+                    'length': len(encoded),
+                    'frontmatter': frontmatter if _json_exact(frontmatter) else None,
+                    'schemas': {
+                        'input': _resolve_schema(input_schema, schema_resolver, ref.name),
+                        'output': _resolve_schema(output_schema, schema_resolver, ref.name),
+                    },
+                }
+            )
+            f.write(encoded)
+            offset += len(encoded)
+
+        for partial_ref in partial_refs:
+            partial = store.load_partial(partial_ref.name, LoadPartialOptions(variant=partial_ref.variant))
+            encoded = partial.source.encode('utf-8')
+            index['partials'].append(
+                {
+                    'name': partial_ref.name,
+                    'variant': partial_ref.variant,
+                    'version': calculate_version(partial.source),
+                    'offset': offset,
+                    'length': len(encoded),
+                }
+            )
+            f.write(encoded)
+            offset += len(encoded)
+
+        encoded_index = json.dumps(index, separators=(',', ':')).encode('utf-8')
+        f.write(encoded_index)
+        f.seek(0)
+        f.write(_HEADER.pack(BUNDLE_MAGIC, BUNDLE_FORMAT_VERSION, offset, len(encoded_index)))
+
+    os.replace(tmp_path, path)
+    logger.info('Wrote prompt bundle', path=str(path), prompts=len(prompt_refs), partials=len(partial_refs))
+
+
+def _page(refs: list[Any], keys: list[SortKey], cursor: str | None, limit: int | None) -> tuple[list[Any], str | None]:
+    """Return the references after a cursor.
+
+    Cursors are those of `encode_cursor`, so bundles page like the other
+    stores and accept their cursors.
+
+    Args:
+        refs: The references, in listing order.
+        keys: The sort keys of the references.
+        cursor: The cursor returned with the previous page, or None for the
+            first page.
+        limit: The maximum number of references to return, or None for all.
+
+    Returns:
+        The page and the cursor for the next page, if any.
+
+    Raises:
+        ValueError: If the cursor is malformed or the limit is not positive.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError(f'Page limit must be positive, got {limit}')
+    start = 0 if cursor is None else bisect.bisect_right(keys, sort_key(*decode_cursor(cursor)))
+    end = len(refs) if limit is None else min(start + limit, len(refs))
+    page = refs[start:end]
+    if end >= len(refs) or not page:
+        return page, None
+    return page, encode_cursor(page[-1].name, page[-1].variant)
+
+
+class _Bundle:
+    """Memory-mapped view of a bundle file."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Map a bundle file and decode its index.
+
+        Args:
+            path: The bundle file.
+
+        Raises:
+            ValueError: If the file is not a bundle of a supported version.
+        """
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < _HEADER.size:
+            self._mmap.close()
+            raise ValueError(f'Not a prompt bundle: {self.path}')
+        magic, format_version, index_offset, index_length = _HEADER.unpack_from(self._mmap)
+        if magic != BUNDLE_MAGIC or format_version != BUNDLE_FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f'Not a prompt bundle of format version {BUNDLE_FORMAT_VERSION}: {self.path}')
+
+        index = json.loads(self._mmap[index_offset : index_offset + index_length])
+        self.prompts: dict[_Key, dict[str, Any]] = {(e['name'], e['variant']): e for e in index['prompts']}
+        self.partials: dict[_Key, dict[str, Any]] = {(e['name'], e['variant']): e for e in index['partials']}
+        self.prompt_refs = [
+            PromptRef(name=e['name'], variant=e['variant'], version=e['version']) for e in index['prompts']
+        ]
+        self.partial_refs = [
+            PartialRef(name=e['name'], variant=e['variant'], version=e['version']) for e in index['partials']
+        ]
+        self.prompt_refs.sort(key=lambda ref: sort_key(ref.name, ref.variant))
+        self.partial_refs.sort(key=lambda ref: sort_key(ref.name, ref.variant))
+        self._prompt_keys = [sort_key(ref.name, ref.variant) for ref in self.prompt_refs]
+        self._partial_keys = [sort_key(ref.name, ref.variant) for ref in self.partial_refs]
+        logger.debug(
+            'Opened prompt bundle',
+            path=str(self.path),
+            prompts=len(self.prompts),
+            partials=len(self.partials),
+        )
+
+    def close(self) -> None:
+        """Unmap the bundle file."""
+        self._mmap.close()
+
+    def list(self, options: ListPromptsOptions | None) -> PaginatedPrompts:
+        """List prompt references in name order."""
+        refs, cursor = _page(
+            self.prompt_refs,
+            self._prompt_keys,
+            options.cursor if options else None,
+            options.limit if options else None,
+        )
+        return PaginatedPrompts(prompts=refs, cursor=cursor)
+
+    def list_partials(self, options: ListPartialsOptions | None) -> PaginatedPartials:
+        """List partial references in name order."""
+        refs, cursor = _page(
+            self.partial_refs,
+            self._partial_keys,
+            options.cursor if options else None,
+            options.limit if options else None,
+        )
+        return PaginatedPartials(partials=refs, cursor=cursor)
+
+    def entry(self, kind: str, name: str, variant: str | None, version: str | None) -> dict[str, Any]:
+        """Look up an index entry.
+
+        Args:
+            kind: Either 'prompt' or 'partial'.
+            name: The name of the prompt or partial.
+            variant: The variant, if any.
+            version: The version the caller expects, if any.
+
+        Returns:
+            The index entry.
+
+        Raises:
+            FileNotFoundError: If the bundle has no such entry.
+            ValueError: If the requested version does not match.
+        """
+        entries = self.prompts if kind == 'prompt' else self.partials
+        entry = entries.get((name, variant))
+        if entry is None:
+            raise FileNotFoundError(
+                f"{kind.capitalize()} '{name}'{f' (variant: {variant})' if variant else ''} not found in {self.path}"
+            )
+        if version and version != entry['version']:
+            raise ValueError(
+                f"Version mismatch for {kind} '{name}'"
+                f'{f" (variant: {variant})" if variant else ""}'
+                f': requested {version} but found {entry["version"]}'
+            )
+        return entry
+
+    def source(self, entry: dict[str, Any]) -> str:
+        """Read the source of an entry from the mapped file."""
+        return self._mmap[entry['offset'] : entry['offset'] + entry['length']].decode('utf-8')
+
+    def frontmatter(self, name: str, variant: str | None) -> dict[str, Any]:
+        """Return the frontmatter of a prompt, reparsing it if it was not stored."""
+        entry = self.entry('prompt', name, variant, None)
+        if entry['frontmatter'] is None:
+            return parse_frontmatter(self.source(entry))
+        return dict(entry['frontmatter'])
+
+    def load(self, name: str, options: LoadPromptOptions | None) -> PromptData:
+        """Load a prompt from the bundle."""
+        variant = options.variant if options else None
+        entry = self.entry('prompt', name, variant, options.version if options else None)
+        return PromptData(name=name, variant=variant, version=entry['version'], source=self.source(entry))
+
+    def load_partial(self, name: str, options: LoadPartialOptions | None) -> PartialData:
+        """Load a partial from the bundle."""
+        variant = options.variant if options else None
+        entry = self.entry('partial', name, variant, options.version if options else None)
+        return PartialData(name=name, variant=variant, version=entry['version'], source=self.source(entry))
+
+
+class BundleStoreSync(PromptStoreSync):
+    """Read-only sync store serving prompts and partials from a bundle file.
+
+    Implements the `PromptStoreSync` protocol. Listing supports cursor
+    pagination with `limit`, and references are returned in name order.
+
+    Examples:
+        ```python
+        store = BundleStoreSync('prompts.bundle')
+        prompt = store.load('greeting')
+        frontmatter = store.frontmatter('greeting')
+        ```
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Open a bundle file.
+
+        Args:
+            path: The bundle file, as written by `build_bundle`.
+
+        Raises:
+            ValueError: If the file is not a bundle of a supported version.
+        """
+        self._bundle = _Bundle(path)
+
+    def close(self) -> None:
+        """Unmap the bundle file."""
+        self._bundle.close()
+
+    def list(self, options: ListPromptsOptions | None = None) -> PaginatedPrompts:
+        """Lists prompts in the bundle (excluding partials).
+
+        Args:
+            options: Listing options, including the cursor and page limit.
+
+        Returns:
+            A page of prompt references.
+        """
+        return self._bundle.list(options)
+
+    def list_partials(self, options: ListPartialsOptions | None = None) -> PaginatedPartials:
+        """Lists partials in the bundle.
+
+        Args:
+            options: Listing options, including the cursor and page limit.
+
+        Returns:
+            A page of partial references.
+        """
+        return self._bundle.list_partials(options)
+
+    def load(self, name: str, options: LoadPromptOptions | None = None) -> PromptData:
+        """Loads a prompt from the bundle.
+
+        Args:
+            name: The name of the prompt.
+            options: Options like variant or version.
+
+        Returns:
+            The prompt data.
+
+        Raises:
+            FileNotFoundError: If the bundle has no such prompt.
+            ValueError: If the requested version does not match.
+        """
+        return self._bundle.load(name, options)
+
+    def load_partial(self, name: str, options: LoadPartialOptions | None = None) -> PartialData:
+        """Loads a partial from the bundle.
+
+        Args:
+            name: The name of the partial.
+            options: Options like variant or version.
+
+        Returns:
+            The partial data.
+
+        Raises:
+            FileNotFoundError: If the bundle has no such partial.
+            ValueError: If the requested version does not match.
+        """
+        return self._bundle.load_partial(name, options)
+
+    def frontmatter(self, name: str, variant: str | None = None) -> dict[str, Any]:
+        """Returns the parsed frontmatter of a prompt.
+
+        Args:
+            name: The name of the prompt.
+            variant: The variant of the prompt.
+
+        Returns:
+            The frontmatter, equal to `parse_frontmatter` of the source. It is
+            served from the index unless it holds values JSON cannot
+            represent, such as dates, in which case it is reparsed.
+
+        Raises:
+            FileNotFoundError: If the bundle has no such prompt.
+        """
+        return self._bundle.frontmatter(name, variant)
+
+    def schemas(self, name: str, variant: str | None = None) -> dict[str, JsonSchema | None]:
+        """Returns the input and output JSON Schemas resolved at build time.
+
+        Args:
+            name: The name of the prompt.
+            variant: The variant of the prompt.
+
+        Returns:
+            A mapping with 'input' and 'output' keys. A value is None if the
+            prompt declares no such schema or it could not be resolved.
+
+        Raises:
+            FileNotFoundError: If the bundle has no such prompt.
+        """
+        return dict(self._bundle.entry('prompt', name, variant, None)['schemas'])
+
+
+class BundleStore(PromptStore):
+    """Read-only async store serving prompts and partials from a bundle file.
+
+    Implements the `PromptStore` protocol. Reads are served from the mapped
+    file without thread hops; see `BundleStoreSync` for details.
+
+    Examples:
+        ```python
+        store = BundleStore('prompts.bundle')
+        prompt = await store.load('greeting')
+        frontmatter = await store.frontmatter('greeting')
+        ```
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Open a bundle file.
+
+        Args:
+            path: The bundle file, as written by `build_bundle`.
+
+        Raises:
+            ValueError: If the file is not a bundle of a supported version.
+        """
+        self._bundle = _Bundle(path)
+
+    def close(self) -> None:
+        """Unmap the bundle file."""
+        self._bundle.close()
+
+    async def list(self, options: ListPromptsOptions | None = None) -> PaginatedPrompts:
+        """Lists prompts in the bundle (excluding partials).
+
+        Args:
+            options: Listing options, including the cursor and page limit.
+
+        Returns:
+            A page of prompt references.
+        """
+        return self._bundle.list(options)
+
+    async def list_partials(self, options: ListPartialsOptions | None = None) -> PaginatedPartials:
+        """Lists partials in the bundle.
+
+        Args:
+            options: Listing options, including the cursor and page limit.
+
+        Returns:
+            A page of partial references.
+        """
+        return self._bundle.list_partials(options)
+
+    async def load(self, name: str, options: LoadPromptOptions | None = None) -> PromptData:
+        """Loads a prompt from the bundle.
+
+        Args:
+            name: The name of the prompt.
+            options: Options like variant or version.
+
+        Returns:
+            The prompt data.
+
+        Raises:
+            FileNotFoundError: If the bundle has no such prompt.
+            ValueError: If the requested version does not match.
+        """
+        return self._bundle.load(name, options)
+
+    async def load_partial(self, name: str, options: LoadPartialOptions | None = None) -> PartialData:
+        """Loads a partial from the bundle.
+
+        Args:
+            name: The name of the partial.
+            options: Options like variant or version.
+
+        Returns:
+            The partial data.
+
+        Raises:
+            FileNotFoundError: If the bundle has no such partial.
+            ValueError: If the requested version does not match.
+        """
+        return self._bundle.load_partial(name, options)
+
+    async def frontmatter(self, name: str, variant: str | None = None) -> dict[str, Any]:
+        """Returns the parsed frontmatter of a prompt.
+
+        Args:
+            name: The name of the prompt.
+            variant: The variant of the prompt.
+
+        Returns:
+            The frontmatter, equal to `parse_frontmatter` of the source. It is
+            served from the index unless it holds values JSON cannot
+            represent, such as dates, in which case it is reparsed.
+
+        Raises:
+            FileNotFoundError: If the bundle has no such prompt.
+        """
+        return self._bundle.frontmatter(name, variant)
+
+    async def schemas(self, name: str, variant: str | None = None) -> dict[str, JsonSchema | None]:
+        """Returns the input and output JSON Schemas resolved at build time.
+
+        Args:
+            name: The name of the prompt.
+            variant: The variant of the prompt.
+
+        Returns:
+            A mapping with 'input' and 'output' keys. A value is None if the
+            prompt declares no such schema or it could not be resolved.
+
+        Raises:
+            FileNotFoundError: If the bundle has no such prompt.
+        """
+        return dict(self._bundle.entry('prompt', name, variant, None)['schemas'])
@@ -0,0 +1,664 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Read-through caching of the prompts and partials of any store.
+
+Loading a prompt from a directory store reads the file and hashes its content
+every time. `CachingStore` and `CachingStoreSync` wrap any store and keep
+recently loaded prompts and partials in memory, keyed by kind, name, variant
+and version. A load of a specific version is also served by the cached latest
+load when its version matches.
+
+- Entries are evicted least recently used first once the cache is full, and
+  expire after a time to live, after which they are loaded again.
+- Changes reported by the backing store's `watch`, or passed to `invalidate`,
+  drop the affected entries right away. Saves and deletes through the wrapper
+  do the same.
+- Concurrent loads of the same entry are coalesced into a single load from
+  the backing store.
+- Hits, misses, coalesced loads, evictions and expirations are counted and
+  reported by `stats`.
+
+Cached data is shared between callers and must not be modified.
+
+Example Usage:
+```python
+from pathlib import Path
+
+from dotpromptz.stores import CachingStore, DirStore, DirStoreOptions
+
+source = DirStore(DirStoreOptions(directory=Path('./prompts')))
+store = CachingStore(source, ttl=300)
+prompt = await store.load('greeting')
+
+async for changes in store.watch():
+    dotprompt.invalidate(changes)
+```
+"""
+
+from __future__ import annotations
+
+import builtins
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any, Literal, TypeVar
+
+import anyio
+import structlog
+
+from dotpromptz.typing import (
+    DeletePromptOrPartialOptions,
+    ListPartialsOptions,
+    ListPromptsOptions,
+    LoadPartialOptions,
+    LoadPromptOptions,
+    PaginatedPartials,
+    PaginatedPrompts,
+    PartialData,
+    PromptData,
+    PromptStore,
+    PromptStoreSync,
+    PromptStoreWritable,
+    PromptStoreWritableSync,
+    StoreChange,
+)
+
+logger = structlog.get_logger(__name__)
+
+_Kind = Literal['prompt', 'partial']
+
+_Key = tuple[_Kind, str, str | None, str | None]
+"""Cache key: (kind, name, variant, version), with no version for the latest."""
+
+DataT = TypeVar('DataT', PromptData, PartialData)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters of a caching store.
+
+    Attributes:
+        hits: Loads served from the cache.
+        misses: Loads that went to the backing store.
+        coalesced: Loads that waited for a concurrent load of the same entry
+            instead of going to the backing store.
+        evictions: Entries dropped to make room for others.
+        expirations: Entries dropped because they outlived the time to live.
+        size: The number of entries in the cache.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of loads served without the backing store."""
+        total = self.hits + self.coalesced + self.misses
+        return (self.hits + self.coalesced) / total if total else 0.0
+
+
+class _Cache:
+    """Thread-safe LRU cache of prompt and partial data with a time to live."""
+
+    def __init__(self, max_entries: int, ttl: float | None) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: The most entries to keep.
+            ttl: Seconds an entry is served for, or None to keep entries until
+                evicted or invalidated.
+
+        Raises:
+            ValueError: If `max_entries` or `ttl` is not positive.
+        """
+        if max_entries < 1:
+            raise ValueError(f'max_entries must be positive, got {max_entries}')
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f'ttl must be positive, got {ttl}')
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries: OrderedDict[_Key, tuple[float, PromptData | PartialData]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._counts = {'hits': 0, 'misses': 0, 'coalesced': 0, 'evictions': 0, 'expirations': 0}
+        self.generation = 0
+        """Incremented on every invalidation, so that loads started before it are not cached."""
+
+    def get(self, key: _Key) -> PromptData | PartialData | None:
+        """Return a live entry and mark it recently used, counting a hit.
+
+        A request for a version is also served by the latest entry when that
+        is the version requested.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            version = key[3]
+            if entry is None and version is not None:
+                key = (key[0], key[1], key[2], None)
+                entry = self._entries.get(key)
+                if entry is not None and entry[1].version != version:
+                    entry = None
+            if entry is None:
+                return None
+            if self._ttl is not None and time.monotonic() - entry[0] > self._ttl:
+                del self._entries[key]
+                self._counts['expirations'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counts['hits'] += 1
+            return entry[1]
+
+    def put(self, key: _Key, data: PromptData | PartialData, generation: int) -> None:
+        """Cache loaded data.
+
+        Args:
+            key: The key the data was loaded for.
+            data: The loaded data.
+            generation: The generation when the load started. Data loaded
+                before an invalidation may be stale and is not cached.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (now, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._counts['evictions'] += 1
+
+    def count(self, counter: str) -> None:
+        """Increment a counter."""
+        with self._lock:
+            self._counts[counter] += 1
+
+    def discard(self, targets: Iterable[tuple[_Kind, str, str | None]]) -> int:
+        """Drop every version of the given prompts and partials.
+
+        Args:
+            targets: The kind, name and variant of each prompt or partial.
+
+        Returns:
+            The number of entries dropped.
+        """
+        wanted = set(targets)
+        with self._lock:
+            self.generation += 1
+            stale = [key for key in self._entries if key[:3] in wanted]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the counters."""
+        with self._lock:
+            return CacheStats(**self._counts, size=len(self._entries))
+
+
+def _change_targets(changes: Iterable[StoreChange]) -> builtins.list[tuple[_Kind, str, str | None]]:
+    """Return the cache targets affected by store changes."""
+    return [(change.kind, change.name, change.variant) for change in changes]
+
+
+def _name_targets(name: str, variant: str | None) -> builtins.list[tuple[_Kind, str, str | None]]:
+    """Return the prompt and partial of a name, as affected by a save or delete."""
+    return [('prompt', name, variant), ('partial', name, variant)]
+
+
+class _Flight:
+    """The outcome of a load, shared with concurrent loads of the same entry."""
+
+    __slots__ = ('data', 'error')
+
+    def __init__(self) -> None:
+        """Initialize a pending load."""
+        self.data: PromptData | PartialData | None = None
+        self.error: Exception | None = None
+
+
+class CachingStore(PromptStoreWritable):
+    """Async read-through cache in front of any async prompt store.
+
+    Implements the `PromptStoreWritable` protocol. Loads are served from the
+    cache when possible; listings always go to the backing store. Saving and
+    deleting require a writable backing store.
+
+    Examples:
+        ```python
+        store = CachingStore(DirStore(DirStoreOptions(directory=Path('./prompts'))))
+        prompt = await store.load('greeting')
+        print(store.stats.hit_rate)
+        ```
+    """
+
+    def __init__(self, store: PromptStore, max_entries: int = 1024, ttl: float | None = 60.0) -> None:
+        """Wrap a store.
+
+        Args:
+            store: The backing store.
+            max_entries: The most prompts and partials to keep, counting each
+                version requested separately.
+            ttl: Seconds a loaded prompt or partial is served for before it is
+                loaded again, or None to keep it until evicted or invalidated.
+
+        Raises:
+            ValueError: If `max_entries` or `ttl` is not positive.
+        """
+        self._store = store
+        self._cache = _Cache(max_entries, ttl)
+        self._flights: dict[_Key, tuple[_Flight, anyio.Event]] = {}
+
+    @property
+    def stats(self) -> CacheStats:
+        """Counters of cache hits, misses and evictions."""
+        return self._cache.stats()
+
+    async def list(self, options: ListPromptsOptions | None = None) -> PaginatedPrompts:
+        """Lists prompts in the backing store.
+
+        Args:
+            options: Listing options, including the cursor and page limit.
+
+        Returns:
+            A page of prompt references.
+        """
+        return await self._store.list(options)
+
+    async def list_partials(self, options: ListPartialsOptions | None = None) -> PaginatedPartials:
+        """Lists partials in the backing store.
+
+        Args:
+            options: Listing options, including the cursor and page limit.
+
+        Returns:
+            A page of partial references.
+        """
+        return await self._store.list_partials(options)
+
+    async def load(self, name: str, options: LoadPromptOptions | None = None) -> PromptData:
+        """Loads a prompt from the cache or the backing store.
+
+        Args:
+            name: The name of the prompt.
+            options: Options like variant or version.
+
+        Returns:
+            The prompt data.
+
+        Raises:
+            Exception: Whatever the backing store raises, e.g.
+                FileNotFoundError if there is no such prompt.
+        """
+        variant = options.variant if options else None
+        key: _Key = ('prompt', name, variant, options.version if options else None)
+        return await self._load(key, PromptData, lambda: self._store.load(name, options))
+
+    async def load_partial(self, name: str, options: LoadPartialOptions | None = None) -> PartialData:
+        """Loads a partial from the cache or the backing store.
+
+        Args:
+            name: The name of the partial.
+            options: Options like variant or version.
+
+        Returns:
+            The partial data.
+
+        Raises:
+            Exception: Whatever the backing store raises, e.g.
+                FileNotFoundError if there is no such partial.
+        """
+        variant = options.variant if options else None
+        key: _Key = ('partial', name, variant, options.version if options else None)
+        return await self._load(key, PartialData, lambda: self._store.load_partial(name, options))
+
+    async def save(self, prompt: PromptData) -> None:
+        """Saves a prompt to the backing store and drops its cached versions.
+
+        Args:
+            prompt: The prompt or partial to save.
+
+        Raises:
+            TypeError: If the backing store is read-only.
+        """
+        save = _writer(self._store, 'save')
+        try:
+            await save(prompt)
+        finally:
+            self._cache.discard(_name_targets(prompt.name, prompt.variant))
+
+    async def delete(self, name: str, options: DeletePromptOrPartialOptions | None = None) -> None:
+        """Deletes a prompt or partial from the backing store and the cache.
+
+        Args:
+            name: The name of the prompt or partial.
+            options: Options like variant.
+
+        Raises:
+            TypeError: If the backing store is read-only.
+        """
+        delete = _writer(self._store, 'delete')
+        try:
+            await delete(name, options)
+        finally:
+            self._cache.discard(_name_targets(name, options.variant if options else None))
+
+    def invalidate(self, changes: Iterable[StoreChange]) -> None:
+        """Drop every cached version of changed prompts and partials.
+
+        Args:
+            changes: The changes reported by the backing store's `watch`.
+        """
+        dropped = self._cache.discard(_change_targets(changes))
+        logger.debug('Invalidated cached prompts', count=dropped)
+
+    def clear(self) -> None:
+        """Drop every cached prompt and partial."""
+        self._cache.clear()
+
+    async def watch(self, *args: Any, **kwargs: Any) -> AsyncIterator[builtins.list[StoreChange]]:
+        """Watch the backing store, invalidating changes before yielding them.
+
+        Args:
+            *args: Positional arguments for the backing store's `watch`.
+            **kwargs: Keyword arguments for the backing store's `watch`.
+
+        Yields:
+            The batches of changes reported by the backing store.
+
+        Raises:
+            TypeError: If the backing store cannot be watched.
+        """
+        watch = getattr(self._store, 'watch', None)
+        if watch is None:
+            raise TypeError(f'{type(self._store).__name__} does not support watching')
+        async for changes in watch(*args, **kwargs):
+            self.invalidate(changes)
+            yield changes
+
+    async def _load(self, key: _Key, kind: type[DataT], load: Callable[[], Awaitable[DataT]]) -> DataT:
+        """Return cached data, or load it once for all concurrent callers.
+
+        Args:
+            key: The cache key.
+            kind: The type of the data, for type checking.
+            load: Loads the data from the backing store.
+
+        Returns:
+            The data.
+        """
+        while True:
+            cached = self._cache.get(key)
+            if cached is not None:
+                assert isinstance(cached, kind)
+                return cached
+            pending = self._flights.get(key)
+            if pending is None:
+                break
+            self._cache.count('coalesced')
+            await pending[1].wait()
+            if pending[0].error is not None:
+                raise pending[0].error
+            if pending[0].data is not None:
+                assert isinstance(pending[0].data, kind)
+                return pending[0].data
+            # The load was cancelled; try again.
+
+        flight = _Flight()
+        done = anyio.Event()
+        self._flights[key] = (flight, done)
+        generation = self._cache.generation
+        self._cache.count('misses')
+        try:
+            data = await load()
+            flight.data = data
+            self._cache.put(key, data, generation)
+            return data
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            del self._flights[key]
+            done.set()
+
+
+class CachingStoreSync(PromptStoreWritableSync):
+    """Sync read-through cache in front of any sync prompt store.
+
+    Implements the `PromptStoreWritableSync` protocol and is safe to use from
+    several threads; see `CachingStore` for details.
+
+    Examples:
+        ```python
+        source = DirStoreSync(DirStoreOptions(directory=Path('./prompts')))
+        store = CachingStoreSync(source)
+        prompt = store.load('greeting')
+        ```
+    """
+
+    def __init__(self, store: PromptStoreSync, max_entries: int = 1024, ttl: float | None = 60.0) -> None:
+        """Wrap a store.
+
+        Args:
+            store: The backing store.
+            max_entries: The most prompts and partials to keep, counting each
+                version requested separately.
+            ttl: Seconds a loaded prompt or partial is served for before it is
+                loaded again, or None to keep it until evicted or invalidated.
+
+        Raises:
+            ValueError: If `max_entries` or `ttl` is not positive.
+        """
+        self._store = store
+        self._cache = _Cache(max_entries, ttl)
+        self._flights: dict[_Key, tuple[_Flight, threading.Event]] = {}
+        self._flights_lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Counters of cache hits, misses and evictions."""
+        return self._cache.stats()
+
+    def list(self, options: ListPromptsOptions | None = None) -> PaginatedPrompts:
+        """Lists prompts in the backing store.
+
+        Args:
+            options: Listing options, including the cursor and page limit.
+
+        Returns:
+            A page of prompt references.
+        """
+        return self._store.list(options)
+
+    def list_partials(self, options: ListPartialsOptions | None = None) -> PaginatedPartials:
+        """Lists partials in the backing store.
+
+        Args:
+            options: Listing options, including the cursor and page limit.
+
+        Returns:
+            A page of partial references.
+        """
+        return self._store.list_partials(options)
+
+    def load(self, name: str, options: LoadPromptOptions | None = None) -> PromptData:
+        """Loads a prompt from the cache or the backing store.
+
+        Args:
+            name: The name of the prompt.
+            options: Options like variant or version.
+
+        Returns:
+            The prompt data.
+
+        Raises:
+            Exception: Whatever the backing store raises, e.g.
+                FileNotFoundError if there is no such prompt.
+        """
+        variant = options.variant if options else None
+        key: _Key = ('prompt', name, variant, options.version if options else None)
+        return self._load(key, PromptData, lambda: self._store.load(name, options))
+
+    def load_partial(self, name: str, options: LoadPartialOptions | None = None) -> PartialData:
+        """Loads a partial from the cache or the backing store.
+
+        Args:
+            name: The name of the partial.
+            options: Options like variant or version.
+
+        Returns:
+            The partial data.
+
+        Raises:
+            Exception: Whatever the backing store raises, e.g.
+                FileNotFoundError if there is no such partial.
+        """
+        variant = options.variant if options else None
+        key: _Key = ('partial', name, variant, options.version if options else None)
+        return self._load(key, PartialData, lambda: self._store.load_partial(name, options))
+
+    def save(self, prompt: PromptData) -> None:
+        """Saves a prompt to the backing store and drops its cached versions.
+
+        Args:
+            prompt: The prompt or partial to save.
+
+        Raises:
+            TypeError: If the backing store is read-only.
+        """
+        save = _writer(self._store, 'save')
+        try:
+            save(prompt)
+        finally:
+            self._cache.discard(_name_targets(prompt.name, prompt.variant))
+
+    def delete(self, name: str, options: DeletePromptOrPartialOptions | None = None) -> None:
+        """Deletes a prompt or partial from the backing store and the cache.
+
+        Args:
+            name: The name of the prompt or partial.
+            options: Options like variant.
+
+        Raises:
+            TypeError: If the backing store is read-only.
+        """
+        delete = _writer(self._store, 'delete')
+        try:
+            delete(name, options)
+        finally:
+            self._cache.discard(_name_targets(name, options.variant if options else None))
+
+    def invalidate(self, changes: Iterable[StoreChange]) -> None:
+        """Drop every cached version of changed prompts and partials.
+
+        Args:
+            changes: The changes reported by the backing store's `watch`.
+        """
+        dropped = self._cache.discard(_change_targets(changes))
+        logger.debug('Invalidated cached prompts (sync)', count=dropped)
+
+    def clear(self) -> None:
+        """Drop every cached prompt and partial."""
+        self._cache.clear()
+
+    def watch(self, *args: Any, **kwargs: Any) -> Iterator[builtins.list[StoreChange]]:
+        """Watch the backing store, invalidating changes before yielding them.
+
+        Args:
+            *args: Positional arguments for the backing store's `watch`.
+            **kwargs: Keyword arguments for the backing store's `watch`.
+
+        Yields:
+            The batches of changes reported by the backing store.
+
+        Raises:
+            TypeError: If the backing store cannot be watched.
+        """
+        watch = getattr(self._store, 'watch', None)
+        if watch is None:
+            raise TypeError(f'{type(self._store).__name__} does not support watching')
+        for changes in watch(*args, **kwargs):
+            self.invalidate(changes)
+            yield changes
+
+    def _load(self, key: _Key, kind: type[DataT], load: Callable[[], DataT]) -> DataT:
+        """Return cached data, or load it once for all concurrent threads.
+
+        Args:
+            key: The cache key.
+            kind: The type of the data, for type checking.
+            load: Loads the data from the backing store.
+
+        Returns:
+            The data.
+        """
+        while True:
+            cached = self._cache.get(key)
+            if cached is not None:
+                assert isinstance(cached, kind)
+                return cached
+            with self._flights_lock:
+                pending = self._flights.get(key)
+                if pending is None:
+                    flight, done = _Flight(), threading.Event()
+                    self._flights[key] = (flight, done)
+                    break
+            self._cache.count('coalesced')
+            pending[1].wait()
+            if pending[0].error is not None:
+                raise pending[0].error
+            if pending[0].data is not None:
+                assert isinstance(pending[0].data, kind)
+                return pending[0].data
+            # The load was interrupted; try again.
+
+        generation = self._cache.generation
+        self._cache.count('misses')
+        try:
+            data = load()
+            flight.data = data
+            self._cache.put(key, data, generation)
+            return data
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._flights_lock:
+                del self._flights[key]
+            done.set()
+
+
+def _writer(store: object, method: str) -> Callable[..., Any]:
+    """Return a write method of a backing store.
+
+    Raises:
+        TypeError: If the store does not have the method.
+    """
+    writer = getattr(store, method, None)
+    if writer is None:
+        raise TypeError(f'{type(store).__name__} is read-only')
+    return writer  # type: ignore[no-any-return]
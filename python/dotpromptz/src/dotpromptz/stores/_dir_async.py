@@ -22,9 +22,13 @@ files with specific naming conventions within a configurable base directory.
 
 Key Features:
 - Asynchronous I/O operations using asyncio and aiofiles
+- Directory scans in a worker thread, which never block the event loop
 - Support for hierarchical organization of prompts using directories
-- Versioning of prompts based on content hashing
+- Versioning of prompts based on content hashing, with an index of file stats
+  so that listing only rehashes changed files
 - Support for prompt variants and partials
+- Watching for changes using inotify, with a polling fallback
+- Reading prompt frontmatter without reading template bodies
 
 File Naming Conventions:
 - Prompts: `[name][.variant].prompt`
@@ -54,13 +58,21 @@ await store.save(
 ```
 """
 
+from __future__ import annotations
+
 import asyncio
+import builtins
 import os
+from collections.abc import AsyncIterator
 from pathlib import Path
+from typing import Any
 
 import aiofiles
+import anyio
 import structlog
+import yaml
 
+from dotpromptz.parse import load_frontmatter
 from dotpromptz.typing import (
     DeletePromptOrPartialOptions,
     ListPartialsOptions,
@@ -74,16 +86,20 @@ from dotpromptz.typing import (
     PromptData,
     PromptRef,
     PromptStoreWritable,
+    StoreChange,
 )
 
+from ._index import ListingEntry, SortedListing, VersionIndex
 from ._io import (
     calculate_version,
     is_partial,
+    iter_scan_directory,
     parse_prompt_filename,
+    read_frontmatter_async,
     read_prompt_file_async,
-    scan_directory,
 )
 from ._typing import DirStoreOptions
+from ._watch import DirWatcher
 
 logger = structlog.get_logger(__name__)
 
@@ -104,7 +120,7 @@ class DirStore(PromptStoreWritable):
     Implements the `PromptStoreWritable` protocol for async operations.
 
     Key Operations:
-    - List prompts and partials
+    - List prompts and partials, by page or as a stream
     - Load specific prompts and partials
     - Save new or updated prompts and partials
     - Delete existing prompts and partials
@@ -117,6 +133,10 @@ class DirStore(PromptStoreWritable):
         # List all available prompts
         prompt_list = await store.list()
 
+        # Stream the prompts of a large store
+        async for prompt in store.iter_prompts():
+            print(prompt.name, prompt.version)
+
         # Load a prompt with a specific variant
         prompt = await store.load('greeting', LoadPromptOptions(variant='formal'))
 
@@ -144,127 +164,172 @@ class DirStore(PromptStoreWritable):
         # Ensure the base directory exists.
         # Although async, this check can be sync during init.
         os.makedirs(self._directory, exist_ok=True)
+        self._versions = VersionIndex(self._directory, options.persist_index)
+        self._listings: dict[bool, SortedListing] = {}
+        self._limiter = anyio.CapacityLimiter(options.max_workers)
         logger.debug('Async DirStore initialized', directory=str(self._directory))
 
     async def list(self, options: ListPromptsOptions | None = None) -> PaginatedPrompts:
         """Asynchronously lists available prompts (excluding partials).
 
-        Note: Pagination options are ignored as this implementation returns all
-        results at once.
+        Prompts are returned in name and variant order. With `options.limit`,
+        at most that many are returned along with a cursor for the next page.
+        Listing without a cursor scans the directory; the pages that follow
+        are served from that scan, so each costs time in proportion to its
+        size. Versions are looked up in the store's version index, so only
+        files changed since they were last listed are read.
 
         Args:
-            options: Listing options (currently unused).
+            options: Listing options, including the cursor and page limit.
 
         Returns:
-            A PaginatedPrompts object containing all found prompt references.
+            A page of prompt references.
+
+        Raises:
+            ValueError: If the cursor is malformed or the limit is not positive.
         """
         await logger.adebug('Listing prompts', options=options)
-        files = await scan_directory(self._directory)
-        prompts: list[PromptRef] = []
-
-        async def process_file(file_rel_path: str) -> None:
-            base_name = os.path.basename(file_rel_path)
-            if not is_partial(base_name):
-                try:
-                    parsed = parse_prompt_filename(base_name)
-                    dir_path = os.path.dirname(file_rel_path)
-                    if dir_path and dir_path != '.':
-                        full_name = f'{dir_path.replace(os.sep, "/")}/{parsed.name}'
-                    else:
-                        full_name = parsed.name
-
-                    full_file_path = self._directory / file_rel_path
-                    content = await read_prompt_file_async(full_file_path)
-                    version = calculate_version(content)
-                    prompts.append(
-                        PromptRef(
-                            name=full_name,
-                            variant=parsed.variant,
-                            version=version,
-                        )
-                    )
-                    await logger.adebug(
-                        'Found prompt',
-                        name=full_name,
-                        variant=parsed.variant,
-                        version=version,
-                    )
-                except ValueError as e:
-                    await logger.awarn(
-                        'Skipping file with invalid name format',
-                        file=file_rel_path,
-                        error=str(e),
-                    )
-                except Exception as e:
-                    await logger.aerror(
-                        'Error processing prompt file',
-                        file=file_rel_path,
-                        error=str(e),
-                    )
-
-        await asyncio.gather(*(process_file(f) for f in files))
+        found, cursor = await self._list_files(False, options)
+        prompts = [PromptRef(name=name, variant=variant, version=version) for name, variant, version in found]
         await logger.ainfo('Finished listing prompts', count=len(prompts))
-        return PaginatedPrompts(prompts=prompts)
+        return PaginatedPrompts(prompts=prompts, cursor=cursor)
 
     async def list_partials(self, options: ListPartialsOptions | None = None) -> PaginatedPartials:
         """Asynchronously lists available partials.
 
-        Note: Pagination options are ignored.
+        Partials are paginated in name and variant order, as prompts are by
+        `list`.
 
         Args:
-            options: Listing options (currently unused).
+            options: Listing options, including the cursor and page limit.
 
         Returns:
-            A PaginatedPartials object containing all found partial references.
+            A page of partial references.
+
+        Raises:
+            ValueError: If the cursor is malformed or the limit is not positive.
         """
         await logger.adebug('Listing partials', options=options)
-        files = await scan_directory(self._directory)
-        partials: list[PartialRef] = []
+        found, cursor = await self._list_files(True, options)
+        partials = [PartialRef(name=name, variant=variant, version=version) for name, variant, version in found]
+        await logger.ainfo('Finished listing partials', count=len(partials))
+        return PaginatedPartials(partials=partials, cursor=cursor)
+
+    async def iter_prompts(self) -> AsyncIterator[PromptRef]:
+        """Asynchronously iterates over the prompts in the store (excluding partials).
+
+        Unlike `list`, prompts are yielded in the order the directory is
+        scanned, a batch at a time as soon as their versions are known, so
+        memory use does not grow with the size of the store. The directory is
+        scanned and files are hashed in worker threads, no more than
+        `DirStoreOptions.max_workers` at once across the store.
+
+        Yields:
+            A reference to each prompt.
+        """
+        count = 0
+        async for name, variant, version in self._iter_files(False):
+            count += 1
+            yield PromptRef(name=name, variant=variant, version=version)
+        await logger.adebug('Finished iterating prompts', count=count)
+
+    async def iter_partials(self) -> AsyncIterator[PartialRef]:
+        """Asynchronously iterates over the partials in the store.
+
+        Partials are yielded in scan order with bounded concurrency and
+        memory, as prompts are by `iter_prompts`.
+
+        Yields:
+            A reference to each partial.
+        """
+        count = 0
+        async for name, variant, version in self._iter_files(True):
+            count += 1
+            yield PartialRef(name=name, variant=variant, version=version)
+        await logger.adebug('Finished iterating partials', count=count)
+
+    async def _iter_files(self, partials: bool) -> AsyncIterator[tuple[str, str | None, str]]:
+        """Find the prompts or partials in the store with their versions, in batches.
+
+        Args:
+            partials: Whether to find partials rather than prompts.
+
+        Yields:
+            The name, variant and version of each prompt or partial.
+        """
+        async for scanned in iter_scan_directory(self._directory, limiter=self._limiter):
+            entries = await self._named_entries(scanned, partials)
+            versions = await anyio.to_thread.run_sync(
+                self._versions.versions, [path for _, _, path in entries], limiter=self._limiter
+            )
+            for name, variant, path in entries:
+                if path in versions:
+                    yield name, variant, versions[path]
+
+    async def _list_files(
+        self, partials: bool, options: ListPromptsOptions | ListPartialsOptions | None
+    ) -> tuple[builtins.list[tuple[str, str | None, str]], str | None]:
+        """Find a page of the prompts or partials in the store with their versions.
+
+        A listing without a cursor rescans the directory, which is streamed
+        in batches as by `_iter_files`, keeping only the names and paths of
+        the files found.
+
+        Args:
+            partials: Whether to find partials rather than prompts.
+            options: Listing options, including the cursor and page limit.
+
+        Returns:
+            The name, variant and version of each prompt or partial in the
+            page, and the cursor of the next page.
+
+        Raises:
+            ValueError: If the cursor is malformed or the limit is not positive.
+        """
+        cursor = options.cursor if options else None
+        listing = self._listings.get(partials)
+        scanned: builtins.list[str] | None = None
+        if cursor is None or listing is None:
+            scanned = []
+            named: builtins.list[ListingEntry] = []
+            async for batch in iter_scan_directory(self._directory, limiter=self._limiter):
+                scanned.extend(batch)
+                named.extend(await self._named_entries(batch, partials))
+            listing = self._listings[partials] = SortedListing(named)
+
+        entries, next_cursor = listing.page(cursor, options.limit if options else None)
+        # Stat, and hash if changed, the files of the page in a single worker
+        # thread.
+        versions = await anyio.to_thread.run_sync(
+            self._versions.versions, [path for _, _, path in entries], scanned, limiter=self._limiter
+        )
+        return [(name, variant, versions[path]) for name, variant, path in entries if path in versions], next_cursor
 
-        async def process_file(file_rel_path: str) -> None:
+    async def _named_entries(self, scanned: builtins.list[str], partials: bool) -> builtins.list[ListingEntry]:
+        """Name the prompt or partial files among scanned files.
+
+        Args:
+            scanned: Relative paths of the prompt files found by a scan.
+            partials: Whether to name partials rather than prompts.
+
+        Returns:
+            The name, variant and path of each prompt or partial file. Files
+            with invalid names are logged and skipped.
+        """
+        named: builtins.list[ListingEntry] = []
+        for file_rel_path in scanned:
             base_name = os.path.basename(file_rel_path)
-            if is_partial(base_name):
-                try:
-                    actual_filename = base_name[1:]
-                    parsed = parse_prompt_filename(actual_filename)
-                    dir_path = os.path.dirname(file_rel_path)
-                    if dir_path and dir_path != '.':
-                        full_name = f'{dir_path.replace(os.sep, "/")}/{parsed.name}'
-                    else:
-                        full_name = parsed.name
-
-                    full_file_path = self._directory / file_rel_path
-                    content = await read_prompt_file_async(full_file_path)
-                    version = calculate_version(content)
-                    partials.append(
-                        PartialRef(
-                            name=full_name,
-                            variant=parsed.variant,
-                            version=version,
-                        )
-                    )
-                    await logger.adebug(
-                        'Found partial',
-                        name=full_name,
-                        variant=parsed.variant,
-                        version=version,
-                    )
-                except ValueError as e:
-                    await logger.awarn(
-                        'Skipping partial file with invalid name format',
-                        file=file_rel_path,
-                        error=str(e),
-                    )
-                except Exception as e:
-                    await logger.aerror(
-                        'Error processing partial file',
-                        file=file_rel_path,
-                        error=str(e),
-                    )
-
-        await asyncio.gather(*(process_file(f) for f in files))
-        await logger.ainfo('Finished listing partials', count=len(partials))
-        return PaginatedPartials(partials=partials)
+            if is_partial(base_name) != partials:
+                continue
+            try:
+                parsed = parse_prompt_filename(base_name[1:] if partials else base_name)
+            except ValueError as e:
+                await logger.awarn('Skipping file with invalid name format', file=file_rel_path, error=str(e))
+                continue
+            dir_path = os.path.dirname(file_rel_path)
+            full_name = f'{dir_path.replace(os.sep, "/")}/{parsed.name}' if dir_path else parsed.name
+            named.append((full_name, parsed.variant, file_rel_path))
+        return named
 
     async def load(self, name: str, options: LoadPromptOptions | None = None) -> PromptData:
         """Asynchronously loads a specific prompt from the store.
@@ -385,6 +450,39 @@ class DirStore(PromptStoreWritable):
             await logger.aerror(err_msg)
             raise RuntimeError(err_msg) from e
 
+    async def frontmatter(self, name: str, variant: str | None = None) -> dict[str, Any]:
+        """Asynchronously reads the frontmatter of a prompt without its template.
+
+        Reading stops at the closing `---` of the frontmatter, which keeps
+        listing and filtering prompts by metadata cheap for large templates.
+
+        Args:
+            name: The logical name of the prompt (including subdirectories).
+            variant: The variant of the prompt.
+
+        Returns:
+            The raw frontmatter as a dictionary; empty if there is none.
+
+        Raises:
+            FileNotFoundError: If the prompt file is not found.
+            ValueError: If the frontmatter is not a valid YAML mapping.
+        """
+        dir_name = os.path.dirname(name)
+        base_name = os.path.basename(name)
+        file_name = f'{base_name}.{variant}.prompt' if variant else f'{base_name}.prompt'
+        file_path = self._directory / dir_name / file_name if dir_name else self._directory / file_name
+
+        await logger.adebug('Reading prompt frontmatter', name=name, variant=variant, path=str(file_path))
+
+        try:
+            frontmatter = await read_frontmatter_async(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Prompt '{name}' not found at {file_path}") from None
+        try:
+            return load_frontmatter(frontmatter)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid frontmatter in prompt '{name}': {e}") from e
+
     async def save(self, prompt: PromptData) -> None:
         """Asynchronously saves a prompt or partial to the store.
 
@@ -544,3 +642,36 @@ class DirStore(PromptStoreWritable):
             )
             await logger.aerror(err_msg)
             raise FileNotFoundError(err_msg)
+
+    async def watch(
+        self, poll_interval: float = 1.0, use_inotify: bool = True
+    ) -> AsyncIterator[builtins.list[StoreChange]]:
+        """Watch the store directory for changes to prompts and partials.
+
+        Uses inotify where available and falls back to polling otherwise. The
+        blocking wait runs on a worker thread, waking up at least every
+        `poll_interval` seconds so the iterator can be cancelled promptly.
+
+        Args:
+            poll_interval: Seconds between scans when polling, and the longest
+                a single wait blocks.
+            use_inotify: Whether to use inotify when available.
+
+        Yields:
+            Non-empty batches of changes, ordered by file path.
+
+        Examples:
+            ```python
+            async for changes in store.watch():
+                dotprompt.invalidate(changes)
+            ```
+        """
+        watcher = await anyio.to_thread.run_sync(DirWatcher, self._directory, poll_interval, 0.05, use_inotify)
+        try:
+            while True:
+                changes = await anyio.to_thread.run_sync(watcher.read, poll_interval)
+                if changes:
+                    await logger.adebug('Store changed', directory=str(self._directory), count=len(changes))
+                    yield changes
+        finally:
+            watcher.close()
@@ -23,8 +23,11 @@ files with specific naming conventions within a configurable base directory.
 Key Features:
 - Synchronous I/O operations for simpler usage patterns
 - Support for hierarchical organization of prompts using directories
-- Versioning of prompts based on content hashing
+- Versioning of prompts based on content hashing, with an index of file stats
+  so that listing only rehashes changed files
 - Support for prompt variants and partials
+- Watching for changes using inotify, with a polling fallback
+- Reading prompt frontmatter without reading template bodies
 
 File Naming Conventions:
 - Prompts: `[name][.variant].prompt`
@@ -54,11 +57,18 @@ store.save(
 ```
 """
 
+from __future__ import annotations
+
+import builtins
 import os
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 import structlog
+import yaml
 
+from dotpromptz.parse import load_frontmatter
 from dotpromptz.typing import (
     DeletePromptOrPartialOptions,
     ListPartialsOptions,
@@ -72,16 +82,20 @@ from dotpromptz.typing import (
     PromptData,
     PromptRef,
     PromptStoreWritableSync,
+    StoreChange,
 )
 
+from ._index import ListingEntry, SortedListing, VersionIndex
 from ._io import (
     calculate_version,
     is_partial,
+    iter_scan_directory_sync,
     parse_prompt_filename,
+    read_frontmatter_sync,
     read_prompt_file_sync,
-    scan_directory_sync,
 )
 from ._typing import DirStoreOptions
+from ._watch import DirWatcher
 
 logger = structlog.get_logger(__name__)
 
@@ -102,7 +116,7 @@ class DirStoreSync(PromptStoreWritableSync):
     Implements the `PromptStoreWritableSync` protocol for sync operations.
 
     Key Operations:
-    - List prompts and partials
+    - List prompts and partials, by page or as a stream
     - Load specific prompts and partials
     - Save new or updated prompts and partials
     - Delete existing prompts and partials
@@ -115,6 +129,10 @@ class DirStoreSync(PromptStoreWritableSync):
         # List all available prompts
         prompt_list = store.list()
 
+        # Stream the prompts of a large store
+        for prompt in store.iter_prompts():
+            print(prompt.name, prompt.version)
+
         # Load a prompt with a specific variant
         prompt = store.load('greeting', LoadPromptOptions(variant='formal'))
 
@@ -141,126 +159,163 @@ class DirStoreSync(PromptStoreWritableSync):
         self._directory = options.directory
         # Ensure the base directory exists.
         os.makedirs(self._directory, exist_ok=True)
+        self._versions = VersionIndex(self._directory, options.persist_index)
+        self._listings: dict[bool, SortedListing] = {}
         logger.debug('Sync DirStore initialized', directory=str(self._directory))
 
     def list(self, options: ListPromptsOptions | None = None) -> PaginatedPrompts:
         """Synchronously lists available prompts (excluding partials).
 
-        Note: Pagination options are ignored.
+        Prompts are returned in name and variant order. With `options.limit`,
+        at most that many are returned along with a cursor for the next page.
+        Listing without a cursor scans the directory; the pages that follow
+        are served from that scan, so each costs time in proportion to its
+        size. Versions are looked up in the store's version index, so only
+        files changed since they were last listed are read.
 
         Args:
-            options: Listing options (currently unused).
+            options: Listing options, including the cursor and page limit.
 
         Returns:
-            A PaginatedPrompts object containing all found prompt references.
+            A page of prompt references.
+
+        Raises:
+            ValueError: If the cursor is malformed or the limit is not positive.
         """
         logger.debug('Listing prompts (sync)', options=options)
-        files = scan_directory_sync(self._directory)
-        prompts: list[PromptRef] = []
-
-        for file_rel_path in files:
-            base_name = os.path.basename(file_rel_path)
-            if not is_partial(base_name):
-                try:
-                    parsed = parse_prompt_filename(base_name)
-                    dir_path = os.path.dirname(file_rel_path)
-                    # Corrected name construction
-                    if dir_path and dir_path != '.':
-                        full_name = f'{dir_path.replace(os.sep, "/")}/{parsed.name}'
-                    else:
-                        full_name = parsed.name
-
-                    full_file_path = self._directory / file_rel_path
-                    content = read_prompt_file_sync(full_file_path)
-                    version = calculate_version(content)
-                    prompts.append(
-                        PromptRef(
-                            name=full_name,
-                            variant=parsed.variant,
-                            version=version,
-                        )
-                    )
-                    logger.debug(
-                        'Found prompt (sync)',
-                        name=full_name,
-                        variant=parsed.variant,
-                        version=version,
-                    )
-                except ValueError as e:
-                    logger.warn(
-                        'Skipping file with invalid name format (sync)',
-                        file=file_rel_path,
-                        error=str(e),
-                    )
-                except Exception as e:
-                    logger.error(
-                        'Error processing prompt file (sync)',
-                        file=file_rel_path,
-                        error=str(e),
-                    )
-
+        found, cursor = self._list_files(False, options)
+        prompts = [PromptRef(name=name, variant=variant, version=version) for name, variant, version in found]
         logger.info('Finished listing prompts (sync)', count=len(prompts))
-        return PaginatedPrompts(prompts=prompts)
+        return PaginatedPrompts(prompts=prompts, cursor=cursor)
 
     def list_partials(self, options: ListPartialsOptions | None = None) -> PaginatedPartials:
         """Synchronously lists available partials.
 
-        Note: Pagination options are ignored.
+        Partials are paginated in name and variant order, as prompts are by
+        `list`.
 
         Args:
-            options: Listing options (currently unused).
+            options: Listing options, including the cursor and page limit.
 
         Returns:
-            A PaginatedPartials object containing all found partial references.
+            A page of partial references.
+
+        Raises:
+            ValueError: If the cursor is malformed or the limit is not positive.
         """
         logger.debug('Listing partials (sync)', options=options)
-        files = scan_directory_sync(self._directory)
-        partials: list[PartialRef] = []
+        found, cursor = self._list_files(True, options)
+        partials = [PartialRef(name=name, variant=variant, version=version) for name, variant, version in found]
+        logger.info('Finished listing partials (sync)', count=len(partials))
+        return PaginatedPartials(partials=partials, cursor=cursor)
 
-        for file_rel_path in files:
-            base_name = os.path.basename(file_rel_path)
-            if is_partial(base_name):
-                try:
-                    actual_filename = base_name[1:]
-                    parsed = parse_prompt_filename(actual_filename)
-                    dir_path = os.path.dirname(file_rel_path)
-                    # Corrected name construction
-                    if dir_path and dir_path != '.':
-                        full_name = f'{dir_path.replace(os.sep, "/")}/{parsed.name}'
-                    else:
-                        full_name = parsed.name
-
-                    full_file_path = self._directory / file_rel_path
-                    content = read_prompt_file_sync(full_file_path)
-                    version = calculate_version(content)
-                    partials.append(
-                        PartialRef(
-                            name=full_name,
-                            variant=parsed.variant,
-                            version=version,
-                        )
-                    )
-                    logger.debug(
-                        'Found partial (sync)',
-                        name=full_name,
-                        variant=parsed.variant,
-                        version=version,
-                    )
-                except ValueError as e:
-                    logger.warn(
-                        'Skipping partial file with invalid name format (sync)',
-                        file=file_rel_path,
-                        error=str(e),
-                    )
-                except Exception as e:
-                    logger.error(
-                        'Error processing partial file (sync)',
-                        file=file_rel_path,
-                        error=str(e),
-                    )
+    def iter_prompts(self) -> Iterator[PromptRef]:
+        """Synchronously iterates over the prompts in the store (excluding partials).
 
-        logger.info('Finished listing partials (sync)', count=len(partials))
-        return PaginatedPartials(partials=partials)
+        Unlike `list`, prompts are yielded in the order the directory is
+        scanned, a batch at a time as soon as their versions are known, so
+        memory use does not grow with the size of the store.
+
+        Yields:
+            A reference to each prompt.
+        """
+        count = 0
+        for name, variant, version in self._iter_files(False):
+            count += 1
+            yield PromptRef(name=name, variant=variant, version=version)
+        logger.debug('Finished iterating prompts (sync)', count=count)
+
+    def iter_partials(self) -> Iterator[PartialRef]:
+        """Synchronously iterates over the partials in the store.
+
+        Partials are yielded in scan order with bounded memory, as prompts
+        are by `iter_prompts`.
+
+        Yields:
+            A reference to each partial.
+        """
+        count = 0
+        for name, variant, version in self._iter_files(True):
+            count += 1
+            yield PartialRef(name=name, variant=variant, version=version)
+        logger.debug('Finished iterating partials (sync)', count=count)
+
+    def _iter_files(self, partials: bool) -> Iterator[tuple[str, str | None, str]]:
+        """Find the prompts or partials in the store with their versions, in batches.
+
+        Args:
+            partials: Whether to find partials rather than prompts.
+
+        Yields:
+            The name, variant and version of each prompt or partial.
+        """
+        for scanned in iter_scan_directory_sync(self._directory):
+            entries = self._named_entries(scanned, partials)
+            versions = self._versions.versions([path for _, _, path in entries])
+            for name, variant, path in entries:
+                if path in versions:
+                    yield name, variant, versions[path]
+
+    def _list_files(
+        self, partials: bool, options: ListPromptsOptions | ListPartialsOptions | None
+    ) -> tuple[builtins.list[tuple[str, str | None, str]], str | None]:
+        """Find a page of the prompts or partials in the store with their versions.
+
+        A listing without a cursor rescans the directory, which is streamed
+        in batches as by `_iter_files`, keeping only the names and paths of
+        the files found.
+
+        Args:
+            partials: Whether to find partials rather than prompts.
+            options: Listing options, including the cursor and page limit.
+
+        Returns:
+            The name, variant and version of each prompt or partial in the
+            page, and the cursor of the next page.
+
+        Raises:
+            ValueError: If the cursor is malformed or the limit is not positive.
+        """
+        cursor = options.cursor if options else None
+        listing = self._listings.get(partials)
+        scanned: builtins.list[str] | None = None
+        if cursor is None or listing is None:
+            scanned = []
+            named: builtins.list[ListingEntry] = []
+            for batch in iter_scan_directory_sync(self._directory):
+                scanned.extend(batch)
+                named.extend(self._named_entries(batch, partials))
+            listing = self._listings[partials] = SortedListing(named)
+
+        entries, next_cursor = listing.page(cursor, options.limit if options else None)
+        versions = self._versions.versions([path for _, _, path in entries], scanned)
+        return [(name, variant, versions[path]) for name, variant, path in entries if path in versions], next_cursor
+
+    def _named_entries(self, scanned: builtins.list[str], partials: bool) -> builtins.list[ListingEntry]:
+        """Name the prompt or partial files among scanned files.
+
+        Args:
+            scanned: Relative paths of the prompt files found by a scan.
+            partials: Whether to name partials rather than prompts.
+
+        Returns:
+            The name, variant and path of each prompt or partial file. Files
+            with invalid names are logged and skipped.
+        """
+        named: builtins.list[ListingEntry] = []
+        for file_rel_path in scanned:
+            base_name = os.path.basename(file_rel_path)
+            if is_partial(base_name) != partials:
+                continue
+            try:
+                parsed = parse_prompt_filename(base_name[1:] if partials else base_name)
+            except ValueError as e:
+                logger.warn('Skipping file with invalid name format (sync)', file=file_rel_path, error=str(e))
+                continue
+            dir_path = os.path.dirname(file_rel_path)
+            full_name = f'{dir_path.replace(os.sep, "/")}/{parsed.name}' if dir_path else parsed.name
+            named.append((full_name, parsed.variant, file_rel_path))
+        return named
 
     def load(self, name: str, options: LoadPromptOptions | None = None) -> PromptData:
         """Synchronously loads a specific prompt from the store.
@@ -390,6 +445,39 @@ class DirStoreSync(PromptStoreWritableSync):
             logger.error(err_msg)
             raise RuntimeError(err_msg) from e
 
+    def frontmatter(self, name: str, variant: str | None = None) -> dict[str, Any]:
+        """Synchronously reads the frontmatter of a prompt without its template.
+
+        Reading stops at the closing `---` of the frontmatter, which keeps
+        listing and filtering prompts by metadata cheap for large templates.
+
+        Args:
+            name: The logical name of the prompt (including subdirectories).
+            variant: The variant of the prompt.
+
+        Returns:
+            The raw frontmatter as a dictionary; empty if there is none.
+
+        Raises:
+            FileNotFoundError: If the prompt file is not found.
+            ValueError: If the frontmatter is not a valid YAML mapping.
+        """
+        dir_name = os.path.dirname(name)
+        base_name = os.path.basename(name)
+        file_name = f'{base_name}.{variant}.prompt' if variant else f'{base_name}.prompt'
+        file_path = self._directory / dir_name / file_name if dir_name else self._directory / file_name
+
+        logger.debug('Reading prompt frontmatter (sync)', name=name, variant=variant, path=str(file_path))
+
+        try:
+            frontmatter = read_frontmatter_sync(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Prompt '{name}' not found at {file_path}") from None
+        try:
+            return load_frontmatter(frontmatter)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid frontmatter in prompt '{name}': {e}") from e
+
     def save(self, prompt: PromptData) -> None:
         """Synchronously saves a prompt or partial to the store.
 
@@ -534,3 +622,28 @@ class DirStoreSync(PromptStoreWritableSync):
             )
             logger.error(err_msg)
             raise FileNotFoundError(err_msg)
+
+    def watch(self, poll_interval: float = 1.0, use_inotify: bool = True) -> Iterator[builtins.list[StoreChange]]:
+        """Watch the store directory for changes to prompts and partials.
+
+        Uses inotify where available and falls back to polling otherwise.
+        Iteration blocks until the next batch of changes is observed.
+
+        Args:
+            poll_interval: Seconds between scans when polling.
+            use_inotify: Whether to use inotify when available.
+
+        Yields:
+            Non-empty batches of changes, ordered by file path.
+
+        Examples:
+            ```python
+            for changes in store.watch():
+                dotprompt.invalidate(changes)
+            ```
+        """
+        with DirWatcher(self._directory, poll_interval, use_inotify=use_inotify) as watcher:
+            while True:
+                changes = watcher.read()
+                logger.debug('Store changed', directory=str(self._directory), count=len(changes))
+                yield changes
@@ -0,0 +1,306 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Version index for directory-based prompt stores.
+
+Listing a store reports the version of every prompt, which is a hash of the
+file's content. The index remembers the version computed for each file along
+with the file's size, modification time and inode, and only reads and hashes
+files whose stats have changed since. Listing an unchanged tree is then a walk
+over file stats.
+
+The index can be persisted to a hidden sidecar file in the store directory, so
+that a new process starts with the versions of the previous one.
+
+Listings are paginated from a snapshot of the directory sorted by name and
+variant. The cursor of a page is the name and variant of its last entry, so
+the next page starts right after it even if the directory was rescanned in
+between, and only the entries of a page are stat'ed for their versions.
+
+Key Components:
+- VersionIndex: Thread-safe mapping of file paths to content versions.
+- SortedListing: Snapshot of the prompts or partials of a store, paginated by
+  cursor.
+- encode_cursor/decode_cursor: Cursors of listings in name and variant order.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import bisect
+import json
+import os
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+import structlog
+
+from ._io import calculate_version
+
+logger = structlog.get_logger(__name__)
+
+INDEX_FILE_NAME = '.dotprompt-index.json'
+"""Name of the sidecar file the index is persisted to. Scans skip hidden files."""
+
+_INDEX_FORMAT = 1
+
+_RACY_WINDOW_NS = 2_000_000_000
+"""Files modified this recently are rehashed on every lookup.
+
+A file rewritten twice within the timestamp granularity of the file system, to
+the same size, would otherwise keep the version of its first content.
+"""
+
+_Signature = tuple[int, int, int]
+"""File identity used to detect modifications: (size, mtime_ns, inode)."""
+
+ListingEntry = tuple[str, str | None, str]
+"""A prompt or partial in a listing: (name, variant, relative file path)."""
+
+SortKey = tuple[str, int, str]
+"""Order of listing entries: by name, with no variant before any variant."""
+
+
+class VersionIndex:
+    """Maps prompt files to the versions of their content.
+
+    Versions are looked up by file path and trusted as long as the file's
+    size, modification time and inode are unchanged. The index is safe to use
+    from several threads.
+
+    Examples:
+        ```python
+        index = VersionIndex(Path('./prompts'), persist=True)
+        versions = index.versions(['greeting.prompt', '_header.prompt'])
+        ```
+    """
+
+    def __init__(self, directory: Path, persist: bool = False) -> None:
+        """Initialize the index, loading the sidecar file if persisted.
+
+        Args:
+            directory: The store directory. File paths are relative to it.
+            persist: Whether to read and write the sidecar file.
+        """
+        self._directory = directory
+        self._root = os.fspath(directory)
+        self._path = directory / INDEX_FILE_NAME if persist else None
+        self._entries: dict[str, tuple[_Signature, str]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        if self._path is not None:
+            self._load(self._path)
+
+    def __len__(self) -> int:
+        """Return the number of files in the index."""
+        return len(self._entries)
+
+    def versions(self, rel_paths: Iterable[str], scanned: Iterable[str] | None = None) -> dict[str, str]:
+        """Return the versions of files, hashing only those that changed.
+
+        Files that cannot be stat'ed or read, for example because they were
+        deleted after the directory was scanned, are left out and dropped
+        from the index. The sidecar file, if any, is rewritten when the index
+        changed.
+
+        Args:
+            rel_paths: The paths of the prompt files, relative to the store
+                directory.
+            scanned: The paths of every prompt file found by a full scan of
+                the directory. Files not among them are dropped from the index.
+
+        Returns:
+            The version of each file by path.
+        """
+        result: dict[str, str] = {}
+        hashed = 0
+        racy_before = time.time_ns() - _RACY_WINDOW_NS
+        with self._lock:
+            if scanned is not None:
+                keep = set(scanned)
+                for rel_path in [p for p in self._entries if p not in keep]:
+                    self._forget(rel_path)
+            for rel_path in rel_paths:
+                path = os.path.join(self._root, rel_path)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    self._forget(rel_path)
+                    continue
+                signature = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+                entry = self._entries.get(rel_path)
+                if entry is not None and entry[0] == signature:
+                    result[rel_path] = entry[1]
+                    continue
+                try:
+                    version = _hash_file(path)
+                except (OSError, UnicodeDecodeError) as e:
+                    logger.error('Error reading prompt file', file=rel_path, error=str(e))
+                    self._forget(rel_path)
+                    continue
+                hashed += 1
+                result[rel_path] = version
+                if stat.st_mtime_ns < racy_before:
+                    self._entries[rel_path] = (signature, version)
+                    self._dirty = True
+                else:
+                    self._forget(rel_path)
+        if hashed:
+            logger.debug('Hashed changed prompt files', directory=str(self._directory), count=hashed)
+        self.save()
+        return result
+
+    def save(self) -> None:
+        """Write the index to the sidecar file, if persisted and changed.
+
+        Errors are logged rather than raised, since the index is only a cache.
+        """
+        if self._path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                'format': _INDEX_FORMAT,
+                'entries': {path: [*signature, version] for path, (signature, version) in self._entries.items()},
+            }
+            self._dirty = False
+        tmp_path = self._path.with_name(f'{self._path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(data, separators=(',', ':')))
+            os.replace(tmp_path, self._path)
+        except OSError as e:
+            logger.warning('Unable to save version index', path=str(self._path), error=str(e))
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _forget(self, rel_path: str) -> None:
+        """Drop a file from the index. The lock must be held."""
+        if self._entries.pop(rel_path, None) is not None:
+            self._dirty = True
+
+    def _load(self, path: Path) -> None:
+        """Load the sidecar file, starting empty if it is missing or invalid."""
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('format') != _INDEX_FORMAT:
+                raise ValueError(f'unsupported format {data.get("format")!r}')
+            entries = {
+                rel_path: ((int(size), int(mtime_ns), int(inode)), str(version))
+                for rel_path, (size, mtime_ns, inode, version) in data['entries'].items()
+            }
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.warning('Ignoring invalid version index', path=str(path), error=str(e))
+            return
+        self._entries = entries
+        logger.debug('Loaded version index', path=str(path), files=len(entries))
+
+
+def _hash_file(path: str) -> str:
+    """Return the version of a prompt file, as `load` computes it."""
+    with open(path, encoding='utf-8') as f:
+        return calculate_version(f.read())
+
+
+class SortedListing:
+    """Snapshot of the prompts or partials of a store, sorted for pagination.
+
+    Examples:
+        ```python
+        listing = SortedListing([('greeting', None, 'greeting.prompt')])
+        entries, cursor = listing.page(None, limit=100)
+        ```
+    """
+
+    __slots__ = ('_entries', '_keys')
+
+    def __init__(self, entries: Iterable[ListingEntry]) -> None:
+        """Sort the entries of a directory scan.
+
+        Args:
+            entries: The name, variant and file path of each prompt or partial.
+        """
+        self._entries = sorted(entries, key=lambda entry: sort_key(entry[0], entry[1]))
+        self._keys = [sort_key(name, variant) for name, variant, _ in self._entries]
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self._entries)
+
+    def page(self, cursor: str | None, limit: int | None) -> tuple[list[ListingEntry], str | None]:
+        """Return the entries after a cursor.
+
+        Args:
+            cursor: The cursor returned with the previous page, or None for the
+                first page.
+            limit: The maximum number of entries to return, or None for all.
+
+        Returns:
+            The entries of the page and the cursor of the next page, or None if
+            this is the last page.
+
+        Raises:
+            ValueError: If the cursor is malformed or the limit is not positive.
+        """
+        if limit is not None and limit < 1:
+            raise ValueError(f'Page limit must be positive, got {limit}')
+        start = 0 if cursor is None else bisect.bisect_right(self._keys, sort_key(*decode_cursor(cursor)))
+        end = len(self._entries) if limit is None else min(start + limit, len(self._entries))
+        entries = self._entries[start:end]
+        if end >= len(self._entries) or not entries:
+            return entries, None
+        name, variant, _ = entries[-1]
+        return entries, encode_cursor(name, variant)
+
+
+def sort_key(name: str, variant: str | None) -> SortKey:
+    """Return the sort key of a listing entry.
+
+    Stores paging with `encode_cursor` cursors list entries in this order.
+    """
+    return (name, 0, '') if variant is None else (name, 1, variant)
+
+
+def encode_cursor(name: str, variant: str | None) -> str:
+    """Encode the position after a prompt or partial as an opaque cursor.
+
+    Stores that list in name and variant order share this encoding.
+    """
+    return base64.urlsafe_b64encode(json.dumps([name, variant]).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> tuple[str, str | None]:
+    """Decode a cursor into the name and variant of the entry it follows.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        name, variant = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        if not isinstance(name, str) or not isinstance(variant, str | None):
+            raise TypeError('cursor does not hold a name and variant')
+    except (binascii.Error, UnicodeError, ValueError, TypeError):
+        raise ValueError(f'Invalid store cursor: {cursor!r}') from None
+    return name, variant
@@ -23,25 +23,38 @@ and scanning directories for prompt files.
 
 Key Functions:
 - read_prompt_file_sync/async: Read prompt file contents
+- read_frontmatter_sync/async: Read only the frontmatter of a prompt file
 - calculate_version: Generate a stable version identifier from content
+- content_hash: Full content hash, of which versions are a prefix
 - parse_prompt_filename: Extract name and variant from filename
 - is_partial: Determine if a filename represents a partial
-- scan_directory_sync/async: Recursively find all prompt files
+- is_prompt_file: Default name filter of the directory scanners
+- scan_directory_sync/async: Find all prompt files in a directory tree
+- iter_scan_directory_sync/async: Walk a directory tree for prompt files in
+  batches, off the event loop for the async variant
 """
 
 from __future__ import annotations
 
 import hashlib
 import os
+import time
+from collections.abc import AsyncIterator, Callable, Generator
 from pathlib import Path
 
 import aiofiles
+import anyio
 import structlog
 
+from dotpromptz.parse import extract_frontmatter
+
 from ._typing import ParsedPromptInfo
 
 logger = structlog.get_logger(__name__)
 
+SCAN_BATCH_SIZE = 512
+"""Number of paths the directory scanners yield at a time."""
+
 
 def read_prompt_file_sync(file_path: Path) -> str:
     """Synchronously reads the content of a prompt file.
@@ -97,6 +110,46 @@ async def read_prompt_file_async(file_path: Path) -> str:
         raise
 
 
+def read_frontmatter_sync(file_path: Path) -> str:
+    """Synchronously reads the frontmatter of a prompt file.
+
+    Reading stops at the closing `---`, so the template body is not read.
+
+    Args:
+        file_path: The full path to the prompt file.
+
+    Returns:
+        The frontmatter, or an empty string if the file has none.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        OSError: If there's an error reading the file.
+    """
+    logger.debug('Reading frontmatter (sync)', path=str(file_path))
+    with open(file_path, encoding='utf-8') as f:
+        return extract_frontmatter(f)
+
+
+async def read_frontmatter_async(file_path: Path) -> str:
+    """Asynchronously reads the frontmatter of a prompt file.
+
+    The file is read line by line in a single worker thread rather than with
+    aiofiles, which would hop to a thread for every line.
+
+    Args:
+        file_path: The full path to the prompt file.
+
+    Returns:
+        The frontmatter, or an empty string if the file has none.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        OSError: If there's an error reading the file.
+    """
+    await logger.adebug('Reading frontmatter', path=str(file_path))
+    return await anyio.to_thread.run_sync(read_frontmatter_sync, file_path)
+
+
 def calculate_version(content: str) -> str:
     """Calculate a deterministic version identifier for a prompt.
 
@@ -115,8 +168,22 @@ def calculate_version(content: str) -> str:
         # Returns a string like: "a123b456c789d0ef"
         ```
     """
-    sha1 = hashlib.sha1(content.encode('utf-8'), usedforsecurity=False)
-    return sha1.hexdigest()[:8]
+    return content_hash(content)[:8]
+
+
+def content_hash(content: str) -> str:
+    """Calculate the full SHA1 hash of a prompt's content.
+
+    Versions are a prefix of this hash. Stores that deduplicate content key it
+    by the full hash, which unlike a version is not expected to collide.
+
+    Args:
+        content: The string content to hash.
+
+    Returns:
+        The hex digest of the content.
+    """
+    return hashlib.sha1(content.encode('utf-8'), usedforsecurity=False).hexdigest()
 
 
 def is_partial(filename: str) -> bool:
@@ -184,67 +251,89 @@ def parse_prompt_filename(filename: str) -> ParsedPromptInfo:
         raise ValueError(f'Invalid prompt filename format: {filename}')
 
 
-async def scan_directory(base_dir: Path, dir_path: str = '', results: list[str] | None = None) -> list[str]:
-    """Asynchronously scan a directory for prompt files.
+def is_prompt_file(filename: str) -> bool:
+    """Determine if a filename is that of a prompt or partial file.
 
-    Recursively searches for .prompt files in the given directory and its
-    subdirectories, returning relative paths to all found files.
+    This is the default name filter of the directory scanners. Hidden files
+    are never scanned.
 
     Args:
-        base_dir: The base directory to start from.
-        dir_path: The relative subdirectory to scan (defaults to '').
-        results: Optional list to accumulate results (for recursive calls).
+        filename: The filename to check, without its directory.
 
     Returns:
-        A list of relative paths to all found .prompt files.
-
-    Example:
-        ```python
-        files = await scan_directory(Path('./prompts'))
-        # Returns ["greeting.prompt", "subdir/welcome.prompt", ...]
-        ```
+        True if the filename ends with `.prompt`, False otherwise.
     """
-    if results is None:
-        results = []
+    return filename.endswith('.prompt')
 
-    full_path = base_dir / dir_path if dir_path else base_dir
-    await logger.adebug('Scanning directory', path=str(full_path))
-
-    try:
-        entries = [entry for entry in os.scandir(full_path) if not entry.name.startswith('.')]
 
-        await logger.adebug(
-            'Found entries',
-            count=len(entries),
-            entries=[e.name for e in entries],
-        )
+def iter_scan_directory_sync(
+    base_dir: Path,
+    name_filter: Callable[[str], bool] = is_prompt_file,
+    batch_size: int = SCAN_BATCH_SIZE,
+) -> Generator[list[str], None, None]:
+    """Walk a directory tree for prompt files, yielding them in batches.
 
-        for entry in entries:
-            relative_path = os.path.join(dir_path, entry.name)
-
-            if entry.is_dir():
-                # Recurse into subdirectories.
-                await scan_directory(base_dir, relative_path, results)
-            elif entry.is_file() and entry.name.endswith('.prompt'):
-                # Add matching files to results.
-                results.append(relative_path)
-                await logger.adebug('Found prompt file', file=relative_path)
-    except Exception as e:
-        await logger.aerror('Error scanning directory', path=str(full_path), error=str(e))
-
-    return results
+    The tree is walked iteratively, so deep trees do not recurse. Hidden files
+    and directories are skipped, and directories that cannot be read are
+    logged and skipped. A single summary is logged once the walk completes.
 
+    Args:
+        base_dir: The base directory to start from.
+        name_filter: Returns whether a file, by name, is to be included.
+        batch_size: The maximum number of paths in a batch.
 
-def scan_directory_sync(base_dir: Path, dir_path: str = '', results: list[str] | None = None) -> list[str]:
+    Yields:
+        Lists of relative paths to the files found.
+    """
+    start = time.perf_counter()
+    pending = ['']
+    batch: list[str] = []
+    files = directories = errors = 0
+    while pending:
+        dir_path = pending.pop()
+        full_path = os.path.join(base_dir, dir_path)
+        directories += 1
+        subdirs: list[str] = []
+        try:
+            with os.scandir(full_path) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir():
+                        subdirs.append(os.path.join(dir_path, entry.name))
+                    elif entry.is_file() and name_filter(entry.name):
+                        batch.append(os.path.join(dir_path, entry.name))
+                        if len(batch) >= batch_size:
+                            files += len(batch)
+                            yield batch
+                            batch = []
+        except OSError as e:
+            errors += 1
+            logger.error('Error scanning directory', path=full_path, error=str(e))
+        # Visit subdirectories in the order they were listed.
+        pending.extend(reversed(subdirs))
+    files += len(batch)
+    if batch:
+        yield batch
+    logger.debug(
+        'Scanned directory',
+        path=str(base_dir),
+        files=files,
+        directories=directories,
+        errors=errors,
+        elapsed_ms=round((time.perf_counter() - start) * 1000, 1),
+    )
+
+
+def scan_directory_sync(base_dir: Path, name_filter: Callable[[str], bool] = is_prompt_file) -> list[str]:
     """Synchronously scan a directory for prompt files.
 
-    Recursively searches for .prompt files in the given directory and its
-    subdirectories, returning relative paths to all found files.
+    Searches for .prompt files in the given directory and its subdirectories,
+    returning relative paths to all found files.
 
     Args:
         base_dir: The base directory to start from.
-        dir_path: The relative subdirectory to scan (defaults to '').
-        results: Optional list to accumulate results (for recursive calls).
+        name_filter: Returns whether a file, by name, is to be included.
 
     Returns:
         A list of relative paths to all found .prompt files.
@@ -255,24 +344,74 @@ def scan_directory_sync(base_dir: Path, dir_path: str = '', results: list[str] |
         # Returns ["greeting.prompt", "subdir/welcome.prompt", ...]
         ```
     """
-    if results is None:
-        results = []
+    return [path for batch in iter_scan_directory_sync(base_dir, name_filter) for path in batch]
 
-    full_path = base_dir / dir_path if dir_path else base_dir
 
+async def iter_scan_directory(
+    base_dir: Path,
+    name_filter: Callable[[str], bool] = is_prompt_file,
+    batch_size: int = SCAN_BATCH_SIZE,
+    *,
+    limiter: anyio.CapacityLimiter | None = None,
+) -> AsyncIterator[list[str]]:
+    """Asynchronously walk a directory tree for prompt files, in batches.
+
+    The walk of `iter_scan_directory_sync` runs in worker threads, one batch
+    per hop, so listing directories never blocks the event loop, even on
+    slow network file systems.
+
+    Args:
+        base_dir: The base directory to start from.
+        name_filter: Returns whether a file, by name, is to be included.
+        batch_size: The maximum number of paths in a batch.
+        limiter: Limits the worker threads the walk runs in. Defaults to
+            anyio's default thread limiter.
+
+    Yields:
+        Lists of relative paths to the files found.
+
+    Example:
+        ```python
+        async for batch in iter_scan_directory(Path('./prompts')):
+            ...
+        ```
+    """
+    walk = iter_scan_directory_sync(base_dir, name_filter, batch_size)
     try:
-        entries = [entry for entry in os.scandir(full_path) if not entry.name.startswith('.')]
+        while True:
+            batch = await anyio.to_thread.run_sync(next, walk, None, limiter=limiter)
+            if batch is None:
+                return
+            yield batch
+    finally:
+        walk.close()
+
+
+async def scan_directory(
+    base_dir: Path,
+    name_filter: Callable[[str], bool] = is_prompt_file,
+    *,
+    limiter: anyio.CapacityLimiter | None = None,
+) -> list[str]:
+    """Asynchronously scan a directory for prompt files.
 
-        for entry in entries:
-            relative_path = os.path.join(dir_path, entry.name)
+    Searches for .prompt files in the given directory and its subdirectories
+    without blocking the event loop, returning relative paths to all found
+    files.
+
+    Args:
+        base_dir: The base directory to start from.
+        name_filter: Returns whether a file, by name, is to be included.
+        limiter: Limits the worker thread the walk runs in. Defaults to
+            anyio's default thread limiter.
 
-            if entry.is_dir():
-                # Recurse into subdirectories.
-                scan_directory_sync(base_dir, relative_path, results)
-            elif entry.is_file() and entry.name.endswith('.prompt'):
-                # Add matching files to results.
-                results.append(relative_path)
-    except Exception as e:
-        logger.error('Error scanning directory (sync)', path=str(full_path), error=str(e))
+    Returns:
+        A list of relative paths to all found .prompt files.
 
-    return results
+    Example:
+        ```python
+        files = await scan_directory(Path('./prompts'))
+        # Returns ["greeting.prompt", "subdir/welcome.prompt", ...]
+        ```
+    """
+    return await anyio.to_thread.run_sync(scan_directory_sync, base_dir, name_filter, limiter=limiter)
@@ -0,0 +1,725 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Prompt stores backed by an embedded SQLite database.
+
+Prompts and partials are rows of an `entries` table keyed by kind, name and
+variant, so loads are primary key lookups and listings walk the key in name
+and variant order, starting right after the cursor. Sources are stored once
+per distinct content in a `sources` table keyed by their content hash; triggers
+drop a source once no entry refers to it.
+
+Saving and loading many prompts at once runs in a single transaction, which is
+what makes importing or exporting large stores fast.
+
+Database Layout:
+- entries: kind ('prompt' or 'partial'), name, variant ('' for none), version
+  and content hash of each prompt and partial.
+- sources: source text by content hash.
+
+Example Usage:
+```python
+from pathlib import Path
+
+from dotpromptz.stores import (
+    DirStoreOptions,
+    DirStoreSync,
+    SqliteStoreSync,
+    import_store,
+)
+
+store = SqliteStoreSync('prompts.db')
+import_store(DirStoreSync(DirStoreOptions(directory=Path('./prompts'))), store)
+prompt = store.load('greeting')
+```
+"""
+
+from __future__ import annotations
+
+import builtins
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Literal
+
+import anyio
+import structlog
+
+from dotpromptz.typing import (
+    DeletePromptOrPartialOptions,
+    ListPartialsOptions,
+    ListPromptsOptions,
+    LoadPartialOptions,
+    LoadPromptOptions,
+    PaginatedPartials,
+    PaginatedPrompts,
+    PartialData,
+    PartialRef,
+    PromptData,
+    PromptRef,
+    PromptStoreSync,
+    PromptStoreWritable,
+    PromptStoreWritableSync,
+)
+
+from ._index import decode_cursor, encode_cursor
+from ._io import content_hash
+
+logger = structlog.get_logger(__name__)
+
+SCHEMA_VERSION = 1
+"""Schema version of the database, kept in its `user_version`."""
+
+_SCHEMA = (
+    """
+    CREATE TABLE entries (
+        kind TEXT NOT NULL,
+        name TEXT NOT NULL,
+        variant TEXT NOT NULL,
+        version TEXT NOT NULL,
+        hash TEXT NOT NULL,
+        PRIMARY KEY (kind, name, variant)
+    ) WITHOUT ROWID
+    """,
+    'CREATE INDEX entries_by_hash ON entries (hash)',
+    """
+    CREATE TABLE sources (
+        hash TEXT PRIMARY KEY,
+        source TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TRIGGER entries_release_source AFTER DELETE ON entries
+    WHEN NOT EXISTS (SELECT 1 FROM entries WHERE hash = old.hash)
+    BEGIN
+        DELETE FROM sources WHERE hash = old.hash;
+    END
+    """,
+    """
+    CREATE TRIGGER entries_replace_source AFTER UPDATE OF hash ON entries
+    WHEN old.hash != new.hash AND NOT EXISTS (SELECT 1 FROM entries WHERE hash = old.hash)
+    BEGIN
+        DELETE FROM sources WHERE hash = old.hash;
+    END
+    """,
+)
+
+_UPSERT_ENTRY = """
+INSERT INTO entries (kind, name, variant, version, hash) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (kind, name, variant) DO UPDATE SET version = excluded.version, hash = excluded.hash
+WHERE hash != excluded.hash
+"""
+
+_SELECT_ENTRY = """
+SELECT entries.name, entries.version, sources.source FROM entries JOIN sources USING (hash)
+WHERE entries.kind = ? AND entries.variant = ? AND entries.name
+"""
+
+_NO_VARIANT = ''
+"""Stored variant of prompts and partials without one, sorting before any variant."""
+
+_MAX_PARAMETERS = 900
+"""Most names bound in one statement, below SQLite's oldest default limit of 999."""
+
+_Kind = Literal['prompt', 'partial']
+
+_Row = tuple[_Kind, str, str, str, str, str]
+"""A prompt or partial to save: (kind, name, variant, version, hash, source)."""
+
+
+def _to_row(data: PromptData | PartialData) -> _Row:
+    """Convert prompt or partial data to a row to save.
+
+    A prompt whose base name starts with an underscore is saved as a partial,
+    as `DirStore` does.
+
+    Raises:
+        ValueError: If the name or source is missing.
+    """
+    if not data.name:
+        raise ValueError('Prompt name is required for saving.')
+    if data.source is None:
+        raise ValueError('Prompt source content is required for saving.')
+    kind: _Kind = 'partial' if isinstance(data, PartialData) else 'prompt'
+    name = data.name
+    dir_name, base_name = os.path.split(name)
+    if kind == 'prompt' and base_name.startswith('_'):
+        kind = 'partial'
+        name = f'{dir_name}/{base_name[1:]}' if dir_name else base_name[1:]
+    digest = content_hash(data.source)
+    return kind, name, data.variant or _NO_VARIANT, digest[:8], digest, data.source
+
+
+def _describe(kind: _Kind, name: str, variant: str | None) -> str:
+    """Describe a prompt or partial for error messages."""
+    return f"{kind} '{name}'{f' (variant: {variant})' if variant else ''}"
+
+
+class _Database:
+    """Connection to a prompt store database, safe to share between threads."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Open a database, creating its tables if it is new.
+
+        Args:
+            path: The database file, or ':memory:' for a private in-memory
+                database.
+
+        Raises:
+            ValueError: If the file is a database of another schema version.
+        """
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode = WAL')
+        self._conn.execute('PRAGMA synchronous = NORMAL')
+        # Sources are keyed by hash, so bulk saves touch pages all over the
+        # index; a larger page cache than the 2 MiB default keeps them in memory.
+        self._conn.execute('PRAGMA cache_size = -16384')
+        with self._transaction():
+            schema_version = self._conn.execute('PRAGMA user_version').fetchone()[0]
+            if schema_version == 0:
+                for statement in _SCHEMA:
+                    self._conn.execute(statement)
+                self._conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        if schema_version not in (0, SCHEMA_VERSION):
+            self._conn.close()
+            raise ValueError(f'Not a prompt store database of schema version {SCHEMA_VERSION}: {self.path}')
+        logger.debug('Opened SQLite prompt store', path=self.path)
+
+    def close(self) -> None:
+        """Close the connection."""
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def _transaction(self, write: bool = True) -> Iterator[sqlite3.Connection]:
+        """Run statements in a transaction, holding the connection.
+
+        Args:
+            write: Whether to take the database's write lock up front, rather
+                than read from a snapshot.
+        """
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE' if write else 'BEGIN')
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    def page(self, kind: _Kind, cursor: str | None, limit: int | None) -> tuple[list[tuple[str, str, str]], str | None]:
+        """List a page of prompts or partials in name and variant order.
+
+        Returns:
+            The name, variant and version of each entry, and the cursor of the
+            next page.
+
+        Raises:
+            ValueError: If the cursor is malformed or the limit is not positive.
+        """
+        if limit is not None and limit < 1:
+            raise ValueError(f'Page limit must be positive, got {limit}')
+        # Fetch one more row than asked for to know whether a page follows.
+        fetch = -1 if limit is None else limit + 1
+        with self._lock:
+            if cursor is None:
+                rows = self._conn.execute(
+                    'SELECT name, variant, version FROM entries WHERE kind = ? ORDER BY name, variant LIMIT ?',
+                    (kind, fetch),
+                ).fetchall()
+            else:
+                name, variant = decode_cursor(cursor)
+                rows = self._conn.execute(
+                    'SELECT name, variant, version FROM entries WHERE kind = ? AND (name, variant) > (?, ?)'
+                    ' ORDER BY name, variant LIMIT ?',
+                    (kind, name, variant or _NO_VARIANT, fetch),
+                ).fetchall()
+        if limit is None or len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, encode_cursor(rows[-1][0], rows[-1][1] or None)
+
+    def list(self, options: ListPromptsOptions | None) -> PaginatedPrompts:
+        """List prompt references in name and variant order."""
+        rows, cursor = self.page('prompt', options.cursor if options else None, options.limit if options else None)
+        refs = [PromptRef(name=name, variant=variant or None, version=version) for name, variant, version in rows]
+        return PaginatedPrompts(prompts=refs, cursor=cursor)
+
+    def list_partials(self, options: ListPartialsOptions | None) -> PaginatedPartials:
+        """List partial references in name and variant order."""
+        rows, cursor = self.page('partial', options.cursor if options else None, options.limit if options else None)
+        refs = [PartialRef(name=name, variant=variant or None, version=version) for name, variant, version in rows]
+        return PaginatedPartials(partials=refs, cursor=cursor)
+
+    def entry(self, kind: _Kind, name: str, variant: str | None, version: str | None) -> tuple[str, str]:
+        """Look up the version and source of a prompt or partial.
+
+        Raises:
+            FileNotFoundError: If there is no such prompt or partial.
+            ValueError: If the requested version does not match.
+        """
+        with self._lock:
+            row = self._conn.execute(f'{_SELECT_ENTRY} = ?', (kind, variant or _NO_VARIANT, name)).fetchone()
+        if row is None:
+            raise FileNotFoundError(f'{_describe(kind, name, variant).capitalize()} not found in {self.path}')
+        if version and version != row[1]:
+            raise ValueError(
+                f'Version mismatch for {_describe(kind, name, variant)}: requested {version} but found {row[1]}'
+            )
+        return row[1], row[2]
+
+    def entries(self, kind: _Kind, names: Sequence[str], variant: str | None) -> dict[str, tuple[str, str]]:
+        """Look up the versions and sources of many prompts or partials at once.
+
+        Returns:
+            The version and source of each entry found, by name.
+        """
+        found: dict[str, tuple[str, str]] = {}
+        unique = list(dict.fromkeys(names))
+        with self._transaction(write=False) as conn:
+            for start in range(0, len(unique), _MAX_PARAMETERS):
+                chunk = unique[start : start + _MAX_PARAMETERS]
+                rows = conn.execute(
+                    f'{_SELECT_ENTRY} IN ({", ".join("?" * len(chunk))})',
+                    (kind, variant or _NO_VARIANT, *chunk),
+                )
+                found.update((name, (version, source)) for name, version, source in rows)
+        return found
+
+    def save_many(self, items: Iterable[PromptData | PartialData]) -> int:
+        """Save prompts and partials in a single transaction.
+
+        Returns:
+            The number of prompts and partials saved.
+
+        Raises:
+            ValueError: If a name or source is missing. Nothing is saved.
+        """
+        rows = [_to_row(item) for item in items]
+        with self._transaction() as conn:
+            # Entries are written before sources, so that a source released by
+            # one entry and taken up by another in the same batch is restored.
+            conn.executemany(_UPSERT_ENTRY, (row[:5] for row in rows))
+            conn.executemany('INSERT OR IGNORE INTO sources (hash, source) VALUES (?, ?)', (row[4:] for row in rows))
+        return len(rows)
+
+    def delete(self, name: str, variant: str | None) -> _Kind:
+        """Delete a prompt, or the partial of that name if there is no prompt.
+
+        Returns:
+            The kind of entry deleted.
+
+        Raises:
+            FileNotFoundError: If there is neither such a prompt nor partial.
+        """
+        kinds: tuple[_Kind, ...] = ('prompt', 'partial')
+        with self._transaction() as conn:
+            for kind in kinds:
+                deleted = conn.execute(
+                    'DELETE FROM entries WHERE kind = ? AND name = ? AND variant = ?',
+                    (kind, name, variant or _NO_VARIANT),
+                ).rowcount
+                if deleted:
+                    return kind
+        raise FileNotFoundError(f"Failed to delete '{name}'{f' (variant: {variant})' if variant else ''}: not found")
+
+
+class SqliteStoreSync(PromptStoreWritableSync):
+    """Sync store keeping prompts and partials in an SQLite database.
+
+    Implements the `PromptStoreWritableSync` protocol. Listing supports cursor
+    pagination with `limit`, and references are returned in name and variant
+    order. The store is safe to use from several threads.
+
+    Examples:
+        ```python
+        store = SqliteStoreSync('prompts.db')
+        store.save_many([PromptData(name='greeting', source='Hello {{name}}!')])
+        prompts = store.load_many(['greeting', 'farewell'])
+        ```
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Open a database, creating it if it does not exist.
+
+        Args:
+            path: The database file, or ':memory:' for a private in-memory
+                database.
+
+        Raises:
+            ValueError: If the file is a database of another schema version.
+        """
+        self._db = _Database(path)
+
+    def close(self) -> None:
+        """Close the database."""
+        self._db.close()
+
+    def list(self, options: ListPromptsOptions | None = None) -> PaginatedPrompts:
+        """Lists prompts in the database (excluding partials).
+
+        Args:
+            options: Listing options, including the cursor and page limit.
+
+        Returns:
+            A page of prompt references.
+
+        Raises:
+            ValueError: If the cursor is malformed or the limit is not positive.
+        """
+        return self._db.list(options)
+
+    def list_partials(self, options: ListPartialsOptions | None = None) -> PaginatedPartials:
+        """Lists partials in the database.
+
+        Args:
+            options: Listing options, including the cursor and page limit.
+
+        Returns:
+            A page of partial references.
+
+        Raises:
+            ValueError: If the cursor is malformed or the limit is not positive.
+        """
+        return self._db.list_partials(options)
+
+    def load(self, name: str, options: LoadPromptOptions | None = None) -> PromptData:
+        """Loads a prompt from the database.
+
+        Args:
+            name: The name of the prompt.
+            options: Options like variant or version.
+
+        Returns:
+            The prompt data.
+
+        Raises:
+            FileNotFoundError: If there is no such prompt.
+            ValueError: If the requested version does not match.
+        """
+        variant = options.variant if options else None
+        version, source = self._db.entry('prompt', name, variant, options.version if options else None)
+        return PromptData(name=name, variant=variant, version=version, source=source)
+
+    def load_partial(self, name: str, options: LoadPartialOptions | None = None) -> PartialData:
+        """Loads a partial from the database.
+
+        Args:
+            name: The name of the partial, without a leading underscore.
+            options: Options like variant or version.
+
+        Returns:
+            The partial data.
+
+        Raises:
+            FileNotFoundError: If there is no such partial.
+            ValueError: If the requested version does not match.
+        """
+        variant = options.variant if options else None
+        version, source = self._db.entry('partial', name, variant, options.version if options else None)
+        return PartialData(name=name, variant=variant, version=version, source=source)
+
+    def load_many(self, names: Sequence[str], variant: str | None = None) -> dict[str, PromptData]:
+        """Loads many prompts of a variant in a single transaction.
+
+        Args:
+            names: The names of the prompts.
+            variant: The variant of the prompts.
+
+        Returns:
+            The data of each prompt found, by name. Names not found are left
+            out.
+        """
+        return {
+            name: PromptData(name=name, variant=variant, version=version, source=source)
+            for name, (version, source) in self._db.entries('prompt', names, variant).items()
+        }
+
+    def load_partials_many(self, names: Sequence[str], variant: str | None = None) -> dict[str, PartialData]:
+        """Loads many partials of a variant in a single transaction.
+
+        Args:
+            names: The names of the partials.
+            variant: The variant of the partials.
+
+        Returns:
+            The data of each partial found, by name. Names not found are left
+            out.
+        """
+        return {
+            name: PartialData(name=name, variant=variant, version=version, source=source)
+            for name, (version, source) in self._db.entries('partial', names, variant).items()
+        }
+
+    def save(self, prompt: PromptData | PartialData) -> None:
+        """Saves a prompt or partial to the database.
+
+        Partials are saved from `PartialData`, or from `PromptData` whose base
+        name starts with an underscore, as by `DirStore`.
+
+        Args:
+            prompt: The prompt or partial to save.
+
+        Raises:
+            ValueError: If the name or source is missing.
+        """
+        self._db.save_many([prompt])
+        logger.debug('Prompt saved (sync)', name=prompt.name, variant=prompt.variant, path=self._db.path)
+
+    def save_many(self, prompts: Iterable[PromptData | PartialData]) -> int:
+        """Saves many prompts and partials in a single transaction.
+
+        Args:
+            prompts: The prompts and partials to save, as by `save`.
+
+        Returns:
+            The number of prompts and partials saved.
+
+        Raises:
+            ValueError: If a name or source is missing. Nothing is saved.
+        """
+        count = self._db.save_many(prompts)
+        logger.debug('Prompts saved (sync)', count=count, path=self._db.path)
+        return count
+
+    def delete(self, name: str, options: DeletePromptOrPartialOptions | None = None) -> None:
+        """Deletes a prompt, or the partial of that name if there is no prompt.
+
+        Args:
+            name: The name of the prompt or partial.
+            options: Options specifying the variant to delete.
+
+        Raises:
+            FileNotFoundError: If there is neither such a prompt nor partial.
+        """
+        variant = options.variant if options else None
+        kind = self._db.delete(name, variant)
+        logger.debug(f'{kind.capitalize()} deleted (sync)', name=name, variant=variant, path=self._db.path)
+
+
+class SqliteStore(PromptStoreWritable):
+    """Async store keeping prompts and partials in an SQLite database.
+
+    Implements the `PromptStoreWritable` protocol. Queries run in a worker
+    thread, one at a time per store; see `SqliteStoreSync` for details.
+
+    Examples:
+        ```python
+        store = SqliteStore('prompts.db')
+        prompt = await store.load('greeting')
+        ```
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Open a database, creating it if it does not exist.
+
+        Args:
+            path: The database file, or ':memory:' for a private in-memory
+                database.
+
+        Raises:
+            ValueError: If the file is a database of another schema version.
+        """
+        self._sync = SqliteStoreSync(path)
+        # Queries are serialized on the connection, so more threads would
+        # only wait for it.
+        self._limiter = anyio.CapacityLimiter(1)
+
+    def close(self) -> None:
+        """Close the database."""
+        self._sync.close()
+
+    async def _run(self, method: Any, *args: Any) -> Any:
+        """Run a method of the sync store in a worker thread."""
+        return await anyio.to_thread.run_sync(method, *args, limiter=self._limiter)
+
+    async def list(self, options: ListPromptsOptions | None = None) -> PaginatedPrompts:
+        """Lists prompts in the database (excluding partials).
+
+        Args:
+            options: Listing options, including the cursor and page limit.
+
+        Returns:
+            A page of prompt references.
+
+        Raises:
+            ValueError: If the cursor is malformed or the limit is not positive.
+        """
+        result: PaginatedPrompts = await self._run(self._sync.list, options)
+        return result
+
+    async def list_partials(self, options: ListPartialsOptions | None = None) -> PaginatedPartials:
+        """Lists partials in the database.
+
+        Args:
+            options: Listing options, including the cursor and page limit.
+
+        Returns:
+            A page of partial references.
+
+        Raises:
+            ValueError: If the cursor is malformed or the limit is not positive.
+        """
+        result: PaginatedPartials = await self._run(self._sync.list_partials, options)
+        return result
+
+    async def load(self, name: str, options: LoadPromptOptions | None = None) -> PromptData:
+        """Loads a prompt from the database.
+
+        Args:
+            name: The name of the prompt.
+            options: Options like variant or version.
+
+        Returns:
+            The prompt data.
+
+        Raises:
+            FileNotFoundError: If there is no such prompt.
+            ValueError: If the requested version does not match.
+        """
+        result: PromptData = await self._run(self._sync.load, name, options)
+        return result
+
+    async def load_partial(self, name: str, options: LoadPartialOptions | None = None) -> PartialData:
+        """Loads a partial from the database.
+
+        Args:
+            name: The name of the partial, without a leading underscore.
+            options: Options like variant or version.
+
+        Returns:
+            The partial data.
+
+        Raises:
+            FileNotFoundError: If there is no such partial.
+            ValueError: If the requested version does not match.
+        """
+        result: PartialData = await self._run(self._sync.load_partial, name, options)
+        return result
+
+    async def load_many(self, names: Sequence[str], variant: str | None = None) -> dict[str, PromptData]:
+        """Loads many prompts of a variant in a single transaction.
+
+        Args:
+            names: The names of the prompts.
+            variant: The variant of the prompts.
+
+        Returns:
+            The data of each prompt found, by name. Names not found are left
+            out.
+        """
+        result: dict[str, PromptData] = await self._run(self._sync.load_many, names, variant)
+        return result
+
+    async def load_partials_many(self, names: Sequence[str], variant: str | None = None) -> dict[str, PartialData]:
+        """Loads many partials of a variant in a single transaction.
+
+        Args:
+            names: The names of the partials.
+            variant: The variant of the partials.
+
+        Returns:
+            The data of each partial found, by name. Names not found are left
+            out.
+        """
+        result: dict[str, PartialData] = await self._run(self._sync.load_partials_many, names, variant)
+        return result
+
+    async def save(self, prompt: PromptData | PartialData) -> None:
+        """Saves a prompt or partial to the database.
+
+        Args:
+            prompt: The prompt or partial to save, as by `SqliteStoreSync.save`.
+
+        Raises:
+            ValueError: If the name or source is missing.
+        """
+        await self._run(self._sync.save, prompt)
+
+    async def save_many(self, prompts: Iterable[PromptData | PartialData]) -> int:
+        """Saves many prompts and partials in a single transaction.
+
+        Args:
+            prompts: The prompts and partials to save, as by `save`.
+
+        Returns:
+            The number of prompts and partials saved.
+
+        Raises:
+            ValueError: If a name or source is missing. Nothing is saved.
+        """
+        count: int = await self._run(self._sync.save_many, builtins.list(prompts))
+        return count
+
+    async def delete(self, name: str, options: DeletePromptOrPartialOptions | None = None) -> None:
+        """Deletes a prompt, or the partial of that name if there is no prompt.
+
+        Args:
+            name: The name of the prompt or partial.
+            options: Options specifying the variant to delete.
+
+        Raises:
+            FileNotFoundError: If there is neither such a prompt nor partial.
+        """
+        await self._run(self._sync.delete, name, options)
+
+
+def import_store(source: PromptStoreSync, target: SqliteStoreSync, batch_size: int = 1000) -> tuple[int, int]:
+    """Copy every prompt and partial of a store into an SQLite store.
+
+    Prompts and partials are listed a page at a time and saved in one
+    transaction per page, replacing any of the same name and variant.
+
+    Args:
+        source: The store to copy from, e.g. a `DirStoreSync`.
+        target: The store to copy into.
+        batch_size: The number of prompts or partials listed, loaded and
+            saved at a time.
+
+    Returns:
+        The number of prompts and of partials copied.
+
+    Examples:
+        ```python
+        source = DirStoreSync(DirStoreOptions(directory=Path('./prompts')))
+        prompts, partials = import_store(source, SqliteStoreSync('prompts.db'))
+        ```
+    """
+    prompts = partials = 0
+    cursor: str | None = None
+    while True:
+        page = source.list(ListPromptsOptions(cursor=cursor, limit=batch_size))
+        prompts += target.save_many(
+            source.load(ref.name, LoadPromptOptions(variant=ref.variant)) for ref in page.prompts
+        )
+        cursor = page.cursor
+        if cursor is None:
+            break
+    while True:
+        partial_page = source.list_partials(ListPartialsOptions(cursor=cursor, limit=batch_size))
+        partials += target.save_many(
+            source.load_partial(ref.name, LoadPartialOptions(variant=ref.variant)) for ref in partial_page.partials
+        )
+        cursor = partial_page.cursor
+        if cursor is None:
+            break
+    logger.info('Imported store', prompts=prompts, partials=partials)
+    return prompts, partials
@@ -43,6 +43,13 @@ class DirStoreOptions:
             stored. The store will read from and write to this directory and
             its subdirectories. The directory structure forms part of the
             prompt/partial names.
+        persist_index: Whether to persist the versions computed when listing
+            the store to a hidden sidecar file in `directory`, so that a new
+            store instance only rehashes files changed since. Versions are
+            always remembered in memory for the lifetime of the store.
+        max_workers: The most worker threads the async DirStore scans the
+            directory and hashes files in at once, across all of its
+            listings. Each worker reads one file at a time.
 
     Example:
         ```python
@@ -55,6 +62,8 @@ class DirStoreOptions:
     """
 
     directory: Path
+    persist_index: bool = False
+    max_workers: int = 4
 
 
 @dataclass
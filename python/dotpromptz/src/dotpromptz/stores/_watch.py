@@ -0,0 +1,385 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Change watching for directory-based prompt stores.
+
+This module detects prompts and partials being added, modified or deleted in a
+store directory and reports them as `StoreChange` events. It is used by the
+`watch` methods of both directory store implementations.
+
+On Linux the watcher subscribes to inotify events for every directory in the
+tree and only re-examines the files named by those events. Elsewhere, or when
+inotify is unavailable, it falls back to polling the tree and comparing file
+stats against the previous scan.
+
+Key Components:
+- DirWatcher: Blocking watcher that returns batches of changes.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Literal
+
+import structlog
+
+from dotpromptz.typing import StoreChange
+
+from ._io import is_partial, parse_prompt_filename
+
+logger = structlog.get_logger(__name__)
+
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF
+
+_EVENT_HEADER = struct.Struct('iIII')
+
+_Signature = tuple[int, int, int]
+"""File identity used to detect modifications: (mtime_ns, size, inode)."""
+
+
+def _load_libc() -> Any | None:
+    """Load libc if it exposes the inotify API.
+
+    Returns:
+        The libc handle, or None if inotify is not available.
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1  # noqa: B018
+        libc.inotify_add_watch  # noqa: B018
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+def _change_for_path(rel_path: str, event: Literal['added', 'modified', 'deleted']) -> StoreChange | None:
+    """Map a prompt file path to a change event.
+
+    Args:
+        rel_path: The path of the prompt file relative to the store directory.
+        event: The kind of change.
+
+    Returns:
+        The change, or None if the file name does not follow the store's
+        naming conventions.
+    """
+    base_name = os.path.basename(rel_path)
+    partial = is_partial(base_name)
+    try:
+        parsed = parse_prompt_filename(base_name[1:] if partial else base_name)
+    except ValueError:
+        return None
+
+    dir_path = os.path.dirname(rel_path)
+    name = f'{dir_path.replace(os.sep, "/")}/{parsed.name}' if dir_path else parsed.name
+    return StoreChange(kind='partial' if partial else 'prompt', event=event, name=name, variant=parsed.variant)
+
+
+class DirWatcher:
+    """Blocking watcher for changes to the prompt files in a directory.
+
+    The watcher takes a snapshot of the tree when created. Each call to `read`
+    waits for file system activity and returns the changes relative to the
+    previous call, coalescing bursts of events (such as an editor's write,
+    close and rename) into a single change per file.
+
+    Examples:
+        ```python
+        with DirWatcher(Path('./prompts')) as watcher:
+            while True:
+                for change in watcher.read(timeout=1.0):
+                    print(change.event, change.kind, change.name)
+        ```
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        poll_interval: float = 1.0,
+        debounce: float = 0.05,
+        use_inotify: bool = True,
+    ) -> None:
+        """Initialize the watcher and take the initial snapshot.
+
+        Args:
+            directory: The store directory to watch.
+            poll_interval: Seconds between scans when polling.
+            debounce: Seconds of quiet to wait for before reporting a burst of
+                inotify events.
+            use_inotify: Whether to use inotify when available. When False,
+                the watcher always polls.
+        """
+        self._directory = directory
+        self._poll_interval = poll_interval
+        self._debounce = debounce
+        self._fd = -1
+        self._watches: dict[int, str] = {}
+        self._libc = _load_libc() if use_inotify else None
+
+        if self._libc is not None:
+            fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                logger.warning('inotify unavailable, polling instead', error=os.strerror(ctypes.get_errno()))
+                self._libc = None
+            else:
+                self._fd = fd
+
+        self._snapshot: dict[str, _Signature] = {}
+        for rel_path, signature in self._walk(''):
+            self._snapshot[rel_path] = signature
+        logger.debug(
+            'Watching directory',
+            directory=str(directory),
+            mode='inotify' if self.uses_inotify else 'polling',
+            files=len(self._snapshot),
+        )
+
+    @property
+    def uses_inotify(self) -> bool:
+        """Whether the watcher receives inotify events rather than polling."""
+        return self._fd >= 0
+
+    def __enter__(self) -> DirWatcher:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Exit the context manager and release the watcher."""
+        self.close()
+
+    def close(self) -> None:
+        """Release the inotify descriptor, if any."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+            self._watches.clear()
+
+    def read(self, timeout: float | None = None) -> list[StoreChange]:
+        """Wait for changes and return them.
+
+        Args:
+            timeout: Maximum number of seconds to wait. None waits until a
+                change is observed.
+
+        Returns:
+            The changes observed since the previous call, ordered by path. The
+            list is empty if the timeout expired without any change.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if self.uses_inotify:
+                changes = self._read_inotify(remaining)
+            else:
+                changes = self._rescan()
+                if not changes and remaining != 0.0:
+                    time.sleep(self._poll_interval if remaining is None else min(self._poll_interval, remaining))
+            if changes:
+                logger.debug('Observed store changes', directory=str(self._directory), count=len(changes))
+                return changes
+            if deadline is not None and time.monotonic() >= deadline:
+                return []
+
+    def _walk(self, rel_dir: str) -> Iterator[tuple[str, _Signature]]:
+        """Yield every prompt file under a directory, watching each directory.
+
+        Hidden files and directories are skipped, as in the store scans.
+
+        Args:
+            rel_dir: The directory to walk, relative to the store directory.
+
+        Yields:
+            The relative path and signature of each prompt file.
+        """
+        pending = [rel_dir]
+        while pending:
+            current = pending.pop()
+            if self._fd >= 0:
+                self._add_watch(current)
+            try:
+                with os.scandir(self._directory / current if current else self._directory) as entries:
+                    for entry in entries:
+                        if entry.name.startswith('.'):
+                            continue
+                        rel_path = os.path.join(current, entry.name)
+                        if entry.is_dir():
+                            pending.append(rel_path)
+                        elif entry.is_file() and entry.name.endswith('.prompt'):
+                            stat = entry.stat()
+                            yield rel_path, (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+            except OSError as e:
+                logger.warning('Error scanning directory', path=current, error=str(e))
+
+    def _add_watch(self, rel_dir: str) -> None:
+        """Subscribe to inotify events for a directory.
+
+        Args:
+            rel_dir: The directory relative to the store directory.
+        """
+        assert self._libc is not None
+        path = os.fsencode(self._directory / rel_dir if rel_dir else self._directory)
+        wd = self._libc.inotify_add_watch(self._fd, path, _WATCH_MASK)
+        if wd < 0:
+            logger.warning('Unable to watch directory', path=rel_dir, error=os.strerror(ctypes.get_errno()))
+            return
+        self._watches[wd] = rel_dir
+
+    def _stat(self, rel_path: str) -> _Signature | None:
+        """Return the signature of a file, or None if it no longer exists."""
+        try:
+            stat = os.stat(self._directory / rel_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _rescan(self) -> list[StoreChange]:
+        """Rescan the whole tree and compare it against the snapshot."""
+        current = dict(self._walk(''))
+        return self._diff(set(current) | set(self._snapshot), current)
+
+    def _diff(self, paths: set[str], signatures: dict[str, _Signature] | None = None) -> list[StoreChange]:
+        """Compare paths against the snapshot and update it.
+
+        Args:
+            paths: The relative file paths that may have changed.
+            signatures: Signatures from a full scan. When omitted, each path
+                is stat'ed.
+
+        Returns:
+            The resulting changes, ordered by path.
+        """
+        changes: list[StoreChange] = []
+        for rel_path in sorted(paths):
+            before = self._snapshot.get(rel_path)
+            after = signatures.get(rel_path) if signatures is not None else self._stat(rel_path)
+            if before == after:
+                continue
+            if after is None:
+                del self._snapshot[rel_path]
+                event: Literal['added', 'modified', 'deleted'] = 'deleted'
+            else:
+                self._snapshot[rel_path] = after
+                event = 'added' if before is None else 'modified'
+            change = _change_for_path(rel_path, event)
+            if change is not None:
+                changes.append(change)
+        return changes
+
+    def _read_inotify(self, timeout: float | None) -> list[StoreChange]:
+        """Wait for a burst of inotify events and turn it into changes.
+
+        Args:
+            timeout: Maximum number of seconds to wait for the first event.
+
+        Returns:
+            The changes caused by the burst, possibly empty.
+        """
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return []
+
+        paths: set[str] = set()
+        overflow = False
+        while ready:
+            try:
+                buffer = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                buffer = b''
+            overflow = self._collect_events(buffer, paths) or overflow
+            ready, _, _ = select.select([self._fd], [], [], self._debounce)
+
+        if overflow:
+            logger.warning('inotify queue overflowed, rescanning', directory=str(self._directory))
+            return self._rescan()
+        return self._diff(paths)
+
+    def _collect_events(self, buffer: bytes, paths: set[str]) -> bool:
+        """Decode inotify events into the set of paths to re-examine.
+
+        New directories are watched and their files added to the paths;
+        files under removed directories are added to the paths so they are
+        reported as deleted.
+
+        Args:
+            buffer: Raw bytes read from the inotify descriptor.
+            paths: The set of relative paths to extend.
+
+        Returns:
+            True if the kernel event queue overflowed.
+        """
+        overflow = False
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _EVENT_HEADER.size
+            name = buffer[offset : offset + length].rstrip(b'\0').decode('utf-8', 'surrogateescape')
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            if mask & _IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            rel_dir = self._watches.get(wd)
+            if rel_dir is None or not name or name.startswith('.'):
+                continue
+
+            rel_path = os.path.join(rel_dir, name)
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    paths.update(path for path, _ in self._walk(rel_path))
+                elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+                    prefix = rel_path + os.sep
+                    paths.update(path for path in self._snapshot if path.startswith(prefix))
+                    self._remove_watches(rel_path)
+            elif name.endswith('.prompt'):
+                paths.add(rel_path)
+        return overflow
+
+    def _remove_watches(self, rel_dir: str) -> None:
+        """Stop watching a directory that left the tree, and its children.
+
+        Args:
+            rel_dir: The directory relative to the store directory.
+        """
+        assert self._libc is not None
+        prefix = rel_dir + os.sep
+        for wd, watched in list(self._watches.items()):
+            if watched == rel_dir or watched.startswith(prefix):
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._watches[wd]
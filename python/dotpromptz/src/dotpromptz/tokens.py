@@ -0,0 +1,57 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Token estimation for rendered messages.
+
+Estimates are used to keep rendered prompts within a `HistoryBudget`. Any
+`TokenEstimator` can be plugged in, e.g. one backed by a model's tokenizer;
+`estimate_tokens` is a fast heuristic that needs no tokenizer.
+"""
+
+from dotpromptz.typing import MediaPart, Message, TextPart
+
+CHARS_PER_TOKEN = 4
+"""Average number of characters per token assumed for text."""
+
+MEDIA_TOKENS = 258
+"""Tokens assumed for a media part, whatever the size of the media."""
+
+MESSAGE_OVERHEAD_TOKENS = 4
+"""Tokens assumed for the role and framing of every message."""
+
+
+def estimate_tokens(message: Message) -> int:
+    """Estimates the number of tokens of a message.
+
+    Text is counted at `CHARS_PER_TOKEN` characters per token, media at a
+    fixed `MEDIA_TOKENS`, and other parts by the length of their JSON form.
+
+    Args:
+        message: The message to estimate.
+
+    Returns:
+        The estimated number of tokens.
+    """
+    chars = 0
+    tokens = MESSAGE_OVERHEAD_TOKENS
+    for part in message.content:
+        if isinstance(part, TextPart):
+            chars += len(part.text)
+        elif isinstance(part, MediaPart):
+            tokens += MEDIA_TOKENS
+        else:
+            chars += len(part.model_dump_json(by_alias=True, exclude_none=True, exclude={'metadata'}))
+    return tokens + (chars + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
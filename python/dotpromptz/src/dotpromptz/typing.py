@@ -74,11 +74,13 @@ protocols: one for async and one for sync.
 |                 | `PromptStoreWritable`     | Extension of `PromptStore` with asynchronous write methods.           |
 |                 | `PromptStoreWritableSync` | Extension of `PromptStoreSync` with synchronous write methods.        |
 |-----------------|---------------------------|-----------------------------------------------------------------------|
-| Utility/Schema  | `HasMetadata`             | Base model for types that can include arbitrary metadata.             |
+| Utility/Schema  | `BatchResolver`           | Protocol for a resolver that also resolves many names in one call.    |
+|                 | `HasMetadata`             | Base model for types that can include arbitrary metadata.             |
 |                 | `JsonSchema`              | JSON schema definition. 'Any' allows flexibility.                     |
 |                 | `PartialResolver`         | function resolving a partial name to a template string.               |
 |                 | `Schema`                  | generic schema, represented as a dictionary.                          |
 |                 | `SchemaResolver`          | function resolving a schema name to a JSON schema.                    |
+|                 | `TokenEstimator`          | function estimating the number of tokens of a message.                |
 
 ## Type Relationships
 
@@ -145,7 +147,8 @@ PromptStoreSync (sync read)
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+import bisect
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Mapping, Sequence
 from enum import Enum
 from typing import (
     Any,
@@ -153,9 +156,11 @@ from typing import (
     Literal,
     Protocol,
     TypeVar,
+    overload,
 )
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
 
 Schema = dict[str, Any]
 """Type alias for a generic schema, represented as a dictionary."""
@@ -175,6 +180,9 @@ OutputT = TypeVar('OutputT')
 VariablesT = TypeVar('VariablesT')
 """Generic TypeVar for prompt input variables within DataArgument."""
 
+DefinitionT_co = TypeVar('DefinitionT_co', covariant=True)
+"""Generic TypeVar for the definitions returned by a BatchResolver."""
+
 
 class HasMetadata(BaseModel):
     """Base model for types that can include arbitrary metadata.
@@ -507,6 +515,184 @@ class Message(HasMetadata):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
+PartDict = dict[str, Any]
+"""A `Part` in serialized form, as dumped with aliases and without None values."""
+
+MessageDict = dict[str, Any]
+"""A `Message` in serialized form; its content is a list of `PartDict`."""
+
+TokenEstimator = Callable[[Message], int]
+"""Type alias for a function estimating the number of tokens of a message."""
+
+
+class History(Sequence[Message]):
+    """An append-only conversation history for rendering long conversations.
+
+    Passed as `DataArgument.messages`, a history is kept by reference instead
+    of being validated and copied. The history-tagged form of each message is
+    built once, sharing the content of the original, and reused by later
+    renders, so a render only pays for the messages added since the last one.
+
+    Messages must only be added through `append` and `extend`.
+
+    Examples:
+        ```python
+        history = History()
+        for turn in conversation:
+            history.append(turn)
+            rendered = await prompt(DataArgument(messages=history))
+        ```
+    """
+
+    __slots__ = ('_messages', '_tagged', '_tagged_at', '_tagged_count', '_token_estimator', '_token_offsets')
+
+    def __init__(self, messages: Iterable[Message] = ()) -> None:
+        """Initialize a history.
+
+        Args:
+            messages: The messages so far, in order.
+        """
+        self._messages: list[Message] = list(messages)
+        # History-tagged messages with content, and how many of the messages
+        # they cover.
+        self._tagged: list[Message] = []
+        self._tagged_at: list[int] = []
+        self._tagged_count = 0
+        # Running totals of the estimated tokens of the messages, for the
+        # estimator they were computed with.
+        self._token_estimator: TokenEstimator | None = None
+        self._token_offsets: list[int] = [0]
+
+    def append(self, message: Message) -> None:
+        """Add a message to the end of the history.
+
+        Args:
+            message: The message to add.
+        """
+        self._messages.append(message)
+
+    def extend(self, messages: Iterable[Message]) -> None:
+        """Add messages to the end of the history.
+
+        Args:
+            messages: The messages to add, in order.
+        """
+        self._messages.extend(messages)
+
+    @property
+    def messages(self) -> list[Message]:
+        """The messages in the history, which must not be modified."""
+        return self._messages
+
+    def tagged(self, start: int = 0) -> list[Message]:
+        """Returns the messages with content, tagged as history.
+
+        Messages are tagged as by `transform_messages_to_history`, but only
+        the messages added since the previous call are tagged, without
+        validation. Messages without content are left out, as they are when
+        rendering.
+
+        Args:
+            start: The index of the first message to include.
+
+        Returns:
+            The tagged messages, which must not be modified.
+        """
+        for index in range(self._tagged_count, len(self._messages)):
+            message = self._messages[index]
+            if message.content:
+                self._tagged.append(
+                    Message.model_construct(
+                        role=message.role,
+                        content=message.content,
+                        metadata={**(message.metadata or {}), 'purpose': 'history'},
+                    )
+                )
+                self._tagged_at.append(index)
+        self._tagged_count = len(self._messages)
+        if start <= 0:
+            return self._tagged
+        return self._tagged[bisect.bisect_left(self._tagged_at, start) :]
+
+    def token_offsets(self, estimator: TokenEstimator) -> list[int]:
+        """Returns running totals of the estimated tokens of the messages.
+
+        Only the messages added since the previous call are estimated, unless
+        a different estimator is given, which starts the totals over.
+
+        Args:
+            estimator: Estimates the tokens of a message.
+
+        Returns:
+            The totals, which must not be modified. The i-th total is the
+            estimated number of tokens of the first i messages, so there is
+            one more total than there are messages.
+        """
+        if estimator != self._token_estimator:
+            self._token_estimator = estimator
+            self._token_offsets = [0]
+        offsets = self._token_offsets
+        total = offsets[-1]
+        for message in self._messages[len(offsets) - 1 :]:
+            total += estimator(message)
+            offsets.append(total)
+        return offsets
+
+    def __len__(self) -> int:
+        """Return the number of messages."""
+        return len(self._messages)
+
+    @overload
+    def __getitem__(self, index: int) -> Message: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Message]: ...
+
+    def __getitem__(self, index: int | slice) -> Message | list[Message]:
+        """Return a message or a list of messages."""
+        return self._messages[index]
+
+    def __iter__(self) -> Iterator[Message]:
+        """Iterate over the messages in order."""
+        return iter(self._messages)
+
+    def __repr__(self) -> str:
+        """Return a representation of the history."""
+        return f'History({self._messages!r})'
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        """Accept histories as they are and serialize them as message lists."""
+        return core_schema.is_instance_schema(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda history: history.messages,
+                return_schema=handler.generate_schema(list[Message]),
+            ),
+        )
+
+
+class HistoryBudget(BaseModel):
+    """A token budget for rendered prompts, met by leaving out older history.
+
+    The messages rendered from the template are always kept; the newest
+    history messages that fit in the rest of the budget are kept with them.
+
+    Attributes:
+        max_tokens: The estimated number of tokens the rendered messages may
+            use.
+        estimator: Estimates the tokens of a message. Defaults to the
+            heuristic `dotpromptz.tokens.estimate_tokens`.
+        placeholder: The text of a message standing in for the history left
+            out, formatted with `count`, the number of messages left out. When
+            omitted, older history is trimmed without a trace.
+    """
+
+    max_tokens: int
+    estimator: TokenEstimator | None = None
+    placeholder: str | None = None
+
+
 class Document(HasMetadata):
     """Represents an external document, often used for context.
 
@@ -524,13 +710,14 @@ class DataArgument(BaseModel, Generic[VariablesT]):
     Attributes:
         input: Values for input variables required by the template.
         docs: List of relevant `Document` objects.
-        messages: List of preceding `Message` objects in the history.
+        messages: List of preceding `Message` objects in the history, or a
+            `History` for long conversations rendered turn after turn.
         context: Arbitrary dictionary of additional context items.
     """
 
     input: VariablesT | None = None
     docs: list[Document] | None = None
-    messages: list[Message] | None = None
+    messages: list[Message] | History | None = None
     context: dict[str, Any] | None = None
 
 
@@ -544,6 +731,31 @@ PartialResolver = Callable[[str], str | None | Awaitable[str | None]]
 """Type alias for a function resolving a partial name to a template string."""
 
 
+class BatchResolver(Protocol[DefinitionT_co]):
+    """Protocol for a resolver that also resolves many names in one call.
+
+    A tool, schema or partial resolver may implement `resolve_many` besides
+    resolving a single name when called. `Dotprompt` then resolves all the
+    names it needs at once, e.g. every tool of a prompt, in a single call
+    instead of one call per name, which saves round trips to remote
+    registries.
+    """
+
+    def resolve_many(
+        self, names: list[str]
+    ) -> Mapping[str, DefinitionT_co | None] | Awaitable[Mapping[str, DefinitionT_co | None]]:
+        """Resolves many names at once.
+
+        Args:
+            names: The names to resolve, without duplicates.
+
+        Returns:
+            The definitions by name, or an awaitable of them. Names that
+            cannot be resolved are left out or map to None.
+        """
+        ...
+
+
 class RenderedPrompt(PromptMetadata[ModelConfigT], Generic[ModelConfigT]):
     """The final output after a prompt template is rendered.
 
@@ -695,6 +907,22 @@ LoadOptions = LoadPromptOptions | LoadPartialOptions
 """Type alias for options when loading a prompt or a partial."""
 
 
+class StoreChange(BaseModel):
+    """A change to a prompt or partial observed in a store.
+
+    Attributes:
+        kind: Whether the change affects a prompt or a partial.
+        event: Whether the prompt or partial was added, modified or deleted.
+        name: The name of the prompt or partial.
+        variant: The variant of the prompt or partial, if any.
+    """
+
+    kind: Literal['prompt', 'partial']
+    event: Literal['added', 'modified', 'deleted']
+    name: str
+    variant: str | None = None
+
+
 class DeletePromptOrPartialOptions(BaseModel):
     """Options for specifying which variant to delete.
 
@@ -0,0 +1,446 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compiled validation of values against JSON Schema.
+
+`compile_validator` turns a JSON Schema into a tree of closures once, so that
+validating a value does not interpret the schema again. It is used to check
+prompt inputs against the resolved `input.schema` of a prompt before
+rendering.
+
+The following keywords are supported; others, such as `format` or
+`description`, are ignored:
+
+| Applies to | Keywords                                                                           |
+|------------|------------------------------------------------------------------------------------|
+| Any value  | `type`, `enum`, `const`, `allOf`, `anyOf`, `oneOf`, `not`, `$ref`                  |
+| Objects    | `properties`, `required`, `additionalProperties`, `minProperties`, `maxProperties` |
+| Arrays     | `items`, `prefixItems`, `minItems`, `maxItems`                                     |
+| Strings    | `minLength`, `maxLength`, `pattern`                                                |
+| Numbers    | `minimum`, `maximum`, `exclusiveMinimum`, `exclusiveMaximum`                       |
+
+`$ref` is supported for references within the schema, e.g. `#/$defs/Address`.
+
+Examples:
+    ```python
+    validate = compile_validator({'type': 'object', 'required': ['name']})
+    validate({})  # ["input: missing required property 'name'"]
+    ```
+"""
+
+import re
+from collections.abc import Callable
+from typing import Any
+
+from dotpromptz.typing import JsonSchema
+
+Validator = Callable[[Any], list[str]]
+"""A compiled validator, returning the errors of a value; empty if it is valid."""
+
+# A compiled check returns None for a valid value, or its errors. Each error
+# is the path to the invalid part, innermost key first, and a message. Paths
+# are only built for invalid values.
+_Error = tuple[list[str | int], str]
+_Check = Callable[[Any], list[_Error] | None]
+
+_TYPES: dict[str, tuple[type, ...]] = {
+    'array': (list, tuple),
+    'boolean': (bool,),
+    'integer': (int,),
+    'null': (type(None),),
+    'number': (int, float),
+    'object': (dict,),
+    'string': (str,),
+}
+
+_OBJECT_KEYWORDS = frozenset({'properties', 'required', 'additionalProperties', 'minProperties', 'maxProperties'})
+_ARRAY_KEYWORDS = frozenset({'items', 'prefixItems', 'minItems', 'maxItems'})
+_STRING_KEYWORDS = frozenset({'minLength', 'maxLength', 'pattern'})
+
+_NUMERIC_BOUNDS: dict[str, tuple[Callable[[Any, Any], bool], str]] = {
+    'minimum': (lambda value, bound: value >= bound, 'at least'),
+    'maximum': (lambda value, bound: value <= bound, 'at most'),
+    'exclusiveMinimum': (lambda value, bound: value > bound, 'greater than'),
+    'exclusiveMaximum': (lambda value, bound: value < bound, 'less than'),
+}
+
+
+def compile_validator(schema: JsonSchema) -> Validator:
+    """Compiles a JSON Schema into a validator.
+
+    Args:
+        schema: The JSON Schema.
+
+    Returns:
+        A function returning the errors of a value, each prefixed with the
+        path to the invalid part, e.g. `input.tags[2]`. The list is empty if
+        the value is valid.
+
+    Raises:
+        ValueError: If the schema is invalid or has a `$ref` that cannot be
+            resolved.
+    """
+    check = _Compiler(schema).compile(schema)
+
+    def validate(value: Any) -> list[str]:
+        errors = check(value)
+        if not errors:
+            return []
+        return [f'{_format_path(path)}: {message}' for path, message in errors]
+
+    return validate
+
+
+def json_type(value: Any) -> str:
+    """Returns the JSON type name of a value, e.g. `integer` or `object`.
+
+    Args:
+        value: The value.
+
+    Returns:
+        The JSON type, or the Python type name for values that have none.
+    """
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, int):
+        return 'integer'
+    for name in ('number', 'string', 'object', 'array'):
+        if isinstance(value, _TYPES[name]):
+            return name
+    return type(value).__name__
+
+
+class _Compiler:
+    """Compiles the subschemas of a JSON Schema into checks."""
+
+    def __init__(self, root: JsonSchema) -> None:
+        """Initialize the compiler.
+
+        Args:
+            root: The root schema, which `$ref` pointers refer to.
+        """
+        self._root = root
+        self._refs: dict[str, _Check] = {}
+
+    def compile(self, schema: Any) -> _Check:
+        """Compiles a schema into a check.
+
+        Args:
+            schema: The schema; `True` or `{}` accepts any value, `False` none.
+
+        Returns:
+            The check.
+
+        Raises:
+            ValueError: If the schema is invalid.
+        """
+        if schema is True:
+            return _accept
+        if schema is False:
+            return _reject
+        if not isinstance(schema, dict):
+            raise ValueError(f'JSON Schema must be an object or a boolean, got: {schema!r}')
+
+        checks: list[_Check] = []
+        if '$ref' in schema:
+            checks.append(self._compile_ref(schema['$ref']))
+        if 'type' in schema:
+            checks.append(_compile_type(schema['type']))
+        if 'enum' in schema:
+            checks.append(_compile_enum(schema['enum']))
+        if 'const' in schema:
+            checks.append(_compile_enum([schema['const']]))
+        checks.extend(self._compile_combinators(schema))
+        if not _OBJECT_KEYWORDS.isdisjoint(schema):
+            checks.append(self._compile_object(schema))
+        if not _ARRAY_KEYWORDS.isdisjoint(schema):
+            checks.append(self._compile_array(schema))
+        if not _STRING_KEYWORDS.isdisjoint(schema):
+            checks.append(_compile_string(schema))
+        if not _NUMERIC_BOUNDS.keys().isdisjoint(schema):
+            checks.append(_compile_number(schema))
+        return _all_of(checks)
+
+    def _compile_ref(self, ref: str) -> _Check:
+        """Compiles a `$ref` to a subschema of the root schema.
+
+        References are compiled once, and may be recursive.
+        """
+        check = self._refs.get(ref)
+        if check is not None:
+            return check
+
+        target = _resolve_pointer(self._root, ref)
+        compiled: list[_Check] = []
+
+        def check_ref(value: Any) -> list[_Error] | None:
+            return compiled[0](value)
+
+        self._refs[ref] = check_ref
+        compiled.append(self.compile(target))
+        return check_ref
+
+    def _compile_combinators(self, schema: JsonSchema) -> list[_Check]:
+        """Compiles `allOf`, `anyOf`, `oneOf` and `not`."""
+        checks: list[_Check] = []
+        if 'allOf' in schema:
+            checks.append(_all_of([self.compile(subschema) for subschema in schema['allOf']]))
+        if 'anyOf' in schema:
+            any_of = [self.compile(subschema) for subschema in schema['anyOf']]
+
+            def check_any_of(value: Any) -> list[_Error] | None:
+                if any(check(value) is None for check in any_of):
+                    return None
+                return [([], 'does not match any of the allowed schemas')]
+
+            checks.append(check_any_of)
+        if 'oneOf' in schema:
+            one_of = [self.compile(subschema) for subschema in schema['oneOf']]
+
+            def check_one_of(value: Any) -> list[_Error] | None:
+                matches = sum(check(value) is None for check in one_of)
+                if matches == 1:
+                    return None
+                return [([], f'must match exactly one of the allowed schemas, matches {matches}')]
+
+            checks.append(check_one_of)
+        if 'not' in schema:
+            not_check = self.compile(schema['not'])
+
+            def check_not(value: Any) -> list[_Error] | None:
+                return [([], 'matches a disallowed schema')] if not_check(value) is None else None
+
+            checks.append(check_not)
+        return checks
+
+    def _compile_object(self, schema: JsonSchema) -> _Check:
+        """Compiles the keywords applying to objects."""
+        properties = {name: self.compile(subschema) for name, subschema in schema.get('properties', {}).items()}
+        required = list(schema.get('required', []))
+        required_keys = frozenset(required)
+        additional = schema.get('additionalProperties', True)
+        additional_check = None if additional is True else self.compile(additional)
+        min_properties = schema.get('minProperties')
+        max_properties = schema.get('maxProperties')
+
+        def check_object(value: Any) -> list[_Error] | None:
+            if not isinstance(value, dict):
+                return None
+            errors: list[_Error] | None = None
+            if not required_keys <= value.keys():
+                errors = [([], f"missing required property '{name}'") for name in required if name not in value]
+            if min_properties is not None and len(value) < min_properties:
+                errors = _add(errors, f'must have at least {min_properties} properties')
+            if max_properties is not None and len(value) > max_properties:
+                errors = _add(errors, f'must have at most {max_properties} properties')
+            for key, item in value.items():
+                check = properties.get(key)
+                if check is None:
+                    if additional_check is None:
+                        continue
+                    if additional is False:
+                        errors = _add(errors, f"unexpected property '{key}'")
+                        continue
+                    check = additional_check
+                item_errors = check(item)
+                if item_errors:
+                    errors = _extend(errors, item_errors, key)
+            return errors
+
+        return check_object
+
+    def _compile_array(self, schema: JsonSchema) -> _Check:
+        """Compiles the keywords applying to arrays."""
+        prefix = [self.compile(subschema) for subschema in schema.get('prefixItems', [])]
+        items = schema.get('items', True)
+        if isinstance(items, list):
+            # Draft 7 and earlier spell `prefixItems` as a list of `items`.
+            prefix = [self.compile(subschema) for subschema in items]
+            items = schema.get('additionalItems', True)
+        items_check = None if items is True else self.compile(items)
+        min_items = schema.get('minItems')
+        max_items = schema.get('maxItems')
+
+        def check_array(value: Any) -> list[_Error] | None:
+            if not isinstance(value, list | tuple):
+                return None
+            errors: list[_Error] | None = None
+            if min_items is not None and len(value) < min_items:
+                errors = _add(errors, f'must have at least {min_items} items')
+            if max_items is not None and len(value) > max_items:
+                errors = _add(errors, f'must have at most {max_items} items')
+            for index, item in enumerate(value):
+                check = prefix[index] if index < len(prefix) else items_check
+                if check is None:
+                    continue
+                item_errors = check(item)
+                if item_errors:
+                    errors = _extend(errors, item_errors, index)
+            return errors
+
+        return check_array
+
+
+def _compile_type(type_: str | list[str]) -> _Check:
+    """Compiles the `type` keyword."""
+    names = [type_] if isinstance(type_, str) else list(type_)
+    unknown = [name for name in names if name not in _TYPES]
+    if unknown:
+        raise ValueError(f'JSON Schema: unknown type {unknown[0]!r}')
+    python_types = tuple(python_type for name in names for python_type in _TYPES[name])
+    # Python booleans are integers, but JSON booleans are not numbers.
+    allows_bool = 'boolean' in names
+    # JSON does not tell 1 and 1.0 apart, so integral floats are integers.
+    allows_integral_float = 'integer' in names and 'number' not in names
+    expected = names[0] if len(names) == 1 else ' or '.join(names)
+
+    def check_type(value: Any) -> list[_Error] | None:
+        if isinstance(value, python_types):
+            if allows_bool or not isinstance(value, bool):
+                return None
+        elif allows_integral_float and isinstance(value, float) and value.is_integer():
+            return None
+        return [([], f'expected {expected}, got {json_type(value)}')]
+
+    return check_type
+
+
+def _compile_enum(values: list[Any]) -> _Check:
+    """Compiles the `enum` and `const` keywords."""
+    # Booleans are told apart from the numbers they compare equal to.
+    allowed = [(type(value) is bool, value) for value in values]
+
+    def check_enum(value: Any) -> list[_Error] | None:
+        key = (type(value) is bool, value)
+        if key in allowed:
+            return None
+        if len(values) == 1:
+            return [([], f'must be {values[0]!r}, got {value!r}')]
+        return [([], f'must be one of {values!r}, got {value!r}')]
+
+    return check_enum
+
+
+def _compile_string(schema: JsonSchema) -> _Check:
+    """Compiles the keywords applying to strings."""
+    min_length = schema.get('minLength')
+    max_length = schema.get('maxLength')
+    pattern = re.compile(schema['pattern']) if 'pattern' in schema else None
+
+    def check_string(value: Any) -> list[_Error] | None:
+        if not isinstance(value, str):
+            return None
+        errors: list[_Error] | None = None
+        if min_length is not None and len(value) < min_length:
+            errors = _add(errors, f'must be at least {min_length} characters long')
+        if max_length is not None and len(value) > max_length:
+            errors = _add(errors, f'must be at most {max_length} characters long')
+        if pattern is not None and pattern.search(value) is None:
+            errors = _add(errors, f'must match pattern {pattern.pattern!r}')
+        return errors
+
+    return check_string
+
+
+def _compile_number(schema: JsonSchema) -> _Check:
+    """Compiles the keywords applying to numbers."""
+    bounds = [(*_NUMERIC_BOUNDS[keyword], schema[keyword]) for keyword in _NUMERIC_BOUNDS if keyword in schema]
+
+    def check_number(value: Any) -> list[_Error] | None:
+        if not isinstance(value, int | float) or isinstance(value, bool):
+            return None
+        errors: list[_Error] | None = None
+        for within, description, bound in bounds:
+            if not within(value, bound):
+                errors = _add(errors, f'must be {description} {bound}, got {value}')
+        return errors
+
+    return check_number
+
+
+def _all_of(checks: list[_Check]) -> _Check:
+    """Combines checks that must all pass."""
+    if not checks:
+        return _accept
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value: Any) -> list[_Error] | None:
+        errors: list[_Error] | None = None
+        for check in checks:
+            check_errors = check(value)
+            if check_errors:
+                errors = check_errors if errors is None else errors + check_errors
+        return errors
+
+    return check_all
+
+
+def _accept(value: Any) -> list[_Error] | None:
+    """Accepts any value."""
+    return None
+
+
+def _reject(value: Any) -> list[_Error] | None:
+    """Rejects every value."""
+    return [([], 'is not allowed')]
+
+
+def _add(errors: list[_Error] | None, message: str) -> list[_Error]:
+    """Adds an error about the value itself."""
+    error: _Error = ([], message)
+    if errors is None:
+        return [error]
+    errors.append(error)
+    return errors
+
+
+def _extend(errors: list[_Error] | None, item_errors: list[_Error], key: str | int) -> list[_Error]:
+    """Adds the errors of an item, under its key."""
+    for path, _ in item_errors:
+        path.append(key)
+    if errors is None:
+        return item_errors
+    errors.extend(item_errors)
+    return errors
+
+
+def _format_path(path: list[str | int]) -> str:
+    """Formats a path, innermost key first, e.g. as `input.tags[2]`."""
+    return 'input' + ''.join(f'[{key}]' if isinstance(key, int) else f'.{key}' for key in reversed(path))
+
+
+def _resolve_pointer(root: JsonSchema, ref: str) -> Any:
+    """Resolves a `$ref` within the root schema.
+
+    Raises:
+        ValueError: If the reference is not a JSON pointer into the schema,
+            or points to nothing.
+    """
+    if not ref.startswith('#'):
+        raise ValueError(f'JSON Schema: only references within the schema are supported, got: {ref!r}')
+    target: Any = root
+    for token in ref[1:].split('/')[1:]:
+        key = token.replace('~1', '/').replace('~0', '~')
+        if isinstance(target, dict) and key in target:
+            target = target[key]
+        elif isinstance(target, list) and key.isdigit() and int(key) < len(target):
+            target = target[int(key)]
+        else:
+            raise ValueError(f'JSON Schema: cannot resolve reference {ref!r}')
+    return target
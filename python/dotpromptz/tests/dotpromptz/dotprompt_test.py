@@ -30,16 +30,38 @@ The tests cover:
 from __future__ import annotations
 
 import asyncio
+import tempfile
+import threading
 import unittest
 from collections.abc import Generator
+from pathlib import Path
 from typing import Any
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock, Mock, patch
 
+import anyio
 import pytest
 
 from dotpromptz.dotprompt import Dotprompt, _identify_partials
-from dotpromptz.typing import ModelConfigT, ParsedPrompt, PromptMetadata, ToolDefinition
+from dotpromptz.errors import InputValidationError
+from dotpromptz.resolvers import nonblocking
+from dotpromptz.stores import DirStore, DirStoreOptions, DirStoreSync
+from dotpromptz.stores._testutils import create_test_partial, create_test_prompt
+from dotpromptz.typing import (
+    DataArgument,
+    HistoryBudget,
+    MediaContent,
+    MediaPart,
+    Message,
+    ModelConfigT,
+    ParsedPrompt,
+    PromptMetadata,
+    Role,
+    StoreChange,
+    TextPart,
+    ToolDefinition,
+)
+from dotpromptz.validation import compile_validator
 from handlebarrz import HelperFn
 
 
@@ -320,6 +342,22 @@ class TestResolveTools(IsolatedAsyncioTestCase):
         assert result.tool_defs[0] == tool_def
         assert result.tools == []
 
+    async def test_resolver_limiter(self) -> None:
+        """Should run sync resolvers under the resolver limiter, and marked ones inline."""
+        limiter = anyio.CapacityLimiter(1)
+        borrowed: list[int] = []
+        tool_def = ToolDefinition(name='remote', inputSchema={'type': 'object'})
+
+        def tool_resolver(name: str) -> ToolDefinition:
+            borrowed.append(limiter.borrowed_tokens)
+            return tool_def
+
+        metadata = PromptMetadata[dict[str, Any]](tools=['remote'])
+        await Dotprompt(tool_resolver=tool_resolver, resolver_limiter=limiter)._resolve_tools(metadata)
+        await Dotprompt(tool_resolver=nonblocking(tool_resolver), resolver_limiter=limiter)._resolve_tools(metadata)
+
+        self.assertEqual(borrowed, [1, 0])
+
 
 class TestRenderPicoSchema(IsolatedAsyncioTestCase):
     """Test the render_picoschema method."""
@@ -365,6 +403,50 @@ class TestRenderPicoSchema(IsolatedAsyncioTestCase):
         assert result == metadata
 
 
+class TestPicoschemaCache(unittest.TestCase):
+    """Test caching of Picoschema conversions."""
+
+    def test_define_schema_invalidates_conversions(self) -> None:
+        """Should reuse conversions until a schema they resolved is redefined."""
+        dotprompt = Dotprompt(schemas={'Name': {'type': 'string'}})
+        source = '---\ninput:\n  schema:\n    name: Name\n---\nHi'
+
+        first = dotprompt.render_metadata_sync(source)
+        second = dotprompt.render_metadata_sync(source)
+        dotprompt.define_schema('Name', {'type': 'integer'})
+        third = dotprompt.render_metadata_sync(source)
+
+        assert first.input is not None and second.input is not None and third.input is not None
+        self.assertEqual(second.input.schema_, first.input.schema_)
+        self.assertEqual(third.input.schema_['properties']['name'], {'type': 'integer'})
+
+    def test_cached_conversions_are_not_shared(self) -> None:
+        """Should not let changes to a rendered schema leak into later renders."""
+        dotprompt = Dotprompt()
+        source = '---\ninput:\n  schema:\n    name: string\n---\nHi'
+
+        first = dotprompt.render_metadata_sync(source)
+        assert first.input is not None
+        first.input.schema_['properties']['name']['type'] = 'integer'
+        second = dotprompt.render_metadata_sync(source)
+
+        assert second.input is not None
+        self.assertEqual(second.input.schema_['properties']['name'], {'type': 'string'})
+
+    def test_use_schema_defs(self) -> None:
+        """Should emit shared named schemas under $defs when enabled."""
+        schemas = {'Item': {'type': 'object', 'properties': {'id': {'type': 'string'}}}}
+        source = '---\noutput:\n  schema:\n    first: Item\n    second: Item\n---\nHi'
+
+        inlined = Dotprompt(schemas=schemas).render_metadata_sync(source)
+        hoisted = Dotprompt(schemas=schemas, use_schema_defs=True).render_metadata_sync(source)
+
+        assert inlined.output is not None and hoisted.output is not None
+        self.assertEqual(inlined.output.schema_['properties']['second'], schemas['Item'])
+        self.assertEqual(hoisted.output.schema_['properties']['second'], {'$ref': '#/$defs/Item'})
+        self.assertEqual(hoisted.output.schema_['$defs'], schemas)
+
+
 class TestWrappedSchemaResolver(IsolatedAsyncioTestCase):
     """Test the wrapped schema resolver."""
 
@@ -558,5 +640,453 @@ def test_use_available_model_config() -> None:
         assert result.config == {'temperature': 0.7}
 
 
+_RENDER_SOURCE = """---
+config:
+  temperature: 0.5
+input:
+  schema:
+    name: string
+---
+<<<dotprompt:role:system>>>You are {{name}}.<<<dotprompt:role:user>>>Hello {{name}}!"""
+
+
+class TestRender(IsolatedAsyncioTestCase):
+    """Test the render, compile and render_many methods."""
+
+    async def test_render(self) -> None:
+        """Should render the template into messages and drop the input schema."""
+        dotprompt = Dotprompt()
+
+        result = await dotprompt.render(_RENDER_SOURCE, DataArgument[Any](input={'name': 'Ada'}))
+
+        self.assertEqual(result.config, {'temperature': 0.5})
+        self.assertIsNone(result.input)
+        self.assertEqual(
+            [(m.role, m.content[0].text) for m in result.messages],  # type: ignore[union-attr]
+            [('system', 'You are Ada.'), ('user', 'Hello Ada!')],
+        )
+
+    async def test_render_uses_input_defaults(self) -> None:
+        """Should fill missing input variables from the options defaults."""
+        dotprompt = Dotprompt()
+        options: PromptMetadata[Any] = PromptMetadata.model_validate({'input': {'default': {'name': 'Bob'}}})
+
+        result = await dotprompt.render('Hello {{name}}!', DataArgument[Any](), options)
+
+        self.assertEqual(result.messages[0].content[0].text, 'Hello Bob!')  # type: ignore[union-attr]
+
+    async def test_render_merges_options_into_metadata(self) -> None:
+        """Should resolve the model, config and tools given in the options."""
+        tool = ToolDefinition(name='search', inputSchema={'type': 'object'})
+        dotprompt = Dotprompt(tools={'search': tool})
+        options: PromptMetadata[Any] = PromptMetadata.model_validate(
+            {'model': 'gemini-pro', 'config': {'topK': 3}, 'tools': ['search']}
+        )
+
+        rendered = await dotprompt.render(_RENDER_SOURCE, DataArgument[Any](input={'name': 'Ada'}), options)
+        compiled = await dotprompt.compile(_RENDER_SOURCE, options)
+        from_compile = await compiled(DataArgument[Any](input={'name': 'Ada'}))
+        from_sync = dotprompt.render_sync(_RENDER_SOURCE, DataArgument[Any](input={'name': 'Ada'}), options)
+        from_many = [
+            r async for r in dotprompt.render_many(_RENDER_SOURCE, [DataArgument[Any](input={'name': 'Ada'})], options)
+        ]
+
+        for result in (rendered, from_compile, from_sync, *from_many):
+            self.assertEqual(result.model, 'gemini-pro')
+            self.assertEqual(result.config, {'temperature': 0.5, 'topK': 3})
+            self.assertEqual(result.tool_defs, [tool])
+
+    async def test_compile_exposes_prompt(self) -> None:
+        """Should expose the parsed prompt on the compiled function."""
+        dotprompt = Dotprompt()
+
+        renderer = await dotprompt.compile(_RENDER_SOURCE)
+
+        self.assertEqual(renderer.prompt.template, dotprompt.parse(_RENDER_SOURCE).template)
+
+    async def test_render_applies_history_budget(self) -> None:
+        """Should leave out older history that does not fit in the budget."""
+        dotprompt = Dotprompt(history_budget=HistoryBudget(max_tokens=30, estimator=lambda message: 10))
+        history = [Message(role=Role.USER, content=[TextPart(text=str(i))]) for i in range(5)]
+
+        result = await dotprompt.render('Hi', DataArgument[Any](messages=history))
+
+        self.assertEqual(
+            [m.content[0].text for m in result.messages],  # type: ignore[union-attr]
+            ['3', '4', 'Hi'],
+        )
+
+    async def test_render_passes_media_by_reference(self) -> None:
+        """Should render media from the input without copying it through the template."""
+        dotprompt = Dotprompt()
+        photo = MediaContent(url='data:image/png;base64,' + 'A' * 10_000, contentType='image/png')
+
+        template = 'Describe <<<dotprompt:media:url {{photo}}>>>'
+
+        result = await dotprompt.render(template, DataArgument[Any](input={'photo': photo}))
+
+        self.assertEqual(result.messages[0].content, [TextPart(text='Describe '), MediaPart(media=photo)])
+        self.assertIs(result.messages[0].content[1].media, photo)  # type: ignore[union-attr]
+
+    async def test_render_many_preserves_order(self) -> None:
+        """Should yield one rendered prompt per input in input order."""
+        for concurrency in (1, 3):
+            dotprompt = Dotprompt()
+            inputs = (DataArgument[Any](input={'name': str(i)}) for i in range(7))
+
+            results = [r async for r in dotprompt.render_many(_RENDER_SOURCE, inputs, concurrency=concurrency)]
+
+            self.assertEqual(
+                [r.messages[1].content[0].text for r in results],  # type: ignore[union-attr]
+                [f'Hello {i}!' for i in range(7)],
+            )
+
+    async def test_render_many_renders_concurrently(self) -> None:
+        """Should run blocking helpers of different inputs at the same time."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def gather(params: list[Any], options: Any) -> str:
+            barrier.wait()
+            return str(params[0])
+
+        dotprompt = Dotprompt(helpers={'gather': gather})
+        inputs = (DataArgument[Any](input={'name': str(i)}) for i in range(6))
+
+        results = [r async for r in dotprompt.render_many('{{gather name}}', inputs, concurrency=3)]
+
+        self.assertEqual(
+            [r.messages[0].content[0].text for r in results],  # type: ignore[union-attr]
+            [str(i) for i in range(6)],
+        )
+
+    async def test_render_many_resolves_metadata_once(self) -> None:
+        """Should resolve metadata a single time for the whole batch."""
+        dotprompt = Dotprompt()
+        inputs = [DataArgument[Any](input={'name': str(i)}) for i in range(5)]
+
+        with patch.object(dotprompt, 'render_metadata', wraps=dotprompt.render_metadata) as render_metadata:
+            results = [r async for r in dotprompt.render_many(_RENDER_SOURCE, inputs)]
+
+        self.assertEqual(len(results), 5)
+        render_metadata.assert_called_once()
+
+    async def test_render_many_rejects_invalid_concurrency(self) -> None:
+        """Should raise a ValueError when concurrency is less than 1."""
+        dotprompt = Dotprompt()
+
+        with self.assertRaises(ValueError):
+            async for _ in dotprompt.render_many(_RENDER_SOURCE, [], concurrency=0):
+                pass
+
+
+class TestRenderSync(unittest.TestCase):
+    """Test the synchronous render_sync, compile_sync and render_metadata_sync methods."""
+
+    def test_render_sync_matches_render(self) -> None:
+        """Should render the same prompt as the async API."""
+        dotprompt = Dotprompt()
+        data = DataArgument[Any](input={'name': 'Ada'})
+
+        expected = asyncio.run(dotprompt.render(_RENDER_SOURCE, data))
+
+        self.assertEqual(dotprompt.render_sync(_RENDER_SOURCE, data), expected)
+
+    def test_render_metadata_sync_resolves_tools_schemas_and_partials(self) -> None:
+        """Should resolve tools, schemas and partials with sync resolvers."""
+        tool = ToolDefinition(name='remote', inputSchema={'type': 'object'})
+        dotprompt = Dotprompt(
+            tool_resolver=lambda name: tool if name == 'remote' else None,
+            schema_resolver=lambda name: {'type': 'string'} if name == 'Named' else None,
+            partial_resolver=lambda name: 'partial {{name}}' if name == 'greeting' else None,
+        )
+        source = '---\ntools: [remote]\noutput:\n  schema:\n    field: Named\n---\n{{> greeting}}'
+
+        metadata = dotprompt.render_metadata_sync(source)
+        rendered = dotprompt.render_sync(source, DataArgument[Any](input={'name': 'x'}))
+
+        self.assertEqual(metadata.tool_defs, [tool])
+        self.assertEqual(metadata.tools, [])
+        assert metadata.output is not None
+        self.assertEqual(metadata.output.schema_['properties'], {'field': {'type': 'string'}})  # type: ignore[index]
+        self.assertEqual(rendered.messages[0].content[0].text, 'partial x')  # type: ignore[union-attr]
+
+    def test_render_sync_rejects_async_resolvers(self) -> None:
+        """Should raise a TypeError when a resolver is asynchronous."""
+
+        async def tool_resolver(name: str) -> ToolDefinition | None:
+            return None
+
+        dotprompt = Dotprompt(tool_resolver=tool_resolver)
+
+        with self.assertRaises(TypeError):
+            dotprompt.render_metadata_sync('---\ntools: [remote]\n---\nHello')
+
+
+class _BatchResolver:
+    """Resolver recording the batches of names it is asked for."""
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.data = data
+        self.batches: list[list[str]] = []
+
+    def __call__(self, name: str) -> Any:
+        raise AssertionError(f'resolved {name} alone')
+
+    def resolve_many(self, names: list[str]) -> dict[str, Any]:
+        self.batches.append(names)
+        return {name: self.data[name] for name in names if name in self.data}
+
+
+class TestBatchResolvers(IsolatedAsyncioTestCase):
+    """Test resolving tools, schemas and partials in batches."""
+
+    async def test_tools_resolved_in_one_call(self) -> None:
+        """Should resolve every tool of a prompt in one call, in order."""
+        tools = {f'tool{i}': ToolDefinition(name=f'tool{i}', inputSchema={'type': 'object'}) for i in range(15)}
+        resolver = _BatchResolver(tools)
+        dotprompt = Dotprompt(tool_resolver=resolver)
+        metadata = PromptMetadata[dict[str, Any]](tools=list(tools))
+
+        result = await dotprompt._resolve_tools(metadata)
+
+        self.assertEqual(resolver.batches, [list(tools)])
+        self.assertEqual(result.tool_defs, list(tools.values()))
+        self.assertEqual(dotprompt._resolve_tools_sync(metadata).tool_defs, list(tools.values()))
+
+    async def test_schemas_resolved_in_one_call(self) -> None:
+        """Should resolve the named schemas missing locally in one call."""
+        resolver = _BatchResolver({'A': {'type': 'string'}, 'B': {'type': 'integer'}})
+        dotprompt = Dotprompt(schemas={'Local': {'type': 'boolean'}}, schema_resolver=resolver)
+        source = '---\noutput:\n  schema:\n    a: A\n    b: B\n    c: Local\n---\nHi'
+
+        metadata = await dotprompt.render_metadata(source)
+
+        self.assertEqual(resolver.batches, [['A', 'B']])
+        assert metadata.output is not None
+        self.assertEqual(
+            metadata.output.schema_['properties'],  # type: ignore[index]
+            {'a': {'type': 'string'}, 'b': {'type': 'integer'}, 'c': {'type': 'boolean'}},
+        )
+
+    async def test_partials_resolved_per_level(self) -> None:
+        """Should resolve each level of the partial graph in one call."""
+        partials = {'a': '{{> b}}{{> c}}', 'b': 'b{{> d}}', 'c': 'c{{> d}}', 'd': 'd'}
+        for sync in (False, True):
+            with self.subTest(sync=sync):
+                resolver = _BatchResolver(partials)
+                dotprompt = Dotprompt(partial_resolver=resolver)
+                if sync:
+                    rendered = dotprompt.render_sync('{{> a}}')
+                else:
+                    rendered = await dotprompt.render('{{> a}}')
+
+                self.assertEqual(resolver.batches, [['a'], ['b', 'c'], ['d']])
+                self.assertEqual(rendered.messages[0].content[0].text, 'bdcd')  # type: ignore[union-attr]
+
+    async def test_missing_partial_raises(self) -> None:
+        """Should raise a LookupError for a partial missing from the batch."""
+        dotprompt = Dotprompt(partial_resolver=_BatchResolver({'a': '{{> missing}}'}))
+
+        with self.assertRaisesRegex(LookupError, "partial resolver for 'missing' returned None"):
+            await dotprompt.render('{{> a}}')
+
+
+class TestInputValidation(IsolatedAsyncioTestCase):
+    """Test validating render input against the input schema."""
+
+    async def test_validate_inputs(self) -> None:
+        """Should report the errors of each input against the resolved schema."""
+        renderer = await Dotprompt().compile(_RENDER_SOURCE)
+        batch = [DataArgument[Any](input={'name': 'Ada'}), DataArgument[Any](input={'name': 1}), DataArgument[Any]()]
+
+        errors = await renderer.validate_inputs(batch)
+
+        self.assertEqual(
+            errors,
+            [[], ['input.name: expected string, got integer'], ["input: missing required property 'name'"]],
+        )
+        self.assertEqual(await renderer.validate_input(batch[0]), [])
+
+    async def test_validate_inputs_without_schema(self) -> None:
+        """Should accept any input when the prompt has no input schema."""
+        renderer = await Dotprompt().compile('Hello {{name}}!')
+
+        self.assertEqual(await renderer.validate_inputs([DataArgument[Any](input={'name': 1})]), [[]])
+
+    async def test_render_rejects_invalid_input(self) -> None:
+        """Should raise before rendering when validation is enabled."""
+        dotprompt = Dotprompt(validate_input=True)
+
+        with self.assertRaises(InputValidationError) as context:
+            await dotprompt.render(_RENDER_SOURCE, DataArgument[Any](input={'name': 1}))
+        with self.assertRaises(InputValidationError):
+            dotprompt.render_sync(_RENDER_SOURCE, DataArgument[Any]())
+        with self.assertRaises(InputValidationError):
+            async for _ in dotprompt.render_many(_RENDER_SOURCE, [DataArgument[Any](input={'name': None})]):
+                pass
+
+        self.assertEqual(context.exception.errors, ['input.name: expected string, got integer'])
+        rendered = await dotprompt.render(_RENDER_SOURCE, DataArgument[Any](input={'name': 'Ada'}))
+        self.assertEqual(rendered.messages[1].content[0].text, 'Hello Ada!')  # type: ignore[union-attr]
+
+    async def test_compiles_validator_once(self) -> None:
+        """Should compile the validator once for renders with the same schema."""
+        renderer = await Dotprompt(validate_input=True).compile(_RENDER_SOURCE)
+
+        with patch('dotpromptz.dotprompt.compile_validator', wraps=compile_validator) as compile_mock:
+            for name in ('Ada', 'Bob'):
+                await renderer(DataArgument[Any](input={'name': name}))
+            await renderer.validate_inputs([DataArgument[Any](input={'name': 'Eve'})])
+
+        compile_mock.assert_called_once()
+
+    async def test_shares_validators_across_renders(self) -> None:
+        """Should compile the validator of a schema once across separate renders."""
+        dotprompt = Dotprompt(validate_input=True)
+
+        with patch('dotpromptz.dotprompt.compile_validator', wraps=compile_validator) as compile_mock:
+            for name in ('Ada', 'Bob'):
+                await dotprompt.render(_RENDER_SOURCE, DataArgument[Any](input={'name': name}))
+                dotprompt.render_sync(_RENDER_SOURCE, DataArgument[Any](input={'name': name}))
+
+        compile_mock.assert_called_once()
+
+    async def test_compiled_prompt_keeps_metadata(self) -> None:
+        """Should resolve metadata once until tools or schemas change."""
+        dotprompt = Dotprompt(schemas={'Name': {'type': 'string'}})
+        renderer = await dotprompt.compile('---\ninput:\n  schema:\n    name: Name\n---\nHi {{name}}')
+
+        with patch.object(dotprompt, 'render_metadata', wraps=dotprompt.render_metadata) as render_metadata:
+            for name in ('Ada', 'Bob'):
+                await renderer(DataArgument[Any](input={'name': name}))
+            self.assertEqual(render_metadata.call_count, 1)
+            dotprompt.define_schema('Name', {'type': 'integer'})
+            self.assertEqual(
+                await renderer.validate_input(DataArgument[Any](input={'name': 'Eve'})),
+                ['input.name: expected integer, got string'],
+            )
+
+        self.assertEqual(render_metadata.call_count, 2)
+
+    def test_sync_validate_inputs(self) -> None:
+        """Should validate with the synchronous compiled prompt."""
+        renderer = Dotprompt().compile_sync(_RENDER_SOURCE)
+
+        self.assertEqual(
+            renderer.validate_inputs([DataArgument[Any](input={'name': 'Ada'}), DataArgument[Any]()]),
+            [[], ["input: missing required property 'name'"]],
+        )
+
+
+class TestPreload(IsolatedAsyncioTestCase):
+    """Test preloading prompts and partials from a store."""
+
+    def setUp(self) -> None:
+        """Create a prompt directory with prompts, a variant and a partial."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self._tmp.name)
+        create_test_prompt(self.directory, 'greet.prompt', _RENDER_SOURCE)
+        create_test_prompt(self.directory, 'greet.formal.prompt', 'Good day, {{name}}.')
+        create_test_prompt(self.directory, 'signed.prompt', 'Hi {{> signature}}')
+        create_test_partial(self.directory, 'signature.prompt', 'from {{name}}')
+
+    def tearDown(self) -> None:
+        """Remove the prompt directory."""
+        self._tmp.cleanup()
+
+    async def test_preload_warms_prompts(self) -> None:
+        """Should compile every prompt and register every partial."""
+        options = DirStoreOptions(directory=self.directory)
+        for store in (DirStore(options), DirStoreSync(options)):
+            dotprompt = Dotprompt()
+
+            report = await dotprompt.preload(store)
+
+            self.assertEqual((report.prompts, report.partials), (3, 1))
+            self.assertEqual(list(report.timings), ['list', 'load', 'partials', 'parse', 'metadata', 'compile'])
+            signed = await dotprompt.get_prompt('signed')
+            rendered = await signed(DataArgument[Any](input={'name': 'Ada'}))
+            self.assertEqual(rendered.messages[0].content[0].text, 'Hi from Ada')  # type: ignore[union-attr]
+            formal = await dotprompt.get_prompt('greet', 'formal')
+            rendered = await formal(DataArgument[Any](input={'name': 'Ada'}))
+            self.assertEqual(rendered.messages[0].content[0].text, 'Good day, Ada.')  # type: ignore[union-attr]
+
+    async def test_preloaded_prompt_skips_store_and_metadata(self) -> None:
+        """Should serve preloaded prompts without reloading or re-resolving."""
+        store = DirStore(DirStoreOptions(directory=self.directory))
+        dotprompt = Dotprompt()
+        await dotprompt.preload(store)
+
+        with (
+            patch.object(store, 'load', wraps=store.load) as load,
+            patch.object(dotprompt, 'render_metadata', wraps=dotprompt.render_metadata) as render_metadata,
+        ):
+            renderer = await dotprompt.get_prompt('greet')
+            rendered = await renderer(DataArgument[Any](input={'name': 'Ada'}))
+
+        load.assert_not_called()
+        render_metadata.assert_not_called()
+        self.assertEqual(rendered.config, {'temperature': 0.5})
+
+    async def test_sync_store_partials_load_off_the_event_loop(self) -> None:
+        """Should load partials from a sync store on worker threads."""
+        store = DirStoreSync(DirStoreOptions(directory=self.directory))
+        dotprompt = Dotprompt()
+        await dotprompt.preload(store)
+        create_test_prompt(self.directory, 'closing.prompt', 'Bye {{> farewell}}')
+        create_test_partial(self.directory, 'farewell.prompt', 'now')
+        threads: list[int] = []
+
+        def load_partial(name: str, options: Any = None) -> Any:
+            threads.append(threading.get_ident())
+            return DirStoreSync.load_partial(store, name, options)
+
+        with patch.object(store, 'load_partial', side_effect=load_partial):
+            renderer = await dotprompt.get_prompt('closing')
+
+        rendered = await renderer(DataArgument[Any]())
+        self.assertEqual(rendered.messages[0].content[0].text, 'Bye now')  # type: ignore[union-attr]
+        self.assertTrue(threads)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    async def test_invalidate_prompt(self) -> None:
+        """Should recompile only the changed prompt."""
+        dotprompt = Dotprompt()
+        await dotprompt.preload(DirStore(DirStoreOptions(directory=self.directory)))
+        signed = await dotprompt.get_prompt('signed')
+        create_test_prompt(self.directory, 'greet.formal.prompt', 'Good evening, {{name}}.')
+
+        dotprompt.invalidate([StoreChange(kind='prompt', event='modified', name='greet', variant='formal')])
+
+        self.assertIs(await dotprompt.get_prompt('signed'), signed)
+        formal = await dotprompt.get_prompt('greet', 'formal')
+        rendered = await formal(DataArgument[Any](input={'name': 'Ada'}))
+        self.assertEqual(rendered.messages[0].content[0].text, 'Good evening, Ada.')  # type: ignore[union-attr]
+
+    async def test_invalidate_partial_evicts_dependents(self) -> None:
+        """Should reload a changed partial and recompile the prompts including it."""
+        create_test_partial(self.directory, 'signature.prompt', '{{> name}} ({{> title}})')
+        create_test_partial(self.directory, 'name.prompt', 'from {{name}}')
+        create_test_partial(self.directory, 'title.prompt', 'admin')
+        dotprompt = Dotprompt()
+        await dotprompt.preload(DirStore(DirStoreOptions(directory=self.directory)))
+        signed = await dotprompt.get_prompt('signed')
+        greet = await dotprompt.get_prompt('greet')
+        create_test_partial(self.directory, 'title.prompt', 'owner')
+
+        dotprompt.invalidate([StoreChange(kind='partial', event='modified', name='title')])
+
+        self.assertIs(await dotprompt.get_prompt('greet'), greet)
+        reloaded = await dotprompt.get_prompt('signed')
+        self.assertIsNot(reloaded, signed)
+        rendered = await reloaded(DataArgument[Any](input={'name': 'Ada'}))
+        self.assertEqual(rendered.messages[0].content[0].text, 'Hi from Ada (owner)')  # type: ignore[union-attr]
+
+    async def test_get_prompt_without_store(self) -> None:
+        """Should raise a ValueError when the prompt is unknown and no store is set."""
+        with self.assertRaises(ValueError):
+            await Dotprompt().get_prompt('greet')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,115 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Import-time regression tests for the dotpromptz package.
+
+Importing the package must stay cheap: the template engine and its
+dependencies are only loaded when `Dotprompt` is first accessed, and each
+store implementation when it is first accessed from `dotpromptz.stores`. The
+checks run in fresh interpreters so that modules loaded by the test session do
+not hide regressions.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import dotpromptz
+
+# Budget for `import dotpromptz`, in microseconds of cumulative import time as
+# reported by `-X importtime`. Eager imports cost several times this.
+IMPORT_TIME_BUDGET_US = 50_000
+
+_HEAVY_MODULES = ('dotpromptz.dotprompt', 'handlebarrz', 'pydantic', 'yaml', 'anyio', 'structlog')
+
+_HEAVY_STORE_MODULES = (
+    'sqlite3',
+    'mmap',
+    'yaml',
+    'anyio',
+    'aiofiles',
+    'dotpromptz.picoschema',
+    'dotpromptz.stores._sqlite',
+)
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess[str]:
+    """Run code in a fresh interpreter and capture its output."""
+    return subprocess.run([sys.executable, *flags, '-c', code], capture_output=True, text=True, check=True)
+
+
+def _cumulative_import_time_us(module: str) -> int:
+    """Measure the cumulative import time of a module in a fresh interpreter."""
+    result = _run(f'import {module}', '-X', 'importtime')
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split('|')]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1])
+    raise AssertionError(f'{module} not found in -X importtime output')
+
+
+def test_import_does_not_load_heavy_modules() -> None:
+    """Should not import the template engine or its dependencies eagerly."""
+    result = _run(f'import sys, dotpromptz; print(*[m for m in {_HEAVY_MODULES!r} if m in sys.modules])')
+
+    assert result.stdout.split() == []
+
+
+def test_import_stores_does_not_load_store_dependencies() -> None:
+    """Should not import the store implementations or their dependencies eagerly."""
+    result = _run(f'import sys, dotpromptz.stores; print(*[m for m in {_HEAVY_STORE_MODULES!r} if m in sys.modules])')
+
+    assert result.stdout.split() == []
+
+
+@pytest.mark.parametrize('module', ['dotpromptz', 'dotpromptz.stores'])
+def test_import_time_within_budget(module: str) -> None:
+    """Should import the package within the import-time budget."""
+    # Take the best of a few runs to smooth out noise from a busy machine.
+    best = min(_cumulative_import_time_us(module) for _ in range(3))
+
+    assert best < IMPORT_TIME_BUDGET_US, f'import {module} took {best}us, budget is {IMPORT_TIME_BUDGET_US}us'
+
+
+def test_lazy_attributes() -> None:
+    """Should resolve public names on access and list them in dir()."""
+    from dotpromptz.dotprompt import Dotprompt
+
+    assert dotpromptz.Dotprompt is Dotprompt
+    assert 'Dotprompt' in dir(dotpromptz)
+    assert dotpromptz.__all__ == ['Dotprompt']
+
+
+def test_lazy_store_attributes() -> None:
+    """Should resolve every store name on access and list them in dir()."""
+    import dotpromptz.stores
+    from dotpromptz.stores._sqlite import SqliteStore
+
+    assert dotpromptz.stores.SqliteStore is SqliteStore
+    for name in dotpromptz.stores.__all__:
+        assert getattr(dotpromptz.stores, name) is not None
+        assert name in dir(dotpromptz.stores)
+
+
+def test_unknown_attribute() -> None:
+    """Should raise AttributeError for names the package does not define."""
+    import dotpromptz.stores
+
+    with pytest.raises(AttributeError, match='DoesNotExist'):
+        dotpromptz.DoesNotExist  # noqa: B018
+    with pytest.raises(AttributeError, match='DoesNotExist'):
+        dotpromptz.stores.DoesNotExist  # noqa: B018
@@ -0,0 +1,131 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for out-of-band media handling."""
+
+import unittest
+
+from dotpromptz.media import MEDIA_HANDLE_MIN_LENGTH, MediaHandles
+from dotpromptz.parse import to_messages, to_parts
+from dotpromptz.typing import MediaContent, MediaPart, Message, Role, TextPart
+
+_DATA_URL = 'data:image/png;base64,' + 'A' * MEDIA_HANDLE_MIN_LENGTH
+
+
+class TestMediaHandles(unittest.TestCase):
+    """Tests for MediaHandles."""
+
+    def test_extract_replaces_media(self) -> None:
+        """Should replace media objects and large data URLs at any depth."""
+        photo = MediaContent(url='https://example.com/a.png', contentType='image/png')
+        media = MediaHandles()
+
+        context = media.extract({'photo': photo, 'pages': [{'scan': _DATA_URL}, 'data:text/plain,hi'], 'n': 1})
+
+        self.assertEqual(context['pages'][1:], ['data:text/plain,hi'])
+        self.assertEqual(context['n'], 1)
+        self.assertIs(media.media_content(context['photo']), photo)
+        self.assertEqual(media.resolve_text(context['pages'][0]['scan']), _DATA_URL)
+        self.assertEqual(len(media), 2)
+
+    def test_extract_copies_only_containers_with_media(self) -> None:
+        """Should return containers without media as they are."""
+        context = {'question': 'Why?', 'docs': [{'text': 'Because.'}]}
+
+        self.assertIs(MediaHandles().extract(context), context)
+
+    def test_media_content(self) -> None:
+        """Should resolve handles to the original media."""
+        photo = MediaContent(url='https://example.com/a.png', contentType='image/png')
+        media = MediaHandles()
+        photo_handle = media.add(photo)
+        url_handle = media.add(_DATA_URL)
+
+        self.assertIs(media.media_content(photo_handle), photo)
+        self.assertIs(media.media_content(photo_handle, 'image/png'), photo)
+        self.assertEqual(
+            media.media_content(photo_handle, 'image/webp'), photo.model_copy(update={'content_type': 'image/webp'})
+        )
+        resolved = media.media_content(url_handle, 'image/png')
+        assert resolved is not None
+        self.assertIs(resolved.url, _DATA_URL)
+        self.assertEqual(resolved.content_type, 'image/png')
+        self.assertIsNone(media.media_content('https://example.com/a.png'))
+        self.assertIsNone(media.media_content(photo_handle.replace(':0;', ':2;')))
+
+    def test_resolve_text(self) -> None:
+        """Should put the URLs back in text rendered from media."""
+        media = MediaHandles()
+        handle = media.add(MediaContent(url='https://example.com/a.png'))
+
+        self.assertEqual(
+            media.resolve_text(f'See {handle} and dotprompt-media:7;'),
+            'See https://example.com/a.png and dotprompt-media:7;',
+        )
+        self.assertEqual(media.resolve_text('No media'), 'No media')
+
+    def test_ignores_handles_of_other_renders(self) -> None:
+        """Should leave handles without its own nonce alone."""
+        media = MediaHandles()
+        secret = media.add(MediaContent(url='https://example.com/secret.png'))
+        forged = MediaHandles().add('https://example.com/other.png')
+        text = f'{forged} dotprompt-media:0; {secret}'
+
+        self.assertEqual(media.resolve_text(text), f'{forged} dotprompt-media:0; https://example.com/secret.png')
+        self.assertIsNone(media.media_content(forged))
+        self.assertIsNone(media.media_content('dotprompt-media:0;'))
+
+
+class TestResolveHandles(unittest.TestCase):
+    """Tests for resolving media handles when converting rendered templates."""
+
+    def test_to_parts(self) -> None:
+        """Should resolve handles in media markers without copying the media."""
+        media = MediaHandles()
+        handle = media.add(_DATA_URL)
+
+        parts = to_parts(f'Look <<<dotprompt:media:url {handle} image/png>>> at {handle}', media)
+
+        self.assertEqual(
+            parts,
+            [
+                TextPart(text='Look '),
+                MediaPart(media=MediaContent(url=_DATA_URL, contentType='image/png')),
+                TextPart(text=f' at {_DATA_URL}'),
+            ],
+        )
+        assert isinstance(parts[1], MediaPart)
+        self.assertIs(parts[1].media.url, _DATA_URL)
+
+    def test_to_messages(self) -> None:
+        """Should resolve handles in both message modes."""
+        photo = MediaContent(url='https://example.com/a.png', contentType='image/png')
+        media = MediaHandles()
+        rendered = f'<<<dotprompt:role:user>>><<<dotprompt:media:url {media.add(photo)}>>>'
+        expected = [Message(role=Role.USER, content=[MediaPart(media=photo)])]
+
+        messages = to_messages(rendered, media=media)
+
+        self.assertEqual(messages, expected)
+        self.assertIs(messages[0].content[0].media, photo)  # type: ignore[union-attr]
+        self.assertEqual(
+            to_messages(rendered, media=media, lightweight=True),
+            [{'role': 'user', 'content': [{'media': {'url': photo.url, 'contentType': 'image/png'}}]}],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
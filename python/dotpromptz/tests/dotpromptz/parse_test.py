@@ -18,21 +18,30 @@
 
 import re
 import unittest
+from collections.abc import Iterator
+from typing import Any
 
 import pytest
+import yaml
 
 from dotpromptz.parse import (
     FRONTMATTER_AND_BODY_REGEX,
+    FRONTMATTER_REGEX,
     MEDIA_AND_SECTION_MARKER_REGEX,
     RESERVED_METADATA_KEYWORDS,
     ROLE_AND_HISTORY_MARKER_REGEX,
+    YAML_LOADER,
     MessageSource,
     convert_namespaced_entry_to_nested_object,
+    extract_frontmatter,
     extract_frontmatter_and_body,
     insert_history,
     message_sources_to_messages,
+    message_to_dict,
+    messages_from_dicts,
     messages_have_history,
     parse_document,
+    parse_frontmatter,
     parse_media_part,
     parse_part,
     parse_section_part,
@@ -40,9 +49,15 @@ from dotpromptz.parse import (
     split_by_media_and_section_markers,
     split_by_regex,
     split_by_role_and_history_markers,
+    to_messages,
+    to_messages_stream,
+    to_parts,
     transform_messages_to_history,
 )
 from dotpromptz.typing import (
+    DataArgument,
+    History,
+    HistoryBudget,
     MediaContent,
     MediaPart,
     Message,
@@ -348,6 +363,83 @@ class TestExtractFrontmatterAndBody(unittest.TestCase):
         assert body == ''
 
 
+_FRONTMATTER_SOURCES = [
+    '---\nfoo: bar\n---\nBody',
+    '---\n\n---\nBody',
+    '---  \n\n\nfoo: bar\n---   \n\nBody',
+    '---\n\n---\nfoo: bar\n---\nBody',
+    '---\nfoo: bar\n---',
+    '---\nfoo: bar\n ---\n----\n---\n',
+    '--- x\nfoo: bar\n---\n',
+    'Hello World',
+    '',
+]
+
+
+class TestExtractFrontmatter(unittest.TestCase):
+    """Test extracting only the frontmatter from a document."""
+
+    def test_matches_frontmatter_and_body_regex(self) -> None:
+        """Should capture what FRONTMATTER_AND_BODY_REGEX captures."""
+        for source in _FRONTMATTER_SOURCES:
+            match = FRONTMATTER_AND_BODY_REGEX.match(source)
+            expected = match.group(1) if match else ''
+            frontmatter_match = FRONTMATTER_REGEX.match(source)
+
+            assert extract_frontmatter(source) == expected, source
+            assert extract_frontmatter(source.splitlines(keepends=True)) == expected, source
+            if match and frontmatter_match:
+                assert source[frontmatter_match.end() :] == match.group(2)
+
+    def test_stops_reading_lines_at_closing_marker(self) -> None:
+        """Should not consume lines past the closing marker."""
+        consumed: list[str] = []
+
+        def lines() -> Iterator[str]:
+            for line in ['---\n', 'foo: bar\n', '---\n', 'Body\n', 'More body\n']:
+                consumed.append(line)
+                yield line
+
+        assert extract_frontmatter(lines()) == 'foo: bar'
+        assert consumed == ['---\n', 'foo: bar\n', '---\n']
+
+    def test_stops_reading_lines_without_frontmatter(self) -> None:
+        """Should stop after the first line when there is no frontmatter."""
+        remaining = iter(['Hello\n', 'World\n'])
+
+        assert extract_frontmatter(remaining) == ''
+        assert list(remaining) == ['World\n']
+
+
+class TestParseFrontmatter(unittest.TestCase):
+    """Test parsing only the frontmatter of a document."""
+
+    def test_parses_raw_frontmatter(self) -> None:
+        """Should return the raw frontmatter, including namespaced keys."""
+        source = '---\nmodel: gemini\nmy.ext: 1\n---\n{{#if x}}unbalanced'
+
+        assert parse_frontmatter(source) == {'model': 'gemini', 'my.ext': 1}
+        assert parse_frontmatter(source.splitlines(keepends=True)) == {'model': 'gemini', 'my.ext': 1}
+
+    def test_empty_and_missing_frontmatter(self) -> None:
+        """Should return an empty dictionary without frontmatter."""
+        assert parse_frontmatter('---\n\n---\nBody') == {}
+        assert parse_frontmatter('Body') == {}
+
+    def test_invalid_frontmatter(self) -> None:
+        """Should raise for invalid YAML and for frontmatter that is not a mapping."""
+        with pytest.raises(yaml.YAMLError):
+            parse_frontmatter('---\nfoo: [bar\n---\nBody')
+        with pytest.raises(ValueError, match='mapping'):
+            parse_frontmatter('---\n- foo\n---\nBody')
+
+    def test_uses_libyaml_when_available(self) -> None:
+        """Should load YAML with the C loader when PyYAML is built with libyaml."""
+        expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+
+        assert YAML_LOADER is expected
+
+
 class TestTransformMessagesToHistory(unittest.TestCase):
     def test_add_history_metadata_to_messages(self) -> None:
         messages: list[Message] = [
@@ -757,3 +849,382 @@ Template content"""
         #    self.assertEqual(getattr(result, keyword), f'value-{keyword}')
 
         self.assertEqual(result.template, 'Template content')
+
+
+_STREAM_SOURCES = [
+    '',
+    'Hello world',
+    '<<<dotprompt:role:system>>>Be brief.<<<dotprompt:role:user>>>Hi!',
+    '  <<<dotprompt:role:system>>>  <<<dotprompt:role:user>>>Question',
+    '<<<dotprompt:role:system>>>S<<<dotprompt:history>>><<<dotprompt:role:user>>>Next',
+    'Look <<<dotprompt:media:url https://example.com/a.png image/png>>> here<<<dotprompt:role:model>>>ok <<',
+]
+
+_STREAM_HISTORY = [
+    Message(role=Role.USER, content=[TextPart(text='earlier question')]),
+    Message(role=Role.MODEL, content=[TextPart(text='earlier answer')], metadata={'foo': 'bar'}),
+]
+
+
+class TestToMessagesStream(unittest.TestCase):
+    """Tests for the streaming variant of to_messages."""
+
+    def test_matches_to_messages_for_every_chunk_size(self) -> None:
+        """Should produce the same messages as to_messages however the text is chunked."""
+        for source in _STREAM_SOURCES:
+            for data in (None, DataArgument(messages=_STREAM_HISTORY)):
+                expected = to_messages(source, data)
+                for size in range(1, len(source) + 2):
+                    chunks = [source[i : i + size] for i in range(0, len(source), size)]
+                    with self.subTest(source=source, size=size, history=data is not None):
+                        self.assertEqual(list(to_messages_stream(chunks, data)), expected)
+
+    def test_yields_messages_before_input_is_exhausted(self) -> None:
+        """Should yield a message once a later message has completed."""
+        consumed: list[str] = []
+
+        def chunks() -> Iterator[str]:
+            for chunk in [
+                '<<<dotprompt:role:system>>>first',
+                '<<<dotprompt:role:user>>>second',
+                '<<<dotprompt:role:model>>>third',
+                '<<<dotprompt:role:user>>>fourth',
+            ]:
+                consumed.append(chunk)
+                yield chunk
+
+        stream = to_messages_stream(chunks())
+        first = next(stream)
+
+        self.assertEqual(first.content, [TextPart(text='first')])
+        self.assertEqual(len(consumed), 3)
+
+    def test_inserts_history_before_trailing_user_message(self) -> None:
+        """Should insert history before the last user message without a history marker."""
+        messages = list(to_messages_stream(['<<<dotprompt:role:sys', 'tem>>>S<<<dotprompt:role:user>>>Q'], None))
+        with_history = list(
+            to_messages_stream(
+                ['<<<dotprompt:role:sys', 'tem>>>S<<<dotprompt:role:user>>>Q'],
+                DataArgument(messages=_STREAM_HISTORY),
+            )
+        )
+
+        self.assertEqual(with_history, [messages[0], *_STREAM_HISTORY, messages[1]])
+
+
+# Sources whose split at markers exercises the edge cases of the tokenizer:
+# markers without an end, markers spanning lines, markers nested in other
+# markers and text that merely begins like a marker.
+_TOKENIZER_SOURCES = [
+    '',
+    '   \n ',
+    'plain text',
+    'a <<<dotprompt:media:url http://x/a.png>>> b',
+    '<<<dotprompt:media:url http://x/a.png image/png>>><<<dotprompt:section code>>>',
+    '<<<dotprompt:section code>>>   <<<dotprompt:media:url u>>>',
+    'x <<<dotprompt:section code',
+    'x <<<dotprompt:section\ncode>>> y <<<dotprompt:section s>>>',
+    'x <<<dotprompt:media:url <<<dotprompt:section b>>>',
+    'x <<<dotprompt:media:foo>>> <<<dotprompt:section a>>>>',
+    'x <<<dotprompt:<<<dotprompt:section a>>>',
+]
+
+
+class TestToParts(unittest.TestCase):
+    """Tests for splitting message sources into parts."""
+
+    def test_matches_regex_split(self) -> None:
+        """Should produce the parts of a regex split that drops blank pieces."""
+        for source in _TOKENIZER_SOURCES:
+            with self.subTest(source=source):
+                expected = [parse_part(piece) for piece in split_by_media_and_section_markers(source)]
+                self.assertEqual(to_parts(source), expected)
+
+    def test_invalid_marker(self) -> None:
+        """Should raise for a marker with too many fields."""
+        with self.assertRaises(ValueError):
+            to_parts('x <<<dotprompt:media:url a b c>>>')
+
+    def test_unterminated_markers_are_linear(self) -> None:
+        """Should scan many unterminated markers without rescanning the text."""
+        source = 'x <<<dotprompt:section ' * 50_000 + '\n<<<dotprompt:section end>>>'
+
+        parts = to_parts(source)
+
+        self.assertEqual(len(parts), 2)
+        self.assertEqual(parts[1], parse_section_part('<<<dotprompt:section end'))
+
+
+class TestToMessages(unittest.TestCase):
+    """Tests for converting rendered templates into messages."""
+
+    def test_splits_roles_before_media_markers(self) -> None:
+        """Should give each message the parts of the text between its role markers."""
+        for source in _TOKENIZER_SOURCES:
+            rendered = f'<<<dotprompt:role:system>>>{source}<<<dotprompt:role:model>>>{source}'
+            parts = to_parts(source)
+            expected = (
+                [Message(role=Role.SYSTEM, content=parts), Message(role=Role.MODEL, content=parts)] if parts else []
+            )
+            with self.subTest(rendered=rendered):
+                self.assertEqual(to_messages(rendered), expected)
+
+    def test_role_marker_ends_media_marker(self) -> None:
+        """Should not let a media marker extend over a role marker."""
+        messages = to_messages('a <<<dotprompt:section <<<dotprompt:role:model>>> b>>>')
+
+        self.assertEqual(
+            messages,
+            [
+                Message(role=Role.USER, content=[TextPart(text='a <<<dotprompt:section ')]),
+                Message(role=Role.MODEL, content=[TextPart(text=' b>>>')]),
+            ],
+        )
+
+    def test_text_starting_like_a_role_marker(self) -> None:
+        """Should treat text that starts like a role marker as a role marker."""
+        with self.assertRaises(ValueError):
+            to_messages('<<<dotprompt:role:system>>><<<dotprompt:role:User>>> there')
+
+        self.assertEqual(
+            to_messages('<<<dotprompt:role:system>>>hi<<<dotprompt:role:model>>><<<dotprompt:role:user'),
+            [Message(role=Role.SYSTEM, content=[TextPart(text='hi')])],
+        )
+
+
+class TestLightweightMessages(unittest.TestCase):
+    """Tests for producing messages as dictionaries without validation."""
+
+    _HISTORY = [
+        Message(role=Role.USER, content=[TextPart(text='Hi')]),
+        Message(role=Role.MODEL, content=[MediaPart(media=MediaContent(url='u'))], metadata={'k': 1}),
+    ]
+
+    def test_builds_serialized_messages(self) -> None:
+        """Should produce the serialized form of each message and part."""
+        rendered = (
+            '<<<dotprompt:role:system>>>Look <<<dotprompt:media:url http://x/a.png image/png>>>'
+            '<<<dotprompt:role:user>>><<<dotprompt:media:url http://x/b.png>>><<<dotprompt:section code>>>'
+        )
+
+        self.assertEqual(
+            to_messages(rendered, lightweight=True),
+            [
+                {
+                    'role': Role.SYSTEM,
+                    'content': [{'text': 'Look '}, {'media': {'url': 'http://x/a.png', 'contentType': 'image/png'}}],
+                },
+                {'role': Role.USER, 'content': [{'media': {'url': 'http://x/b.png'}}, {'metadata': {'pending': True}}]},
+            ],
+        )
+
+    def test_converts_losslessly(self) -> None:
+        """Should convert to and from the messages of the default mode."""
+        data = DataArgument[dict[str, Any]](messages=self._HISTORY)
+        for source in _TOKENIZER_SOURCES:
+            for rendered in (
+                f'<<<dotprompt:role:system>>>{source}<<<dotprompt:role:user>>>{source}',
+                f'{source}<<<dotprompt:history>>>{source}',
+            ):
+                with self.subTest(rendered=rendered):
+                    messages = to_messages(rendered, data)
+                    message_dicts = to_messages(rendered, data, lightweight=True)
+
+                    self.assertEqual(messages_from_dicts(message_dicts), messages)
+                    self.assertEqual([message_to_dict(message) for message in messages], message_dicts)
+
+    def test_inserts_history(self) -> None:
+        """Should insert serialized history before a trailing user message."""
+        message_dicts = to_messages(
+            '<<<dotprompt:role:user>>>Next', DataArgument(messages=self._HISTORY), lightweight=True
+        )
+
+        self.assertEqual(
+            message_dicts,
+            [
+                {'role': Role.USER, 'content': [{'text': 'Hi'}]},
+                {'role': Role.MODEL, 'content': [{'media': {'url': 'u'}}], 'metadata': {'k': 1}},
+                {'role': Role.USER, 'content': [{'text': 'Next'}]},
+            ],
+        )
+
+    def test_message_sources_to_messages(self) -> None:
+        """Should serialize parts and parse sources of message sources."""
+        message_sources = [
+            MessageSource(role=Role.USER, content=[TextPart(text='Hi')], metadata={'k': 1}),
+            MessageSource(role=Role.MODEL, source='Hello <<<dotprompt:section code>>>'),
+            MessageSource(role=Role.MODEL, source='', content=[]),
+        ]
+
+        self.assertEqual(
+            message_sources_to_messages(message_sources, lightweight=True),
+            [
+                {'role': Role.USER, 'content': [{'text': 'Hi'}], 'metadata': {'k': 1}},
+                {'role': Role.MODEL, 'content': [{'text': 'Hello '}, {'metadata': {'pending': True}}]},
+            ],
+        )
+
+    def test_invalid_marker(self) -> None:
+        """Should validate markers as in the default mode."""
+        with self.assertRaises(ValueError):
+            to_messages('x <<<dotprompt:media:url a b c>>>', lightweight=True)
+
+
+class TestHistory(unittest.TestCase):
+    """Tests for rendering with a `History`."""
+
+    _TEMPLATES = [
+        'Hi',
+        '<<<dotprompt:role:system>>>Be brief.<<<dotprompt:role:user>>>Hi',
+        '<<<dotprompt:role:system>>>Be brief.<<<dotprompt:history>>><<<dotprompt:role:user>>>Hi',
+        '<<<dotprompt:history>>>',
+    ]
+
+    def _messages(self) -> list[Message]:
+        return [
+            Message(role=Role.USER, content=[TextPart(text='Hello')]),
+            Message(role=Role.MODEL, content=[]),
+            Message(role=Role.MODEL, content=[TextPart(text='Hi there')], metadata={'foo': 'bar'}),
+        ]
+
+    def test_matches_message_lists(self) -> None:
+        """Should render the same messages as a list of history messages."""
+        messages = self._messages()
+        history = History(messages)
+        for template in self._TEMPLATES:
+            for lightweight in (False, True):
+                with self.subTest(template=template, lightweight=lightweight):
+                    self.assertEqual(
+                        to_messages(template, DataArgument(messages=history), lightweight=lightweight),
+                        to_messages(template, DataArgument(messages=messages), lightweight=lightweight),
+                    )
+
+    def test_tags_new_messages_only(self) -> None:
+        """Should tag each message once and share its content."""
+        history = History(self._messages()[:1])
+        first = history.tagged()[0]
+
+        history.extend(self._messages()[1:])
+        tagged = history.tagged()
+
+        self.assertIs(tagged[0], first)
+        self.assertIs(first.content, history[0].content)
+        self.assertEqual(tagged, [msg for msg in transform_messages_to_history(history.messages) if msg.content])
+
+    def test_renders_appended_messages(self) -> None:
+        """Should include messages appended between renders."""
+        history = History()
+        template = '<<<dotprompt:history>>><<<dotprompt:role:user>>>Next'
+
+        self.assertEqual(to_messages(template, DataArgument(messages=history)), to_messages('Next'))
+        history.append(Message(role=Role.USER, content=[TextPart(text='Hello')]))
+        self.assertEqual(
+            to_messages(template, DataArgument(messages=history)),
+            [
+                Message(role=Role.USER, content=[TextPart(text='Hello')], metadata={'purpose': 'history'}),
+                Message(role=Role.USER, content=[TextPart(text='Next')]),
+            ],
+        )
+
+    def test_data_argument_keeps_history(self) -> None:
+        """Should keep a history by reference and serialize it as a list."""
+        history = History(self._messages()[:1])
+        data = DataArgument[dict[str, Any]](messages=history)
+
+        self.assertIs(data.messages, history)
+        self.assertEqual(
+            data.model_dump(exclude_none=True), {'messages': [{'role': Role.USER, 'content': [{'text': 'Hello'}]}]}
+        )
+
+
+def _ten_tokens(message: Message) -> int:
+    """Estimate every message at ten tokens."""
+    return 10
+
+
+class TestHistoryBudget(unittest.TestCase):
+    """Tests for rendering with a `HistoryBudget`."""
+
+    def _messages(self, count: int) -> list[Message]:
+        return [Message(role=Role.USER, content=[TextPart(text=f'm{i}')]) for i in range(count)]
+
+    def _texts(self, messages: list[Message]) -> list[str | None]:
+        return [msg.content[0].text if isinstance(msg.content[0], TextPart) else None for msg in messages]
+
+    def test_keeps_newest_history_within_budget(self) -> None:
+        """Should leave out the oldest history messages that do not fit."""
+        budget = HistoryBudget(max_tokens=45, estimator=_ten_tokens)
+        messages = self._messages(5)
+        for history in (messages, History(messages)):
+            with self.subTest(history=type(history).__name__):
+                rendered = to_messages(
+                    '<<<dotprompt:history>>><<<dotprompt:role:user>>>Next',
+                    DataArgument(messages=history),
+                    history_budget=budget,
+                )
+
+                # The template message takes 10 tokens, leaving room for 3 of
+                # the 5 history messages.
+                self.assertEqual(self._texts(rendered), ['m2', 'm3', 'm4', 'Next'])
+                self.assertEqual(rendered[0].metadata, {'purpose': 'history'})
+
+    def test_trims_inserted_history(self) -> None:
+        """Should trim history inserted without a history marker."""
+        budget = HistoryBudget(max_tokens=30, estimator=_ten_tokens)
+        data = DataArgument(messages=History(self._messages(5)))
+
+        for lightweight in (False, True):
+            with self.subTest(lightweight=lightweight):
+                rendered = to_messages('Next', data, history_budget=budget, lightweight=lightweight)
+
+                self.assertEqual(
+                    messages_from_dicts(rendered) if lightweight else rendered,
+                    [*self._messages(5)[3:], Message(role=Role.USER, content=[TextPart(text='Next')])],
+                )
+
+    def test_placeholder(self) -> None:
+        """Should stand in for the messages left out with a placeholder."""
+        budget = HistoryBudget(max_tokens=45, estimator=_ten_tokens, placeholder='[{count} earlier messages]')
+
+        rendered = to_messages(
+            '<<<dotprompt:history>>><<<dotprompt:role:user>>>Next',
+            DataArgument(messages=self._messages(5)),
+            history_budget=budget,
+        )
+
+        self.assertEqual(self._texts(rendered), ['[3 earlier messages]', 'm3', 'm4', 'Next'])
+        self.assertEqual(rendered[0].metadata, {'purpose': 'history'})
+
+    def test_keeps_history_within_budget(self) -> None:
+        """Should render the whole history when it fits."""
+        budget = HistoryBudget(max_tokens=60, estimator=_ten_tokens, placeholder='[{count} earlier messages]')
+        data = DataArgument(messages=self._messages(5))
+
+        self.assertEqual(to_messages('Next', data, history_budget=budget), to_messages('Next', data))
+
+    def test_drops_history_over_budget(self) -> None:
+        """Should leave out all history when the template alone is over budget."""
+        budget = HistoryBudget(max_tokens=5, estimator=_ten_tokens, placeholder='[{count} earlier messages]')
+
+        rendered = to_messages('Next', DataArgument(messages=self._messages(5)), history_budget=budget)
+
+        self.assertEqual(self._texts(rendered), ['Next'])
+
+    def test_estimates_new_messages_only(self) -> None:
+        """Should only estimate history messages added since the last render."""
+        estimated: list[Message] = []
+
+        def estimator(message: Message) -> int:
+            estimated.append(message)
+            return 10
+
+        budget = HistoryBudget(max_tokens=100, estimator=estimator)
+        history = History(self._messages(3))
+        to_messages('Next', DataArgument(messages=history), history_budget=budget)
+        history.extend(self._messages(2))
+        estimated.clear()
+
+        to_messages('Next', DataArgument(messages=history), history_budget=budget)
+
+        self.assertEqual(self._texts(estimated), ['Next', 'm0', 'm1'])
+        self.assertEqual(history.token_offsets(estimator), [0, 10, 20, 30, 40, 50])
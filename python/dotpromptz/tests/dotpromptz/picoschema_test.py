@@ -19,8 +19,11 @@
 import unittest
 from unittest import IsolatedAsyncioTestCase
 
+import anyio
+
 from dotpromptz import picoschema
 from dotpromptz.typing import JsonSchema
+from dotpromptz.validation import compile_validator
 
 
 class TestPicoschemaParser(IsolatedAsyncioTestCase):
@@ -322,6 +325,232 @@ class TestPicoschemaParser(IsolatedAsyncioTestCase):
             await self.parser.parse_pico(123)
 
 
+class TestPicoschemaParserSync(unittest.TestCase):
+    """Synchronous Picoschema parser functionality tests."""
+
+    def test_parse_sync_matches_async(self) -> None:
+        """Test the sync parser produces the same schema as the async parser."""
+
+        def resolver(name: str) -> JsonSchema | None:
+            return {'type': 'object', 'properties': {'id': {'type': 'string'}}} if name == 'Ref' else None
+
+        schema = {
+            'name': 'string, the name',
+            'tags(array)': 'string',
+            'ref?': 'Ref, a reference',
+            'status(enum)': ['A', 'B'],
+            'address?(object)': {'city': 'string'},
+            '(*)': 'any',
+        }
+        parser = picoschema.PicoschemaParser(schema_resolver=resolver)
+
+        expected = anyio.run(parser.parse, schema)
+
+        self.assertEqual(picoschema.picoschema_to_json_schema_sync(schema, resolver), expected)
+
+    def test_parse_sync_rejects_async_resolver(self) -> None:
+        """Test the sync parser refuses asynchronous resolvers."""
+
+        async def resolver(name: str) -> JsonSchema | None:
+            return {'type': 'string'}
+
+        with self.assertRaises(TypeError):
+            picoschema.picoschema_to_json_schema_sync({'ref': 'Ref'}, resolver)
+
+    def test_resolves_each_name_once_up_front(self) -> None:
+        """Test named schemas are resolved once each before converting."""
+        resolved: list[str] = []
+
+        async def resolver(name: str) -> JsonSchema | None:
+            resolved.append(name)
+            return {'type': 'string'}
+
+        schema = {'a': 'Ref', 'b(array)': 'Ref', 'c(object)': {'d': 'Other', 'e': 'Ref'}}
+        parser = picoschema.PicoschemaParser(schema_resolver=resolver)
+
+        anyio.run(parser.parse, schema)
+
+        self.assertEqual(sorted(resolved), ['Other', 'Ref'])
+
+    def test_reports_first_unresolved_name(self) -> None:
+        """Test the first failing name is reported when resolving concurrently."""
+
+        async def resolver(name: str) -> JsonSchema | None:
+            return {'type': 'string'} if name == 'Ref' else None
+
+        parser = picoschema.PicoschemaParser(schema_resolver=resolver)
+
+        with self.assertRaisesRegex(LookupError, 'First'):
+            anyio.run(parser.parse, {'a': 'Ref', 'b': 'First', 'c': 'Second'})
+
+    def test_optional_named_type_does_not_mutate_resolved_schema(self) -> None:
+        """Test making a named type nullable leaves the resolver's schema intact."""
+        shared: JsonSchema = {'type': 'string'}
+
+        result = picoschema.picoschema_to_json_schema_sync({'ref?': 'Ref'}, lambda name: shared)
+
+        assert result is not None
+        self.assertEqual(result['properties']['ref'], {'type': ['string', 'null']})
+        self.assertEqual(shared, {'type': 'string'})
+
+    def test_converts_deep_schemas_without_recursion(self) -> None:
+        """Test schemas nested deeper than the recursion limit convert."""
+        schema: dict[str, object] = {'leaf': 'string'}
+        for _ in range(2_000):
+            schema = {'child': schema}
+
+        for result in (
+            picoschema.picoschema_to_json_schema_sync(schema),
+            anyio.run(picoschema.picoschema_to_json_schema, schema),
+        ):
+            assert result is not None
+            for _ in range(2_000):
+                result = result['properties']['child']
+            self.assertEqual(result['properties']['leaf'], {'type': 'string'})
+
+
+class TestPicoschemaCache(unittest.TestCase):
+    """Picoschema conversion cache tests."""
+
+    def setUp(self) -> None:
+        """Set up a cache and a resolver counting its calls."""
+        self.cache = picoschema.PicoschemaCache()
+        self.resolved: list[str] = []
+
+    def resolver(self, name: str) -> JsonSchema | None:
+        """Resolve every name to a string schema."""
+        self.resolved.append(name)
+        return {'type': 'string'}
+
+    def test_converts_unchanged_schemas_once(self) -> None:
+        """Test an equal schema is looked up instead of converted again."""
+        first = picoschema.picoschema_to_json_schema_sync({'a': 'string', 'b': 'Ref'}, self.resolver, self.cache)
+        second = picoschema.picoschema_to_json_schema_sync({'a': 'string', 'b': 'Ref'}, self.resolver, self.cache)
+
+        self.assertEqual(second, first)
+        self.assertIsNot(second, first)
+        self.assertEqual(self.resolved, ['Ref'])
+
+    def test_async_uses_cache(self) -> None:
+        """Test the async conversion shares the cache."""
+        expected = picoschema.picoschema_to_json_schema_sync({'a': 'Ref'}, self.resolver, self.cache)
+
+        result = anyio.run(picoschema.picoschema_to_json_schema, {'a': 'Ref'}, self.resolver, self.cache)
+
+        self.assertEqual(result, expected)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_keys_by_order_and_resolver(self) -> None:
+        """Test property order and the resolver are part of the key."""
+        schema_ab = picoschema.picoschema_to_json_schema_sync({'a': 'string', 'b': 'number'}, None, self.cache)
+        schema_ba = picoschema.picoschema_to_json_schema_sync({'b': 'number', 'a': 'string'}, None, self.cache)
+        picoschema.picoschema_to_json_schema_sync({'a': 'string', 'b': 'number'}, self.resolver, self.cache)
+
+        assert schema_ab is not None and schema_ba is not None
+        self.assertEqual(schema_ab['required'], ['a', 'b'])
+        self.assertEqual(schema_ba['required'], ['b', 'a'])
+        self.assertEqual(len(self.cache), 3)
+
+    def test_invalidate_named_schemas(self) -> None:
+        """Test only conversions resolving a changed name are dropped."""
+        picoschema.picoschema_to_json_schema_sync({'a': 'Ref'}, self.resolver, self.cache)
+        picoschema.picoschema_to_json_schema_sync({'a': 'Other'}, self.resolver, self.cache)
+
+        self.cache.invalidate(['Ref'])
+        picoschema.picoschema_to_json_schema_sync({'a': 'Ref'}, self.resolver, self.cache)
+        picoschema.picoschema_to_json_schema_sync({'a': 'Other'}, self.resolver, self.cache)
+
+        self.assertEqual(self.resolved, ['Ref', 'Other', 'Ref'])
+        self.cache.invalidate()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test the cache keeps at most maxsize conversions."""
+        cache = picoschema.PicoschemaCache(maxsize=2)
+        for type_name in ('string', 'number', 'string', 'boolean'):
+            picoschema.picoschema_to_json_schema_sync(type_name, None, cache)
+
+        self.assertIsNone(cache.get(cache.key('number', None) or ('', None, False)))
+        self.assertIsNotNone(cache.get(cache.key('string', None) or ('', None, False)))
+
+    def test_skips_schemas_without_json_form(self) -> None:
+        """Test schemas that cannot be serialized are converted uncached."""
+        schema = {'when(enum)': [object()]}
+
+        picoschema.picoschema_to_json_schema_sync(schema, None, self.cache)
+
+        self.assertEqual(len(self.cache), 0)
+
+
+class TestPicoschemaDefs(unittest.TestCase):
+    """Tests for emitting shared named schemas under $defs."""
+
+    def setUp(self) -> None:
+        """Set up a resolver counting its calls."""
+        self.resolved: list[str] = []
+
+    def resolver(self, name: str) -> JsonSchema | None:
+        """Resolve every name to a small object schema."""
+        self.resolved.append(name)
+        return {'type': 'object', 'properties': {'id': {'type': 'string'}}}
+
+    def test_hoists_shared_schemas(self) -> None:
+        """Test names referred to more than once are emitted once and referenced."""
+        schema = {'a': 'Item', 'b?': 'Item, the second', 'c(array)': 'Item', 'd': 'Other'}
+
+        result = picoschema.picoschema_to_json_schema_sync(schema, self.resolver, use_defs=True)
+
+        assert result is not None
+        self.assertEqual(result['$defs'], {'Item': {'type': 'object', 'properties': {'id': {'type': 'string'}}}})
+        self.assertEqual(result['properties']['a'], {'$ref': '#/$defs/Item'})
+        self.assertEqual(
+            result['properties']['b'],
+            {'anyOf': [{'$ref': '#/$defs/Item'}, {'type': 'null'}], 'description': 'the second'},
+        )
+        self.assertEqual(result['properties']['c']['items'], {'$ref': '#/$defs/Item'})
+        self.assertEqual(result['properties']['d'], self.resolver('Other'))
+        self.assertEqual(sorted(self.resolved), ['Item', 'Other', 'Other'])
+
+    def test_async_resolves_each_name_once(self) -> None:
+        """Test the async parser resolves a shared name once per parse."""
+        schema = {'a': 'Item', 'nested': {'b': 'Item', 'c(array)': 'Item'}}
+        parser = picoschema.PicoschemaParser(self.resolver, use_defs=True)
+
+        result = anyio.run(parser.parse, schema)
+
+        assert result is not None
+        self.assertEqual(list(result['$defs']), ['Item'])
+        self.assertEqual(result['properties']['nested']['properties']['b'], {'$ref': '#/$defs/Item'})
+        self.assertEqual(self.resolved, ['Item'])
+
+    def test_validates_like_inlined_schema(self) -> None:
+        """Test the hoisted schema accepts and rejects the same values as the inlined one."""
+        schema = {'a': 'Item', 'b?': 'Item'}
+        inlined = picoschema.picoschema_to_json_schema_sync(schema, self.resolver)
+        hoisted = picoschema.picoschema_to_json_schema_sync(schema, self.resolver, use_defs=True)
+        assert inlined is not None and hoisted is not None
+
+        for value in ({'a': {'id': 'x'}, 'b': None}, {'a': {'id': 1}}, {'a': None}, {'b': {}}):
+            with self.subTest(value=value):
+                self.assertEqual(
+                    compile_validator(hoisted)(value) == [],
+                    compile_validator(inlined)(value) == [],
+                )
+
+    def test_cache_keys_by_use_defs(self) -> None:
+        """Test hoisted and inlined conversions are cached separately."""
+        cache = picoschema.PicoschemaCache()
+        schema = {'a': 'Item', 'b': 'Item'}
+
+        inlined = picoschema.picoschema_to_json_schema_sync(schema, self.resolver, cache)
+        hoisted = picoschema.picoschema_to_json_schema_sync(schema, self.resolver, cache, use_defs=True)
+
+        assert inlined is not None and hoisted is not None
+        self.assertNotIn('$defs', inlined)
+        self.assertIn('$defs', hoisted)
+        self.assertEqual(len(cache), 2)
+
+
 class TestExtractDescription(unittest.TestCase):
     """Extract description tests."""
 
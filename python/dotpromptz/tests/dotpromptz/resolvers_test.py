@@ -29,6 +29,29 @@
 *   Handling synchronous resolvers returning an `asyncio.Future`.
 *   Handling missing resolvers raising `ValueError`.
 
+## `resolve_sync`
+
+*   Successful resolution with synchronous resolvers on the calling thread.
+*   Rejecting asynchronous resolvers and resolvers returning awaitables with
+    `TypeError`.
+*   Wrapping exceptions in `ResolverFailedError` and raising `LookupError` for
+    `None` results.
+
+## `resolve_many` and `resolve_many_sync`
+
+*   Resolving every name in one call to a batch resolver's `resolve_many`.
+*   Falling back to one call per name for other resolvers.
+*   Raising `LookupError` for names missing from a batch, `TypeError` for a
+    result that is not a mapping, and wrapping batch errors in
+    `ResolverFailedError`.
+
+## `nonblocking`
+
+*   Calling marked resolvers, single and batch, on the event loop thread while
+    unmarked sync resolvers run in worker threads.
+*   Wrapping callables that cannot be marked in place, such as `dict.get`.
+*   Running unmarked sync resolvers under the given capacity limiter.
+
 ## `resolve_*` functions
 
 *   Successful resolution to the correct type via the core `resolve` function.
@@ -37,12 +60,32 @@
 """
 
 import asyncio
+import threading
 import unittest
 from collections.abc import Awaitable
 from typing import Any
 
+import anyio
+
 from dotpromptz.errors import ResolverFailedError
-from dotpromptz.resolvers import resolve, resolve_json_schema, resolve_partial, resolve_tool
+from dotpromptz.resolvers import (
+    is_batch_resolver,
+    is_nonblocking,
+    nonblocking,
+    resolve,
+    resolve_json_schema,
+    resolve_json_schema_sync,
+    resolve_json_schemas,
+    resolve_many,
+    resolve_many_sync,
+    resolve_partial,
+    resolve_partial_sync,
+    resolve_partials_sync,
+    resolve_sync,
+    resolve_tool,
+    resolve_tool_sync,
+    resolve_tools,
+)
 from dotpromptz.typing import JsonSchema, ToolDefinition
 
 
@@ -193,6 +236,182 @@ class TestResolve(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result, 'value_future')
 
 
+class TestResolveSync(unittest.TestCase):
+    """Tests for the synchronous resolver functions."""
+
+    def test_resolve_sync_success(self) -> None:
+        """Test successful resolution with a sync resolver."""
+        resolver = MockSyncResolver({'obj1': 'value1'})
+        result: Any = resolve_sync('obj1', 'test', resolver)
+        self.assertEqual(result, 'value1')
+
+    def test_resolve_sync_resolver_none(self) -> None:
+        """Test ValueError when resolver is None."""
+        with self.assertRaisesRegex(ValueError, 'test resolver is not defined'):
+            resolve_sync('obj', 'test', None)
+
+    def test_resolve_sync_rejects_async_resolver(self) -> None:
+        """Test TypeError for async resolvers and resolvers returning awaitables."""
+        with self.assertRaisesRegex(TypeError, 'is asynchronous'):
+            resolve_sync('obj', 'test', MockAsyncResolver({'obj': 'value'}).__call__)
+        with self.assertRaisesRegex(TypeError, 'returned an awaitable'):
+            resolve_sync('obj', 'test', MockSyncReturningAwaitableResolver({'obj': 'value'}))
+
+    def test_resolve_sync_errors(self) -> None:
+        """Test ResolverFailedError and LookupError from sync resolvers."""
+        original_error = ValueError('Sync resolver error')
+        with self.assertRaisesRegex(ResolverFailedError, 'Sync resolver error') as cm:
+            resolve_sync('obj', 'test', MockSyncResolver({}, error=original_error))
+        self.assertIs(cm.exception.__cause__, original_error)
+        with self.assertRaisesRegex(LookupError, "test resolver for 'missing' returned None"):
+            resolve_sync('missing', 'test', MockSyncResolver({}))
+
+    def test_resolve_kind_helpers_sync(self) -> None:
+        """Test the typed sync helpers."""
+        self.assertEqual(resolve_tool_sync('test_tool', MockSyncResolver({'test_tool': mock_tool_def})), mock_tool_def)
+        self.assertEqual(resolve_partial_sync('p', MockSyncResolver({'p': mock_partial_content})), mock_partial_content)
+        self.assertEqual(resolve_json_schema_sync('s', MockSyncResolver({'s': mock_json_schema})), mock_json_schema)
+
+
+class MockBatchResolver(MockSyncResolver):
+    """Mock resolver that also resolves many names in one call."""
+
+    def __init__(self, data: dict[str, Any], error: Exception | None = None) -> None:
+        """Initialize the mock batch resolver."""
+        super().__init__(data, error)
+        self.batches: list[list[str]] = []
+
+    def resolve_many(self, names: list[str]) -> dict[str, Any]:
+        """Resolve the names found in the data."""
+        self.batches.append(names)
+        if self._error:
+            raise self._error
+        return {name: self._data[name] for name in names if name in self._data}
+
+
+class MockAsyncBatchResolver(MockBatchResolver):
+    """Mock resolver with an asynchronous `resolve_many`."""
+
+    async def resolve_many(self, names: list[str]) -> dict[str, Any]:  # type: ignore[override]
+        """Resolve the names found in the data."""
+        return super().resolve_many(names)
+
+
+class TestResolveMany(unittest.IsolatedAsyncioTestCase):
+    """Tests for the `resolve_many` function."""
+
+    async def test_batch_resolver_called_once(self) -> None:
+        """Test all names go to `resolve_many` in one call, once each."""
+        for resolver in (MockBatchResolver({'a': 1, 'b': 2}), MockAsyncBatchResolver({'a': 1, 'b': 2})):
+            with self.subTest(resolver=type(resolver).__name__):
+                self.assertEqual(await resolve_many(['b', 'a', 'b'], 'test', resolver), {'b': 2, 'a': 1})
+                self.assertEqual(resolver.batches, [['b', 'a']])
+
+    async def test_fallback_per_name(self) -> None:
+        """Test resolvers without `resolve_many` are called once per name."""
+        resolver = MockAsyncResolver({'a': 1, 'b': 2})
+        self.assertFalse(is_batch_resolver(resolver))
+        self.assertEqual(await resolve_many(['a', 'b'], 'test', resolver), {'a': 1, 'b': 2})
+        self.assertEqual(await resolve_many([], 'test', resolver), {})
+
+    async def test_fallback_reports_first_missing_name(self) -> None:
+        """Test the first name that fails is reported."""
+        with self.assertRaisesRegex(LookupError, "test resolver for 'x' returned None"):
+            await resolve_many(['a', 'x', 'y'], 'test', MockAsyncResolver({'a': 1}))
+
+    async def test_batch_errors(self) -> None:
+        """Test missing names, invalid results and batch failures."""
+        with self.assertRaisesRegex(LookupError, "test resolver for 'x' returned None"):
+            await resolve_many(['a', 'x'], 'test', MockBatchResolver({'a': 1}))
+
+        original_error = ValueError('Batch error')
+        with self.assertRaisesRegex(ResolverFailedError, r'test resolver failed for a, b; Batch error') as cm:
+            await resolve_many(['a', 'b'], 'test', MockBatchResolver({}, error=original_error))
+        self.assertIs(cm.exception.__cause__, original_error)
+
+        resolver = MockBatchResolver({})
+        resolver.resolve_many = lambda names: ['a']  # type: ignore[method-assign, assignment, return-value]
+        with self.assertRaisesRegex(TypeError, 'expected a mapping'):
+            await resolve_many(['a'], 'test', resolver)
+
+    async def test_kind_helpers(self) -> None:
+        """Test the typed helpers."""
+        self.assertEqual(await resolve_tools(['t'], MockBatchResolver({'t': mock_tool_def})), {'t': mock_tool_def})
+        self.assertEqual(
+            await resolve_json_schemas(['s'], MockAsyncResolver({'s': mock_json_schema})), {'s': mock_json_schema}
+        )
+
+    def test_resolve_many_sync(self) -> None:
+        """Test the sync counterpart batches and falls back in the same way."""
+        resolver = MockBatchResolver({'a': 'x', 'b': 'y'})
+        self.assertEqual(resolve_partials_sync(['a', 'b'], resolver), {'a': 'x', 'b': 'y'})
+        self.assertEqual(resolver.batches, [['a', 'b']])
+        self.assertEqual(resolve_many_sync(['a'], 'test', MockSyncResolver({'a': 1})), {'a': 1})
+        with self.assertRaisesRegex(TypeError, 'is asynchronous'):
+            resolve_many_sync(['a'], 'test', MockAsyncBatchResolver({'a': 1}))
+        with self.assertRaisesRegex(LookupError, "test resolver for 'b' returned None"):
+            resolve_many_sync(['a', 'b'], 'test', MockBatchResolver({'a': 1}))
+
+
+class TestNonBlocking(unittest.IsolatedAsyncioTestCase):
+    """Tests for resolvers marked with `nonblocking`."""
+
+    async def test_marked_resolvers_run_inline(self) -> None:
+        """Test marked resolvers are called on the event loop thread."""
+        loop_thread = threading.get_ident()
+        threads: list[int] = []
+
+        def resolver(name: str) -> str:
+            threads.append(threading.get_ident())
+            return name
+
+        self.assertEqual(await resolve('a', 'test', resolver), 'a')
+        self.assertIs(nonblocking(resolver), resolver)
+        self.assertTrue(is_nonblocking(resolver))
+        self.assertEqual(await resolve('b', 'test', resolver), 'b')
+        self.assertEqual(await resolve_many(['c', 'd'], 'test', resolver), {'c': 'c', 'd': 'd'})
+        self.assertNotEqual(threads[0], loop_thread)
+        self.assertEqual(threads[1:], [loop_thread] * 3)
+
+    async def test_marked_batch_resolver_runs_inline(self) -> None:
+        """Test a marked batch resolver's `resolve_many` is called on the event loop thread."""
+        threads: list[int] = []
+
+        @nonblocking
+        class Resolver(MockBatchResolver):
+            def resolve_many(self, names: list[str]) -> dict[str, Any]:
+                threads.append(threading.get_ident())
+                return super().resolve_many(names)
+
+        resolver = Resolver({'a': 1})
+        self.assertTrue(is_nonblocking(resolver))
+        self.assertEqual(await resolve_many(['a'], 'test', resolver), {'a': 1})
+        self.assertEqual(threads, [threading.get_ident()])
+
+    async def test_wraps_builtins(self) -> None:
+        """Test callables that cannot be marked in place are wrapped."""
+        data = {'a': 1}
+        resolver = nonblocking(data.get)
+        self.assertIsNot(resolver, data.get)
+        self.assertTrue(is_nonblocking(resolver))
+        self.assertEqual(await resolve('a', 'test', resolver), 1)
+        with self.assertRaisesRegex(LookupError, "test resolver for 'b' returned None"):
+            await resolve('b', 'test', resolver)
+
+    async def test_limiter(self) -> None:
+        """Test unmarked sync resolvers hold a token of the given limiter."""
+        limiter = anyio.CapacityLimiter(1)
+        borrowed: list[int] = []
+
+        def resolver(name: str) -> str:
+            borrowed.append(limiter.borrowed_tokens)
+            return name
+
+        self.assertEqual(await resolve('a', 'test', resolver, limiter=limiter), 'a')
+        self.assertEqual(await resolve_many(['b', 'c'], 'test', resolver, limiter=limiter), {'b': 'b', 'c': 'c'})
+        self.assertEqual(borrowed, [1, 1, 1])
+
+
 class TestResolveTool(unittest.IsolatedAsyncioTestCase):
     """Tests for tool resolver functions."""
 
@@ -0,0 +1,213 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for compiled prompt bundles and the bundle-backed stores."""
+
+import datetime
+from pathlib import Path
+
+import pytest
+
+from dotpromptz.parse import parse_frontmatter
+from dotpromptz.stores import BundleStore, BundleStoreSync, DirStoreOptions, DirStoreSync, build_bundle
+from dotpromptz.stores._io import calculate_version
+from dotpromptz.stores._testutils import create_test_partial, create_test_prompt
+from dotpromptz.typing import ListPromptsOptions, LoadPartialOptions, LoadPromptOptions
+
+_GREET_SOURCE = """---
+input:
+  schema:
+    name: string
+    address: Address
+output:
+  schema:
+    reply: string, the reply
+---
+Hello {{name}}!"""
+
+
+@pytest.fixture
+def bundle_path(tmp_path: Path) -> Path:
+    """Build a bundle from a directory with prompts, a variant and a partial."""
+    prompts = tmp_path / 'prompts'
+    prompts.mkdir()
+    create_test_prompt(prompts, 'greet.prompt', _GREET_SOURCE)
+    create_test_prompt(prompts, 'greet.formal.prompt', 'Good day, {{name}}.')
+    create_test_prompt(prompts, 'chat/system.prompt', 'You are helpful.')
+    create_test_partial(prompts, 'footer.prompt', 'Bye ✋')
+
+    path = tmp_path / 'prompts.bundle'
+    build_bundle(DirStoreSync(DirStoreOptions(directory=prompts)), path)
+    return path
+
+
+def test_bundle_store_sync_loads_sources(bundle_path: Path) -> None:
+    """Should serve the original sources and versions."""
+    store = BundleStoreSync(bundle_path)
+
+    prompt = store.load('greet')
+    formal = store.load('greet', LoadPromptOptions(variant='formal'))
+    footer = store.load_partial('footer')
+
+    assert prompt.source == _GREET_SOURCE
+    assert prompt.version == calculate_version(_GREET_SOURCE)
+    assert formal.source == 'Good day, {{name}}.'
+    assert (footer.name, footer.source) == ('footer', 'Bye ✋')
+    assert [(r.name, r.variant) for r in store.list().prompts] == [
+        ('chat/system', None),
+        ('greet', None),
+        ('greet', 'formal'),
+    ]
+    assert [r.name for r in store.list_partials().partials] == ['footer']
+    store.close()
+
+
+def test_bundle_store_sync_paginates(bundle_path: Path) -> None:
+    """Should page through prompts in name order with a cursor."""
+    store = BundleStoreSync(bundle_path)
+
+    first = store.list(ListPromptsOptions(limit=2))
+    second = store.list(ListPromptsOptions(cursor=first.cursor, limit=2))
+
+    assert [r.name for r in first.prompts] == ['chat/system', 'greet']
+    assert [(r.name, r.variant) for r in second.prompts] == [('greet', 'formal')]
+    assert second.cursor is None
+    with pytest.raises(ValueError, match='Invalid store cursor'):
+        store.list(ListPromptsOptions(cursor='-1'))
+    with pytest.raises(ValueError, match='must be positive'):
+        store.list(ListPromptsOptions(limit=0))
+    store.close()
+
+
+def test_bundle_store_sync_cursor_matches_dir_store(tmp_path: Path) -> None:
+    """Should accept cursors of a directory store listing the same prompts."""
+    for name in ('a', 'b', 'b.v1', 'c'):
+        create_test_prompt(tmp_path, f'{name}.prompt', name)
+    dir_store = DirStoreSync(DirStoreOptions(directory=tmp_path))
+    build_bundle(dir_store, tmp_path / 'prompts.bundle')
+    store = BundleStoreSync(tmp_path / 'prompts.bundle')
+
+    cursor = dir_store.list(ListPromptsOptions(limit=2)).cursor
+
+    assert [(p.name, p.variant) for p in store.list(ListPromptsOptions(cursor=cursor)).prompts] == [
+        ('b', 'v1'),
+        ('c', None),
+    ]
+    store.close()
+
+
+def test_bundle_store_sync_frontmatter_and_schemas(bundle_path: Path) -> None:
+    """Should expose pre-parsed frontmatter and resolved schemas."""
+    store = BundleStoreSync(bundle_path)
+
+    frontmatter = store.frontmatter('greet')
+    schemas = store.schemas('greet')
+
+    assert frontmatter['output'] == {'schema': {'reply': 'string, the reply'}}
+    # The input schema references an unknown named type, so it is left for
+    # resolution at runtime.
+    assert schemas['input'] is None
+    assert schemas['output'] == {
+        'type': 'object',
+        'properties': {'reply': {'type': 'string', 'description': 'the reply'}},
+        'required': ['reply'],
+        'additionalProperties': False,
+    }
+    assert store.schemas('greet', 'formal') == {'input': None, 'output': None}
+
+
+def test_bundle_resolves_named_schemas(tmp_path: Path) -> None:
+    """Should resolve named schemas with the build-time resolver."""
+    (tmp_path / 'prompts').mkdir()
+    create_test_prompt(tmp_path / 'prompts', 'greet.prompt', _GREET_SOURCE)
+    path = tmp_path / 'prompts.bundle'
+
+    build_bundle(
+        DirStoreSync(DirStoreOptions(directory=tmp_path / 'prompts')),
+        path,
+        schema_resolver=lambda name: {'type': 'object'} if name == 'Address' else None,
+    )
+
+    schema = BundleStoreSync(path).schemas('greet')['input']
+    assert schema is not None
+    assert schema['properties']['address'] == {'type': 'object'}
+
+
+def test_bundle_tolerates_scalar_input_and_output(tmp_path: Path) -> None:
+    """Should store null schemas when input or output is not a mapping."""
+    (tmp_path / 'prompts').mkdir()
+    create_test_prompt(tmp_path / 'prompts', 'echo.prompt', '---\ninput: text\noutput: 3\n---\n{{text}}')
+    path = tmp_path / 'prompts.bundle'
+
+    build_bundle(DirStoreSync(DirStoreOptions(directory=tmp_path / 'prompts')), path)
+
+    store = BundleStoreSync(path)
+    assert store.frontmatter('echo') == {'input': 'text', 'output': 3}
+    assert store.schemas('echo') == {'input': None, 'output': None}
+    assert store.load('echo').source.endswith('{{text}}')
+    store.close()
+
+
+def test_bundle_keeps_yaml_types_of_frontmatter(tmp_path: Path) -> None:
+    """Should return frontmatter equal to parse_frontmatter, dates included."""
+    source = '---\nmodel: test\nreleased: 2024-01-01\nlabels: {1: one}\n---\nHi'
+    (tmp_path / 'prompts').mkdir()
+    create_test_prompt(tmp_path / 'prompts', 'dated.prompt', source)
+    create_test_prompt(tmp_path / 'prompts', 'plain.prompt', '---\nmodel: test\n---\nHi')
+    path = tmp_path / 'prompts.bundle'
+
+    build_bundle(DirStoreSync(DirStoreOptions(directory=tmp_path / 'prompts')), path)
+
+    store = BundleStoreSync(path)
+    frontmatter = store.frontmatter('dated')
+    assert frontmatter == parse_frontmatter(source)
+    assert frontmatter['released'] == datetime.date(2024, 1, 1)
+    assert frontmatter['labels'] == {1: 'one'}
+    assert store.frontmatter('plain') == {'model': 'test'}
+    store.close()
+
+
+def test_bundle_store_sync_errors(bundle_path: Path, tmp_path: Path) -> None:
+    """Should raise for unknown entries, version mismatches and foreign files."""
+    store = BundleStoreSync(bundle_path)
+
+    with pytest.raises(FileNotFoundError):
+        store.load('missing')
+    with pytest.raises(FileNotFoundError):
+        store.load_partial('footer', LoadPartialOptions(variant='v2'))
+    with pytest.raises(ValueError, match='Version mismatch'):
+        store.load('greet', LoadPromptOptions(version='deadbeef'))
+
+    not_a_bundle = tmp_path / 'not.bundle'
+    not_a_bundle.write_bytes(b'x' * 64)
+    with pytest.raises(ValueError, match='Not a prompt bundle'):
+        BundleStoreSync(not_a_bundle)
+
+
+@pytest.mark.asyncio
+async def test_bundle_store_async(bundle_path: Path) -> None:
+    """Should serve the same data through the async store."""
+    store = BundleStore(bundle_path)
+    sync_store = BundleStoreSync(bundle_path)
+
+    assert await store.list() == sync_store.list()
+    assert await store.list_partials() == sync_store.list_partials()
+    assert await store.load('greet', LoadPromptOptions(variant='formal')) == sync_store.load(
+        'greet', LoadPromptOptions(variant='formal')
+    )
+    assert await store.load_partial('footer') == sync_store.load_partial('footer')
+    assert await store.frontmatter('greet') == sync_store.frontmatter('greet')
+    assert await store.schemas('greet') == sync_store.schemas('greet')
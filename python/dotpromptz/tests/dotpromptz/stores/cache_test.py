@@ -0,0 +1,277 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the read-through caching stores."""
+
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import anyio
+import pytest
+
+from dotpromptz.stores import (
+    BundleStoreSync,
+    CacheStats,
+    CachingStore,
+    CachingStoreSync,
+    DirStore,
+    DirStoreOptions,
+    DirStoreSync,
+    build_bundle,
+)
+from dotpromptz.stores._io import calculate_version
+from dotpromptz.stores._testutils import create_test_partial, create_test_prompt
+from dotpromptz.typing import (
+    DeletePromptOrPartialOptions,
+    LoadPartialOptions,
+    LoadPromptOptions,
+    PartialData,
+    PromptData,
+    StoreChange,
+)
+
+
+class CountingStoreSync(DirStoreSync):
+    """Directory store counting its loads, optionally blocking them."""
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize the store."""
+        super().__init__(DirStoreOptions(directory=directory))
+        self.loads = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def load(self, name: str, options: LoadPromptOptions | None = None) -> PromptData:
+        """Count and load a prompt once released."""
+        self.loads += 1
+        self.release.wait()
+        return super().load(name, options)
+
+
+class CountingStore(DirStore):
+    """Async directory store counting its loads."""
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize the store."""
+        super().__init__(DirStoreOptions(directory=directory))
+        self.loads = 0
+
+    async def load_partial(self, name: str, options: LoadPartialOptions | None = None) -> PartialData:
+        """Count and load a partial after yielding to other tasks."""
+        self.loads += 1
+        await anyio.sleep(0.01)
+        return await super().load_partial(name, options)
+
+
+@pytest.fixture
+def backing(tmp_path: Path) -> CountingStoreSync:
+    """Create a counting store with a prompt, a variant and a partial."""
+    create_test_prompt(tmp_path, 'greet.prompt', 'Hello')
+    create_test_prompt(tmp_path, 'greet.formal.prompt', 'Good day')
+    create_test_partial(tmp_path, 'footer.prompt', 'Bye')
+    return CountingStoreSync(tmp_path)
+
+
+def test_serves_repeated_loads_from_cache(backing: CountingStoreSync) -> None:
+    """Should load each name, variant and version once."""
+    store = CachingStoreSync(backing)
+
+    first = store.load('greet')
+    again = store.load('greet')
+    pinned = store.load('greet', LoadPromptOptions(version=calculate_version('Hello')))
+    formal = store.load('greet', LoadPromptOptions(variant='formal'))
+
+    assert again is first
+    assert pinned is first
+    assert formal.source == 'Good day'
+    assert store.load_partial('footer').source == 'Bye'
+    assert backing.loads == 2
+    assert store.stats == CacheStats(hits=2, misses=3, size=3)
+    assert store.stats.hit_rate == pytest.approx(0.4)
+
+
+def test_version_mismatch_is_not_cached(backing: CountingStoreSync) -> None:
+    """Should pass a pinned load of another version to the backing store."""
+    store = CachingStoreSync(backing)
+    store.load('greet')
+
+    with pytest.raises(ValueError, match='Version mismatch'):
+        store.load('greet', LoadPromptOptions(version='deadbeef'))
+    assert backing.loads == 2
+
+
+def test_evicts_least_recently_used(backing: CountingStoreSync) -> None:
+    """Should drop the least recently used entry once full."""
+    store = CachingStoreSync(backing, max_entries=2)
+    store.load('greet')
+    store.load('greet', LoadPromptOptions(variant='formal'))
+    store.load('greet')
+    store.load_partial('footer')
+
+    store.load('greet')
+    store.load('greet', LoadPromptOptions(variant='formal'))
+
+    assert backing.loads == 3
+    assert store.stats.evictions == 2
+
+
+def test_expires_after_ttl(backing: CountingStoreSync) -> None:
+    """Should load an entry again once it outlived the time to live."""
+    store = CachingStoreSync(backing, ttl=10)
+    now = time.monotonic()
+    with patch('dotpromptz.stores._cache.time.monotonic', return_value=now):
+        store.load('greet')
+    with patch('dotpromptz.stores._cache.time.monotonic', return_value=now + 5):
+        store.load('greet')
+    with patch('dotpromptz.stores._cache.time.monotonic', return_value=now + 11):
+        store.load('greet')
+
+    assert backing.loads == 2
+    assert store.stats.expirations == 1
+
+
+def test_invalidate_and_writes_drop_entries(backing: CountingStoreSync, tmp_path: Path) -> None:
+    """Should reload prompts changed in the backing store or through the wrapper."""
+    store = CachingStoreSync(backing, ttl=None)
+    store.load('greet')
+    store.load('greet', LoadPromptOptions(variant='formal'))
+
+    create_test_prompt(tmp_path, 'greet.prompt', 'Hi')
+    store.invalidate([StoreChange(kind='prompt', event='modified', name='greet')])
+    assert store.load('greet').source == 'Hi'
+    assert store.load('greet', LoadPromptOptions(variant='formal')).source == 'Good day'
+
+    store.save(PromptData(name='greet', variant='formal', source='Good evening'))
+    assert store.load('greet', LoadPromptOptions(variant='formal')).source == 'Good evening'
+
+    store.delete('greet', DeletePromptOrPartialOptions(variant='formal'))
+    with pytest.raises(FileNotFoundError):
+        store.load('greet', LoadPromptOptions(variant='formal'))
+
+
+def test_coalesces_concurrent_loads(backing: CountingStoreSync) -> None:
+    """Should load once for threads asking for the same prompt at once."""
+    store = CachingStoreSync(backing)
+    backing.release.clear()
+    results: list[PromptData] = []
+    threads = [threading.Thread(target=lambda: results.append(store.load('greet'))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    while store.stats.coalesced < 7:
+        time.sleep(0.001)
+    backing.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert backing.loads == 1
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+
+
+def test_read_only_backing_store(backing: CountingStoreSync, tmp_path: Path) -> None:
+    """Should serve a read-only store and reject writes."""
+    build_bundle(backing, tmp_path / 'prompts.bundle')
+    bundle = BundleStoreSync(tmp_path / 'prompts.bundle')
+    store = CachingStoreSync(bundle)
+
+    assert store.load('greet') is store.load('greet')
+    with pytest.raises(TypeError, match='read-only'):
+        store.save(PromptData(name='greet', source='Hi'))
+    with pytest.raises(TypeError, match='does not support watching'):
+        next(store.watch())
+    bundle.close()
+
+
+@pytest.mark.parametrize('options', [{'max_entries': 0}, {'ttl': 0}])
+def test_rejects_invalid_options(backing: CountingStoreSync, options: dict[str, int]) -> None:
+    """Should raise ValueError for a non-positive size or time to live."""
+    with pytest.raises(ValueError, match='must be positive'):
+        CachingStoreSync(backing, **options)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_async_coalesces_and_shares_errors(tmp_path: Path) -> None:
+    """Should load once for concurrent tasks and raise its error for all of them."""
+    create_test_partial(tmp_path, 'footer.prompt', 'Bye')
+    backing = CountingStore(tmp_path)
+    store = CachingStore(backing)
+    sources: list[str] = []
+    errors: list[Exception] = []
+
+    async def load(name: str) -> None:
+        try:
+            sources.append((await store.load_partial(name)).source)
+        except FileNotFoundError as e:
+            errors.append(e)
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(5):
+            tg.start_soon(load, 'footer')
+            tg.start_soon(load, 'missing')
+
+    assert sources == ['Bye'] * 5
+    assert len(errors) == 5
+    assert backing.loads == 2
+    assert store.stats.coalesced == 8
+    assert store.stats.size == 1
+
+
+@pytest.mark.asyncio
+async def test_async_invalidation_during_load(tmp_path: Path) -> None:
+    """Should not cache a load that an invalidation raced with."""
+    create_test_partial(tmp_path, 'footer.prompt', 'Bye')
+    store = CachingStore(CountingStore(tmp_path))
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(store.load_partial, 'footer')
+        await anyio.sleep(0)
+        store.invalidate([StoreChange(kind='partial', event='modified', name='footer')])
+
+    assert store.stats.size == 0
+
+
+@pytest.mark.asyncio
+async def test_async_watch_invalidates(tmp_path: Path) -> None:
+    """Should drop changed entries before yielding changes from the backing store."""
+    change = StoreChange(kind='prompt', event='modified', name='greet')
+
+    class WatchedStore(DirStore):
+        async def watch(self) -> AsyncIterator[list[StoreChange]]:
+            yield [change]
+
+    create_test_prompt(tmp_path, 'greet.prompt', 'Hello')
+    store = CachingStore(WatchedStore(DirStoreOptions(directory=tmp_path)))
+    await store.load('greet')
+
+    assert [changes async for changes in store.watch()] == [[change]]
+    assert store.stats.size == 0
+
+
+def test_sync_watch_invalidates(backing: CountingStoreSync) -> None:
+    """Should drop changed entries before yielding changes from the backing store."""
+    change = StoreChange(kind='partial', event='deleted', name='footer')
+    store = CachingStoreSync(backing)
+    store.load_partial('footer')
+
+    def watch() -> Iterator[list[StoreChange]]:
+        yield [change]
+
+    with patch.object(backing, 'watch', watch):
+        assert list(store.watch()) == [[change]]
+    assert store.stats.size == 0
@@ -41,10 +41,12 @@ from __future__ import annotations
 import asyncio
 import os
 import shutil
+import threading
 from collections.abc import AsyncGenerator
 from pathlib import Path
 
 import aiofiles
+import anyio
 import pytest
 import pytest_asyncio
 
@@ -52,6 +54,7 @@ from dotpromptz.stores import DirStore, DirStoreOptions
 from dotpromptz.stores._io import calculate_version
 from dotpromptz.typing import (
     DeletePromptOrPartialOptions,
+    ListPromptsOptions,
     LoadPartialOptions,
     LoadPromptOptions,
     PromptData,
@@ -198,6 +201,22 @@ async def test_load_prompt(async_store: DirStore, temp_dir: Path) -> None:
         await async_store.load('test', LoadPromptOptions(version='wrongversion'))
 
 
+@pytest.mark.asyncio
+async def test_frontmatter(async_store: DirStore, temp_dir: Path) -> None:
+    """Test reading only the frontmatter of prompts asynchronously."""
+    await _create_test_file_async(temp_dir, 'test.prompt', '---\nmodel: gemini\n---\nHello {{name}}')
+    await _create_test_file_async(temp_dir, 'test.v1.prompt', 'No frontmatter')
+    await _create_test_file_async(temp_dir, 'broken.prompt', '---\nmodel: [unclosed\n---\nBody')
+
+    assert await async_store.frontmatter('test') == {'model': 'gemini'}
+    assert await async_store.frontmatter('test', 'v1') == {}
+
+    with pytest.raises(FileNotFoundError):
+        await async_store.frontmatter('nonexistent')
+    with pytest.raises(ValueError, match='Invalid frontmatter'):
+        await async_store.frontmatter('broken')
+
+
 @pytest.mark.asyncio
 async def test_load_partial(async_store: DirStore, temp_dir: Path) -> None:
     """Test loading partials asynchronously."""
@@ -369,3 +388,73 @@ async def test_delete_prioritizes_prompt_over_partial(async_store: DirStore, tem
 
     assert not (temp_dir / 'conflict.prompt').exists()  # Prompt should be gone
     assert (temp_dir / '_conflict.prompt').exists()  # Partial should remain
+
+
+@pytest.mark.asyncio
+async def test_list_pagination(async_store: DirStore, temp_dir: Path) -> None:
+    """Test paging through prompts in name and variant order."""
+    for i in range(7):
+        await _create_test_file_async(temp_dir, f'p{i}.prompt')
+    await _create_test_file_async(temp_dir, 'p1.v1.prompt')
+
+    first = await async_store.list(ListPromptsOptions(limit=3))
+    second = await async_store.list(ListPromptsOptions(cursor=first.cursor, limit=3))
+    third = await async_store.list(ListPromptsOptions(cursor=second.cursor, limit=3))
+
+    assert [(p.name, p.variant) for p in first.prompts] == [('p0', None), ('p1', None), ('p1', 'v1')]
+    assert [p.name for p in second.prompts] == ['p2', 'p3', 'p4']
+    assert [p.name for p in third.prompts] == ['p5', 'p6']
+    assert third.cursor is None
+    with pytest.raises(ValueError, match='Invalid store cursor'):
+        await async_store.list(ListPromptsOptions(cursor='@@'))
+
+
+@pytest.mark.asyncio
+async def test_iter_prompts_and_partials(async_store: DirStore, temp_dir: Path) -> None:
+    """Test streaming prompts and partials yields what listing returns."""
+    await _create_test_file_async(temp_dir, 'a.prompt')
+    await _create_test_file_async(temp_dir, 'sub/b.v1.prompt')
+    await _create_test_file_async(temp_dir, '_header.prompt')
+
+    prompts = [p async for p in async_store.iter_prompts()]
+    partials = [p async for p in async_store.iter_partials()]
+
+    assert sorted(prompts, key=lambda p: p.name) == (await async_store.list()).prompts
+    assert partials == (await async_store.list_partials()).partials
+    assert {(p.name, p.variant) for p in prompts} == {('a', None), ('sub/b', 'v1')}
+
+
+@pytest.mark.asyncio
+async def test_iter_prompts_max_workers(temp_dir: Path) -> None:
+    """Test concurrent listings share the store's worker thread limit."""
+    for i in range(20):
+        await _create_test_file_async(temp_dir, f'p{i}.prompt')
+    store = DirStore(DirStoreOptions(directory=temp_dir, max_workers=1))
+    versions = store._versions.versions
+    lock = threading.Lock()
+    active = peak = 0
+
+    def counting_versions(*args: object) -> dict[str, str]:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        try:
+            return versions(*args)  # type: ignore[arg-type]
+        finally:
+            with lock:
+                active -= 1
+
+    store._versions.versions = counting_versions  # type: ignore[method-assign]
+    counts: list[int] = []
+
+    async def consume() -> None:
+        counts.append(len([p async for p in store.iter_prompts()]))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(4):
+            tg.start_soon(consume)
+        tg.start_soon(store.list)
+
+    assert counts == [20] * 4
+    assert peak == 1
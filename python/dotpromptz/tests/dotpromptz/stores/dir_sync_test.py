@@ -26,6 +26,7 @@ Core Test Areas:
 - Saving prompts and partials to the filesystem
 - Deleting prompts and partials
 - Version verification and error handling
+- Cursor pagination of listings
 
 Test Strategy:
 Tests use temporary directories with fixture prompts/partials to validate
@@ -52,6 +53,8 @@ from dotpromptz.stores._testutils import (
 )
 from dotpromptz.typing import (
     DeletePromptOrPartialOptions,
+    ListPartialsOptions,
+    ListPromptsOptions,
     LoadPartialOptions,
     LoadPromptOptions,
     PromptData,
@@ -187,6 +190,21 @@ def test_load_prompt(sync_store: DirStoreSync, temp_dir: Path) -> None:
         sync_store.load('test', LoadPromptOptions(version='wrongversion'))
 
 
+def test_frontmatter(sync_store: DirStoreSync, temp_dir: Path) -> None:
+    """Test reading only the frontmatter of prompts synchronously."""
+    create_test_prompt_sync(temp_dir, 'test.prompt', '---\nmodel: gemini\n---\nHello {{name}}')
+    create_test_prompt_sync(temp_dir, 'test.v1.prompt', 'No frontmatter')
+    create_test_prompt_sync(temp_dir, 'broken.prompt', '---\n- a list\n---\nBody')
+
+    assert sync_store.frontmatter('test') == {'model': 'gemini'}
+    assert sync_store.frontmatter('test', 'v1') == {}
+
+    with pytest.raises(FileNotFoundError):
+        sync_store.frontmatter('nonexistent')
+    with pytest.raises(ValueError, match='mapping'):
+        sync_store.frontmatter('broken')
+
+
 def test_load_partial(sync_store: DirStoreSync, temp_dir: Path) -> None:
     """Test loading partials synchronously."""
     source = 'partial source content'
@@ -351,3 +369,70 @@ def test_delete_prioritizes_prompt_over_partial(sync_store: DirStoreSync, temp_d
 
     assert not (temp_dir / 'conflict.prompt').exists()  # Prompt should be gone
     assert (temp_dir / '_conflict.prompt').exists()  # Partial should remain
+
+
+def test_list_pagination(sync_store: DirStoreSync, temp_dir: Path) -> None:
+    """Test paging through prompts and partials in name and variant order."""
+    for i in range(12):
+        create_test_prompt_sync(temp_dir, f'p{i:02}.prompt')
+    create_test_prompt_sync(temp_dir, 'p03.v1.prompt')
+    create_test_partial_sync(temp_dir, 'a.prompt')
+    create_test_partial_sync(temp_dir, 'b.prompt')
+
+    names: list[tuple[str, str | None]] = []
+    cursor: str | None = None
+    pages = 0
+    while True:
+        page = sync_store.list(ListPromptsOptions(cursor=cursor, limit=5))
+        assert len(page.prompts) <= 5
+        names.extend((p.name, p.variant) for p in page.prompts)
+        pages += 1
+        cursor = page.cursor
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert names[3:5] == [('p03', None), ('p03', 'v1')]
+    assert names == [(p.name, p.variant) for p in sync_store.list().prompts]
+    assert sync_store.list().cursor is None
+
+    first = sync_store.list_partials(ListPartialsOptions(limit=1))
+    assert [p.name for p in first.partials] == ['a']
+    rest = sync_store.list_partials(ListPartialsOptions(cursor=first.cursor, limit=1))
+    assert [p.name for p in rest.partials] == ['b']
+    assert rest.cursor is None
+
+
+def test_list_pagination_continues_after_changes(sync_store: DirStoreSync, temp_dir: Path) -> None:
+    """Test the next page starts after the last prompt seen, whatever changed since."""
+    for name in ('a', 'b', 'c', 'd'):
+        create_test_prompt_sync(temp_dir, f'{name}.prompt')
+    first = sync_store.list(ListPromptsOptions(limit=2))
+    os.remove(temp_dir / 'b.prompt')
+    create_test_prompt_sync(temp_dir, 'aa.prompt')
+
+    rest = DirStoreSync(DirStoreOptions(directory=temp_dir)).list(ListPromptsOptions(cursor=first.cursor))
+
+    assert [p.name for p in first.prompts] == ['a', 'b']
+    assert [p.name for p in rest.prompts] == ['c', 'd']
+
+
+def test_list_invalid_pagination(sync_store: DirStoreSync) -> None:
+    """Test malformed cursors and non-positive limits are rejected."""
+    with pytest.raises(ValueError, match='Invalid store cursor'):
+        sync_store.list(ListPromptsOptions(cursor='not a cursor'))
+    with pytest.raises(ValueError, match='must be positive'):
+        sync_store.list_partials(ListPartialsOptions(limit=0))
+
+
+def test_iter_prompts_and_partials(sync_store: DirStoreSync, temp_dir: Path) -> None:
+    """Test streaming prompts and partials yields what listing returns."""
+    create_test_prompt_sync(temp_dir, 'a.prompt')
+    create_test_prompt_sync(temp_dir, 'sub/b.v1.prompt')
+    create_test_partial_sync(temp_dir, 'header.prompt')
+
+    prompts = sorted(sync_store.iter_prompts(), key=lambda p: p.name)
+
+    assert prompts == sync_store.list().prompts
+    assert list(sync_store.iter_partials()) == sync_store.list_partials().partials
+    assert [(p.name, p.variant) for p in prompts] == [('a', None), ('sub/b', 'v1')]
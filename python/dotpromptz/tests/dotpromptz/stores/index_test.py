@@ -0,0 +1,173 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the version index of directory-based prompt stores."""
+
+import os
+import time
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from dotpromptz.stores import DirStore, DirStoreOptions, DirStoreSync
+from dotpromptz.stores._index import INDEX_FILE_NAME, SortedListing, VersionIndex, _hash_file
+from dotpromptz.stores._io import calculate_version
+from dotpromptz.stores._testutils import create_test_partial, create_test_prompt
+
+
+def _age(path: Path, seconds: float = 60.0) -> None:
+    """Move the modification time of a file into the past, out of the racy window."""
+    mtime = time.time() - seconds
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def reads() -> Generator[list[Path], None, None]:
+    """Record the files the index reads."""
+    paths: list[Path] = []
+
+    def hash_file(path: str) -> str:
+        paths.append(Path(path))
+        return _hash_file(path)
+
+    with patch('dotpromptz.stores._index._hash_file', side_effect=hash_file):
+        yield paths
+
+
+def test_rehashes_only_changed_files(tmp_path: Path, reads: list[Path]) -> None:
+    """Should read a file again only when its size, mtime or inode change."""
+    _age(create_test_prompt(tmp_path, 'a.prompt', 'first'))
+    _age(create_test_prompt(tmp_path, 'b.prompt', 'second'))
+    index = VersionIndex(tmp_path)
+
+    assert index.versions(['a.prompt', 'b.prompt']) == {
+        'a.prompt': calculate_version('first'),
+        'b.prompt': calculate_version('second'),
+    }
+    assert len(reads) == 2
+    assert index.versions(['a.prompt', 'b.prompt'])['a.prompt'] == calculate_version('first')
+    assert len(reads) == 2
+
+    _age(create_test_prompt(tmp_path, 'a.prompt', 'changed'), seconds=30)
+    assert index.versions(['a.prompt', 'b.prompt'])['a.prompt'] == calculate_version('changed')
+    assert reads[2:] == [tmp_path / 'a.prompt']
+
+
+def test_recently_modified_files_are_not_trusted(tmp_path: Path, reads: list[Path]) -> None:
+    """Should rehash files modified within the timestamp granularity window."""
+    create_test_prompt(tmp_path, 'a.prompt', 'fresh')
+    index = VersionIndex(tmp_path)
+
+    index.versions(['a.prompt'])
+    index.versions(['a.prompt'])
+
+    assert len(reads) == 2
+    assert len(index) == 0
+
+
+def test_drops_deleted_and_unscanned_files(tmp_path: Path) -> None:
+    """Should leave out files that vanished and forget files missing from a scan."""
+    _age(create_test_prompt(tmp_path, 'a.prompt'))
+    _age(create_test_prompt(tmp_path, 'b.prompt'))
+    index = VersionIndex(tmp_path)
+    index.versions(['a.prompt', 'b.prompt'])
+
+    os.remove(tmp_path / 'a.prompt')
+    assert index.versions(['a.prompt']) == {}
+    assert len(index) == 1
+    index.versions([], scanned=[])
+    assert len(index) == 0
+
+
+def test_persists_to_sidecar(tmp_path: Path, reads: list[Path]) -> None:
+    """Should start a new index from the sidecar file when persisted."""
+    _age(create_test_prompt(tmp_path, 'a.prompt', 'persisted'))
+    VersionIndex(tmp_path, persist=True).versions(['a.prompt'])
+    assert (tmp_path / INDEX_FILE_NAME).exists()
+
+    assert VersionIndex(tmp_path, persist=True).versions(['a.prompt']) == {'a.prompt': calculate_version('persisted')}
+    assert len(reads) == 1
+
+
+def test_ignores_invalid_sidecar(tmp_path: Path) -> None:
+    """Should start empty when the sidecar file cannot be used."""
+    _age(create_test_prompt(tmp_path, 'a.prompt', 'text'))
+    (tmp_path / INDEX_FILE_NAME).write_text('{"format": 1, "entries": {"a.prompt": [1]}}')
+
+    index = VersionIndex(tmp_path, persist=True)
+
+    assert len(index) == 0
+    assert index.versions(['a.prompt']) == {'a.prompt': calculate_version('text')}
+
+
+def test_sync_store_lists_from_index(tmp_path: Path, reads: list[Path]) -> None:
+    """Should list versions from the index and keep the sidecar out of listings."""
+    _age(create_test_prompt(tmp_path, 'greet.prompt', 'Hello'))
+    _age(create_test_partial(tmp_path, 'footer.prompt', 'Bye'))
+    store = DirStoreSync(DirStoreOptions(directory=tmp_path, persist_index=True))
+
+    store.list()
+    store.list_partials()
+    prompts = DirStoreSync(DirStoreOptions(directory=tmp_path, persist_index=True)).list().prompts
+
+    assert [(p.name, p.version) for p in prompts] == [('greet', calculate_version('Hello'))]
+    assert prompts[0].version == store.load('greet').version
+    assert len(reads) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_store_lists_from_index(tmp_path: Path, reads: list[Path]) -> None:
+    """Should list versions from the index in the async store."""
+    _age(create_test_prompt(tmp_path, 'greet.prompt', 'Hello'))
+    store = DirStore(DirStoreOptions(directory=tmp_path))
+
+    first = await store.list()
+    second = await store.list()
+
+    assert first == second
+    assert [(p.name, p.version) for p in second.prompts] == [('greet', calculate_version('Hello'))]
+    assert len(reads) == 1
+
+
+def test_sorted_listing_pages_by_name_and_variant() -> None:
+    """Should page entries in name order, the default variant first."""
+    listing = SortedListing([('b', None, 'b.prompt'), ('a', 'x', 'a.x.prompt'), ('a', None, 'a.prompt')])
+
+    first, cursor = listing.page(None, 2)
+    rest, end = listing.page(cursor, 2)
+
+    assert [entry[:2] for entry in first] == [('a', None), ('a', 'x')]
+    assert rest == [('b', None, 'b.prompt')]
+    assert end is None
+    assert listing.page(None, None) == (first + rest, None)
+
+
+def test_sorted_listing_cursor_survives_new_snapshot() -> None:
+    """Should resume after the cursor's entry in a snapshot without it."""
+    _, cursor = SortedListing([('a', None, 'a.prompt'), ('b', None, 'b.prompt'), ('c', None, 'c.prompt')]).page(None, 2)
+
+    entries, _ = SortedListing([('a', None, 'a.prompt'), ('c', None, 'c.prompt')]).page(cursor, 2)
+
+    assert entries == [('c', None, 'c.prompt')]
+
+
+@pytest.mark.parametrize('cursor', ['not a cursor', 'WzFd', 'e30='])
+def test_sorted_listing_rejects_invalid_cursor(cursor: str) -> None:
+    """Should raise ValueError for cursors it did not produce."""
+    with pytest.raises(ValueError, match='Invalid store cursor'):
+        SortedListing([]).page(cursor, 10)
@@ -0,0 +1,120 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the directory scanners of prompt stores."""
+
+import os
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from dotpromptz.stores._io import (
+    iter_scan_directory,
+    iter_scan_directory_sync,
+    scan_directory,
+    scan_directory_sync,
+)
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    """Create a tree of prompt files, with hidden and unrelated files."""
+    for rel_path in (
+        'a.prompt',
+        '_p.prompt',
+        'notes.txt',
+        '.hidden.prompt',
+        'x/b.prompt',
+        'x/y/c.v1.prompt',
+        '.git/d.prompt',
+    ):
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('Hello')
+    return tmp_path
+
+
+def _expected(*paths: str) -> list[str]:
+    """Return sorted relative paths in the separator of the platform."""
+    return sorted(os.path.join(*path.split('/')) for path in paths)
+
+
+def test_scan_directory_sync(tree: Path) -> None:
+    """Should find prompt files in subdirectories, skipping hidden ones."""
+    assert sorted(scan_directory_sync(tree)) == _expected('a.prompt', '_p.prompt', 'x/b.prompt', 'x/y/c.v1.prompt')
+
+
+def test_scan_directory_sync_name_filter(tree: Path) -> None:
+    """Should include only the files accepted by the name filter."""
+    assert scan_directory_sync(tree, lambda name: name.startswith('_')) == ['_p.prompt']
+
+
+def test_scan_directory_sync_missing(tmp_path: Path) -> None:
+    """Should return no files for a missing directory."""
+    assert scan_directory_sync(tmp_path / 'missing') == []
+
+
+def test_iter_scan_directory_sync_batches(tmp_path: Path) -> None:
+    """Should yield every file in batches of at most the batch size."""
+    for i in range(7):
+        (tmp_path / f'p{i}.prompt').write_text('Hello')
+
+    batches = list(iter_scan_directory_sync(tmp_path, batch_size=3))
+
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert sorted(path for batch in batches for path in batch) == [f'p{i}.prompt' for i in range(7)]
+
+
+def test_scan_directory_sync_deep_tree(tmp_path: Path) -> None:
+    """Should walk deeply nested trees."""
+    deep = tmp_path.joinpath(*['d'] * 200)
+    deep.mkdir(parents=True)
+    (deep / 'deep.prompt').write_text('Hello')
+
+    assert scan_directory_sync(tmp_path) == [os.path.join(*['d'] * 200, 'deep.prompt')]
+
+
+@pytest.mark.asyncio
+async def test_scan_directory_off_event_loop(tree: Path) -> None:
+    """Should list directories in worker threads and match the sync scan."""
+    threads: set[int] = set()
+    scandir = os.scandir
+
+    def record_scandir(path: str) -> object:
+        threads.add(threading.get_ident())
+        return scandir(path)
+
+    with patch('dotpromptz.stores._io.os.scandir', side_effect=record_scandir):
+        files = await scan_directory(tree)
+        batches = [batch async for batch in iter_scan_directory(tree, batch_size=2)]
+
+    assert sorted(files) == sorted(scan_directory_sync(tree))
+    assert sorted(path for batch in batches for path in batch) == sorted(files)
+    assert all(len(batch) <= 2 for batch in batches)
+    assert threading.get_ident() not in threads
+
+
+@pytest.mark.asyncio
+async def test_iter_scan_directory_stops_early(tmp_path: Path) -> None:
+    """Should stop walking when the consumer stops iterating."""
+    for i in range(5):
+        (tmp_path / f'p{i}.prompt').write_text('Hello')
+
+    async for batch in iter_scan_directory(tmp_path, batch_size=2):
+        assert len(batch) == 2
+        break
@@ -0,0 +1,210 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the SQLite-backed prompt stores."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from dotpromptz.stores import DirStoreOptions, DirStoreSync, SqliteStore, SqliteStoreSync, import_store
+from dotpromptz.stores._io import calculate_version
+from dotpromptz.stores._testutils import create_test_partial, create_test_prompt
+from dotpromptz.typing import (
+    DeletePromptOrPartialOptions,
+    ListPartialsOptions,
+    ListPromptsOptions,
+    LoadPartialOptions,
+    LoadPromptOptions,
+    PartialData,
+    PromptData,
+)
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> SqliteStoreSync:
+    """Create a store with prompts, a variant and partials."""
+    store = SqliteStoreSync(tmp_path / 'prompts.db')
+    store.save_many(
+        [
+            PromptData(name='greet', source='Hello'),
+            PromptData(name='greet', variant='formal', source='Good day'),
+            PromptData(name='chat/system', source='You are helpful.'),
+            PartialData(name='footer', source='Bye'),
+            PromptData(name='chat/_header', source='Hi'),
+        ]
+    )
+    return store
+
+
+def _sources(path: Path) -> int:
+    """Count the distinct sources stored in a database."""
+    with sqlite3.connect(path) as conn:
+        count: int = conn.execute('SELECT COUNT(*) FROM sources').fetchone()[0]
+    return count
+
+
+def test_loads_prompts_and_partials(store: SqliteStoreSync) -> None:
+    """Should load sources with the versions DirStore would report."""
+    greet = store.load('greet')
+    formal = store.load('greet', LoadPromptOptions(variant='formal'))
+    header = store.load_partial('chat/header')
+
+    assert (greet.source, greet.version) == ('Hello', calculate_version('Hello'))
+    assert (formal.variant, formal.source) == ('formal', 'Good day')
+    assert header.source == 'Hi'
+    assert store.load_partial('footer', LoadPartialOptions(version=calculate_version('Bye'))).source == 'Bye'
+
+
+def test_load_errors(store: SqliteStoreSync) -> None:
+    """Should raise FileNotFoundError for missing entries and ValueError for other versions."""
+    with pytest.raises(FileNotFoundError, match="Prompt 'footer' not found"):
+        store.load('footer')
+    with pytest.raises(FileNotFoundError, match=r"Partial 'footer' \(variant: x\) not found"):
+        store.load_partial('footer', LoadPartialOptions(variant='x'))
+    with pytest.raises(ValueError, match="Version mismatch for prompt 'greet'"):
+        store.load('greet', LoadPromptOptions(version='deadbeef'))
+
+
+def test_lists_in_pages(store: SqliteStoreSync) -> None:
+    """Should page through entries in name and variant order."""
+    first = store.list(ListPromptsOptions(limit=2))
+    rest = store.list(ListPromptsOptions(cursor=first.cursor, limit=2))
+
+    assert [(p.name, p.variant) for p in first.prompts] == [('chat/system', None), ('greet', None)]
+    assert [(p.name, p.variant, p.version) for p in rest.prompts] == [
+        ('greet', 'formal', calculate_version('Good day'))
+    ]
+    assert rest.cursor is None
+    assert store.list().prompts == first.prompts + rest.prompts
+    assert [p.name for p in store.list_partials().partials] == ['chat/header', 'footer']
+    with pytest.raises(ValueError, match='Invalid store cursor'):
+        store.list_partials(ListPartialsOptions(cursor='nope'))
+    with pytest.raises(ValueError, match='must be positive'):
+        store.list(ListPromptsOptions(limit=0))
+
+
+def test_cursor_matches_dir_store(tmp_path: Path) -> None:
+    """Should accept cursors of a directory store listing the same prompts."""
+    for name in ('a', 'b', 'b.v1', 'c'):
+        create_test_prompt(tmp_path, f'{name}.prompt', name)
+    dir_store = DirStoreSync(DirStoreOptions(directory=tmp_path))
+    store = SqliteStoreSync(':memory:')
+    import_store(dir_store, store)
+
+    cursor = dir_store.list(ListPromptsOptions(limit=2)).cursor
+
+    assert [(p.name, p.variant) for p in store.list(ListPromptsOptions(cursor=cursor)).prompts] == [
+        ('b', 'v1'),
+        ('c', None),
+    ]
+
+
+def test_load_many(store: SqliteStoreSync) -> None:
+    """Should load the entries found and leave out the others."""
+    prompts = store.load_many(['greet', 'missing', 'chat/system', 'greet'])
+    formal = store.load_many(['greet', 'chat/system'], variant='formal')
+
+    assert {name: p.source for name, p in prompts.items()} == {'greet': 'Hello', 'chat/system': 'You are helpful.'}
+    assert list(formal) == ['greet']
+    assert store.load_partials_many([f'p{i}' for i in range(2000)] + ['footer'])['footer'].source == 'Bye'
+
+
+def test_deduplicates_sources(tmp_path: Path) -> None:
+    """Should store identical sources once and drop sources no longer used."""
+    path = tmp_path / 'prompts.db'
+    store = SqliteStoreSync(path)
+    store.save_many([PromptData(name=f'p{i}', source='same') for i in range(10)])
+    assert _sources(path) == 1
+
+    store.save(PromptData(name='p0', source='other'))
+    assert _sources(path) == 2
+    for i in range(1, 10):
+        store.delete(f'p{i}')
+    assert _sources(path) == 1
+
+    # A source given up by one entry and taken up by another in one batch.
+    store.save_many([PromptData(name='p0', source='third'), PromptData(name='p1', source='other')])
+    assert store.load('p1').source == 'other'
+    assert _sources(path) == 2
+
+
+def test_save_many_is_atomic(store: SqliteStoreSync) -> None:
+    """Should save nothing when any entry is invalid."""
+    with pytest.raises(ValueError, match='name is required'):
+        store.save_many([PromptData(name='new', source='New'), PromptData(name='', source='x')])
+    with pytest.raises(FileNotFoundError):
+        store.load('new')
+
+
+def test_delete(store: SqliteStoreSync) -> None:
+    """Should delete a prompt, or else the partial of that name."""
+    store.save(PartialData(name='greet', source='Partial'))
+
+    store.delete('greet', DeletePromptOrPartialOptions(variant='formal'))
+    store.delete('greet')
+    store.delete('greet')
+
+    assert [p.name for p in store.list().prompts] == ['chat/system']
+    with pytest.raises(FileNotFoundError):
+        store.load_partial('greet')
+    with pytest.raises(FileNotFoundError, match="Failed to delete 'greet'"):
+        store.delete('greet')
+
+
+def test_reopens_database(store: SqliteStoreSync, tmp_path: Path) -> None:
+    """Should keep prompts across connections and reject other databases."""
+    store.close()
+    assert SqliteStoreSync(tmp_path / 'prompts.db').load('greet').source == 'Hello'
+
+    with sqlite3.connect(tmp_path / 'other.db') as conn:
+        conn.execute('PRAGMA user_version = 7')
+    with pytest.raises(ValueError, match='schema version'):
+        SqliteStoreSync(tmp_path / 'other.db')
+
+
+def test_import_store(tmp_path: Path) -> None:
+    """Should copy every prompt and partial of a directory store."""
+    directory = tmp_path / 'prompts'
+    for i in range(25):
+        create_test_prompt(directory, f'group/p{i}.prompt', f'Prompt {i}')
+    create_test_prompt(directory, 'greet.formal.prompt', 'Good day')
+    create_test_partial(directory, 'footer.prompt', 'Bye')
+    source = DirStoreSync(DirStoreOptions(directory=directory))
+    store = SqliteStoreSync(tmp_path / 'prompts.db')
+
+    assert import_store(source, store, batch_size=10) == (26, 1)
+    assert store.list() == source.list()
+    assert store.list_partials() == source.list_partials()
+
+
+@pytest.mark.asyncio
+async def test_async_store(tmp_path: Path) -> None:
+    """Should serve the async protocol from worker threads."""
+    store = SqliteStore(tmp_path / 'prompts.db')
+
+    assert await store.save_many(PromptData(name=f'p{i}', source=f'Prompt {i}') for i in range(3)) == 3
+    await store.save(PartialData(name='footer', source='Bye'))
+    await store.delete('p2')
+
+    assert [p.name for p in (await store.list()).prompts] == ['p0', 'p1']
+    assert (await store.load('p1')).source == 'Prompt 1'
+    assert (await store.load_partial('footer')).source == 'Bye'
+    assert list(await store.load_many(['p0', 'p2'])) == ['p0']
+    assert list(await store.load_partials_many(['footer'])) == ['footer']
+    assert len((await store.list_partials()).partials) == 1
+    store.close()
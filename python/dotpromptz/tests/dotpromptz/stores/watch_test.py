@@ -0,0 +1,120 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for watching directory-based prompt stores for changes.
+
+Every watcher test runs twice: once with inotify (where the platform supports
+it) and once with the polling fallback.
+"""
+
+import os
+import shutil
+import threading
+from collections.abc import Generator
+from pathlib import Path
+
+import anyio
+import pytest
+
+from dotpromptz.stores import DirStore, DirStoreOptions, DirStoreSync
+from dotpromptz.stores._testutils import create_test_partial, create_test_prompt
+from dotpromptz.stores._watch import DirWatcher
+from dotpromptz.typing import StoreChange
+
+
+@pytest.fixture(params=[True, False], ids=['inotify', 'polling'])
+def watcher(request: pytest.FixtureRequest, tmp_path: Path) -> Generator[DirWatcher, None, None]:
+    """Provide a watcher over a directory holding one prompt and one partial."""
+    create_test_prompt(tmp_path, 'greet.prompt', 'Hello')
+    create_test_partial(tmp_path, 'footer.prompt', 'Bye')
+    with DirWatcher(tmp_path, poll_interval=0.01, use_inotify=request.param) as watcher:
+        yield watcher
+
+
+def _read_all(watcher: DirWatcher) -> list[tuple[str, str, str, str | None]]:
+    """Collect changes until the watcher goes quiet."""
+    changes: list[StoreChange] = []
+    while batch := watcher.read(timeout=0.2):
+        changes.extend(batch)
+    return [(c.event, c.kind, c.name, c.variant) for c in changes]
+
+
+def test_watch_reports_added_modified_and_deleted(watcher: DirWatcher, tmp_path: Path) -> None:
+    """Should report file additions, modifications and deletions."""
+    create_test_prompt(tmp_path, 'greet.formal.prompt', 'Good day')
+    create_test_partial(tmp_path, 'footer.prompt', 'Goodbye for now')
+    os.remove(tmp_path / 'greet.prompt')
+
+    assert sorted(_read_all(watcher)) == [
+        ('added', 'prompt', 'greet', 'formal'),
+        ('deleted', 'prompt', 'greet', None),
+        ('modified', 'partial', 'footer', None),
+    ]
+
+
+def test_watch_follows_subdirectories(watcher: DirWatcher, tmp_path: Path) -> None:
+    """Should pick up new directories and report removed ones as deletions."""
+    create_test_prompt(tmp_path, 'chat/system.prompt', 'System')
+    assert _read_all(watcher) == [('added', 'prompt', 'chat/system', None)]
+
+    create_test_prompt(tmp_path, 'chat/user.prompt', 'User')
+    assert _read_all(watcher) == [('added', 'prompt', 'chat/user', None)]
+
+    shutil.rmtree(tmp_path / 'chat')
+    assert sorted(_read_all(watcher)) == [
+        ('deleted', 'prompt', 'chat/system', None),
+        ('deleted', 'prompt', 'chat/user', None),
+    ]
+
+
+def test_watch_ignores_other_files(watcher: DirWatcher, tmp_path: Path) -> None:
+    """Should ignore hidden files and files that are not prompts."""
+    (tmp_path / 'notes.txt').write_text('x')
+    (tmp_path / '.greet.prompt.swp').write_text('x')
+
+    assert watcher.read(timeout=0.1) == []
+
+
+def test_dir_store_sync_watch(tmp_path: Path) -> None:
+    """Should yield batches of changes from the sync store."""
+    store = DirStoreSync(DirStoreOptions(directory=tmp_path))
+    writer = threading.Timer(0.2, create_test_prompt, (tmp_path, 'greet.prompt', 'Hello'))
+    writer.start()
+
+    changes = store.watch(poll_interval=0.01)
+    batch = next(changes)
+    changes.close()
+    writer.join()
+
+    assert batch == [StoreChange(kind='prompt', event='added', name='greet')]
+
+
+@pytest.mark.asyncio
+async def test_dir_store_watch(tmp_path: Path) -> None:
+    """Should yield batches of changes from the async store."""
+    store = DirStore(DirStoreOptions(directory=tmp_path))
+
+    async def write_later() -> None:
+        await anyio.sleep(0.2)
+        create_test_prompt(tmp_path, 'greet.prompt', 'Hello')
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(write_later)
+        changes = store.watch(poll_interval=0.05)
+        batch = await changes.__anext__()
+        await changes.aclose()
+
+    assert batch == [StoreChange(kind='prompt', event='added', name='greet')]
@@ -0,0 +1,54 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for token estimation."""
+
+import unittest
+
+from dotpromptz.tokens import MEDIA_TOKENS, MESSAGE_OVERHEAD_TOKENS, estimate_tokens
+from dotpromptz.typing import DataPart, MediaContent, MediaPart, Message, Role, TextPart
+
+
+class TestEstimateTokens(unittest.TestCase):
+    """Tests for estimate_tokens."""
+
+    def test_counts_text_by_characters(self) -> None:
+        """Should count about four characters of text per token."""
+        message = Message(role=Role.USER, content=[TextPart(text='a' * 10), TextPart(text='b' * 10)])
+
+        self.assertEqual(estimate_tokens(message), MESSAGE_OVERHEAD_TOKENS + 5)
+
+    def test_counts_media_at_a_fixed_cost(self) -> None:
+        """Should not count the characters of media URLs."""
+        url = 'data:image/png;base64,' + 'A' * 100_000
+        message = Message(role=Role.USER, content=[MediaPart(media=MediaContent(url=url))])
+
+        self.assertEqual(estimate_tokens(message), MESSAGE_OVERHEAD_TOKENS + MEDIA_TOKENS)
+
+    def test_counts_other_parts_by_their_json(self) -> None:
+        """Should count structured parts by the length of their JSON form."""
+        message = Message(role=Role.USER, content=[DataPart(data={'key': 'value'}, metadata={'x': 'y' * 100})])
+
+        # {"data":{"key":"value"}} is 24 characters.
+        self.assertEqual(estimate_tokens(message), MESSAGE_OVERHEAD_TOKENS + 6)
+
+    def test_empty_message(self) -> None:
+        """Should count only the message overhead for empty messages."""
+        self.assertEqual(estimate_tokens(Message(role=Role.MODEL, content=[])), MESSAGE_OVERHEAD_TOKENS)
+
+
+if __name__ == '__main__':
+    unittest.main()
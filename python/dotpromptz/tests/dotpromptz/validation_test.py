@@ -0,0 +1,134 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for compiled JSON Schema validation."""
+
+import unittest
+
+from dotpromptz.picoschema import picoschema_to_json_schema_sync
+from dotpromptz.validation import compile_validator, json_type
+
+
+class TestCompileValidator(unittest.TestCase):
+    """Compiled validator tests."""
+
+    def test_picoschema_output(self) -> None:
+        """Test validating against a schema converted from Picoschema."""
+        schema = picoschema_to_json_schema_sync(
+            {
+                'name': 'string',
+                'age?': 'integer',
+                'tags(array)': 'string',
+                'status(enum)': ['A', 'B'],
+                'address?(object)': {'city': 'string'},
+            }
+        )
+        assert schema is not None
+        validate = compile_validator(schema)
+
+        self.assertEqual(validate({'name': 'Ada', 'age': None, 'tags': [], 'status': 'A'}), [])
+        self.assertEqual(
+            validate({'name': 'Ada', 'age': 1.5, 'tags': ['a', 2], 'status': 'C', 'address': {}, 'extra': 1}),
+            [
+                'input.age: expected integer or null, got number',
+                'input.tags[1]: expected string, got integer',
+                "input.status: must be one of ['A', 'B'], got 'C'",
+                "input.address: missing required property 'city'",
+                "input: unexpected property 'extra'",
+            ],
+        )
+
+    def test_types(self) -> None:
+        """Test JSON types are told apart from their Python counterparts."""
+        self.assertEqual(compile_validator({'type': 'integer'})(2.0), [])
+        self.assertEqual(compile_validator({'type': 'integer'})(True), ['input: expected integer, got boolean'])
+        self.assertEqual(compile_validator({'type': 'number'})(False), ['input: expected number, got boolean'])
+        self.assertEqual(compile_validator({'enum': [1]})(True), ['input: must be 1, got True'])
+        self.assertEqual(compile_validator({'type': 'array'})((1, 2)), [])
+
+    def test_keywords(self) -> None:
+        """Test string, number, array and combinator keywords."""
+        validate = compile_validator(
+            {
+                'type': 'object',
+                'properties': {
+                    'code': {'type': 'string', 'pattern': '^[A-Z]+$', 'maxLength': 3},
+                    'score': {'type': 'number', 'minimum': 0, 'exclusiveMaximum': 1},
+                    'pair': {'type': 'array', 'prefixItems': [{'type': 'string'}], 'items': {'type': 'integer'}},
+                    'id': {'anyOf': [{'type': 'string'}, {'type': 'integer'}]},
+                },
+                'additionalProperties': {'type': 'boolean'},
+            }
+        )
+
+        self.assertEqual(validate({'code': 'AB', 'score': 0.5, 'pair': ['a', 1], 'id': 3, 'flag': True}), [])
+        self.assertEqual(
+            validate({'code': 'abcd', 'score': 1, 'pair': [1, 'a'], 'id': None, 'flag': 'yes'}),
+            [
+                'input.code: must be at most 3 characters long',
+                "input.code: must match pattern '^[A-Z]+$'",
+                'input.score: must be less than 1, got 1',
+                'input.pair[0]: expected string, got integer',
+                'input.pair[1]: expected integer, got string',
+                'input.id: does not match any of the allowed schemas',
+                'input.flag: expected boolean, got string',
+            ],
+        )
+
+    def test_refs(self) -> None:
+        """Test local and recursive references."""
+        validate = compile_validator(
+            {
+                '$defs': {
+                    'Node': {'type': 'object', 'properties': {'next': {'$ref': '#/$defs/Node'}}, 'required': ['id']}
+                },
+                '$ref': '#/$defs/Node',
+            }
+        )
+
+        self.assertEqual(validate({'id': 1, 'next': {'id': 2}}), [])
+        self.assertEqual(
+            validate({'id': 1, 'next': {'next': {}}}),
+            [
+                "input.next: missing required property 'id'",
+                "input.next.next: missing required property 'id'",
+            ],
+        )
+
+    def test_invalid_schemas(self) -> None:
+        """Test schemas that cannot be compiled are rejected up front."""
+        for schema in ({'type': 'text'}, {'$ref': 'https://example.com/schema'}, {'$ref': '#/$defs/Missing'}):
+            with self.subTest(schema=schema), self.assertRaises(ValueError):
+                compile_validator(schema)
+
+    def test_json_type(self) -> None:
+        """Test naming the JSON type of values."""
+        self.assertEqual(
+            [json_type(v) for v in (None, True, 1, 1.5, 's', {}, [])],
+            [
+                'null',
+                'boolean',
+                'integer',
+                'number',
+                'string',
+                'object',
+                'array',
+            ],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()